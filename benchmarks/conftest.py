@@ -0,0 +1,48 @@
+"""Fixtures for the benchmark suite.
+
+Run with `make test-benchmark`, or `pytest benchmarks` (requires pytest-benchmark). The
+10k-table sizes are skipped unless `--large-schemas` is passed.
+"""
+
+from functools import cache
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from synthetic import SHAPES, SIZES, SchemaSpec, SyntheticCatalog, make_catalog  # noqa: E402
+
+from supabase_pydantic.db.models import TableInfo  # noqa: E402
+
+# Specs with at least this many tables only run with --large-schemas
+LARGE_TABLES = 10_000
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:  # noqa: D103
+    parser.addoption('--large-schemas', action='store_true', help='Include the 10k-table benchmark sizes.')
+
+
+@cache
+def _catalog(spec: SchemaSpec) -> SyntheticCatalog:
+    return make_catalog(spec)
+
+
+@pytest.fixture(params=SIZES + SHAPES, ids=lambda spec: spec.id)
+def spec(request: pytest.FixtureRequest) -> SchemaSpec:
+    """The shape of the synthetic schema to benchmark."""
+    spec: SchemaSpec = request.param
+    if spec.tables >= LARGE_TABLES and not request.config.getoption('--large-schemas'):
+        pytest.skip('pass --large-schemas to run the 10k-table sizes')
+    return spec
+
+
+@pytest.fixture
+def catalog(spec: SchemaSpec) -> SyntheticCatalog:
+    """Catalog rows for the schema, shared between benchmarks."""
+    return _catalog(spec)
+
+
+@pytest.fixture
+def tables(catalog: SyntheticCatalog) -> list[TableInfo]:
+    """Freshly marshaled tables for the schema, sorted by name as `gen` does."""
+    return sorted(catalog.construct_tables(), key=lambda t: t.name)
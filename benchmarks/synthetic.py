@@ -0,0 +1,148 @@
+"""Synthetic PostgreSQL catalog rows for benchmarking without a database.
+
+The rows have the same shapes as the results of the Postgres catalog queries in
+`supabase_pydantic.db.drivers.postgres.queries`:
+
+- columns: `GET_ALL_PUBLIC_TABLES_AND_COLUMNS`
+- foreign keys: `GET_TABLE_COLUMN_DETAILS`
+- constraints: `GET_CONSTRAINTS`
+- enum types: `GET_ENUM_TYPES`
+- enum type mappings: `GET_COLUMN_TO_USER_DEFINED_TYPE_MAPPING`
+
+Generation is seeded, so a given `SchemaSpec` always produces the same catalog.
+"""
+
+from dataclasses import dataclass, field
+from random import Random
+
+from supabase_pydantic.db.marshalers.schema import construct_table_info
+from supabase_pydantic.db.models import TableInfo
+
+# (data_type, udt_name, array_element_type) for plain columns, cycled through per table
+COLUMN_TYPES = [
+    ('text', 'text', None),
+    ('integer', 'int4', None),
+    ('boolean', 'bool', None),
+    ('timestamp with time zone', 'timestamptz', None),
+    ('uuid', 'uuid', None),
+    ('numeric', 'numeric', None),
+    ('jsonb', 'jsonb', None),
+    ('character varying', 'varchar', None),
+    ('date', 'date', None),
+    ('ARRAY', '_text', 'text[]'),
+]
+
+
+@dataclass(frozen=True)
+class SchemaSpec:
+    """The shape of a synthetic schema.
+
+    Attributes:
+        tables: The number of tables.
+        columns: The number of plain columns per table, besides the primary key.
+        foreign_keys: The number of foreign keys per table; each references an earlier table.
+        enums: The number of enum types; tables get one enum and one enum array column each.
+        seed: The seed for choosing foreign key targets.
+    """
+
+    tables: int
+    columns: int = 10
+    foreign_keys: int = 1
+    enums: int = 0
+    seed: int = 0
+
+    @property
+    def id(self) -> str:
+        """A short label for parametrized benchmark ids."""
+        return f'{self.tables}t-{self.columns}c-{self.foreign_keys}fk-{self.enums}e'
+
+
+@dataclass
+class SyntheticCatalog:
+    """Catalog query results for one schema."""
+
+    schema: str = 'public'
+    columns: list[tuple] = field(default_factory=list)
+    foreign_keys: list[tuple] = field(default_factory=list)
+    constraints: list[tuple] = field(default_factory=list)
+    enum_types: list[tuple] = field(default_factory=list)
+    enum_type_mapping: list[tuple] = field(default_factory=list)
+
+    def construct_tables(self) -> list[TableInfo]:
+        """Marshal the catalog rows into TableInfo objects."""
+        tables: list[TableInfo] = construct_table_info(
+            self.columns, self.foreign_keys, self.constraints, self.enum_types, self.enum_type_mapping, self.schema
+        )
+        return tables
+
+
+def make_catalog(spec: SchemaSpec, schema: str = 'public') -> SyntheticCatalog:
+    """Build the catalog rows for a schema with the given shape."""
+    rand = Random(spec.seed)
+    catalog = SyntheticCatalog(schema=schema)
+
+    enum_names = [f'enum_{e}' for e in range(spec.enums)]
+    for name in enum_names:
+        catalog.enum_types.append((name, schema, 'postgres', 'E', True, 'e', ['alpha', 'beta', 'gamma']))
+
+    for t in range(spec.tables):
+        table = f'table_{t}'
+
+        def column(name: str, data_type: str, udt_name: str, array_type: str | None = None, **kw: object) -> None:
+            catalog.columns.append(
+                (
+                    schema,
+                    table,
+                    name,
+                    kw.get('default'),
+                    kw.get('nullable', 'YES'),
+                    data_type,
+                    kw.get('max_length'),
+                    'BASE TABLE',
+                    None,
+                    udt_name,
+                    array_type,
+                    None,
+                )
+            )
+
+        column('id', 'integer', 'int4', default=f"nextval('{table}_id_seq'::regclass)", nullable='NO')
+        catalog.constraints.append((f'{table}_pkey', table, ['id'], 'p', 'PRIMARY KEY (id)'))
+
+        for c in range(spec.columns):
+            data_type, udt_name, array_type = COLUMN_TYPES[c % len(COLUMN_TYPES)]
+            column(f'col_{c}', data_type, udt_name, array_type, max_length=255 if udt_name == 'varchar' else None)
+        if spec.columns:
+            catalog.constraints.append((f'{table}_col_0_key', table, ['col_0'], 'u', 'UNIQUE (col_0)'))
+
+        if enum_names:
+            enum_name = enum_names[t % len(enum_names)]
+            column('status', 'USER-DEFINED', enum_name)
+            column('tags', 'ARRAY', f'_{enum_name}', f'{enum_name}[]')
+            catalog.enum_type_mapping.append(('status', table, schema, enum_name, 'e', 'Enum'))
+
+        for f in range(min(spec.foreign_keys, t)):
+            target = f'table_{rand.randrange(t)}'
+            name = f'fk_{f}_id'
+            constraint = f'{table}_{name}_fkey'
+            column(name, 'integer', 'int4')
+            catalog.foreign_keys.append((schema, table, name, schema, target, 'id', constraint))
+            catalog.constraints.append(
+                (constraint, table, [name], 'f', f'FOREIGN KEY ({name}) REFERENCES {target}(id)')
+            )
+
+    return catalog
+
+
+# Table counts for the scaling benchmarks; the largest is opt-in (see conftest.py)
+SIZES = [SchemaSpec(tables=n) for n in (10, 100, 1_000, 10_000)]
+
+# Schemas stressing one dimension each: wide tables, dense foreign key graphs and many enums
+SHAPES = [
+    SchemaSpec(tables=20, columns=200),
+    SchemaSpec(tables=200, foreign_keys=10),
+    SchemaSpec(tables=200, enums=100),
+]
+
+# Seed data generation calls Faker per cell, so it is benchmarked on smaller schemas
+SEED_SPECS = [SchemaSpec(tables=10), SchemaSpec(tables=100), SchemaSpec(tables=20, columns=200)]
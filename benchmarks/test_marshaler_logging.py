@@ -0,0 +1,36 @@
+"""Benchmarks for the cost of marshaler logging with DEBUG off and on.
+
+Records go to a NullHandler, so only building the messages is measured, not I/O. With the
+level-guarded marshaler loggers, the INFO run should spend nothing on debug messages.
+"""
+
+import logging
+from collections.abc import Iterator
+
+import pytest
+from synthetic import SchemaSpec
+
+LOGGING_SPECS = [SchemaSpec(tables=1_000), SchemaSpec(tables=200, enums=100)]
+
+
+@pytest.fixture(params=[logging.INFO, logging.DEBUG], ids=logging.getLevelName)
+def marshaler_log_level(request: pytest.FixtureRequest) -> Iterator[int]:
+    """Set the marshaler loggers to the level, with their records discarded."""
+    marshalers = logging.getLogger('supabase_pydantic.db.marshalers')
+    level, propagate = marshalers.level, marshalers.propagate
+    handler = logging.NullHandler()
+    marshalers.addHandler(handler)
+    marshalers.setLevel(request.param)
+    marshalers.propagate = False
+    yield request.param
+    marshalers.removeHandler(handler)
+    marshalers.setLevel(level)
+    marshalers.propagate = propagate
+
+
+@pytest.mark.benchmark(group='marshaler-logging')
+@pytest.mark.parametrize('spec', LOGGING_SPECS, ids=lambda spec: spec.id, indirect=True)
+def test_construct_table_info_logging(benchmark, catalog, marshaler_log_level):
+    """Time `construct_table_info` with the marshaler loggers at INFO and at DEBUG."""
+    tables = benchmark(catalog.construct_tables)
+    assert len(tables) == len({row[1] for row in catalog.columns})
@@ -0,0 +1,7 @@
+"""Benchmarks for marshaling catalog rows into TableInfo objects."""
+
+
+def test_construct_table_info(benchmark, catalog):
+    """Time `construct_table_info` over the synthetic catalog rows."""
+    tables = benchmark(catalog.construct_tables)
+    assert len(tables) == len({row[1] for row in catalog.columns})
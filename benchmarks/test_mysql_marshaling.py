@@ -0,0 +1,116 @@
+"""Benchmarks for marshaling MySQL column rows, as tuples and as dictionary-cursor rows.
+
+The MySQL schema reader fetches tuples, and the marshaler reads the column details by position
+(see `supabase_pydantic.db.drivers.mysql.rows`). `test_mysql_dict_rows` keeps the former path
+for comparison: a dict per row from a dictionary cursor, converted back to a tuple by key.
+"""
+
+from typing import Any
+
+import pytest
+
+from supabase_pydantic.db.connectors.mysql.schema_reader import MySQLSchemaReader
+from supabase_pydantic.db.drivers.mysql.rows import COLUMN_ROW
+from supabase_pydantic.db.marshalers.mysql.column import MySQLColumnMarshaler
+from supabase_pydantic.db.marshalers.mysql.constraints import MySQLConstraintMarshaler
+from supabase_pydantic.db.marshalers.mysql.relationship import MySQLRelationshipMarshaler
+from supabase_pydantic.db.marshalers.mysql.schema import MySQLSchemaMarshaler
+from supabase_pydantic.db.marshalers.schema import get_table_details_from_columns
+
+# (data_type, column_type, max_length), cycled through per table
+MYSQL_COLUMN_TYPES = [
+    ('int', 'int', None),
+    ('varchar', 'varchar(255)', 255),
+    ('datetime', 'datetime', None),
+    ('tinyint', 'tinyint(1)', None),
+    ('enum', "enum('alpha','beta','gamma')", 5),
+    ('decimal', 'decimal(10,2)', None),
+    ('json', 'json', None),
+    ('set', "set('x','y')", 3),
+]
+
+COLUMNS_PER_TABLE = 20
+ROW_COUNTS = [10_000, 100_000]
+
+
+def make_mysql_columns(rows: int, schema: str = 'bench') -> list[tuple[Any, ...]]:
+    """Build column rows shaped like the results of GET_ALL_PUBLIC_TABLES_AND_COLUMNS."""
+    columns = []
+    for i in range(rows):
+        table, c = divmod(i, COLUMNS_PER_TABLE)
+        data_type, column_type, max_length = MYSQL_COLUMN_TYPES[c % len(MYSQL_COLUMN_TYPES)]
+        identity = 'IDENTITY' if c == 0 else None
+        columns.append(
+            (schema, f'table_{table}', f'col_{c}', None, 'YES', data_type, max_length, 'BASE TABLE', identity,
+             data_type, None, '', column_type)
+        )  # fmt: skip
+    return columns
+
+
+def as_dict_rows(columns: list[tuple[Any, ...]]) -> list[dict[str, Any]]:
+    """Key each row by upper-case column name, as a MySQL 8 dictionary cursor returns them."""
+    names = [name.upper() for name in COLUMN_ROW.fields]
+    return [dict(zip(names, row)) for row in columns]
+
+
+def dict_process_columns(column_data: list[dict[str, Any]]) -> list[tuple]:
+    """Convert dictionary-cursor rows back to the shared column tuples, by key."""
+    return [
+        (
+            column.get('TABLE_SCHEMA'),
+            column.get('TABLE_NAME'),
+            column.get('COLUMN_NAME'),
+            column.get('COLUMN_DEFAULT'),
+            column.get('IS_NULLABLE'),
+            column.get('DATA_TYPE'),
+            column.get('CHARACTER_MAXIMUM_LENGTH'),
+            column.get('TABLE_TYPE', 'BASE TABLE'),
+            column.get('IDENTITY_GENERATION'),
+            column.get('UDT_NAME', column.get('DATA_TYPE')),
+            column.get('ARRAY_ELEMENT_TYPE'),
+            column.get('DESCRIPTION', ''),
+        )
+        for column in column_data
+    ]
+
+
+@pytest.fixture(scope='module')
+def marshaler() -> MySQLSchemaMarshaler:
+    """A MySQL schema marshaler with the MySQL component marshalers."""
+    return MySQLSchemaMarshaler(MySQLColumnMarshaler(), MySQLConstraintMarshaler(), MySQLRelationshipMarshaler())
+
+
+@pytest.fixture(scope='module', params=ROW_COUNTS, ids=lambda rows: f'{rows}cols')
+def mysql_columns(request: pytest.FixtureRequest) -> list[tuple[Any, ...]]:
+    """Column rows for a MySQL schema."""
+    return make_mysql_columns(request.param)
+
+
+def test_mysql_tuple_rows(benchmark, marshaler, mysql_columns):
+    """Time marshaling tuple rows into tables."""
+    tables = benchmark(marshaler.get_table_details_from_columns, mysql_columns)
+    assert sum(len(t.columns) for t in tables.values()) == len(mysql_columns)
+
+
+def test_mysql_dict_rows(benchmark, marshaler, mysql_columns):
+    """Time the former path: building a dict per row, then converting it back by key."""
+
+    def run() -> dict:
+        processed = dict_process_columns(as_dict_rows(mysql_columns))
+        return get_table_details_from_columns(processed, column_marshaler=marshaler.column_marshaler)
+
+    tables = benchmark(run)
+    assert sum(len(t.columns) for t in tables.values()) == len(mysql_columns)
+
+
+def test_mysql_enum_types_from_columns(benchmark, mysql_columns):
+    """Time deriving enum types and type mappings from the column rows."""
+    reader = MySQLSchemaReader(connector=None)  # type: ignore[arg-type]
+    reader.execute_query = lambda *args, **kwargs: mysql_columns  # type: ignore[method-assign]
+
+    def run() -> tuple[list, list]:
+        reader.get_columns(None, 'bench')
+        return reader.get_user_defined_types(None, 'bench'), reader.get_type_mappings(None, 'bench')
+
+    enum_types, type_mappings = benchmark(run)
+    assert len(enum_types) < len(type_mappings)
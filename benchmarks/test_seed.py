@@ -0,0 +1,22 @@
+"""Benchmarks for insert ordering and seed data generation."""
+
+import pytest
+from synthetic import SEED_SPECS
+
+from supabase_pydantic.db.graph import sort_tables_for_insert
+from supabase_pydantic.db.seed import SeedContext, generate_seed_data
+
+
+def test_sort_tables_for_insert(benchmark, tables):
+    """Time `sort_tables_for_insert`."""
+    base_tables, _ = benchmark(sort_tables_for_insert, tables)
+    assert len(base_tables) == len(tables)
+
+
+@pytest.mark.parametrize('spec', SEED_SPECS, ids=lambda spec: spec.id, indirect=True)
+def test_generate_seed_data(benchmark, tables):
+    """Time `generate_seed_data` with a fixed seed, so every round generates the same data."""
+    seed_data = benchmark.pedantic(
+        generate_seed_data, setup=lambda: ((tables, SeedContext(0)), {}), rounds=3, warmup_rounds=0
+    )
+    assert len(seed_data) == len(tables)
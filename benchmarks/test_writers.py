@@ -0,0 +1,16 @@
+"""Benchmarks for rendering model files."""
+
+from supabase_pydantic.core.writers.pydantic import PydanticFastAPIWriter
+from supabase_pydantic.core.writers.sqlalchemy import SqlAlchemyFastAPIWriter
+
+
+def test_pydantic_fastapi_writer(benchmark, tables, tmp_path):
+    """Time `PydanticFastAPIWriter.write`."""
+    writer = PydanticFastAPIWriter(tables, str(tmp_path / 'schemas.py'))
+    assert 'class Table0BaseSchema' in benchmark(writer.write)
+
+
+def test_sqlalchemy_fastapi_writer(benchmark, tables, tmp_path):
+    """Time `SqlAlchemyFastAPIWriter.write`."""
+    writer = SqlAlchemyFastAPIWriter(tables, str(tmp_path / 'database.py'))
+    assert 'class Table0' in benchmark(writer.write)
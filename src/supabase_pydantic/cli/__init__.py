@@ -4,12 +4,22 @@ from typing import Any
 
 import click
 
-from supabase_pydantic.cli.commands.clean import clean
-from supabase_pydantic.cli.commands.gen import gen
+from supabase_pydantic.cli.common import LazyGroup
 from supabase_pydantic.utils.logging import setup_logging
 
+# Subcommands are imported on first use, so `--help` and `clean` skip the database, writer
+# and seed data modules that `gen` needs.
+LAZY_SUBCOMMANDS = {
+    'clean': (
+        'supabase_pydantic.cli.commands.clean:clean',
+        'Clean the project directory by removing generated files and clearing caches.',
+    ),
+    'gen': ('supabase_pydantic.cli.commands.gen:gen', 'Generates code with specified configurations.'),
+    'watch': ('supabase_pydantic.cli.commands.watch:watch', 'Regenerates code whenever the database schema changes.'),
+}
 
-@click.group(invoke_without_command=True)
+
+@click.group(cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS, invoke_without_command=True)
 @click.pass_context
 def cli(ctx: Any) -> None:
     """A CLI tool for generating Pydantic models from a Supabase/PostgreSQL database.
@@ -35,9 +45,5 @@ def cli(ctx: Any) -> None:
         return
 
 
-# Register commands
-cli.add_command(clean)
-cli.add_command(gen)
-
 if __name__ == '__main__':
     cli()
@@ -1,5 +1,7 @@
 import logging
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
 from urllib.parse import urlparse
 
 import click
@@ -7,19 +9,31 @@ from click_option_group import OptionGroup, RequiredMutuallyExclusiveOptionGroup
 
 from supabase_pydantic.cli.common import (
     framework_choices,
+    load_config,
     model_choices,
 )
 from supabase_pydantic.core.config import WriterConfig, get_standard_jobs
+from supabase_pydantic.core.manifest import ManifestTarget, load_manifest
 from supabase_pydantic.core.writers.factories import FileWriterFactory
+from supabase_pydantic.core.writers.package import PackageWriter
 from supabase_pydantic.db.builder import construct_tables
 from supabase_pydantic.db.connection_manager import setup_database_connection
 from supabase_pydantic.db.constants import DatabaseConnectionType
 from supabase_pydantic.db.database_type import DatabaseType
-from supabase_pydantic.db.models import MySQLConnectionParams
-from supabase_pydantic.db.seed import generate_seed_data, write_seed_file
-from supabase_pydantic.utils.formatting import RuffNotFoundError, format_with_ruff
+from supabase_pydantic.db.factory import CATALOG_FILE_BACKEND, SQL_FILE_BACKEND, Backend
+from supabase_pydantic.db.models import (
+    CatalogFileConnectionParams,
+    ConnectionOptions,
+    MySQLConnectionParams,
+    SqlFileConnectionParams,
+    TableInfo,
+)
+from supabase_pydantic.db.snapshot import read_snapshot_header
+from supabase_pydantic.db.table_filter import TableFilter
+from supabase_pydantic.utils.formatting import RuffNotFoundError, format_many_with_ruff, format_with_ruff
 from supabase_pydantic.utils.io import get_working_directories
 from supabase_pydantic.utils.logging import setup_logging
+from supabase_pydantic.utils.profiling import DEEP_PROFILERS, Profiler, deep_profile, profiling, span
 
 # Get Logger
 logger = logging.getLogger(__name__)
@@ -81,6 +95,445 @@ def _resolve_level(log_level: str | None, debug: bool, verbose: int, quiet: int)
     return candidate
 
 
+def _start_profiling(profile: bool, profile_output: str | None, profile_deep: str | None) -> Profiler | None:
+    """Enable profiling for the rest of the current command, reporting when it finishes.
+
+    The per-stage summary is printed to stderr, and written as a Chrome trace to
+    `profile_output` if given. A deep profiler's output is written next to it.
+    """
+    if not (profile or profile_output or profile_deep):
+        return None
+
+    ctx = click.get_current_context()
+    profiler: Profiler = ctx.with_resource(profiling())
+
+    def report() -> None:
+        click.echo(f'\nProfile summary:\n{profiler.format_summary()}', err=True)
+        if profile_output:
+            profiler.write(profile_output)
+            logger.info(f'Profile trace written to {profile_output} (open in chrome://tracing or Perfetto)')
+
+    ctx.call_on_close(report)
+
+    if profile_deep:
+        deep_output = None
+        if profile_output:
+            deep_output = os.path.splitext(profile_output)[0] + ('.prof' if profile_deep == 'cprofile' else '.html')
+        ctx.with_resource(deep_profile(profile_deep, deep_output))
+
+    return profiler
+
+
+def configure_jobs(
+    models: tuple[str, ...],
+    frameworks: tuple[str, ...],
+    dirs: dict[str, str | None],
+    schemas: tuple[str, ...],
+    table_dict: dict[str, list[TableInfo]],
+    db_type: DatabaseType,
+) -> dict[str, dict[str, WriterConfig]]:
+    """Configure the enabled writer jobs for each schema."""
+    std_jobs = get_standard_jobs(models, frameworks, dirs, schemas)
+    jobs: dict[str, dict[str, WriterConfig]] = {}
+
+    # For MySQL, ensure that job configuration includes the actual schema name and not just 'public'
+    if db_type == DatabaseType.MYSQL:
+        # Get the actual schema names from table_dict (excluding the synthetic 'public')
+        actual_schemas = [s for s in table_dict.keys()]
+        if actual_schemas and 'public' in std_jobs:
+            logger.info(f'Adjusting job configuration to include MySQL schemas: {", ".join(actual_schemas)}')
+            # Create a modified std_jobs that includes actual MySQL schema names
+            for schema in actual_schemas:
+                if schema not in std_jobs:
+                    std_jobs[schema] = std_jobs['public']
+
+    for k, v in std_jobs.items():
+        jobs[k] = {}
+        for job, c in v.items():
+            if c.enabled is False:
+                continue
+            jobs[k][job] = c
+
+    return jobs
+
+
+def write_models(
+    table_dict: dict[str, list[TableInfo]],
+    jobs: dict[str, dict[str, WriterConfig]],
+    db_type: DatabaseType,
+    connection_params: Any,
+    overwrite: bool,
+    layout: str = 'module',
+    **writer_options: Any,
+) -> list[str]:
+    """Run the writer jobs for each schema and return the paths of the written files.
+
+    Args:
+        table_dict: The introspected tables, by schema.
+        jobs: The writer jobs, by schema (see `configure_jobs`).
+        db_type: The database type the tables came from.
+        connection_params: The connection parameters, used to resolve MySQL schema names.
+        overwrite: Whether to overwrite existing files.
+        layout: 'module' to write a single module per job, or 'package' to write a package of
+            lazily loaded modules (see `supabase_pydantic.core.writers.package`).
+        **writer_options: Options passed to each file writer (e.g. `generate_enums`).
+    """
+    # Generate the models; Run jobs
+    paths = []
+    factory = FileWriterFactory()
+
+    # Process each schema
+    for s, j in jobs.items():  # s = schema, j = jobs
+        # For MySQL, the database name in connection parameters might be different from the schemas found
+        # by the database connector. Add a fallback logic.
+        schema_key = s
+        if s not in table_dict and db_type == DatabaseType.MYSQL:
+            # Log available schemas for debugging
+            available_schemas = list(table_dict.keys())
+            logger.info(f"Schema '{s}' not found in table_dict. Available schemas: {available_schemas}")
+
+            # If there's exactly one schema in the database, use that regardless of name
+            if len(table_dict) == 1:
+                actual_schema = next(iter(table_dict.keys()))
+                logger.info(f"Using the only available schema '{actual_schema}' instead of '{s}'")
+                schema_key = actual_schema
+            # If the database has a 'public' schema (which is uncommon in MySQL but possible)
+            elif 'public' in table_dict and s == 'public':
+                logger.info("Using 'public' schema directly.")
+                schema_key = 'public'
+            # If job is for 'public' but we have a schema with same name as database
+            elif (
+                s == 'public'
+                and isinstance(connection_params, MySQLConnectionParams)
+                and connection_params.dbname in table_dict
+            ):
+                schema_key = connection_params.dbname
+                logger.info(f"Using database name '{schema_key}' instead of 'public'")
+            # In other cases, try to find a matching schema
+            else:
+                logger.error(f"Could not find schema '{s}' in available schemas: {available_schemas}")
+                continue
+
+        # Get tables for the current schema (using the potentially corrected schema key)
+        if schema_key not in table_dict:
+            logger.error(f"Schema '{schema_key}' not found in table_dict, skipping")
+            continue
+
+        tables = table_dict[schema_key]
+        # Sort tables by name
+        tables.sort(key=lambda x: x.name)
+
+        # Process each job for the current schema
+        for job, c in j.items():  # c = config
+            logger.info(f'Generating {job} models...')
+            with span('render', job=job, schema=s):
+                writer = factory.get_file_writer(
+                    tables,
+                    c.fpath(),
+                    c.file_type,
+                    c.framework_type,
+                    database_type=db_type,
+                    **writer_options,
+                )
+                if layout == 'package':
+                    # A package is always regenerated in place; there are no versioned copies
+                    package = PackageWriter(writer)
+                    paths += package.save()
+                    p = str(package.directory)
+                else:
+                    p, vf = writer.save(overwrite)
+                    paths += [p, vf] if vf is not None else [p]
+            logger.info(f"{job} models generated successfully for schema '{s}': {p}")
+
+    return paths
+
+
+def format_files(paths: list[str], batch: bool = False) -> None:
+    """Format the generated files with ruff, logging (not raising) any failure.
+
+    Args:
+        paths: The files to format.
+        batch: Run each ruff step once for all the files, rather than once per file.
+    """
+    groups = [paths] if batch and paths else [[p] for p in paths]
+    for group in groups:
+        files = ', '.join(group)
+        try:
+            if batch:
+                format_many_with_ruff(group)
+            else:
+                format_with_ruff(group[0])
+            logger.info(f'File formatted successfully: {files}')
+        except RuffNotFoundError as e:
+            logger.warning(str(e))  # The exception message is already descriptive
+        except Exception as e:  # Catch any other unexpected errors during formatting
+            logger.error(f'An unexpected error occurred while formatting {files}: {str(e)}')
+
+
+def resolve_source(
+    local: bool,
+    db_url: str | None,
+    from_sql: str | None,
+    from_catalog: str | None,
+    db_type: str | None,
+) -> tuple[DatabaseConnectionType, Any, DatabaseType, Backend | None] | None:
+    """Resolve a connection source to its connection parameters, logging (not raising) any error.
+
+    Returns:
+        The connection type, the connection parameters, the database type, and the backend that
+        reads the schema when it is not read from the database itself; or None on error.
+    """
+    # The backend that reads the schema, when it is not read from the database itself
+    source: Backend | None = None
+    if from_sql is not None:
+        # SQL files are read as PostgreSQL DDL into an in-memory catalog
+        if db_type and db_type.lower() != 'postgres':
+            logger.error('--from-sql reads PostgreSQL DDL only. Exiting...')
+            return None
+        conn_type = DatabaseConnectionType.SQL_FILE
+        connection_params: Any = SqlFileConnectionParams(paths=[from_sql])
+        detected_db_type = DatabaseType.POSTGRES
+        source = SQL_FILE_BACKEND
+        logger.info(f'Reading the schema from SQL files: {from_sql}')
+    elif from_catalog is not None:
+        # The snapshot's header names the database type its result sets came from
+        try:
+            detected_db_type = DatabaseType(read_snapshot_header(from_catalog)['db_type'])
+        except (OSError, ValueError) as e:
+            logger.error(f'Error reading catalog snapshot: {e}')
+            return None
+        if db_type and db_type.lower() != detected_db_type.value:
+            logger.error(f'The catalog snapshot was taken from {detected_db_type.value}, not {db_type}. Exiting...')
+            return None
+        conn_type = DatabaseConnectionType.CATALOG_FILE
+        connection_params = CatalogFileConnectionParams(path=from_catalog)
+        source = CATALOG_FILE_BACKEND
+        logger.info(f'Replaying catalog snapshot of a {detected_db_type.value} database: {from_catalog}')
+    else:
+        # setup database connection
+        try:
+            # Convert db_type string to DatabaseType enum if provided
+            database_type = None
+            if db_type:
+                if db_type.lower() == 'postgres':
+                    database_type = DatabaseType.POSTGRES
+                elif db_type.lower() == 'mysql':
+                    database_type = DatabaseType.MYSQL
+                else:
+                    logger.error(f'Unsupported database type: {db_type}')
+                    return None
+                logger.info(f'Using specified database type: {database_type.value}')
+
+            # Set up the database connection using our connection manager
+            conn_type = DatabaseConnectionType.DB_URL if db_url else DatabaseConnectionType.LOCAL
+            with span('connection_setup'):
+                connection_params, detected_db_type = setup_database_connection(
+                    conn_type=conn_type, db_type=database_type, env_file=None, local=local, db_url=db_url
+                )
+
+            logger.info(f'Successfully established connection parameters for {detected_db_type.value}')
+
+        except Exception as e:
+            logger.error(f'Error setting up database connection: {str(e)}')
+            return None
+
+    return conn_type, connection_params, detected_db_type, source
+
+
+def resolve_schemas(
+    all_schemas: bool,
+    schema: tuple[str, ...],
+    detected_db_type: DatabaseType,
+    conn_type: DatabaseConnectionType,
+    connection_params: Any,
+) -> tuple[str, ...]:
+    """Determine the schemas to process; for MySQL, the default schema is the database name."""
+    schemas = ('*',) if all_schemas else tuple(schema)  # Use '*' as an indicator to fetch all schemas
+
+    # For MySQL, the default schema is the database name, not 'public'
+    if detected_db_type == DatabaseType.MYSQL and schemas == ('public',):
+        # If using DB_URL, extract database name from connection parameters
+        if conn_type == DatabaseConnectionType.DB_URL and connection_params.db_url is not None:
+            # Debug log original connection params
+            logger.debug(f'MySQL connection parameters before URL parsing: dbname={connection_params.dbname}')
+
+            parsed_url_debug = urlparse(connection_params.db_url)
+            logger.debug(f'MySQL db_url path: {parsed_url_debug.path}')
+
+            # For MySQL, we need to use the database name as the schema
+            if isinstance(connection_params, MySQLConnectionParams):
+                # Parse the database name from the URL directly
+                db_name = parsed_url_debug.path.strip('/')
+
+                if db_name:
+                    schemas = (db_name,)
+                    logger.info(
+                        f"Using MySQL database name '{schemas[0]}' extracted from URL as schema instead of 'public'"
+                    )
+                else:
+                    schemas = ('*',)
+                    logger.info("Using all available MySQL schemas since database name couldn't be determined")
+        else:
+            # Use extracted dbname if available, otherwise use wildcard
+            if isinstance(connection_params, MySQLConnectionParams) and connection_params.dbname:
+                schemas = (connection_params.dbname,)
+                logger.info(f"Using MySQL database name '{schemas[0]}' as schema instead of 'public'")
+            else:
+                schemas = ('*',)
+                logger.info("Using all available MySQL schemas since 'public' doesn't exist in MySQL")
+
+    return schemas
+
+
+def introspect(
+    conn_type: DatabaseConnectionType,
+    db_type: DatabaseType,
+    schemas: tuple[str, ...],
+    connection_params: Any,
+    disable_model_prefix_protection: bool,
+    **options: Any,
+) -> tuple[dict[str, list[TableInfo]], tuple[str, ...]] | None:
+    """Read the tables of the schemas, skipping schemas without tables.
+
+    Args:
+        conn_type: The connection type.
+        db_type: The database type.
+        schemas: The schemas to read; ('*',) reads every schema.
+        connection_params: The connection parameters.
+        disable_model_prefix_protection: If True, disable model_ prefix protection.
+        **options: Options passed to `construct_tables` (e.g. `table_filter`).
+
+    Returns:
+        The tables by schema, and the schemas read (the schemas found, for ('*',)); or None if
+        no table information was obtained.
+    """
+    with span('introspection'):
+        table_dict = construct_tables(
+            conn_type=conn_type,
+            db_type=db_type,
+            schemas=schemas,
+            disable_model_prefix_protection=disable_model_prefix_protection,
+            connection_params=connection_params.to_dict(),
+            **options,
+        )
+    if not table_dict:
+        return None
+
+    schemas_with_no_tables = [k for k, v in table_dict.items() if len(v) == 0]
+    if len(schemas_with_no_tables) > 0:
+        logger.warning(f'The following schemas have no tables and will be skipped: {", ".join(schemas_with_no_tables)}')
+    table_dict = {k: v for k, v in table_dict.items() if len(v) > 0}
+    if schemas == ('*',):  # Reset schemas if all schemas were read
+        schemas = tuple(table_dict.keys())
+    return table_dict, schemas
+
+
+def run_manifest(
+    manifest: str,
+    concurrency: int,
+    overwrite: bool,
+    connection_options: ConnectionOptions | None = None,
+    layout: str = 'module',
+    **writer_options: Any,
+) -> list[str]:
+    """Generate code for every target of a manifest in one process.
+
+    Targets are introspected concurrently, on up to `concurrency` threads; their code is then
+    rendered in up to `concurrency` processes, and every generated file is formatted in a single
+    ruff batch at the end.
+
+    Args:
+        manifest: The manifest file (see `supabase_pydantic.core.manifest`).
+        concurrency: The number of targets to introspect, and to render, at once.
+        overwrite: Whether to overwrite existing files.
+        connection_options: How each target's connections are opened, if not the defaults.
+        layout: The layout of the generated code (see `write_models`).
+        **writer_options: Options passed to each file writer (e.g. `generate_enums`); its
+            `disable_model_prefix_protection` also applies to introspection.
+
+    Returns:
+        The paths of the written files.
+
+    Raises:
+        click.ClickException: If the manifest is invalid, or any target failed.
+    """
+    try:
+        targets = load_manifest(manifest)
+    except (OSError, ValueError) as e:
+        raise click.ClickException(str(e)) from e
+    for target in targets:
+        for key, choices in (('type', model_choices), ('framework', framework_choices)):
+            invalid = [v for v in getattr(target, key) if v not in choices]
+            if invalid:
+                raise click.ClickException(f'Invalid {key} for target {target.name!r}: {", ".join(invalid)}')
+    logger.info(f'Generating {len(targets)} target(s) from {manifest} with concurrency {concurrency}')
+    disable_model_prefix_protection = writer_options.get('disable_model_prefix_protection', False)
+
+    def introspect_target(target: ManifestTarget) -> tuple[Any, ...] | None:
+        with span('target', target=target.name):
+            try:
+                resolved = resolve_source(
+                    target.local, target.db_url, target.from_sql, target.from_catalog, target.db_type
+                )
+                if resolved is None:
+                    return None
+                conn_type, connection_params, db_type, source = resolved
+                schemas = resolve_schemas(target.all_schemas, target.schemas, db_type, conn_type, connection_params)
+                options: dict[str, Any] = {}
+                if source is not None:
+                    options['source'] = source
+                if target.workers > 1:
+                    options['workers'] = target.workers
+                if connection_options is not None:
+                    options['connection_options'] = connection_options
+                table_filter = TableFilter(include=target.include_tables, exclude=target.exclude_tables)
+                if table_filter:
+                    options['table_filter'] = table_filter
+                introspected = introspect(
+                    conn_type, db_type, schemas, connection_params, disable_model_prefix_protection, **options
+                )
+            except Exception as e:
+                logger.error(f'Target {target.name!r} failed: {e}')
+                return None
+        if introspected is None:
+            logger.error(f'Target {target.name!r}: no table information obtained from the database')
+            return None
+        table_dict, schemas = introspected
+        dirs = get_working_directories(target.dir, target.framework, auto_create=True)
+        jobs = configure_jobs(target.type, target.framework, dirs, schemas, table_dict, db_type)
+        return table_dict, jobs, db_type, connection_params, overwrite, layout
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(targets))) as threads:
+        renders = dict(zip((t.name for t in targets), threads.map(introspect_target, targets)))
+    failed = [name for name, args in renders.items() if args is None]
+
+    paths: list[str] = []
+    ready = {name: args for name, args in renders.items() if args is not None}
+    if concurrency > 1 and len(ready) > 1:
+        # Rendering is CPU-bound; each target's writers run in their own process
+        with span('render.pool', targets=len(ready)), ProcessPoolExecutor(min(concurrency, len(ready))) as processes:
+            futures = {name: processes.submit(write_models, *args, **writer_options) for name, args in ready.items()}
+            for name, future in futures.items():
+                try:
+                    paths += future.result()
+                except Exception as e:
+                    logger.error(f'Target {name!r} failed to render: {e}')
+                    failed.append(name)
+    else:
+        for name, args in ready.items():
+            try:
+                paths += write_models(*args, **writer_options)
+            except Exception as e:
+                logger.error(f'Target {name!r} failed to render: {e}')
+                failed.append(name)
+
+    format_files(paths, batch=True)
+    if failed:
+        raise click.ClickException(f'{len(failed)} of {len(targets)} target(s) failed: {", ".join(failed)}')
+    logger.info(f'Generated {len(targets)} target(s): {len(paths)} file(s)')
+    return paths
+
+
 @click.command(short_help='Generates code with specified configurations.')  # noqa
 @generator_config.option(
     '-t',
@@ -112,6 +565,21 @@ def _resolve_level(log_level: str | None, debug: bool, verbose: int, quiet: int)
     default=False,
     help='Generate seed data for the tables if possible.',
 )
+@generator_config.option(
+    '--seed-rng',
+    'seed_rng',
+    type=int,
+    default=None,
+    help='Seed the random number generators used for seed data, making the generated data reproducible.',
+)
+@generator_config.option(
+    '--seed-fk-skew',
+    'seed_fk_skew',
+    type=click.FloatRange(min=0),
+    default=0.0,
+    show_default=True,
+    help='Zipf exponent for picking foreign key values in seed data. 0 is uniform; higher values create hot keys.',
+)
 @generator_config.option('--all-schemas', is_flag=True, help='Process all schemas in the database.')
 @generator_config.option(
     '--schema',
@@ -119,6 +587,20 @@ def _resolve_level(log_level: str | None, debug: bool, verbose: int, quiet: int)
     default=['public'],
     help='Specify one or more schemas to include. Defaults to public.',
 )
+@generator_config.option(
+    '--include-table',
+    'include_tables',
+    multiple=True,
+    help='Only generate tables matching this glob (or regular expression, prefixed with "re:"); repeatable. '
+    'Tables referenced by foreign keys are included too. Defaults to include_tables in [tool.supabase_pydantic].',
+)
+@generator_config.option(
+    '--exclude-table',
+    'exclude_tables',
+    multiple=True,
+    help='Skip tables matching this glob (or regular expression, prefixed with "re:"); repeatable. '
+    'Defaults to exclude_tables in [tool.supabase_pydantic].',
+)
 @connect_sources.option(
     '--local',
     is_flag=True,
@@ -129,6 +611,70 @@ def _resolve_level(log_level: str | None, debug: bool, verbose: int, quiet: int)
     type=str,
     help='Use database URL for connection.',
 )
+@connect_sources.option(
+    '--from-sql',
+    type=click.Path(exists=True, file_okay=True, dir_okay=True),
+    help='Read the schema from a PostgreSQL DDL file (e.g., pg_dump --schema-only output) or a folder of '
+    'migration files, without connecting to a database.',
+)
+@connect_sources.option(
+    '--from-catalog',
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+    help='Replay a catalog snapshot written by --dump-catalog, without connecting to a database.',
+)
+@connect_sources.option(
+    '--manifest',
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+    help='Generate code for every target in this TOML manifest, in one process; the other connection, '
+    'schema, table and output options are taken from each target.',
+)
+@click.option(
+    '--concurrency',
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help='With --manifest, the number of targets to introspect and render at once.',
+)
+@click.option(
+    '--dump-catalog',
+    type=click.Path(file_okay=True, dir_okay=False, writable=True),
+    default=None,
+    help='Save the raw introspection result sets to this catalog snapshot file (gzip-compressed if it ends '
+    'in .gz), for replaying with --from-catalog.',
+)
+@click.option(
+    '--workers',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help='Read several schemas over this many database connections at once, all from the same snapshot.',
+)
+@click.option(
+    '--connect-timeout',
+    type=click.FloatRange(min=0, min_open=True),
+    default=ConnectionOptions.connect_timeout,
+    show_default=True,
+    help='Seconds to wait for a database connection before retrying.',
+)
+@click.option(
+    '--connect-retries',
+    type=click.IntRange(min=0),
+    default=ConnectionOptions.retries,
+    show_default=True,
+    help='Retry a failed database connection this many times, with exponential backoff.',
+)
+@click.option(
+    '--statement-timeout',
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help='Cancel introspection queries running longer than this many seconds.',
+)
+@click.option(
+    '--pooler/--no-pooler',
+    default=None,
+    help='Whether the database URL goes through a transaction-mode pooler (PgBouncer, Supavisor); '
+    'detected from the port (6543) if not set. The catalog is then read in a single statement.',
+)
 @click.option(
     '--db-type',
     type=click.Choice(['postgres', 'mysql']),
@@ -145,6 +691,14 @@ def _resolve_level(log_level: str | None, debug: bool, verbose: int, quiet: int)
     help='The directory to save files',
     required=False,
 )
+@click.option(
+    '--layout',
+    type=click.Choice(['module', 'package']),
+    default='module',
+    show_default=True,
+    help="Write each schema's models as a single module, or as a package with a module per group of related "
+    'tables that is only imported when one of its models is used.',
+)
 @click.option(
     '--no-overwrite',
     'overwrite',
@@ -230,6 +784,31 @@ def _resolve_level(log_level: str | None, debug: bool, verbose: int, quiet: int)
     show_default=True,
     help='Append milliseconds to timestamps.',
 )
+@click.option(
+    '--log-queue/--no-log-queue',
+    default=False,
+    show_default=True,
+    help='Write log output from a background thread, so generation never waits on the terminal.',
+)
+@click.option(
+    '--profile',
+    is_flag=True,
+    default=False,
+    help='Time each stage (connection, catalog queries, marshaling, rendering, formatting, seeding) '
+    'and print a summary.',
+)
+@click.option(
+    '--profile-output',
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help='Write the stage timings as a Chrome trace JSON file (implies --profile).',
+)
+@click.option(
+    '--profile-deep',
+    type=click.Choice(DEEP_PROFILERS, case_sensitive=False),
+    default=None,
+    help='Also run a function-level profiler (pyinstrument must be installed separately).',
+)
 def gen(
     models: tuple[str],
     frameworks: tuple[str],
@@ -239,13 +818,28 @@ def gen(
     create_seed_data: bool,
     all_schemas: bool,
     schema: tuple[str],
+    include_tables: tuple[str, ...] = (),
+    exclude_tables: tuple[str, ...] = (),
     local: bool = False,
     db_url: str | None = None,
+    from_sql: str | None = None,
+    from_catalog: str | None = None,
+    manifest: str | None = None,
+    concurrency: int = 4,
+    dump_catalog: str | None = None,
+    workers: int = 1,
+    connect_timeout: float | None = ConnectionOptions.connect_timeout,
+    connect_retries: int = ConnectionOptions.retries,
+    statement_timeout: float | None = None,
+    pooler: bool | None = None,
     db_type: str | None = None,
+    layout: str = 'module',
     no_crud_models: bool = False,
     no_enums: bool = False,
     disable_model_prefix_protection: bool = False,
     singular_names: bool = False,
+    seed_rng: int | None = None,
+    seed_fk_skew: float = 0.0,
     # NEW / UPDATED:
     log_level: str | None = None,
     verbose: int = 0,
@@ -254,6 +848,10 @@ def gen(
     log_timefmt: str = 'YYYY-MM-DD HH:mm:ss',
     datefmt: str = '%Y-%m-%d %H:%M:%S',
     log_ms: bool = False,
+    log_queue: bool = False,
+    profile: bool = False,
+    profile_output: str | None = None,
+    profile_deep: str | None = None,
 ) -> None:
     """Generate models from a database."""
     # logging setup
@@ -265,6 +863,7 @@ def gen(
         stdlib_datefmt=datefmt,
         include_ms=log_ms,
         force=True,  # reliably override any pre-configured handlers
+        enqueue=log_queue,
     )
 
     # example: reflect the resolved level
@@ -274,197 +873,121 @@ def gen(
         f'timefmt={log_timefmt}/{datefmt}, ms={log_ms}'
     )
 
-    # validate connection options and prepare environment variables
-    if not local and db_url is None:
-        logger.error('Please provide a valid connection source (--local or --db-url). Exiting...')
+    _start_profiling(profile, profile_output, profile_deep.lower() if profile_deep else None)
+
+    # How connections are opened; passed on only if not the defaults
+    connection_options: ConnectionOptions | None = ConnectionOptions(
+        connect_timeout=connect_timeout, statement_timeout=statement_timeout, retries=connect_retries, pooler=pooler
+    )
+    if connection_options == ConnectionOptions():
+        connection_options = None
+
+    if manifest is not None:
+        if create_seed_data or dump_catalog is not None:
+            logger.warning('--seed and --dump-catalog are not supported with --manifest; skipping them')
+        if include_tables or exclude_tables:
+            logger.warning(
+                '--include-table and --exclude-table are ignored with --manifest; '
+                'set include_tables and exclude_tables in its targets or [defaults] instead'
+            )
+        run_manifest(
+            manifest,
+            concurrency,
+            overwrite,
+            connection_options,
+            layout,
+            add_null_parent_classes=null_parent_classes,
+            generate_crud_models=not no_crud_models,
+            generate_enums=not no_enums,
+            disable_model_prefix_protection=disable_model_prefix_protection,
+            singular_names=singular_names,
+        )
         return
 
-    # setup database connection
-    try:
-        # Convert db_type string to DatabaseType enum if provided
-        database_type = None
-        if db_type:
-            if db_type.lower() == 'postgres':
-                database_type = DatabaseType.POSTGRES
-            elif db_type.lower() == 'mysql':
-                database_type = DatabaseType.MYSQL
-            else:
-                logger.error(f'Unsupported database type: {db_type}')
-                return
-            logger.info(f'Using specified database type: {database_type.value}')
-
-        # Set up the database connection using our connection manager
-        conn_type = DatabaseConnectionType.DB_URL if db_url else DatabaseConnectionType.LOCAL
-        connection_params, detected_db_type = setup_database_connection(
-            conn_type=conn_type, db_type=database_type, env_file=None, local=local, db_url=db_url
+    # validate connection options and prepare environment variables
+    if not local and db_url is None and from_sql is None and from_catalog is None:
+        logger.error(
+            'Please provide a valid connection source (--local, --db-url, --from-sql, --from-catalog or --manifest). '
+            'Exiting...'
         )
+        return
 
-        logger.info(f'Successfully established connection parameters for {detected_db_type.value}')
+    # The tables to generate, from the options or else the project configuration
+    if not include_tables and not exclude_tables:
+        config = load_config()
+        include_tables = tuple(config.get('include_tables', ()))
+        exclude_tables = tuple(config.get('exclude_tables', ()))
+    try:
+        table_filter = TableFilter(include=include_tables, exclude=exclude_tables)
+    except ValueError as e:
+        logger.error(f'{e}. Exiting...')
+        return
 
-    except Exception as e:
-        logger.error(f'Error setting up database connection: {str(e)}')
+    resolved = resolve_source(local, db_url, from_sql, from_catalog, db_type)
+    if resolved is None:
         return
+    conn_type, connection_params, detected_db_type, source = resolved
 
     # Get the directories for the generated files
     dirs = get_working_directories(default_directory, frameworks, auto_create=True)
 
     # Determine schemas to process
-    schemas = ('*',) if all_schemas else tuple(schema)  # Use '*' as an indicator to fetch all schemas
-
-    # For MySQL, the default schema is the database name, not 'public'
-    if detected_db_type == DatabaseType.MYSQL and schemas == ('public',):
-        # If using DB_URL, extract database name from connection parameters
-        if conn_type == DatabaseConnectionType.DB_URL and connection_params.db_url is not None:
-            # Debug log original connection params
-            logger.debug(f'MySQL connection parameters before URL parsing: dbname={connection_params.dbname}')
-
-            parsed_url_debug = urlparse(connection_params.db_url)
-            logger.debug(f'MySQL db_url path: {parsed_url_debug.path}')
-
-            # For MySQL, we need to use the database name as the schema
-            if isinstance(connection_params, MySQLConnectionParams):
-                # Parse the database name from the URL directly
-                db_name = parsed_url_debug.path.strip('/')
-
-                if db_name:
-                    schemas = (db_name,)
-                    logger.info(
-                        f"Using MySQL database name '{schemas[0]}' extracted from URL as schema instead of 'public'"
-                    )
-                else:
-                    schemas = ('*',)
-                    logger.info("Using all available MySQL schemas since database name couldn't be determined")
-        else:
-            # Use extracted dbname if available, otherwise use wildcard
-            if isinstance(connection_params, MySQLConnectionParams) and connection_params.dbname:
-                schemas = (connection_params.dbname,)
-                logger.info(f"Using MySQL database name '{schemas[0]}' as schema instead of 'public'")
-            else:
-                schemas = ('*',)
-                logger.info("Using all available MySQL schemas since 'public' doesn't exist in MySQL")
+    schemas = resolve_schemas(all_schemas, schema, detected_db_type, conn_type, connection_params)
 
     # Generate table information from the database
-    table_dict = construct_tables(
-        conn_type=conn_type,
-        db_type=detected_db_type,
-        schemas=schemas,
-        disable_model_prefix_protection=disable_model_prefix_protection,
-        connection_params=connection_params.to_dict(),
+    options: dict[str, Any] = {}
+    if source is not None:
+        options['source'] = source
+    if dump_catalog is not None:
+        options['dump_catalog'] = dump_catalog
+    if workers > 1:
+        options['workers'] = workers
+    if table_filter:
+        options['table_filter'] = table_filter
+    if connection_options is not None:
+        options['connection_options'] = connection_options
+    introspected = introspect(
+        conn_type, detected_db_type, schemas, connection_params, disable_model_prefix_protection, **options
     )
-    if not table_dict:
+    if introspected is None:
         logger.warning('Exiting; No table information obtained from the database')
         return
-
-    schemas_with_no_tables = [k for k, v in table_dict.items() if len(v) == 0]
-    if len(schemas_with_no_tables) > 0:
-        logger.warning(f'The following schemas have no tables and will be skipped: {", ".join(schemas_with_no_tables)}')
-    table_dict = {k: v for k, v in table_dict.items() if len(v) > 0}
-    if all_schemas:  # Reset schemas if all_schemas is True
-        schemas = tuple(table_dict.keys())
+    table_dict, schemas = introspected
 
     # Configure the writer jobs
-    std_jobs = get_standard_jobs(models, frameworks, dirs, schemas)
-    jobs: dict[str, dict[str, WriterConfig]] = {}
-
-    # For MySQL, ensure that job configuration includes the actual schema name and not just 'public'
-    job_schemas = schemas  # noqa: F841
-    if detected_db_type == DatabaseType.MYSQL:
-        # Get the actual schema names from table_dict (excluding the synthetic 'public')
-        actual_schemas = [s for s in table_dict.keys()]
-        if actual_schemas and 'public' in std_jobs:
-            logger.info(f'Adjusting job configuration to include MySQL schemas: {", ".join(actual_schemas)}')
-            # Create a modified std_jobs that includes actual MySQL schema names
-            for schema in actual_schemas:
-                if schema not in std_jobs:
-                    std_jobs[schema] = std_jobs['public']
-
-    for k, v in std_jobs.items():
-        jobs[k] = {}
-        for job, c in v.items():
-            if c.enabled is False:
-                continue
-            jobs[k][job] = c
+    jobs = configure_jobs(models, frameworks, dirs, schemas, table_dict, detected_db_type)
 
     # Generate the models; Run jobs
-    paths = []
-    factory = FileWriterFactory()
-
-    # Process each schema
-    for s, j in jobs.items():  # s = schema, j = jobs
-        # For MySQL, the database name in connection parameters might be different from the schemas found
-        # by the database connector. Add a fallback logic.
-        schema_key = s
-        if s not in table_dict and detected_db_type == DatabaseType.MYSQL:
-            # Log available schemas for debugging
-            available_schemas = list(table_dict.keys())
-            logger.info(f"Schema '{s}' not found in table_dict. Available schemas: {available_schemas}")
-
-            # If there's exactly one schema in the database, use that regardless of name
-            if len(table_dict) == 1:
-                actual_schema = next(iter(table_dict.keys()))
-                logger.info(f"Using the only available schema '{actual_schema}' instead of '{s}'")
-                schema_key = actual_schema
-            # If the database has a 'public' schema (which is uncommon in MySQL but possible)
-            elif 'public' in table_dict and s == 'public':
-                logger.info("Using 'public' schema directly.")
-                schema_key = 'public'
-            # If job is for 'public' but we have a schema with same name as database
-            elif (
-                s == 'public'
-                and isinstance(connection_params, MySQLConnectionParams)
-                and connection_params.dbname in table_dict
-            ):
-                schema_key = connection_params.dbname
-                logger.info(f"Using database name '{schema_key}' instead of 'public'")
-            # In other cases, try to find a matching schema
-            else:
-                logger.error(f"Could not find schema '{s}' in available schemas: {available_schemas}")
-                continue
-
-        # Get tables for the current schema (using the potentially corrected schema key)
-        if schema_key not in table_dict:
-            logger.error(f"Schema '{schema_key}' not found in table_dict, skipping")
-            continue
-
-        tables = table_dict[schema_key]
-        # Sort tables by name
-        tables.sort(key=lambda x: x.name)
-
-        # Process each job for the current schema
-        for job, c in j.items():  # c = config
-            logger.info(f'Generating {job} models...')
-            p, vf = factory.get_file_writer(
-                tables,
-                c.fpath(),
-                c.file_type,
-                c.framework_type,
-                add_null_parent_classes=null_parent_classes,
-                generate_crud_models=not no_crud_models,
-                generate_enums=not no_enums,
-                disable_model_prefix_protection=disable_model_prefix_protection,
-                singular_names=singular_names,
-                database_type=detected_db_type,
-            ).save(overwrite)
-            paths += [p, vf] if vf is not None else [p]
-            logger.info(f"{job} models generated successfully for schema '{s}': {p}")
+    paths = write_models(
+        table_dict,
+        jobs,
+        detected_db_type,
+        connection_params,
+        overwrite,
+        layout,
+        add_null_parent_classes=null_parent_classes,
+        generate_crud_models=not no_crud_models,
+        generate_enums=not no_enums,
+        disable_model_prefix_protection=disable_model_prefix_protection,
+        singular_names=singular_names,
+    )
 
-    # Format the generated files
-    for p in paths:
-        try:
-            format_with_ruff(p)
-            logger.info(f'File formatted successfully: {p}')
-        except RuffNotFoundError as e:
-            logger.warning(str(e))  # The exception message is already descriptive
-        except Exception as e:  # Catch any other unexpected errors during formatting
-            logger.error(f'An unexpected error occurred while formatting {p}: {str(e)}')
+    # Format the generated files; a package's modules are formatted together
+    format_files(paths, batch=layout == 'package')
 
     # Generate seed data
     if create_seed_data:
+        # Imported here since Faker (and NumPy, if installed) are slow to import and only needed for seeding
+        from supabase_pydantic.db.seed import SeedContext, generate_seed_data, write_seed_file
+
         logger.info('Generating seed data...')
+        seed_context = SeedContext(seed_rng)
+        logger.debug(f'Seed data random seed: {seed_context.seed}')
         for s, j in jobs.items():  # s = schema, j = jobs
-            # Generate seed data
+            # Generate seed data; each schema gets its own stream derived from the run's seed
             tables = table_dict[s]
-            seed_data = generate_seed_data(tables)
+            with span('seed', schema=s):
+                seed_data = generate_seed_data(tables, seed_context.spawn(s), foreign_key_skew=seed_fk_skew)
 
             # Check if seed data was generated
             if len(seed_data) == 0:
@@ -478,5 +1001,6 @@ def gen(
             # Write the seed data
             d = dirs.get('default')
             fname = os.path.join(d if d is not None else 'entities', f'seed_{s}.sql')
-            fpaths = write_seed_file(seed_data, fname, overwrite)
+            with span('seed.write', schema=s):
+                fpaths = write_seed_file(seed_data, fname, overwrite)
             logger.info(f'Seed data generated successfully: {", ".join(fpaths)}')
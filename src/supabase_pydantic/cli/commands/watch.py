@@ -0,0 +1,235 @@
+import logging
+
+import click
+from click_option_group import OptionGroup, RequiredMutuallyExclusiveOptionGroup
+
+from supabase_pydantic.cli.commands.gen import configure_jobs, format_files, write_models
+from supabase_pydantic.cli.common import framework_choices, model_choices
+from supabase_pydantic.db.builder import DatabaseBuilder
+from supabase_pydantic.db.connection_manager import setup_database_connection
+from supabase_pydantic.db.constants import DatabaseConnectionType
+from supabase_pydantic.db.database_type import DatabaseType
+from supabase_pydantic.db.models import TableInfo
+from supabase_pydantic.db.watch import (
+    ChangeTrigger,
+    DDLLogTrigger,
+    FingerprintTrigger,
+    MigrationsTrigger,
+    NotifyTrigger,
+    Watcher,
+    install_ddl_event_triggers,
+)
+from supabase_pydantic.utils.io import get_working_directories
+from supabase_pydantic.utils.logging import setup_logging
+
+# Get Logger
+logger = logging.getLogger(__name__)
+
+# Option groups
+generator_config = OptionGroup('Generator Options', help='Options for generating code.')
+watch_config = OptionGroup('Watch Options', help='Options for detecting schema changes.')
+connect_sources = RequiredMutuallyExclusiveOptionGroup('Connection Configuration', help='The sources of the input data')
+
+TRIGGER_CHOICES = ['ddl-log', 'notify', 'fingerprint']
+
+
+def build_triggers(
+    triggers: tuple[str, ...], schemas: tuple[str, ...], migrations_dir: str | None
+) -> list[ChangeTrigger]:
+    """Create the change triggers selected on the command line."""
+    selected: list[ChangeTrigger] = []
+    if 'ddl-log' in triggers:
+        # Wakes on the same notifications as 'notify', and names the changed tables
+        selected.append(DDLLogTrigger())
+    elif 'notify' in triggers:
+        selected.append(NotifyTrigger())
+    if 'fingerprint' in triggers:
+        selected.append(FingerprintTrigger(schemas))
+    if migrations_dir:
+        selected.append(MigrationsTrigger(migrations_dir))
+    return selected
+
+
+@click.command(short_help='Regenerates code whenever the database schema changes.')
+@generator_config.option(
+    '-t',
+    '--type',
+    'models',
+    multiple=True,
+    default=['pydantic'],
+    show_default=True,
+    type=click.Choice(model_choices, case_sensitive=False),
+    help='The model type to generate.',
+)
+@generator_config.option(
+    '-r',
+    '--framework',
+    'frameworks',
+    multiple=True,
+    default=['fastapi'],
+    show_default=True,
+    type=click.Choice(framework_choices, case_sensitive=False),
+    help='The framework to generate code for.',
+)
+@generator_config.option('--all-schemas', is_flag=True, help='Watch all schemas in the database.')
+@generator_config.option(
+    '--schema',
+    multiple=True,
+    default=['public'],
+    help='Specify one or more schemas to watch. Defaults to public.',
+)
+@generator_config.option(
+    '--null-parent-classes', is_flag=True, default=False, help='Generate null parent classes (Pydantic only).'
+)
+@generator_config.option(
+    '--no-crud-models', is_flag=True, default=False, help='Do not generate Insert and Update models.'
+)
+@generator_config.option('--no-enums', is_flag=True, default=False, help='Do not generate Enum classes.')
+@generator_config.option(
+    '--disable-model-prefix-protection',
+    is_flag=True,
+    default=False,
+    help='Disable Pydantic\'s "model_" prefix protection.',
+)
+@generator_config.option('--singular-names', is_flag=True, default=False, help='Generate singular class names.')
+@generator_config.option(
+    '--layout',
+    type=click.Choice(['module', 'package']),
+    default='module',
+    show_default=True,
+    help="Write each schema's models as a single module, or as a package of lazily imported modules.",
+)
+@watch_config.option(
+    '--trigger',
+    'triggers',
+    multiple=True,
+    default=['fingerprint'],
+    show_default=True,
+    type=click.Choice(TRIGGER_CHOICES, case_sensitive=False),
+    help='How to detect schema changes: read the tables recorded in the DDL log, re-reading only those '
+    'tables; LISTEN for notifications from the DDL event triggers (both need --install-trigger once); '
+    'or poll a fingerprint of the catalog.',
+)
+@watch_config.option(
+    '--migrations-dir',
+    type=click.Path(exists=True, file_okay=False, dir_okay=True),
+    default=None,
+    help='Also regenerate when files in this migrations folder change.',
+)
+@watch_config.option(
+    '--install-trigger',
+    is_flag=True,
+    default=False,
+    help='Install the DDL event triggers and log used by --trigger ddl-log and notify before watching '
+    '(requires superuser).',
+)
+@watch_config.option(
+    '--interval',
+    type=click.FloatRange(min=0.05),
+    default=2.0,
+    show_default=True,
+    help='Seconds between polls.',
+)
+@watch_config.option(
+    '--debounce',
+    type=click.FloatRange(min=0),
+    default=0.5,
+    show_default=True,
+    help='Seconds to wait for further changes before regenerating.',
+)
+@connect_sources.option('--local', is_flag=True, help='Use local database connection.')
+@connect_sources.option('--db-url', type=str, help='Use database URL for connection.')
+@click.option(
+    '-d',
+    '--dir',
+    'default_directory',
+    default='entities',
+    show_default=True,
+    type=click.Path(exists=False, file_okay=False, dir_okay=True, resolve_path=True),
+    help='The directory to save files',
+)
+@click.option(
+    '--log-level',
+    type=click.Choice(['critical', 'error', 'warning', 'info', 'debug', 'trace'], case_sensitive=False),
+    default='info',
+    show_default=True,
+    help='Set the log level.',
+)
+def watch(
+    models: tuple[str, ...],
+    frameworks: tuple[str, ...],
+    all_schemas: bool,
+    schema: tuple[str, ...],
+    null_parent_classes: bool,
+    no_crud_models: bool,
+    no_enums: bool,
+    disable_model_prefix_protection: bool,
+    singular_names: bool,
+    layout: str,
+    triggers: tuple[str, ...],
+    migrations_dir: str | None,
+    install_trigger: bool,
+    interval: float,
+    debounce: float,
+    default_directory: str,
+    local: bool = False,
+    db_url: str | None = None,
+    log_level: str = 'info',
+) -> None:
+    """Watch a PostgreSQL database and regenerate models when its schema changes.
+
+    Keeps one process and one connection open. Each change re-introspects only the affected
+    schemas and rewrites only the files of schemas whose tables changed.
+    """
+    setup_logging(log_level.upper(), force=True)
+    triggers = tuple(t.lower() for t in triggers)
+
+    conn_type = DatabaseConnectionType.DB_URL if db_url else DatabaseConnectionType.LOCAL
+    try:
+        connection_params, db_type = setup_database_connection(
+            conn_type=conn_type, db_type=DatabaseType.POSTGRES, env_file=None, local=local, db_url=db_url
+        )
+    except Exception as e:
+        raise click.ClickException(f'Error setting up database connection: {e}')
+    if db_type != DatabaseType.POSTGRES:
+        raise click.ClickException('watch supports PostgreSQL databases only.')
+
+    schemas = ('*',) if all_schemas else tuple(schema)
+    dirs = get_working_directories(default_directory, frameworks, auto_create=True)
+    builder = DatabaseBuilder(db_type, conn_type, connection_params=connection_params.to_dict())
+
+    if install_trigger:
+        with builder.connector as conn:
+            install_ddl_event_triggers(conn)
+
+    def regenerate(tables: dict[str, list[TableInfo]]) -> None:
+        jobs = configure_jobs(models, frameworks, dirs, tuple(tables), tables, db_type)
+        paths = write_models(
+            tables,
+            jobs,
+            db_type,
+            connection_params,
+            overwrite=True,
+            layout=layout,
+            add_null_parent_classes=null_parent_classes,
+            generate_crud_models=not no_crud_models,
+            generate_enums=not no_enums,
+            disable_model_prefix_protection=disable_model_prefix_protection,
+            singular_names=singular_names,
+        )
+        format_files(paths, batch=layout == 'package')
+        logger.info(f'Regenerated models for schemas: {", ".join(tables)}')
+
+    watcher = Watcher(
+        builder,
+        schemas,
+        regenerate,
+        build_triggers(triggers, schemas, migrations_dir),
+        interval=interval,
+        debounce=debounce,
+        disable_model_prefix_protection=disable_model_prefix_protection,
+    )
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        logger.info('Stopped watching')
@@ -1,5 +1,6 @@
 import logging
 from collections.abc import Callable
+from importlib import import_module
 from typing import Any
 
 import click
@@ -68,3 +69,44 @@ def common_options(f: Callable) -> Callable:
     for decorator in reversed(decorators):
         f = decorator(f)
     return f
+
+
+class LazyGroup(click.Group):
+    """A command group that imports its subcommands only when they are invoked.
+
+    Each lazy subcommand is given as an import path ('package.module:command') and a short
+    help string. `--help` lists the short help without importing anything, so a command's
+    heavy dependencies are only loaded when that command runs.
+    """
+
+    def __init__(self, *args: Any, lazy_subcommands: dict[str, tuple[str, str]] | None = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List the eager and lazy subcommands by name."""
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return the named subcommand, importing it if it is lazy."""
+        if cmd_name not in self.lazy_subcommands:
+            return super().get_command(ctx, cmd_name)
+        module_name, _, attr = self.lazy_subcommands[cmd_name][0].partition(':')
+        command = getattr(import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            raise TypeError(f'Lazy subcommand {cmd_name!r} did not resolve to a click.Command')
+        return command
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """Write the subcommand list, using the stored short help for lazy subcommands."""
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.lazy_subcommands:
+                rows.append((name, self.lazy_subcommands[name][1]))
+                continue
+            command = super().get_command(ctx, name)
+            if command is not None and not command.hidden:
+                rows.append((name, command.get_short_help_str(formatter.width - 6 - len(name))))
+        if rows:
+            with formatter.section('Commands'):
+                formatter.write_dl(rows)
@@ -0,0 +1,116 @@
+"""Manifests: many generation targets, run by a single `gen --manifest` call.
+
+A manifest is a TOML file with a `[[targets]]` table per database, and an optional `[defaults]`
+table whose keys apply to every target that does not set them:
+
+    [defaults]
+    type = ["pydantic"]
+    schemas = ["public"]
+
+    [[targets]]
+    name = "billing"
+    db_url = "${BILLING_DATABASE_URL}"
+    dir = "services/billing/entities"
+
+    [[targets]]
+    name = "search"
+    from_sql = "services/search/migrations"
+    type = ["pydantic", "sqlalchemy"]
+    exclude_tables = ["re:.*_audit"]
+
+Each target names exactly one source: `db_url` (environment variables are expanded), `local`,
+`from_sql` or `from_catalog`. Relative paths are resolved against the manifest's folder, and each
+target must write to its own `dir`.
+"""
+
+import os
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any
+
+import toml
+
+SOURCE_KEYS = ('db_url', 'local', 'from_sql', 'from_catalog')
+
+
+@dataclass
+class ManifestTarget:
+    """One database to generate code for, and how."""
+
+    name: str
+    db_url: str | None = None
+    local: bool = False
+    from_sql: str | None = None
+    from_catalog: str | None = None
+    db_type: str | None = None
+    schemas: tuple[str, ...] = ('public',)
+    all_schemas: bool = False
+    dir: str = 'entities'
+    type: tuple[str, ...] = ('pydantic',)
+    framework: tuple[str, ...] = ('fastapi',)
+    include_tables: tuple[str, ...] = ()
+    exclude_tables: tuple[str, ...] = ()
+    workers: int = 1
+
+
+TARGET_KEYS = {f.name for f in fields(ManifestTarget)}
+TUPLE_KEYS = {'schemas', 'type', 'framework', 'include_tables', 'exclude_tables'}
+
+
+def _target(index: int, values: dict[str, Any], base: Path) -> ManifestTarget:
+    """Build and check a target from its merged manifest values."""
+    name = str(values.setdefault('name', f'target_{index}'))
+    unknown = set(values) - TARGET_KEYS
+    if unknown:
+        raise ValueError(f'Unknown key(s) for target {name!r}: {", ".join(sorted(unknown))}')
+    sources = [key for key in SOURCE_KEYS if values.get(key)]
+    if len(sources) != 1:
+        raise ValueError(f'Target {name!r} must set exactly one of: {", ".join(SOURCE_KEYS)}')
+
+    for key in TUPLE_KEYS & set(values):
+        value = values[key]
+        values[key] = (value,) if isinstance(value, str) else tuple(value)
+    if values.get('db_url'):
+        values['db_url'] = os.path.expandvars(values['db_url'])
+    for key in ('from_sql', 'from_catalog', 'dir'):
+        if values.get(key):
+            values[key] = str((base / os.path.expanduser(values[key])).resolve())
+    return ManifestTarget(**values)
+
+
+def load_manifest(path: str | Path) -> list[ManifestTarget]:
+    """Read the targets of a manifest file.
+
+    Args:
+        path: The TOML manifest.
+
+    Returns:
+        The targets, in file order.
+
+    Raises:
+        ValueError: If the manifest is not valid TOML, or a target is invalid.
+    """
+    path = Path(path)
+    try:
+        data = toml.load(path)
+    except toml.TomlDecodeError as e:
+        raise ValueError(f'Invalid manifest {path}: {e}') from e
+
+    defaults = data.get('defaults', {})
+    targets = data.get('targets', [])
+    if not isinstance(targets, list) or not targets:
+        raise ValueError(f'No [[targets]] in manifest {path}')
+    loaded = [_target(i, {**defaults, **values}, path.parent) for i, values in enumerate(targets, 1)]
+    names = [target.name for target in loaded]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f'Duplicate target name(s) in manifest {path}: {", ".join(duplicates)}')
+
+    # Targets render concurrently, so two writing to one folder would overwrite each other's files
+    dirs: dict[str, list[str]] = {}
+    for target in loaded:
+        dirs.setdefault(os.path.abspath(target.dir), []).append(target.name)
+    shared = [f'{", ".join(names)} ({d})' for d, names in dirs.items() if len(names) > 1]
+    if shared:
+        raise ValueError(f'Targets in manifest {path} share an output dir: {"; ".join(shared)}')
+    return loaded
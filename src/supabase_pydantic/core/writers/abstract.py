@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import os
+import shutil
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
 
 from inflection import singularize
@@ -11,8 +12,13 @@ from supabase_pydantic.core.constants import BASE_CLASS_POSTFIX, WriterClassType
 from supabase_pydantic.core.writers.utils import generate_unique_filename
 from supabase_pydantic.db.database_type import DatabaseType
 from supabase_pydantic.db.models import TableInfo
+from supabase_pydantic.utils.profiling import span
 from supabase_pydantic.utils.strings import to_pascal_case
 
+# A section writer returns the section, as a string or as chunks (e.g., a class at a time), or
+# None if the file has no such section
+SectionWriter = Callable[[], 'str | Iterable[str] | None']
+
 
 def get_section_comment(title: str, description_lines: list[str] | None = None) -> str:
     """Generate a section comment with a title and optional description lines.
@@ -133,6 +139,12 @@ class AbstractClassWriter(ABC):
 
 
 class AbstractFileWriter(ABC):
+    # The package layout (see `supabase_pydantic.core.writers.package`) splits the file into a
+    # shared enum module, a shared base module and modules of model classes. Writers that
+    # support it set the imports of the shared modules and implement the methods below.
+    enum_module_imports: tuple[str, ...] = ()
+    base_module_imports: tuple[str, ...] = ()
+
     def __init__(
         self,
         tables: list[TableInfo],
@@ -152,29 +164,54 @@ class AbstractFileWriter(ABC):
 
     def write(self) -> str:
         """Method to write the complete file."""
-        # order is important here
-        parts = [
-            self.write_imports(),
-            self.write_custom_classes(),
-            self.write_base_classes(),
-            self.write_operational_classes(),
-        ]
+        return ''.join(self.write_chunks())
 
-        # filter None and join parts
-        return self.jstr.join(p for p in parts if p is not None) + '\n'
+    def write_chunks(self) -> Iterator[str]:
+        """Method to write the complete file as a stream of chunks, without building it whole."""
+        # order is important here
+        yield from self.stream_sections(
+            self.write_imports,
+            self.write_custom_classes,
+            self.write_base_classes,
+            self.write_operational_classes,
+        )
+        yield '\n'
+
+    def stream_sections(self, *sections: SectionWriter) -> Iterator[str]:
+        """Method to run section writers in order and stream their chunks, separated by `jstr`.
+
+        Sections that are None or yield no chunks are left out. Each section is timed as a
+        profiling span, including the time its chunks take to be consumed.
+        """
+        writer = type(self).__name__
+        first = True
+        for section in sections:
+            with span(f'render.{getattr(section, "__name__", "section")}', writer=writer):
+                part = section()
+                if part is None:
+                    continue
+                chunks = iter((part,) if isinstance(part, str) else part)
+                head = next(chunks, None)
+                if head is None:
+                    continue
+                if not first:
+                    yield self.jstr
+                first = False
+                yield head
+                yield from chunks
 
     def save(self, overwrite: bool = False) -> tuple[str, str | None]:
-        """Method to save the file."""
+        """Method to save the file, streaming it to disk so the whole module is never held in memory."""
         fp = Path(self.file_path)
         base, ext, directory = fp.stem, fp.suffix, str(fp.parent)
         latest_file = os.path.join(directory, f'{base}_latest{ext}')
         with open(latest_file, 'w') as f:
-            f.write(self.write())
+            f.writelines(self.write_chunks())
 
         if not overwrite:
+            # Copy the file just written rather than rendering it again
             versioned_file = generate_unique_filename(base, ext, directory)
-            with open(versioned_file, 'w') as f:
-                f.write(self.write())
+            shutil.copyfile(latest_file, versioned_file)
 
             return latest_file, versioned_file
 
@@ -184,6 +221,18 @@ class AbstractFileWriter(ABC):
         """Method to join strings."""
         return self.jstr.join(strings)
 
+    def write_enum_classes(self) -> str | None:
+        """Method to generate the enum classes alone, for a package's shared enum module."""
+        raise NotImplementedError(f'{type(self).__name__} does not support the package layout')
+
+    def write_shared_classes(self) -> str:
+        """Method to generate the classes every model derives from, for a package's shared base module."""
+        raise NotImplementedError(f'{type(self).__name__} does not support the package layout')
+
+    def model_sections(self) -> tuple[SectionWriter, ...]:
+        """Method to list the sections of model classes, for the modules of a package."""
+        raise NotImplementedError(f'{type(self).__name__} does not support the package layout')
+
     @abstractmethod
     def write_imports(self) -> str:
         """Method to generate import statements for the file."""
@@ -0,0 +1,206 @@
+"""Writing generated models as a package of lazily loaded modules (`gen --layout package`).
+
+Importing any model from a single module built for a large schema builds every model in it. The
+package layout splits a file writer's output into:
+
+- `_enums.py`, with the enum classes, and `_base.py`, with the classes every model derives from;
+- a module per group of tables connected by foreign keys, so that relationships between models
+  always resolve within their own module; a table without any is a group of its own;
+- an `__init__.py` that imports a module only when one of its classes is first accessed (PEP 562
+  module `__getattr__`), so consumers only pay for the models they use.
+
+The package is regenerated in place, and modules left from tables that no longer exist are
+removed.
+"""
+
+import copy
+import keyword
+import logging
+import os
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from supabase_pydantic.core.writers.abstract import AbstractFileWriter
+from supabase_pydantic.db.models import TableInfo
+
+# Get Logger
+logger = logging.getLogger(__name__)
+
+ENUM_MODULE = '_enums'
+BASE_MODULE = '_base'
+
+CLASS_NAME_PATTERN = re.compile(r'^class (\w+)\b', re.MULTILINE)
+
+INIT_TEMPLATE = '''"""Generated models, imported lazily: a module is only imported when one of its classes is used."""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+{type_checking_imports}
+
+# The module defining each class
+_MODULES: dict[str, str] = {{
+{modules}
+}}
+
+__all__ = [
+{exports}
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f'module {{__name__!r}} has no attribute {{name!r}}')
+    value = getattr(importlib.import_module(f'.{{module}}', __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({{*globals(), *__all__}})
+'''
+
+
+def group_tables(tables: list[TableInfo]) -> list[list[TableInfo]]:
+    """Group tables connected by foreign keys or relationships, directly or through other tables.
+
+    Args:
+        tables: The tables of a schema.
+
+    Returns:
+        The groups, each in table order, ordered by their first table.
+    """
+    names = {table.name for table in tables}
+    parents = {name: name for name in names}
+
+    def find(name: str) -> str:
+        while parents[name] != name:
+            parents[name] = parents[parents[name]]
+            name = parents[name]
+        return name
+
+    for table in tables:
+        related = {fk.foreign_table_name for fk in table.foreign_keys if fk.foreign_table_schema == table.schema}
+        related.update(r.related_table_name for r in table.relationships)
+        for other in related & names:
+            parents[find(other)] = find(table.name)
+
+    groups: dict[str, list[TableInfo]] = {}
+    for table in tables:
+        groups.setdefault(find(table.name), []).append(table)
+    return list(groups.values())
+
+
+def module_name(table_name: str, taken: set[str]) -> str:
+    """Return an importable module name for a table, unique among the `taken` ones (which it joins).
+
+    Names are lower-cased, so modules never clash on case-insensitive file systems.
+    """
+    base = re.sub(r'\W', '_', table_name).lower()
+    if not base.isidentifier() or keyword.iskeyword(base) or base.startswith('_'):
+        base = f'table_{base}'
+    name, suffix = base, 2
+    while name in taken:
+        name, suffix = f'{base}_{suffix}', suffix + 1
+    taken.add(name)
+    return name
+
+
+class PackageWriter:
+    """Write the models of a file writer as a package of lazily loaded modules."""
+
+    def __init__(self, file_writer: AbstractFileWriter):
+        """Initialize the package writer.
+
+        Args:
+            file_writer: The writer of the single module; the package takes its place, named
+                after its file without the extension (e.g., `schema_public/`).
+        """
+        self.file_writer = file_writer
+        file_path = Path(file_writer.file_path)
+        self.directory = file_path.parent / file_path.stem
+
+    def save(self) -> list[str]:
+        """Write the package, replacing any previous version of it.
+
+        Returns:
+            The paths of the written modules.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        writer = self.file_writer
+        exports: dict[str, str] = {}  # class name -> module
+        paths: list[str] = []
+
+        def save_module(module: str, chunks: Iterable[str]) -> list[str]:
+            path = self.directory / f'{module}.py'
+            names = []
+            with open(path, 'w') as f:
+                for chunk in chunks:
+                    names += CLASS_NAME_PATTERN.findall(chunk)
+                    f.write(chunk)
+            exports.update(dict.fromkeys(names, module))
+            paths.append(str(path))
+            return names
+
+        enum_classes = writer.write_enum_classes()
+        enums = (
+            save_module(ENUM_MODULE, self._shared_module(writer.enum_module_imports, enum_classes))
+            if enum_classes
+            else []
+        )
+        shared = save_module(
+            BASE_MODULE, self._shared_module(writer.base_module_imports, writer.write_shared_classes())
+        )
+
+        taken = {ENUM_MODULE, BASE_MODULE}
+        for tables in group_tables(writer.tables):
+            save_module(module_name(tables[0].name, taken), self._model_module(tables, enums, shared))
+
+        init_path = self.directory / '__init__.py'
+        with open(init_path, 'w') as f:
+            f.write(self._init_module(exports))
+        paths.append(str(init_path))
+
+        # Remove the modules of tables that no longer exist
+        for stale in set(self.directory.glob('*.py')) - {Path(p) for p in paths}:
+            logger.info(f'Removing stale module: {stale}')
+            stale.unlink()
+        return paths
+
+    def _shared_module(self, imports: tuple[str, ...], classes: str) -> Iterator[str]:
+        """Stream a shared module: its imports, then its classes."""
+        yield '\n'.join(imports)
+        yield self.file_writer.jstr
+        yield classes
+        yield '\n'
+
+    def _model_module(self, tables: list[TableInfo], enums: list[str], shared: list[str]) -> Iterator[str]:
+        """Stream the module of a group of tables, importing the shared classes it uses."""
+        writer = copy.copy(self.file_writer)
+        writer.tables = tables
+        used_enums = {c.enum_info.python_class_name() for t in tables for c in t.columns if c.enum_info}
+
+        def write_imports() -> str:
+            imports = [writer.write_imports(), f'from .{BASE_MODULE} import {", ".join(shared)}']
+            module_enums = [name for name in enums if name in used_enums]
+            if module_enums:
+                imports.append(f'from .{ENUM_MODULE} import {", ".join(module_enums)}')
+            return '\n'.join(imports)
+
+        yield from writer.stream_sections(write_imports, *writer.model_sections())
+        yield '\n'
+
+    @staticmethod
+    def _init_module(exports: dict[str, str]) -> str:
+        """Return the package's `__init__.py`, mapping each class to the module it is lazily imported from."""
+        names = sorted(exports)
+        return INIT_TEMPLATE.format(
+            type_checking_imports='\n'.join(f'    from .{exports[n]} import {n} as {n}' for n in names) or '    pass',
+            modules='\n'.join(f"    '{n}': '{exports[n]}'," for n in names),
+            exports='\n'.join(f"    '{n}'," for n in names),
+        )
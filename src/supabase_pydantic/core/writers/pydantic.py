@@ -1,12 +1,13 @@
 import logging
 import re
+from collections.abc import Iterable, Iterator
 from functools import partial
 from typing import Any
 
 from inflection import pluralize, singularize
 
 from supabase_pydantic.core.constants import CUSTOM_MODEL_NAME, WriterClassType
-from supabase_pydantic.core.writers.abstract import AbstractClassWriter, AbstractFileWriter
+from supabase_pydantic.core.writers.abstract import AbstractClassWriter, AbstractFileWriter, SectionWriter
 from supabase_pydantic.core.writers.utils import get_base_class_post_script as post
 from supabase_pydantic.core.writers.utils import get_section_comment
 from supabase_pydantic.db.constants import RelationType
@@ -491,6 +492,9 @@ class PydanticFastAPIClassWriter(AbstractClassWriter):
 
 
 class PydanticFastAPIWriter(AbstractFileWriter):
+    enum_module_imports = ('from enum import Enum',)
+    base_module_imports = ('from pydantic import BaseModel',)
+
     def __init__(
         self,
         tables: list[TableInfo],
@@ -611,11 +615,26 @@ class PydanticFastAPIWriter(AbstractFileWriter):
         class_type: WriterClassType = WriterClassType.BASE,
         **kwargs: Any,
     ) -> str:
-        # print(f'\n=== Generating {comment_title} ===\nClass type: {class_type}')
-        sxn = get_section_comment(comment_title, comments)
+        return ''.join(
+            self._iter_class_writer_helper(
+                comment_title, comments, classes_override or None, is_base, class_type, **kwargs
+            )
+        )
+
+    def _iter_class_writer_helper(
+        self,
+        comment_title: str,
+        comments: list[str] = [],
+        classes_override: Iterable[str] | None = None,
+        is_base: bool = True,
+        class_type: WriterClassType = WriterClassType.BASE,
+        **kwargs: Any,
+    ) -> Iterator[str]:
+        """Stream a section: its comment, then each class, written one at a time."""
+        yield get_section_comment(comment_title, comments)
         classes = classes_override
 
-        if len(classes_override) == 0:
+        if classes is None:
             attr = 'write_class' if is_base else 'write_operational_class'
 
             def _method(t: TableInfo) -> Any:
@@ -633,20 +652,13 @@ class PydanticFastAPIWriter(AbstractFileWriter):
                         t, class_type, generate_enums=self.generate_enums, singular_names=self.singular_names
                     )
 
-                # print(f'\nTable: {t.name}')
-                # print(f'Class type: {class_type}')
-                # print(f'Writer class: {writer.__class__.__name__}')
-                # print(f'Method: {attr}')
-
                 return getattr(writer, attr)
 
-            if len(kwargs) > 0:
-                classes = [_method(t)(**kwargs) for t in self.tables]
-            else:
-                classes = [_method(t)() for t in self.tables]
+            classes = (_method(t)(**kwargs) for t in self.tables)
 
-        result: str = self.join([sxn, *classes])
-        return result
+        for class_def in classes:
+            yield self.jstr
+            yield class_def
 
     def write_enum_types(self) -> str | None:
         """Generate a section of Python Enum classes for all unique enums used in the schema."""
@@ -680,6 +692,18 @@ class PydanticFastAPIWriter(AbstractFileWriter):
 
         return '\n'.join(lines)
 
+    def write_enum_classes(self) -> str | None:
+        """Method to generate the enum classes alone, for a package's shared enum module."""
+        return self.write_enum_types()
+
+    def write_shared_classes(self) -> str:
+        """Method to generate the custom classes, for a package's shared base module."""
+        return self.write_custom_classes() or ''
+
+    def model_sections(self) -> tuple[SectionWriter, ...]:
+        """Method to list the sections of model classes, for the modules of a package."""
+        return self.iter_base_classes, self.iter_operational_classes
+
     def write_custom_classes(self) -> str | None:
         """Method to generate the custom classes for the file."""
         b = 'BaseModel'
@@ -703,12 +727,16 @@ class PydanticFastAPIWriter(AbstractFileWriter):
 
     def write_base_classes(self) -> str:
         """Method to generate the base, insert, and update classes for the file."""
-        classes = []
+        return ''.join(self.iter_base_classes())
+
+    def iter_base_classes(self) -> Iterator[str]:
+        """Method to stream the base, insert, and update classes for the file, a class at a time."""
+        sections = []
 
         # Generate parent classes if needed
         if self.add_null_parent_classes:
-            classes.append(
-                self._class_writer_helper(
+            sections.append(
+                self._iter_class_writer_helper(
                     'Parent Classes',
                     comments=[
                         'This is a parent class with all fields as nullable. This is useful for refining your models with inheritance. See https://stackoverflow.com/a/65907609.'  # noqa: E501
@@ -721,8 +749,8 @@ class PydanticFastAPIWriter(AbstractFileWriter):
             base_class_type = WriterClassType.BASE
 
         # Generate base (Row) classes
-        classes.append(
-            self._class_writer_helper(
+        sections.append(
+            self._iter_class_writer_helper(
                 'Base Classes',
                 comments=['These are the base Row models that include all fields.'],
                 class_type=base_class_type,
@@ -731,8 +759,8 @@ class PydanticFastAPIWriter(AbstractFileWriter):
 
         if self.generate_crud_models:
             # Generate Insert classes
-            classes.append(
-                self._class_writer_helper(
+            sections.append(
+                self._iter_class_writer_helper(
                     'Insert Classes',
                     comments=[
                         'These models are used for insert operations. Auto-generated fields (like IDs and timestamps) are optional.'  # noqa: E501
@@ -742,30 +770,35 @@ class PydanticFastAPIWriter(AbstractFileWriter):
             )
 
             # Generate Update classes
-            classes.append(
-                self._class_writer_helper(
+            sections.append(
+                self._iter_class_writer_helper(
                     'Update Classes',
                     comments=['These models are used for update operations. All fields are optional.'],
                     class_type=WriterClassType.UPDATE,
                 )
             )
 
-        return '\n'.join(c for c in classes if c)
+        # The generators only render their classes as the sections are consumed
+        for i, section in enumerate(sections):
+            if i > 0:
+                yield '\n'
+            yield from section
 
     def write_operational_classes(self) -> str | None:
         """Method to generate the operational classes for the file."""
-        return self._class_writer_helper('Operational Classes', is_base=False)
+        return ''.join(self.iter_operational_classes())
 
-    def write(self) -> str:
-        """Override to include enum types after imports and before custom classes."""
-        parts = [
-            self.write_imports(),
-            self.write_enum_types(),
-            self.write_custom_classes(),
-            self.write_base_classes(),
-            self.write_operational_classes(),
-        ]
+    def iter_operational_classes(self) -> Iterator[str]:
+        """Method to stream the operational classes for the file, a class at a time."""
+        return self._iter_class_writer_helper('Operational Classes', is_base=False)
 
-        # filter None and join parts using self.jstr (which is '\n\n\n')
-        result: str = self.jstr.join(p for p in parts if p is not None) + '\n'
-        return result
+    def write_chunks(self) -> Iterator[str]:
+        """Override to include enum types after imports and before custom classes."""
+        yield from self.stream_sections(
+            self.write_imports,
+            self.write_enum_types,
+            self.write_custom_classes,
+            self.iter_base_classes,
+            self.iter_operational_classes,
+        )
+        yield '\n'
@@ -1,8 +1,15 @@
+from collections.abc import Iterable, Iterator
+from itertools import chain
 from typing import Any
 
 from supabase_pydantic.core.constants import WriterClassType
 from supabase_pydantic.core.models import EnumInfo
-from supabase_pydantic.core.writers.abstract import AbstractClassWriter, AbstractFileWriter, get_section_comment
+from supabase_pydantic.core.writers.abstract import (
+    AbstractClassWriter,
+    AbstractFileWriter,
+    SectionWriter,
+    get_section_comment,
+)
 from supabase_pydantic.db.constants import RelationType
 from supabase_pydantic.db.database_type import DatabaseType
 from supabase_pydantic.db.models import ColumnInfo, SortedColumns, TableInfo
@@ -378,6 +385,9 @@ class SqlAlchemyFastAPIClassWriter(AbstractClassWriter):
 
 
 class SqlAlchemyFastAPIWriter(AbstractFileWriter):
+    enum_module_imports = ('from enum import Enum as PyEnum',)
+    base_module_imports = ('from sqlalchemy.orm import DeclarativeBase',)
+
     def __init__(
         self,
         tables: list[TableInfo],
@@ -389,16 +399,14 @@ class SqlAlchemyFastAPIWriter(AbstractFileWriter):
     ):
         super().__init__(tables, file_path, writer, add_null_parent_classes, singular_names, database_type)
 
-    def write(self) -> str:
-        """Override the base write method to handle newlines correctly."""
-        parts = [
-            self.write_imports(),
-            self.write_custom_classes(),
-            self.write_base_classes(),
-            self.write_operational_classes(),
-        ]
-        result: str = self.jstr.join(p for p in parts if p is not None)
-        return result
+    def write_chunks(self) -> Iterator[str]:
+        """Override the base method to handle newlines correctly."""
+        yield from self.stream_sections(
+            self.write_imports,
+            self.write_custom_classes,
+            self.iter_base_classes,
+            self.iter_operational_classes,
+        )
 
     def _dt_imports(
         self, imports: set, default_import: tuple[Any, Any | None] = ('String,str', 'from sqlalchemy import String')
@@ -456,9 +464,22 @@ class SqlAlchemyFastAPIWriter(AbstractFileWriter):
         is_base: bool = True,
         **kwargs: Any,
     ) -> str:
-        sxn = get_section_comment(comment_title, comments)
+        return ''.join(
+            self._iter_class_writer_helper(comment_title, comments, classes_override or None, is_base, **kwargs)
+        )
+
+    def _iter_class_writer_helper(
+        self,
+        comment_title: str,
+        comments: list[str] = [],
+        classes_override: Iterable[str] | None = None,
+        is_base: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[str]:
+        """Stream a section: its comment, then each class, written one at a time."""
+        yield get_section_comment(comment_title, comments)
         classes = classes_override
-        if len(classes_override) == 0:
+        if classes is None:
             attr = 'write_class' if is_base else 'write_operational_class'
 
             def _method(t: TableInfo) -> Any:
@@ -466,12 +487,13 @@ class SqlAlchemyFastAPIWriter(AbstractFileWriter):
                 return getattr(writer_instance, attr)
 
             if 'add_fk' in kwargs:
-                classes = [_method(t)(add_fk=kwargs['add_fk']) for t in self.tables]
+                classes = (_method(t)(add_fk=kwargs['add_fk']) for t in self.tables)
             else:
-                classes = [_method(t)() for t in self.tables]
+                classes = (_method(t)() for t in self.tables)
 
-        result: str = self.join([sxn, *classes])
-        return result
+        for class_def in classes:
+            yield self.jstr
+            yield class_def
 
     def _collect_enum_infos(self) -> list[EnumInfo]:
         """Collect all unique enum infos from all tables."""
@@ -506,49 +528,61 @@ class SqlAlchemyFastAPIWriter(AbstractFileWriter):
 
     def write_custom_classes(self, add_fk: bool = False) -> str:
         """Method to write the complete class definition."""
-        classes = []
-
         # Generate enum classes first
+        sections = [self.write_enum_classes(), self.write_shared_classes()]
+        return '\n\n'.join(section for section in sections if section)
+
+    def write_enum_classes(self) -> str | None:
+        """Method to write the enum classes alone, for a package's shared enum module."""
         enum_classes = self._generate_enum_classes()
-        if enum_classes:
-            enums_section = get_section_comment('Enum Classes', ['Database enum types as Python classes'])
-            classes.extend([enums_section] + enum_classes)
+        if not enum_classes:
+            return None
+        enums_section = get_section_comment('Enum Classes', ['Database enum types as Python classes'])
+        return '\n\n'.join([enums_section] + enum_classes)
 
-        # Add base class
+    def write_shared_classes(self) -> str:
+        """Method to write the declarative base class, for a package's shared base module."""
         declarative_base_class = (
             'class Base(DeclarativeBase):\n\t"""Declarative Base Class."""\n\t# type_annotation_map = {}\n\n\tpass'
         )
         base_section = get_section_comment('Declarative Base', [])
-        classes.extend([base_section, declarative_base_class])
+        return '\n\n'.join([base_section, declarative_base_class])
 
-        return '\n\n'.join(classes)
+    def model_sections(self) -> tuple[SectionWriter, ...]:
+        """Method to list the sections of model classes, for the modules of a package."""
+        return self.iter_base_classes, self.iter_operational_classes
 
     def write_base_classes(self) -> str:
         """Method to write the base classes."""
-        return self._class_writer_helper('Base Classes')
+        return ''.join(self.iter_base_classes())
+
+    def iter_base_classes(self) -> Iterator[str]:
+        """Method to stream the base classes, a class at a time."""
+        return self._iter_class_writer_helper('Base Classes')
 
     def write_operational_classes(self) -> str | None:
         """Method to write the operational classes.
 
         This includes Insert and Update models that follow the CRUD pattern.
         """
-        # Generate Insert models
-        insert_models = self._generate_crud_models(WriterClassType.INSERT, 'Insert Models')
-
-        # Generate Update models
-        update_models = self._generate_crud_models(WriterClassType.UPDATE, 'Update Models')
-
-        # Combine them if any exist
-        parts = []
-        if insert_models:
-            parts.append(insert_models)
-        if update_models:
-            parts.append(update_models)
-
-        return '\n\n'.join(parts) if parts else None
+        return ''.join(self.iter_operational_classes()) or None
+
+    def iter_operational_classes(self) -> Iterator[str]:
+        """Method to stream the Insert and Update models, a class at a time."""
+        wrote = False
+        for class_type, title in ((WriterClassType.INSERT, 'Insert Models'), (WriterClassType.UPDATE, 'Update Models')):
+            for i, chunk in enumerate(self._iter_crud_models(class_type, title)):
+                if i == 0 and wrote:
+                    yield '\n\n'
+                yield chunk
+                wrote = True
 
     def _generate_crud_models(self, class_type: WriterClassType, title: str) -> str | None:
         """Helper method to generate CRUD models (Insert or Update)."""
+        return ''.join(self._iter_crud_models(class_type, title)) or None
+
+    def _iter_crud_models(self, class_type: WriterClassType, title: str) -> Iterator[str]:
+        """Helper method to stream CRUD models (Insert or Update); yields nothing if there are none."""
         comments = []
         if class_type == WriterClassType.INSERT:
             comments.extend(
@@ -567,20 +601,21 @@ class SqlAlchemyFastAPIWriter(AbstractFileWriter):
                 ]
             )
 
-        classes = []
-        for table in self.tables:
-            # Create writer with the specified class type
-            writer = self.writer(
+        # Create a writer with the specified class type per table, as the classes are consumed
+        classes = (
+            self.writer(
                 table,
                 class_type=class_type,
                 database_type=self.database_type,
                 singular_names=self.singular_names,
-            )
-            class_def = writer.write_class()
-            if class_def:
-                classes.append(class_def)
-
-        if not classes:
-            return None
+            ).write_class()
+            for table in self.tables
+        )
+        classes = (class_def for class_def in classes if class_def)
+        first = next(classes, None)
+        if first is None:
+            return
 
-        return self._class_writer_helper(comment_title=title, comments=comments, classes_override=classes)
+        yield from self._iter_class_writer_helper(
+            comment_title=title, comments=comments, classes_override=chain([first], classes)
+        )
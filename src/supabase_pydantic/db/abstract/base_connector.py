@@ -1,11 +1,18 @@
 """Abstract base connector for database operations."""
 
+import logging
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any, Generic, Literal, TypeVar
 
 from pydantic import BaseModel
 
-from supabase_pydantic.db.models import DatabaseConnectionParams
+from supabase_pydantic.db.models import ConnectionOptions, DatabaseConnectionParams
+
+# Get Logger
+logger = logging.getLogger(__name__)
 
 T = TypeVar('T', bound=DatabaseConnectionParams)
 
@@ -16,15 +23,18 @@ class BaseDBConnector(ABC, Generic[T]):
     params_model: T | None  # Type annotation to indicate params_model can be None
     connection_params: dict[str, Any]
     connection: Any | None
+    connection_options: ConnectionOptions
 
     def __init__(self, connection_params: T | dict[str, Any] | None = None, **kwargs: Any):
         """Initialize the connector with connection parameters.
 
         Args:
             connection_params: Connection parameters as a Pydantic model or dict
-            **kwargs: Additional connection parameters to store for later use
+            **kwargs: Additional connection parameters to store for later use; a
+                `connection_options` keyword sets the connector's `ConnectionOptions`.
         """
         self.connection = None
+        self._pop_connection_options(kwargs)
 
         # If a Pydantic model is provided, use it
         if isinstance(connection_params, BaseModel):
@@ -43,6 +53,10 @@ class BaseDBConnector(ABC, Generic[T]):
             self.params_model = None
             self.connection_params = kwargs
 
+    def _pop_connection_options(self, kwargs: dict[str, Any]) -> None:
+        """Set the connector's `ConnectionOptions` from a `connection_options` keyword, removing it from `kwargs`."""
+        self.connection_options = kwargs.pop('connection_options', None) or ConnectionOptions()
+
     @abstractmethod
     def connect(self, connection_params: T | dict[str, Any] | None = None, **kwargs: Any) -> Any:
         """Create a connection to the database.
@@ -125,16 +139,65 @@ class BaseDBConnector(ABC, Generic[T]):
         """
         pass
 
+    def _new_connection(self) -> Any:
+        """Make a single attempt at opening a connection with the connector's parameters."""
+        if self.params_model:
+            return self.connect(self.params_model)  # type: ignore
+        return self.connect(self.connection_params)
+
+    def open_connection(self) -> Any:
+        """Open a new connection with the connector's parameters.
+
+        Failed attempts are retried with exponential backoff, as set by `connection_options`.
+        Unlike using the connector as a context manager, the connection is not kept on the
+        connector, so several can be open at once (e.g., one per worker thread). Close it with
+        `close_connection`.
+
+        Returns:
+            Database connection object.
+
+        Raises:
+            ConnectionError: If the last attempt fails.
+        """
+        options = self.connection_options
+        for attempt in range(options.retries + 1):
+            try:
+                conn = self._new_connection()
+            except ConnectionError as e:
+                if attempt == options.retries:
+                    raise
+                error: Any = e
+            else:
+                if conn is not None or attempt == options.retries:
+                    return conn
+                error = 'no connection returned'
+            delay = options.backoff * 2**attempt
+            logger.warning(f'Connection attempt {attempt + 1} failed ({error}); retrying in {delay:.1f}s')
+            time.sleep(delay)
+
+    @contextmanager
+    def consistent_read(self, conn: Any, snapshot: str | None = None, export: bool = False) -> Iterator[str | None]:
+        """Run the enclosed queries on `conn` against a single, unchanging view of the database.
+
+        Connectors that cannot do this run the queries as usual, and yield None.
+
+        Args:
+            conn: Database connection object.
+            snapshot: Read from this snapshot, exported by another connection's consistent read.
+            export: Export the snapshot, so other connections can read from it.
+
+        Yields:
+            The id of the exported snapshot, or None if it was not exported.
+        """
+        yield None
+
     def __enter__(self) -> Any:
         """Context manager entry.
 
         Returns:
             Database connection object.
         """
-        if self.params_model:
-            self.connection = self.connect(self.params_model)  # type: ignore
-        else:
-            self.connection = self.connect(self.connection_params)
+        self.connection = self.open_connection()
         return self.connection
 
     def __exit__(self, _exc_type: Any, _exc_val: Any, _exc_tb: Any) -> Literal[False]:
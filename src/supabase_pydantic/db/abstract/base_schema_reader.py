@@ -1,12 +1,18 @@
 """Abstract base schema reader for database introspection."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, ClassVar
+
+from supabase_pydantic.db.models import SchemaCatalog
 
 
 class BaseSchemaReader(ABC):
     """Abstract base class for database schema introspection."""
 
+    # Readers that can re-read a subset of tables accept a `tables` argument to their per-table
+    # methods, and give the position of the table name in the rows each of them returns
+    relation_positions: ClassVar[dict[str, int]] = {}
+
     def __init__(self, connector: Any):
         """Initialize schema reader with a connector.
 
@@ -15,6 +21,41 @@ class BaseSchemaReader(ABC):
         """
         self.connector = connector
 
+    def read_catalogs(self, conn: Any, schemas: list[str]) -> dict[str, SchemaCatalog] | None:
+        """Read the result sets of several schemas in one pass.
+
+        Readers that can query many schemas at once override this; the default reads nothing,
+        and each schema is then read on its own.
+
+        Args:
+            conn: Database connection object.
+            schemas: Schema names.
+
+        Returns:
+            The result sets by schema, or None if they were not read.
+        """
+        return None
+
+    def batches_single_schema(self) -> bool:
+        """Return whether `read_catalogs` saves round trips even when reading a single schema."""
+        return False
+
+    def get_referenced_tables(self, conn: Any, schema: str, tables: list[str]) -> set[str]:
+        """Get the tables of a schema that foreign keys of the given tables reference.
+
+        Readers with `relation_positions` implement this, to select tables with a `TableFilter`
+        without reading the whole schema.
+
+        Args:
+            conn: Database connection object.
+            schema: Schema name.
+            tables: The referencing tables.
+
+        Returns:
+            The referenced table names.
+        """
+        raise NotImplementedError(f'{type(self).__name__} cannot read the foreign keys of a subset of tables')
+
     @abstractmethod
     def get_schemas(self, conn: Any) -> list[str]:
         """Get all schemas in the database.
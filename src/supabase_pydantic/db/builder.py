@@ -1,16 +1,19 @@
 """Database-agnostic table construction module."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from typing import Any
 
 from supabase_pydantic.db.abstract.base_connector import BaseDBConnector
 from supabase_pydantic.db.abstract.base_schema_reader import BaseSchemaReader
 from supabase_pydantic.db.constants import DatabaseConnectionType
 from supabase_pydantic.db.database_type import DatabaseType
-from supabase_pydantic.db.factory import DatabaseFactory
+from supabase_pydantic.db.factory import Backend, DatabaseFactory
 from supabase_pydantic.db.marshalers.abstract.base_schema_marshaler import BaseSchemaMarshaler
-from supabase_pydantic.db.models import TableInfo
-from supabase_pydantic.db.registrations import register_database_components
+from supabase_pydantic.db.models import SchemaCatalog, TableInfo
+from supabase_pydantic.db.table_filter import TableFilter
+from supabase_pydantic.utils.profiling import span
 
 # Get Logger
 logger = logging.getLogger(__name__)
@@ -21,43 +24,145 @@ class DatabaseBuilder:
 
     def __init__(
         self,
-        db_type: DatabaseType,
+        db_type: Backend,
         conn_type: DatabaseConnectionType,
         connection_params: Any = None,
+        source: Backend | None = None,
         **kwargs: Any,
     ):
         """Initialize the database builder.
 
         Args:
-            db_type: Type of database (PostgreSQL, MySQL, etc.)
+            db_type: Type of database (PostgreSQL, MySQL, etc.), or a plugin backend's name.
             conn_type: Type of connection (LOCAL, DB_URL, etc.)
             connection_params: Connection parameters as Pydantic model or dict
+            source: The backend to read the schema with, if not the database itself (e.g., 'sql'
+                to read SQL files). The database type's marshalers build the table information.
             **kwargs: Additional connection parameters
         """
         self.db_type = db_type
         self.conn_type = conn_type
+        source = source or db_type
 
-        # Register database components before using the factory
-        register_database_components()
+        # Register the selected backend's components; other backends are never imported
+        DatabaseFactory.load_backend(db_type)
 
         # Create components using factory
         factory = DatabaseFactory()
         self.connector: BaseDBConnector = factory.create_connector(
-            db_type, connection_params=connection_params, **kwargs
+            source, connection_params=connection_params, **kwargs
         )
-        self.schema_reader: BaseSchemaReader = factory.create_schema_reader(db_type, connector=self.connector)
+        self.schema_reader: BaseSchemaReader = factory.create_schema_reader(source, connector=self.connector)
         self.marshaler: BaseSchemaMarshaler = factory.create_marshalers(db_type)
 
+        # The raw result sets last read for each schema
+        self.catalogs: dict[str, SchemaCatalog] = {}
+
+    def read_catalog(self, connection: Any, schema: str, tables: list[str] | None = None) -> SchemaCatalog:
+        """Read the raw result sets for a schema.
+
+        Args:
+            connection: An open connection.
+            schema: The schema to read.
+            tables: Only read these tables, if given. User-defined types are always read for the
+                whole schema.
+
+        Returns:
+            The schema's result sets.
+        """
+        reader = self.schema_reader
+        only = {} if tables is None else {'tables': tables}
+        catalog = SchemaCatalog()
+        with span('catalog.tables', schema=schema):
+            catalog.tables = reader.get_tables(connection, schema, **only)
+        with span('catalog.columns', schema=schema):
+            catalog.columns = reader.get_columns(connection, schema, **only)
+        with span('catalog.constraints', schema=schema):
+            catalog.constraints = reader.get_constraints(connection, schema, **only)
+        with span('catalog.foreign_keys', schema=schema):
+            catalog.foreign_keys = reader.get_foreign_keys(connection, schema, **only)
+        with span('catalog.user_defined_types', schema=schema):
+            catalog.user_defined_types = reader.get_user_defined_types(connection, schema)
+        with span('catalog.type_mappings', schema=schema):
+            catalog.type_mappings = reader.get_type_mappings(connection, schema, **only)
+        return catalog
+
+    def select_tables(self, connection: Any, schema: str, table_filter: TableFilter) -> list[str]:
+        """Select the tables of a schema to read, reading only their names and foreign keys.
+
+        Args:
+            connection: An open connection.
+            schema: The schema to select tables from.
+            table_filter: The tables to select; tables their foreign keys reference are added.
+
+        Returns:
+            The selected table names.
+        """
+        reader = self.schema_reader
+        position = reader.relation_positions['tables']
+        names = [row[position] for row in reader.get_tables(connection, schema)]
+        return table_filter.select(
+            schema, names, lambda tables: reader.get_referenced_tables(connection, schema, tables)
+        )
+
+    def read_catalogs_in_parallel(self, schemas: list[str], workers: int, snapshot: str) -> dict[str, SchemaCatalog]:
+        """Read the raw result sets for several schemas over several connections at once.
+
+        Each worker opens its own connection and reads from the exported snapshot, so every
+        schema is read from the same view of the database.
+
+        Args:
+            schemas: The schemas to read.
+            workers: The number of connections to read with.
+            snapshot: The id of a snapshot exported by a consistent read that is still open.
+
+        Returns:
+            The result sets, by schema.
+        """
+
+        def read_chunk(chunk: list[str]) -> dict[str, SchemaCatalog]:
+            connection = self.connector.open_connection()
+            try:
+                with self.connector.consistent_read(connection, snapshot=snapshot):
+                    return {schema: self.read_catalog(connection, schema) for schema in chunk}
+            finally:
+                self.connector.close_connection(connection)
+
+        chunks = [schemas[i::workers] for i in range(min(workers, len(schemas)))]
+        catalogs: dict[str, SchemaCatalog] = {}
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            for result in executor.map(read_chunk, chunks):
+                catalogs.update(result)
+        return catalogs
+
     def build_tables(
         self,
         schemas: tuple[str, ...] = ('public',),
         disable_model_prefix_protection: bool = False,
+        connection: Any = None,
+        changed_tables: dict[str, set[str]] | None = None,
+        workers: int = 1,
+        table_filter: TableFilter | None = None,
     ) -> dict[str, list[TableInfo]]:
         """Build table information from database.
 
+        The catalog is read in a single read-only transaction, so the result sets agree with each
+        other even if the schema changes meanwhile (where the connector supports it).
+
         Args:
             schemas: Tuple of schema names to process.
             disable_model_prefix_protection: If True, disable model_ prefix protection.
+            connection: An open connection to reuse. If not given, a connection is opened for
+                this call and closed when it returns.
+            changed_tables: The tables changed since the last call, by schema. For these schemas,
+                only the changed tables are read again, and merged into the result sets cached by
+                the last call, if the schema reader supports it.
+            workers: The number of connections to read schemas with, when there are several and
+                the schema reader cannot batch them. The workers read from a snapshot exported
+                by this call's transaction.
+            table_filter: Only build the tables it selects, and the tables they reference. If the
+                schema reader supports it, only those tables are read; they are read in full
+                even when `changed_tables` is given.
 
         Returns:
             Dictionary of schema names to lists of TableInfo objects.
@@ -65,76 +170,144 @@ class DatabaseBuilder:
         all_tables_info: dict[str, list[TableInfo]] = {}
 
         # Connect to database
-        with self.connector as connection:
-            if not self.connector.check_connection(connection):
+        with ExitStack() as stack:
+            if connection is None:
+                with span('connect'):
+                    connection = stack.enter_context(self.connector)
+            with span('check_connection'):
+                connected = self.connector.check_connection(connection)
+            if not connected:
                 if logger.getEffectiveLevel() <= logging.DEBUG:
                     raise ConnectionError('Failed to establish database connection')
                 else:
                     logger.error('Failed to establish database connection')
                     return all_tables_info
 
+            # Read everything from one view of the catalog, shared with any workers
+            snapshot = stack.enter_context(self.connector.consistent_read(connection, export=workers > 1))
+
             # Discover all schemas
-            schema_names = self.schema_reader.get_schemas(connection)
-            for schema_name in schema_names:
-                # Skip schemas that are not in the list of schemas from user
-                # If the list of schemas is '*', include all schemas
-                if schema_name not in schemas and schemas != ('*',):
-                    continue
+            with span('catalog.schemas'):
+                schema_names = self.schema_reader.get_schemas(connection)
+            # Skip schemas that are not in the list of schemas from user
+            # If the list of schemas is '*', include all schemas
+            targets = [name for name in schema_names if name in schemas or schemas == ('*',)]
+
+            # Select the filtered tables up front, if the reader can read just those
+            selections: dict[str, list[str]] = {}
+            if table_filter and self.schema_reader.relation_positions:
+                for name in targets:
+                    with span('catalog.select_tables', schema=name):
+                        selections[name] = self.select_tables(connection, name, table_filter)
+
+            # Read the schemas that are read in full together, if the reader can batch them
+            batched: dict[str, SchemaCatalog] = {}
+            full_reads = [
+                name
+                for name in targets
+                if name not in selections
+                and (
+                    (changed_tables or {}).get(name) is None
+                    or name not in self.catalogs
+                    or not self.schema_reader.relation_positions
+                )
+            ]
+            if len(full_reads) > 1 or (full_reads and self.schema_reader.batches_single_schema()):
+                with span('catalog.batch', schemas=len(full_reads)):
+                    batched = self.schema_reader.read_catalogs(connection, full_reads) or {}
+                if not batched and workers > 1 and snapshot is not None:
+                    with span('catalog.parallel', schemas=len(full_reads), workers=workers):
+                        batched = self.read_catalogs_in_parallel(full_reads, workers, snapshot)
 
+            for schema_name in targets:
                 # Fetch schema information
                 logger.info(f'Processing schema: {schema_name}')
 
-                # Get raw data
-                table_data = self.schema_reader.get_tables(connection, schema_name)
-                column_data = self.schema_reader.get_columns(connection, schema_name)
-                constraint_data = self.schema_reader.get_constraints(connection, schema_name)
-                fk_data = self.schema_reader.get_foreign_keys(connection, schema_name)
-                user_defined_types = self.schema_reader.get_user_defined_types(connection, schema_name)
-                type_mappings = self.schema_reader.get_type_mappings(connection, schema_name)
+                # Get raw data, re-reading only the changed tables if this schema was read before
+                changed = (changed_tables or {}).get(schema_name)
+                cached = self.catalogs.get(schema_name)
+                if schema_name in batched:
+                    catalog = batched[schema_name]
+                elif schema_name in selections:
+                    selected = selections[schema_name]
+                    logger.info(f'Reading {len(selected)} selected table(s) in schema: {schema_name}')
+                    catalog = (
+                        self.read_catalog(connection, schema_name, tables=selected) if selected else SchemaCatalog()
+                    )
+                elif changed is not None and cached is not None and self.schema_reader.relation_positions:
+                    logger.info(f'Re-reading {len(changed)} changed table(s) in schema: {schema_name}')
+                    delta = self.read_catalog(connection, schema_name, tables=sorted(changed))
+                    catalog = cached.replace_tables(changed, delta, self.schema_reader.relation_positions)
+                else:
+                    catalog = self.read_catalog(connection, schema_name)
+                self.catalogs[schema_name] = catalog
 
                 # Construct table info using schema marshaler
-                all_tables_info[schema_name] = self.marshaler.construct_table_info(
-                    table_data=table_data,
-                    column_data=column_data,
-                    fk_data=fk_data,
-                    constraint_data=constraint_data,
-                    type_data=user_defined_types,
-                    type_mapping_data=type_mappings,
-                    schema=schema_name,
-                    disable_model_prefix_protection=disable_model_prefix_protection,
-                )
+                with span('marshal', schema=schema_name):
+                    all_tables_info[schema_name] = self.marshaler.construct_table_info(
+                        table_data=catalog.tables,
+                        column_data=catalog.columns,
+                        fk_data=catalog.foreign_keys,
+                        constraint_data=catalog.constraints,
+                        type_data=catalog.user_defined_types,
+                        type_mapping_data=catalog.type_mappings,
+                        schema=schema_name,
+                        disable_model_prefix_protection=disable_model_prefix_protection,
+                    )
+                if table_filter and schema_name not in selections:
+                    all_tables_info[schema_name] = table_filter.apply(schema_name, all_tables_info[schema_name])
 
         return all_tables_info
 
 
 def construct_tables(
     conn_type: DatabaseConnectionType,
-    db_type: DatabaseType = DatabaseType.POSTGRES,
+    db_type: Backend = DatabaseType.POSTGRES,
     schemas: tuple[str, ...] = ('public',),
     disable_model_prefix_protection: bool = False,
     connection_params: Any = None,
+    source: Backend | None = None,
+    dump_catalog: str | None = None,
+    workers: int = 1,
+    table_filter: TableFilter | None = None,
     **kwargs: Any,
 ) -> dict[str, list[TableInfo]]:
     """Database-agnostic function to construct table information.
 
     Args:
         conn_type: Type of connection (LOCAL, DB_URL, etc.)
-        db_type: Type of database (PostgreSQL, MySQL, etc.)
+        db_type: Type of database (PostgreSQL, MySQL, etc.), or a plugin backend's name.
         schemas: Tuple of schema names to process.
         disable_model_prefix_protection: If True, disable model_ prefix protection.
         connection_params: Connection parameters as a Pydantic model or dictionary.
+        source: The backend to read the schema with, if not the database itself.
+        dump_catalog: Save the raw result sets read to this catalog snapshot file.
+        workers: The number of connections to read schemas with.
+        table_filter: Only construct the tables it selects, and the tables they reference.
         **kwargs: Additional connection parameters as keyword arguments.
 
     Returns:
         Dictionary of schema names to lists of TableInfo objects.
     """
     # Combine connection_params with any additional kwargs
+    if source is not None:
+        kwargs['source'] = source
     if connection_params is None:
         builder = DatabaseBuilder(db_type, conn_type, **kwargs)
     else:
         builder = DatabaseBuilder(db_type, conn_type, connection_params=connection_params, **kwargs)
 
-    return builder.build_tables(
+    options: dict[str, Any] = {} if workers == 1 else {'workers': workers}
+    if table_filter:
+        options['table_filter'] = table_filter
+    tables = builder.build_tables(
         schemas=schemas,
         disable_model_prefix_protection=disable_model_prefix_protection,
+        **options,
     )
+    if dump_catalog is not None:
+        # Imported here since only dumping needs it
+        from supabase_pydantic.db.snapshot import write_catalog_snapshot
+
+        write_catalog_snapshot(dump_catalog, builder.catalogs, db_type)
+    return tables
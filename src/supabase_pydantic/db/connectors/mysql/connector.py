@@ -1,6 +1,7 @@
 """MySQL database connector implementation."""
 
 import logging
+import math
 from collections.abc import Generator
 from contextlib import contextmanager
 from typing import Any
@@ -29,6 +30,8 @@ class MySQLConnector(BaseDBConnector):
             connection_params: Connection parameters as Pydantic model or dictionary
             **kwargs: Additional connection parameters
         """
+        self._pop_connection_options(kwargs)
+
         # Set default connection parameters if none provided
         if connection_params is None:
             connection_params = {}
@@ -68,7 +71,7 @@ class MySQLConnector(BaseDBConnector):
 
                 # Parse URL parameters
                 url_params = self.get_url_connection_params(db_url)
-                connection = mysql.connector.connect(**url_params)
+                connection = mysql.connector.connect(**url_params, **self._driver_options())
             else:
                 # Connect using direct parameters
                 logger.info('Connecting to MySQL using direct connection parameters')
@@ -82,7 +85,15 @@ class MySQLConnector(BaseDBConnector):
 
                 # Remove None values
                 conn_params = {k: v for k, v in conn_params.items() if v is not None}
-                connection = mysql.connector.connect(**conn_params)
+                connection = mysql.connector.connect(**conn_params, **self._driver_options())
+
+            if self.connection_options.statement_timeout is not None:
+                # Applies to SELECT statements, which is all introspection runs
+                cursor = connection.cursor()
+                cursor.execute(
+                    f'SET SESSION max_execution_time = {round(self.connection_options.statement_timeout * 1000)}'
+                )
+                cursor.close()
 
             logger.info('MySQL connection established successfully')
             return connection  # type: ignore
@@ -92,6 +103,16 @@ class MySQLConnector(BaseDBConnector):
             if logger.getEffectiveLevel() <= logging.DEBUG:
                 raise ConnectionError(f'Failed to connect to MySQL database: {str(e)}')
 
+    def _driver_options(self) -> dict[str, Any]:
+        """Translate the connector's `ConnectionOptions` to MySQL connection arguments."""
+        if self.connection_options.connect_timeout is None:
+            return {}
+        return {'connection_timeout': max(1, math.ceil(self.connection_options.connect_timeout))}
+
+    def _new_connection(self) -> MySQLConnection:
+        """Make a single attempt at opening a connection with the connector's parameters."""
+        return self.connect()
+
     @contextmanager
     def __call__(self) -> Generator[MySQLConnection, None, None]:
         """Context manager for database connection.
@@ -99,7 +120,7 @@ class MySQLConnector(BaseDBConnector):
         Yields:
             MySQL connection object
         """
-        connection = self.connect()
+        connection = self.open_connection()
         try:
             yield connection
         finally:
@@ -111,8 +132,9 @@ class MySQLConnector(BaseDBConnector):
         Returns:
             MySQL connection object
         """
-        self._connection = self.connect()
-        return self._connection
+        connection: MySQLConnection = self.open_connection()
+        self._connection = connection
+        return connection
 
     def __exit__(self, _exc_type: Any, _exc_val: Any, _exc_tb: Any) -> None:
         """Exit context manager.
@@ -130,16 +152,18 @@ class MySQLConnector(BaseDBConnector):
         """Check if the database connection is valid.
 
         Args:
-            connection: Optional connection object to check
+            connection: Optional connection object to check. If not provided, a new connection
+                is opened temporarily to check connectivity.
 
         Returns:
             True if the connection is valid, False otherwise
         """
         try:
-            # Always create a new test connection
-            test_connection = None
+            # Probe the given connection, rather than paying for another handshake
+            test_connection = connection
             try:
-                test_connection = self.connect()
+                if test_connection is None:
+                    test_connection = self.connect()
                 if test_connection is None:
                     logger.error('MySQL connection failed: Could not establish connection to server')
                     return False
@@ -150,7 +174,7 @@ class MySQLConnector(BaseDBConnector):
                 cursor.close()
                 return True
             finally:
-                if test_connection is not None:
+                if connection is None and test_connection is not None:
                     self.close_connection(test_connection)
 
         except Exception as e:
@@ -9,20 +9,58 @@ from mysql.connector.connection import MySQLConnection
 from supabase_pydantic.db.abstract.base_schema_reader import BaseSchemaReader
 from supabase_pydantic.db.connectors.mysql.connector import MySQLConnector
 from supabase_pydantic.db.drivers.mysql.queries import (
+    BATCH_COLUMNS_QUERY,
+    BATCH_CONSTRAINTS_QUERY,
+    BATCH_FOREIGN_KEYS_QUERY,
+    BATCH_TABLES_QUERY,
     COLUMNS_QUERY,
     CONSTRAINTS_QUERY,
-    ENUMS_QUERY,
     FOREIGN_KEYS_QUERY,
     GET_ALL_PUBLIC_TABLES_AND_COLUMNS,
     SCHEMAS_QUERY,
     TABLES_QUERY,
-    USER_DEFINED_TYPES_QUERY,
 )
+from supabase_pydantic.db.drivers.mysql.rows import COLUMN_ROW, CONSTRAINT_ROW
+from supabase_pydantic.db.models import SchemaCatalog
 
 # Get Logger
 logger = logging.getLogger(__name__)
 
 
+# Fields of the column rows that enum types and type mappings are derived from
+enum_fields = COLUMN_ROW.getter('table_schema', 'table_name', 'column_name', 'data_type', 'column_type')
+
+# Position of the comma-separated column names in constraint rows
+CONSTRAINT_COLUMNS = CONSTRAINT_ROW.positions['columns']
+
+# The most schemas read by one batched query
+SCHEMA_BATCH_SIZE = 100
+
+
+def split_constraint_columns(row: tuple[Any, ...]) -> tuple[Any, ...]:
+    """Replace the comma-separated column names of a constraint row with a list."""
+    i = CONSTRAINT_COLUMNS
+    return (*row[:i], row[i].split(',') if row[i] else [], *row[i + 1 :])
+
+
+def partition_by_schema(
+    rows: list[tuple[Any, ...]], catalogs: dict[str, SchemaCatalog], name: str, strip_schema: bool
+) -> None:
+    """Append rows starting with their schema to that schema's result set.
+
+    Args:
+        rows: Rows of a batched query.
+        catalogs: The catalogs being read, by schema.
+        name: The result set to append to.
+        strip_schema: Drop the schema from the rows, for queries that add it to the fields of
+            their single-schema query.
+    """
+    for row in rows:
+        catalog = catalogs.get(row[0])
+        if catalog is not None:
+            getattr(catalog, name).append(row[1:] if strip_schema else row)
+
+
 class MySQLSchemaReader(BaseSchemaReader):
     """MySQL schema reader for retrieving database schema information."""
 
@@ -33,10 +71,13 @@ class MySQLSchemaReader(BaseSchemaReader):
             connector: MySQL database connector
         """
         self.connector = connector
+        # Column rows of the last full-schema read, by schema; enum types and type mappings are
+        # derived from these instead of scanning information_schema.columns again
+        self._columns: dict[str, list[tuple[Any, ...]]] = {}
 
     def execute_query(
         self, connection: MySQLConnection, query: str, params: dict[str, Any] | None = None
-    ) -> list[dict[str, Any]]:
+    ) -> list[tuple[Any, ...]]:
         """Execute a query on the MySQL database and return the results.
 
         Args:
@@ -45,9 +86,10 @@ class MySQLSchemaReader(BaseSchemaReader):
             params: Query parameters
 
         Returns:
-            Query results as a list of dictionaries
+            Query results as a list of tuples, in the field order of the query's row schema
+            (see `supabase_pydantic.db.drivers.mysql.rows`)
         """
-        cursor = connection.cursor(dictionary=True)
+        cursor = connection.cursor()
         try:
             # MySQL Connector uses different parameter substitution than what's in our queries
             # Convert dictionary parameters to tuple format for proper MySQL parameter binding
@@ -75,7 +117,7 @@ class MySQLSchemaReader(BaseSchemaReader):
                 cursor.execute(query)
 
             results = cursor.fetchall()
-            return cast(list[dict[str, Any]], results)
+            return cast(list[tuple[Any, ...]], results)
         except Exception as e:
             logger.error(f'MySQL query execution failed: {e}')
             logger.error(f'Failed query: {query}')
@@ -85,6 +127,21 @@ class MySQLSchemaReader(BaseSchemaReader):
         finally:
             cursor.close()
 
+    def execute_batch(self, connection: MySQLConnection, query: str, schemas: list[str]) -> list[tuple[Any, ...]]:
+        """Execute a batched query for the given schemas.
+
+        Args:
+            connection: MySQL connection
+            query: A batched query, with a '{schemas}' placeholder for the schema list
+            schemas: Schema names
+
+        Returns:
+            Query results as a list of tuples, each starting with its schema
+        """
+        placeholders = ', '.join(['%s'] * len(schemas))
+        params = {f'schema_{i}': schema for i, schema in enumerate(schemas)}
+        return self.execute_query(connection, query.format(schemas=placeholders), params)
+
     def parse_mysql_enum_values(self, enum_values_string: str) -> list[str]:
         """Parse MySQL enum values string into a list.
 
@@ -135,14 +192,14 @@ class MySQLSchemaReader(BaseSchemaReader):
         try:
             logger.debug('Executing MySQL schema query: %s', SCHEMAS_QUERY)
             result = self.execute_query(connection, SCHEMAS_QUERY)
-            schemas = [row['SCHEMA_NAME'] for row in result]
+            schemas = [row[0] for row in result]
             logger.info(f'Found schemas: {schemas}')
             return schemas
         except Exception as e:
             logger.error(f'Error retrieving schemas: {e}')
             return []
 
-    def get_tables(self, connection: MySQLConnection, schema: str) -> list[dict[str, Any]]:
+    def get_tables(self, connection: MySQLConnection, schema: str) -> list[tuple[Any, ...]]:
         """Get all tables in the schema.
 
         Args:
@@ -150,13 +207,13 @@ class MySQLSchemaReader(BaseSchemaReader):
             schema: Schema name
 
         Returns:
-            List of table information dictionaries
+            List of table rows
         """
         try:
             params = {'schema': schema}
             logger.debug(f"Executing MySQL tables query for schema '{schema}': {TABLES_QUERY}")
             result = self.execute_query(connection, TABLES_QUERY, params)
-            table_names = [row.get('TABLE_NAME', 'unknown') for row in result]
+            table_names = [row[0] for row in result]
             logger.info(f'Found {len(result)} tables in schema {schema}: {table_names}')
             return result
         except Exception as e:
@@ -165,7 +222,7 @@ class MySQLSchemaReader(BaseSchemaReader):
 
     def get_columns(
         self, connection: MySQLConnection, schema: str, table_name: str | None = None
-    ) -> list[dict[str, Any]]:
+    ) -> list[tuple[Any, ...]]:
         """Get all columns for all tables in the schema or for a specific table.
 
         Args:
@@ -174,13 +231,14 @@ class MySQLSchemaReader(BaseSchemaReader):
             table_name: Optional table name to filter columns
 
         Returns:
-            List of column information dictionaries
+            List of column rows
         """
         try:
             # Use the comprehensive query that gets all tables and columns at once
             if table_name is None:
                 params = {'schema': schema}
                 result = self.execute_query(connection, GET_ALL_PUBLIC_TABLES_AND_COLUMNS, params)
+                self._columns[schema] = result
                 logger.info(f'Found {len(result)} columns across all tables in schema {schema}')
             else:
                 # For specific table, continue using the existing query
@@ -192,7 +250,7 @@ class MySQLSchemaReader(BaseSchemaReader):
             logger.error(f'Error retrieving columns for schema {schema}: {e}')
             return []
 
-    def get_constraints(self, connection: MySQLConnection, schema: str) -> list[dict[str, Any]]:
+    def get_constraints(self, connection: MySQLConnection, schema: str) -> list[tuple[Any, ...]]:
         """Get all constraints for all tables in the schema.
 
         Args:
@@ -200,18 +258,20 @@ class MySQLSchemaReader(BaseSchemaReader):
             schema: Schema name
 
         Returns:
-            List of constraint information dictionaries
+            List of constraint rows, with the constrained column names as a list
         """
         try:
             params = {'schema': schema}
-            result = self.execute_query(connection, CONSTRAINTS_QUERY, params)
+            result = [
+                split_constraint_columns(row) for row in self.execute_query(connection, CONSTRAINTS_QUERY, params)
+            ]
             logger.info(f'Found {len(result)} constraints in schema {schema}')
             return result
         except Exception as e:
             logger.error(f'Error retrieving constraints for schema {schema}: {e}')
             return []
 
-    def get_foreign_keys(self, connection: MySQLConnection, schema: str) -> list[dict[str, Any]]:
+    def get_foreign_keys(self, connection: MySQLConnection, schema: str) -> list[tuple[Any, ...]]:
         """Get all foreign keys for all tables in the schema.
 
         Args:
@@ -219,7 +279,7 @@ class MySQLSchemaReader(BaseSchemaReader):
             schema: Schema name
 
         Returns:
-            List of foreign key information dictionaries
+            List of foreign key rows
         """
         try:
             params = {'schema': schema}
@@ -230,26 +290,44 @@ class MySQLSchemaReader(BaseSchemaReader):
             logger.error(f'Error retrieving foreign keys for schema {schema}: {e}')
             return []
 
-    def get_user_defined_types(self, connection: MySQLConnection, schema: str) -> list[dict[str, Any]]:
-        """Get all user-defined types in the schema.
+    def schema_columns(self, connection: MySQLConnection, schema: str) -> list[tuple[Any, ...]]:
+        """Get the column rows of a schema, read by the last `get_columns` call if there was one.
 
         Args:
             connection: MySQL connection
             schema: Schema name
 
         Returns:
-            List of user-defined type information dictionaries
+            List of column rows, including each column's `column_type`
         """
-        try:
-            # MySQL doesn't have user-defined types in the same way as PostgreSQL
-            # Here we're primarily looking for ENUM types
+        if schema not in self._columns:
             params = {'schema': schema}
-            result = self.execute_query(connection, ENUMS_QUERY, params)
+            self._columns[schema] = self.execute_query(connection, GET_ALL_PUBLIC_TABLES_AND_COLUMNS, params)
+        return self._columns[schema]
 
-            # Process the enum values to convert from string to array format
-            for row in result:
-                if 'enum_values' in row and row['enum_values']:
-                    row['enum_values'] = self.parse_mysql_enum_values(row['enum_values'])
+    def get_user_defined_types(self, connection: MySQLConnection, schema: str) -> list[tuple[Any, ...]]:
+        """Get all user-defined types in the schema.
+
+        MySQL has no named user-defined types; each ENUM column is reported as an enum type
+        named after the column, with the values parsed from its `column_type`.
+
+        Args:
+            connection: MySQL connection
+            schema: Schema name
+
+        Returns:
+            List of enum type rows: type name, namespace, owner, category, whether it is defined,
+            type ('e') and the list of values
+        """
+        try:
+            result = []
+            for row in self.schema_columns(connection, schema):
+                namespace, _, column_name, _, column_type = enum_fields(row)
+                if not column_type or not column_type.startswith('enum('):
+                    continue
+                # Values from the enum('value1','value2') column type
+                enum_values = self.parse_mysql_enum_values(column_type[len('enum(') : -1])
+                result.append((f'{column_name}_enum', namespace, 'mysql_user', 'E', True, 'e', enum_values))
 
             logger.info(f'Found {len(result)} enum types in schema {schema}')
             return result
@@ -257,21 +335,70 @@ class MySQLSchemaReader(BaseSchemaReader):
             logger.error(f'Error retrieving user-defined types for schema {schema}: {e}')
             return []
 
-    def get_type_mappings(self, connection: MySQLConnection, schema: str) -> list[dict[str, Any]]:
+    def get_type_mappings(self, connection: MySQLConnection, schema: str) -> list[tuple[Any, ...]]:
         """Get all user-defined type mappings in the schema.
 
+        Maps each ENUM and SET column to its type. This is the last result set read for a schema,
+        so the cached column rows are released afterwards.
+
         Args:
             connection: MySQL connection
             schema: Schema name
 
         Returns:
-            List of user-defined type mapping dictionaries
+            List of type mapping rows: column name, table name, namespace, type name, type
+            category ('e' or 's') and type description
         """
         try:
-            params = {'schema': schema}
-            result = self.execute_query(connection, USER_DEFINED_TYPES_QUERY, params)
+            result = []
+            for row in self.schema_columns(connection, schema):
+                namespace, table_name, column_name, data_type, _ = enum_fields(row)
+                if data_type == 'enum':
+                    result.append((column_name, table_name, namespace, data_type, 'e', 'Enum'))
+                elif data_type == 'set':
+                    result.append((column_name, table_name, namespace, data_type, 's', 'Set'))
             logger.info(f'Found {len(result)} type mappings in schema {schema}')
             return result
         except Exception as e:
             logger.error(f'Error retrieving type mappings for schema {schema}: {e}')
             return []
+        finally:
+            self._columns.pop(schema, None)
+
+    def read_catalogs(self, connection: MySQLConnection, schemas: list[str]) -> dict[str, SchemaCatalog] | None:
+        """Read the result sets of several schemas with one query per result set.
+
+        Each query reads up to `SCHEMA_BATCH_SIZE` schemas with `IN (...)`, and its rows are
+        partitioned by schema.
+
+        Args:
+            connection: MySQL connection
+            schemas: Schema names
+
+        Returns:
+            The result sets by schema, or None if a batched query failed
+        """
+        catalogs = {schema: SchemaCatalog() for schema in schemas}
+        try:
+            for start in range(0, len(schemas), SCHEMA_BATCH_SIZE):
+                batch = schemas[start : start + SCHEMA_BATCH_SIZE]
+                tables = self.execute_batch(connection, BATCH_TABLES_QUERY, batch)
+                partition_by_schema(tables, catalogs, 'tables', strip_schema=True)
+                columns = self.execute_batch(connection, BATCH_COLUMNS_QUERY, batch)
+                partition_by_schema(columns, catalogs, 'columns', strip_schema=False)
+                constraints = self.execute_batch(connection, BATCH_CONSTRAINTS_QUERY, batch)
+                constraints = [(row[0], *split_constraint_columns(row[1:])) for row in constraints]
+                partition_by_schema(constraints, catalogs, 'constraints', strip_schema=True)
+                foreign_keys = self.execute_batch(connection, BATCH_FOREIGN_KEYS_QUERY, batch)
+                partition_by_schema(foreign_keys, catalogs, 'foreign_keys', strip_schema=False)
+        except Exception as e:
+            logger.warning(f'Batched read of {len(schemas)} schemas failed, reading them one by one: {e}')
+            return None
+
+        for schema, catalog in catalogs.items():
+            # Enum types and type mappings are derived from the column rows
+            self._columns[schema] = catalog.columns
+            catalog.user_defined_types = self.get_user_defined_types(connection, schema)
+            catalog.type_mappings = self.get_type_mappings(connection, schema)
+        logger.info(f'Read {len(schemas)} schemas with batched queries')
+        return catalogs
@@ -1,20 +1,38 @@
 """PostgreSQL database connector implementation."""
 
 import logging
+import math
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 from urllib.parse import urlparse
 
 import psycopg2
 
 from supabase_pydantic.db.abstract.base_connector import BaseDBConnector
+from supabase_pydantic.db.drivers.postgres.queries import (
+    BEGIN_CONSISTENT_READ,
+    END_CONSISTENT_READ,
+    EXPORT_SNAPSHOT_QUERY,
+    SET_LOCAL_STATEMENT_TIMEOUT,
+    SET_TRANSACTION_SNAPSHOT,
+)
 from supabase_pydantic.db.models import PostgresConnectionParams
 
 # Get Logger
 logger = logging.getLogger(__name__)
 
+# The port of Supabase's transaction-mode pooler (Supavisor)
+POOLER_PORT = 6543
+
 
 class PostgresConnector(BaseDBConnector[PostgresConnectionParams]):
-    """PostgreSQL database connector implementation."""
+    """PostgreSQL database connector implementation.
+
+    Behind a transaction-mode pooler (PgBouncer, Supavisor), each transaction may run on a
+    different server connection: the connector then sets no session-level parameters and shares
+    no snapshots, and the schema reader reads the catalog in a single statement.
+    """
 
     def __init__(
         self, connection_params: PostgresConnectionParams | dict[str, Any] | None = None, **kwargs: Any
@@ -26,6 +44,8 @@ class PostgresConnector(BaseDBConnector[PostgresConnectionParams]):
             **kwargs: Additional parameters passed from the factory
         """
         super().__init__(connection_params, **kwargs)
+        # Whether connections go through a transaction-mode pooler; detected again on connecting
+        self.pooled = bool(self.connection_options.pooler)
         # Store the original PostgresConnectionParams object if provided,
         # or create one from the dictionary that was passed to the parent class
         if isinstance(connection_params, PostgresConnectionParams):
@@ -183,6 +203,67 @@ class PostgresConnector(BaseDBConnector[PostgresConnectionParams]):
         finally:
             cur.close()
 
+    @contextmanager
+    def consistent_read(self, conn: Any, snapshot: str | None = None, export: bool = False) -> Iterator[str | None]:
+        """Run the enclosed queries in one REPEATABLE READ READ ONLY transaction.
+
+        Every query then sees the catalog as it was when the transaction started, even if DDL
+        runs meanwhile. The connection's autocommit setting is restored afterwards.
+
+        Behind a transaction-mode pooler no snapshot is exported or imported, and a transaction is
+        only opened to scope the statement timeout: the schema reader then reads the catalog in a
+        single statement, which is consistent on its own.
+
+        Args:
+            conn: PostgreSQL connection object.
+            snapshot: Read from this snapshot, exported by another connection's consistent read
+                that is still open.
+            export: Export the snapshot with pg_export_snapshot(), for other connections.
+
+        Yields:
+            The id of the exported snapshot, or None if it was not exported.
+        """
+        autocommit = conn.autocommit
+        if not autocommit:
+            # End the transaction psycopg2 opens implicitly, so the isolation level applies
+            conn.rollback()
+            conn.autocommit = True
+        timeout = self.connection_options.statement_timeout
+        in_transaction = not self.pooled or timeout is not None
+        cur = conn.cursor()
+        try:
+            exported = None
+            if in_transaction:
+                cur.execute(BEGIN_CONSISTENT_READ)
+            if self.pooled:
+                if snapshot is not None or export:
+                    logger.warning('Snapshots cannot be shared through a transaction-mode pooler; reading serially')
+                if timeout is not None:
+                    cur.execute(SET_LOCAL_STATEMENT_TIMEOUT, (round(timeout * 1000),))
+            elif snapshot is not None:
+                cur.execute(SET_TRANSACTION_SNAPSHOT, (snapshot,))
+                logger.debug(f'Reading from exported snapshot {snapshot}')
+            elif export:
+                try:
+                    cur.execute(EXPORT_SNAPSHOT_QUERY)
+                    exported = cur.fetchone()[0]
+                    logger.debug(f'Exported snapshot {exported}')
+                except psycopg2.Error as e:
+                    # E.g., on a standby; the reads stay consistent on this connection only
+                    logger.warning(f'Could not export a snapshot for parallel reads: {e}')
+                    cur.execute(END_CONSISTENT_READ)
+                    cur.execute(BEGIN_CONSISTENT_READ)
+            yield exported
+        finally:
+            if not conn.closed:
+                try:
+                    if in_transaction:
+                        cur.execute(END_CONSISTENT_READ)
+                    cur.close()
+                    conn.autocommit = autocommit
+                except psycopg2.Error as e:
+                    logger.warning(f'Could not end the consistent read transaction: {e}')
+
     def close_connection(self, conn: Any) -> None:
         """Close PostgreSQL database connection.
 
@@ -224,6 +305,32 @@ class PostgresConnector(BaseDBConnector[PostgresConnectionParams]):
 
         return {'dbname': database, 'user': username, 'password': password, 'host': host, 'port': str(port)}
 
+    def is_pooler(self, port: str | int) -> bool:
+        """Return whether connections to a port go through a transaction-mode pooler.
+
+        The `pooler` connection option decides, if set; otherwise Supabase's pooler port does.
+        """
+        pooler: bool | None = self.connection_options.pooler
+        if pooler is not None:
+            return pooler
+        return str(port) == str(POOLER_PORT)
+
+    def _driver_options(self) -> dict[str, Any]:
+        """Translate the connector's `ConnectionOptions` to libpq connection parameters."""
+        options = self.connection_options
+        driver_options: dict[str, Any] = {}
+        if options.connect_timeout is not None:
+            # libpq takes whole seconds
+            driver_options['connect_timeout'] = max(1, math.ceil(options.connect_timeout))
+        if options.keepalives_idle is not None:
+            driver_options.update(
+                keepalives=1, keepalives_idle=options.keepalives_idle, keepalives_interval=10, keepalives_count=3
+            )
+        if options.statement_timeout is not None and not self.pooled:
+            # Poolers reject startup options; consistent_read sets the timeout per transaction
+            driver_options['options'] = f'-c statement_timeout={round(options.statement_timeout * 1000)}'
+        return driver_options
+
     def _create_connection(self, dbname: str, username: str, password: str, host: str, port: str) -> Any:
         """Create a direct connection to PostgreSQL database.
 
@@ -240,8 +347,13 @@ class PostgresConnector(BaseDBConnector[PostgresConnectionParams]):
         Raises:
             ConnectionError: If connection fails.
         """
+        self.pooled = self.is_pooler(port)
+        if self.pooled:
+            logger.info('Connecting through a transaction-mode pooler')
         try:
-            conn = psycopg2.connect(dbname=dbname, user=username, password=password, host=host, port=port)
+            conn = psycopg2.connect(
+                dbname=dbname, user=username, password=password, host=host, port=port, **self._driver_options()
+            )
             return conn
         except psycopg2.OperationalError as e:
             raise ConnectionError(f'Error connecting to PostgreSQL database: {e}')
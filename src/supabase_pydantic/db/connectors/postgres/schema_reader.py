@@ -1,26 +1,48 @@
 """PostgreSQL schema reader implementation."""
 
 import logging
-from typing import Any
+from collections.abc import Sequence
+from typing import Any, ClassVar
 
 from supabase_pydantic.db.abstract.base_connector import BaseDBConnector
 from supabase_pydantic.db.abstract.base_schema_reader import BaseSchemaReader
+from supabase_pydantic.db.connectors.postgres.connector import PostgresConnector
 from supabase_pydantic.db.drivers.postgres.queries import (
+    CATALOG_QUERY,
+    CATALOG_QUERY_SCHEMA_PARAMS,
     GET_ALL_PUBLIC_TABLES_AND_COLUMNS,
     GET_COLUMN_TO_USER_DEFINED_TYPE_MAPPING,
     GET_CONSTRAINTS,
     GET_ENUM_TYPES,
     GET_TABLE_COLUMN_DETAILS,
+    RELATION_COLUMNS_QUERY,
+    RELATION_CONSTRAINTS_QUERY,
+    RELATION_FOREIGN_KEYS_QUERY,
+    RELATION_TABLES_QUERY,
+    RELATION_TYPE_MAPPING_QUERY,
     SCHEMAS_QUERY,
     TABLES_QUERY,
 )
+from supabase_pydantic.db.models import SchemaCatalog
 
 # Get Logger
 logger = logging.getLogger(__name__)
 
 
 class PostgresSchemaReader(BaseSchemaReader):
-    """PostgreSQL schema reader implementation."""
+    """PostgreSQL schema reader implementation.
+
+    The per-table methods take an optional list of tables, to re-read only the tables that DDL
+    changed (see `DatabaseBuilder.build_tables`).
+    """
+
+    relation_positions: ClassVar[dict[str, int]] = {
+        'tables': 0,
+        'columns': 1,
+        'constraints': 1,
+        'foreign_keys': 1,
+        'type_mappings': 1,
+    }
 
     def __init__(self, connector: BaseDBConnector):
         """Initialize with a PostgreSQL connector.
@@ -31,6 +53,46 @@ class PostgresSchemaReader(BaseSchemaReader):
         logger.info('PostgresSchemaReader initialized')
         super().__init__(connector)
 
+    def batches_single_schema(self) -> bool:
+        """Return whether the connector goes through a transaction-mode pooler.
+
+        Every round trip then counts, so even a single schema is read with `read_catalogs`.
+        """
+        return isinstance(self.connector, PostgresConnector) and self.connector.pooled
+
+    def read_catalogs(self, conn: Any, schemas: list[str]) -> dict[str, SchemaCatalog] | None:
+        """Read the result sets of several schemas in a single statement, behind a pooler.
+
+        Transaction-mode poolers may run each statement on a different server connection, so the
+        whole catalog is read with one statement (see `CATALOG_QUERY`). Without a pooler this
+        reads nothing, and each schema is read on its own.
+
+        Args:
+            conn: PostgreSQL connection object.
+            schemas: Schema names.
+
+        Returns:
+            The result sets by schema, or None if they were not read.
+        """
+        if not self.batches_single_schema():
+            return None
+        result = self.connector.execute_query(conn, CATALOG_QUERY, (list(schemas),) * CATALOG_QUERY_SCHEMA_PARAMS)
+        tables, columns, constraints, foreign_keys, user_defined_types, type_mappings = result[0]
+
+        # The user-defined types and type mappings are read for the whole database, as by the
+        # per-schema methods, and shared by every schema
+        shared = {
+            'user_defined_types': [tuple(row.values()) for row in user_defined_types or []],
+            'type_mappings': [tuple(row.values()) for row in type_mappings or []],
+        }
+        catalogs = {schema: SchemaCatalog(**shared) for schema in schemas}
+        per_schema = {'tables': tables, 'columns': columns, 'constraints': constraints, 'foreign_keys': foreign_keys}
+        for name, rows in per_schema.items():
+            for schema, row in rows or []:
+                getattr(catalogs[schema], name).append(tuple(row.values()))
+        logger.debug(f'Read the catalogs of {len(schemas)} schema(s) in one statement')
+        return catalogs
+
     def get_schemas(self, conn: Any) -> list[str]:
         """Get all schemas in the PostgreSQL database.
 
@@ -43,56 +105,86 @@ class PostgresSchemaReader(BaseSchemaReader):
         schemas_result = self.connector.execute_query(conn, SCHEMAS_QUERY)
         return [schema[0] for schema in schemas_result]
 
-    def get_tables(self, conn: Any, schema: str) -> list[tuple]:
+    def get_tables(self, conn: Any, schema: str, tables: Sequence[str] | None = None) -> list[tuple]:
         """Get all tables in the specified schema.
 
         Args:
             conn: PostgreSQL connection object.
             schema: Schema name.
+            tables: Only read these tables, if given.
 
         Returns:
             List of table information as tuples.
         """
-        result = self.connector.execute_query(conn, TABLES_QUERY, (schema,))
+        if tables is not None:
+            result = self.connector.execute_query(conn, RELATION_TABLES_QUERY, (schema, list(tables)))
+        else:
+            result = self.connector.execute_query(conn, TABLES_QUERY, (schema,))
         return result if isinstance(result, list) else []
 
-    def get_columns(self, conn: Any, schema: str) -> list[tuple[Any, ...]]:
+    def get_columns(self, conn: Any, schema: str, tables: Sequence[str] | None = None) -> list[tuple[Any, ...]]:
         """Get all columns in the specified schema.
 
         Args:
             conn: PostgreSQL connection object.
             schema: Schema name.
+            tables: Only read these tables, if given.
 
         Returns:
             List of column information as tuples.
         """
-        result = self.connector.execute_query(conn, GET_ALL_PUBLIC_TABLES_AND_COLUMNS, (schema,))
+        if tables is not None:
+            result = self.connector.execute_query(conn, RELATION_COLUMNS_QUERY, (schema, list(tables)))
+        else:
+            result = self.connector.execute_query(conn, GET_ALL_PUBLIC_TABLES_AND_COLUMNS, (schema,))
         return result if isinstance(result, list) else []
 
-    def get_foreign_keys(self, conn: Any, schema: str) -> list[tuple[Any, ...]]:
+    def get_foreign_keys(self, conn: Any, schema: str, tables: Sequence[str] | None = None) -> list[tuple[Any, ...]]:
         """Get all foreign keys in the specified schema.
 
         Args:
             conn: PostgreSQL connection object.
             schema: Schema name.
+            tables: Only read these tables, if given.
 
         Returns:
             List of foreign key information as tuples.
         """
-        result = self.connector.execute_query(conn, GET_TABLE_COLUMN_DETAILS, (schema,))
+        if tables is not None:
+            result = self.connector.execute_query(conn, RELATION_FOREIGN_KEYS_QUERY, (schema, list(tables)))
+        else:
+            result = self.connector.execute_query(conn, GET_TABLE_COLUMN_DETAILS, (schema,))
         return result if isinstance(result, list) else []
 
-    def get_constraints(self, conn: Any, schema: str) -> list[tuple[Any, ...]]:
+    def get_referenced_tables(self, conn: Any, schema: str, tables: list[str]) -> set[str]:
+        """Get the tables of a schema that foreign keys of the given tables reference.
+
+        Args:
+            conn: PostgreSQL connection object.
+            schema: Schema name.
+            tables: The referencing tables.
+
+        Returns:
+            The referenced table names.
+        """
+        # Rows: (table_schema, table_name, column_name, foreign_table_schema, foreign_table_name, ...)
+        return {row[4] for row in self.get_foreign_keys(conn, schema, tables=tables) if row[3] == schema}
+
+    def get_constraints(self, conn: Any, schema: str, tables: Sequence[str] | None = None) -> list[tuple[Any, ...]]:
         """Get all constraints in the specified schema.
 
         Args:
             conn: PostgreSQL connection object.
             schema: Schema name.
+            tables: Only read these tables, if given.
 
         Returns:
             List of constraint information as tuples.
         """
-        result = self.connector.execute_query(conn, GET_CONSTRAINTS, (schema,))
+        if tables is not None:
+            result = self.connector.execute_query(conn, RELATION_CONSTRAINTS_QUERY, (schema, list(tables)))
+        else:
+            result = self.connector.execute_query(conn, GET_CONSTRAINTS, (schema,))
         return result if isinstance(result, list) else []
 
     def get_user_defined_types(self, conn: Any, schema: str) -> list[tuple[Any, ...]]:
@@ -108,15 +200,19 @@ class PostgresSchemaReader(BaseSchemaReader):
         result = self.connector.execute_query(conn, GET_ENUM_TYPES, (schema,))
         return result if isinstance(result, list) else []
 
-    def get_type_mappings(self, conn: Any, schema: str) -> list[tuple[Any, ...]]:
+    def get_type_mappings(self, conn: Any, schema: str, tables: Sequence[str] | None = None) -> list[tuple[Any, ...]]:
         """Get type mapping information for the specified schema.
 
         Args:
             conn: PostgreSQL connection object.
             schema: Schema name.
+            tables: Only read these tables, if given.
 
         Returns:
             List of type mapping information as tuples.
         """
-        result = self.connector.execute_query(conn, GET_COLUMN_TO_USER_DEFINED_TYPE_MAPPING, (schema,))
+        if tables is not None:
+            result = self.connector.execute_query(conn, RELATION_TYPE_MAPPING_QUERY, (schema, list(tables)))
+        else:
+            result = self.connector.execute_query(conn, GET_COLUMN_TO_USER_DEFINED_TYPE_MAPPING, (schema,))
         return result if isinstance(result, list) else []
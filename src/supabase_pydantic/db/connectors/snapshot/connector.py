@@ -0,0 +1,69 @@
+"""Connector that replays a catalog snapshot instead of querying a database."""
+
+import logging
+from typing import Any
+
+from supabase_pydantic.db.abstract.base_connector import BaseDBConnector
+from supabase_pydantic.db.models import CatalogFileConnectionParams
+from supabase_pydantic.db.snapshot import CatalogSnapshot, read_catalog_snapshot
+from supabase_pydantic.utils.profiling import span
+
+# Get Logger
+logger = logging.getLogger(__name__)
+
+
+class CatalogFileConnector(BaseDBConnector[CatalogFileConnectionParams]):
+    """Connector that "connects" by loading a catalog snapshot.
+
+    The connection is a `CatalogSnapshot`, read by `CatalogFileSchemaReader`.
+    """
+
+    def validate_connection_params(
+        self, params: CatalogFileConnectionParams | dict[str, Any]
+    ) -> CatalogFileConnectionParams:
+        """Validate and convert connection parameters to CatalogFileConnectionParams.
+
+        Raises:
+            ValueError: If no path is given.
+        """
+        model = params if isinstance(params, CatalogFileConnectionParams) else CatalogFileConnectionParams(**params)
+        if not model.is_valid():
+            raise ValueError("Invalid connection parameters. Provide the 'path' of a catalog snapshot.")
+        return model
+
+    def connect(
+        self, connection_params: CatalogFileConnectionParams | dict[str, Any] | None = None, **kwargs: Any
+    ) -> Any:
+        """Load the catalog snapshot.
+
+        Returns:
+            The `CatalogSnapshot` saved in the file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If no path is given, or the file is not a catalog snapshot.
+        """
+        params = self.validate_connection_params({**self.connection_params, **dict(connection_params or {}), **kwargs})
+        with span('snapshot.read'):
+            snapshot = read_catalog_snapshot(params.path)
+        logger.info(f'Loaded catalog snapshot of {len(snapshot.catalogs)} schema(s) from {params.path}')
+        return snapshot
+
+    def check_connection(self, conn: Any) -> bool:
+        """Check that the snapshot was loaded."""
+        return isinstance(conn, CatalogSnapshot)
+
+    def execute_query(self, conn: Any, query: str, params: tuple = ()) -> list[tuple]:
+        """Snapshots cannot be queried; the schema reader reads them directly.
+
+        Raises:
+            NotImplementedError: Always.
+        """
+        raise NotImplementedError('Queries are not supported when replaying a catalog snapshot')
+
+    def close_connection(self, conn: Any) -> None:
+        """Nothing to close."""
+
+    def get_url_connection_params(self, url: str) -> dict[str, Any]:
+        """Treat the URL as the path of a snapshot file."""
+        return {'path': url}
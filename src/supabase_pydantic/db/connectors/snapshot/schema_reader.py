@@ -0,0 +1,56 @@
+"""Schema reader for catalog snapshots."""
+
+import logging
+from typing import Any
+
+from supabase_pydantic.db.abstract.base_schema_reader import BaseSchemaReader
+from supabase_pydantic.db.models import SchemaCatalog
+from supabase_pydantic.db.snapshot import CatalogSnapshot
+
+# Get Logger
+logger = logging.getLogger(__name__)
+
+
+class CatalogFileSchemaReader(BaseSchemaReader):
+    """Schema reader that returns the result sets saved in a catalog snapshot.
+
+    The rows are those the snapshotted database's own schema reader returned, so that
+    database's marshalers build table information from them.
+    """
+
+    def _catalog(self, conn: CatalogSnapshot, schema: str) -> SchemaCatalog:
+        return conn.catalogs.get(schema) or SchemaCatalog()
+
+    def get_schemas(self, conn: CatalogSnapshot) -> list[str]:
+        """Get the schemas saved in the snapshot."""
+        return list(conn.catalogs)
+
+    def get_tables(self, conn: CatalogSnapshot, schema: str) -> list[tuple]:
+        """Get all tables in the specified schema."""
+        result = self._catalog(conn, schema).tables
+        return result if isinstance(result, list) else []
+
+    def get_columns(self, conn: CatalogSnapshot, schema: str) -> list[tuple[Any, ...]]:
+        """Get all columns in the specified schema."""
+        result = self._catalog(conn, schema).columns
+        return result if isinstance(result, list) else []
+
+    def get_foreign_keys(self, conn: CatalogSnapshot, schema: str) -> list[tuple[Any, ...]]:
+        """Get all foreign keys in the specified schema."""
+        result = self._catalog(conn, schema).foreign_keys
+        return result if isinstance(result, list) else []
+
+    def get_constraints(self, conn: CatalogSnapshot, schema: str) -> list[tuple[Any, ...]]:
+        """Get all constraints in the specified schema."""
+        result = self._catalog(conn, schema).constraints
+        return result if isinstance(result, list) else []
+
+    def get_user_defined_types(self, conn: CatalogSnapshot, schema: str) -> list[tuple[Any, ...]]:
+        """Get all user-defined types."""
+        result = self._catalog(conn, schema).user_defined_types
+        return result if isinstance(result, list) else []
+
+    def get_type_mappings(self, conn: CatalogSnapshot, schema: str) -> list[tuple[Any, ...]]:
+        """Get type mapping information for the specified schema."""
+        result = self._catalog(conn, schema).type_mappings
+        return result if isinstance(result, list) else []
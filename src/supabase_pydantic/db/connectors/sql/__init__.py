@@ -0,0 +1 @@
+"""SQL file connector module."""
@@ -0,0 +1,90 @@
+"""Connector that reads a schema from SQL files instead of a database."""
+
+import logging
+from pathlib import Path
+from typing import Any
+
+from supabase_pydantic.db.abstract.base_connector import BaseDBConnector
+from supabase_pydantic.db.drivers.postgres.ddl import DDLCatalog
+from supabase_pydantic.db.models import SqlFileConnectionParams
+from supabase_pydantic.utils.profiling import span
+
+# Get Logger
+logger = logging.getLogger(__name__)
+
+
+def sql_files(paths: list[str]) -> list[Path]:
+    """Expand paths into the SQL files to apply.
+
+    Files are used as given. Folders contribute their .sql files in name order, the order
+    migration tools apply them in.
+
+    Raises:
+        FileNotFoundError: If a path does not exist.
+    """
+    files: list[Path] = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(path.rglob('*.sql')))
+        elif path.exists():
+            files.append(path)
+        else:
+            raise FileNotFoundError(f'SQL file or folder not found: {path}')
+    return files
+
+
+class SqlFileConnector(BaseDBConnector[SqlFileConnectionParams]):
+    """Connector that "connects" by applying SQL files to an in-memory catalog.
+
+    The connection is a `DDLCatalog`, read by `SqlFileSchemaReader`. `pg_dump --schema-only`
+    output and migration files are both supported.
+    """
+
+    def validate_connection_params(self, params: SqlFileConnectionParams | dict[str, Any]) -> SqlFileConnectionParams:
+        """Validate and convert connection parameters to SqlFileConnectionParams.
+
+        Raises:
+            ValueError: If no paths are given.
+        """
+        model = params if isinstance(params, SqlFileConnectionParams) else SqlFileConnectionParams(**params)
+        if not model.is_valid():
+            raise ValueError("Invalid connection parameters. Provide 'paths' to one or more SQL files or folders.")
+        return model
+
+    def connect(self, connection_params: SqlFileConnectionParams | dict[str, Any] | None = None, **kwargs: Any) -> Any:
+        """Apply the SQL files to a new catalog.
+
+        Returns:
+            A `DDLCatalog` with the statements of every file applied.
+
+        Raises:
+            FileNotFoundError: If a path does not exist.
+            ValueError: If no paths are given.
+        """
+        params = self.validate_connection_params({**self.connection_params, **dict(connection_params or {}), **kwargs})
+        catalog = DDLCatalog()
+        for path in sql_files(params.paths):
+            logger.debug(f'Applying SQL file: {path}')
+            with span('sql.parse', file=path.name):
+                catalog.execute(path.read_text(encoding='utf-8'), source=str(path))
+        logger.info(f'Read {len(catalog.tables)} table(s) from SQL files')
+        return catalog
+
+    def check_connection(self, conn: Any) -> bool:
+        """Check that the SQL files were read."""
+        return isinstance(conn, DDLCatalog)
+
+    def execute_query(self, conn: Any, query: str, params: tuple = ()) -> list[tuple]:
+        """SQL files cannot be queried; the schema reader reads the catalog directly.
+
+        Raises:
+            NotImplementedError: Always.
+        """
+        raise NotImplementedError('Queries are not supported when reading a schema from SQL files')
+
+    def close_connection(self, conn: Any) -> None:
+        """Nothing to close."""
+
+    def get_url_connection_params(self, url: str) -> dict[str, Any]:
+        """Treat the URL as the path of a SQL file or folder."""
+        return {'paths': [url]}
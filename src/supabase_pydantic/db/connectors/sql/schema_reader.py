@@ -0,0 +1,53 @@
+"""Schema reader for schemas read from SQL files."""
+
+import logging
+from typing import Any
+
+from supabase_pydantic.db.abstract.base_schema_reader import BaseSchemaReader
+from supabase_pydantic.db.drivers.postgres.ddl import DDLCatalog
+
+# Get Logger
+logger = logging.getLogger(__name__)
+
+
+class SqlFileSchemaReader(BaseSchemaReader):
+    """Schema reader that returns a `DDLCatalog`'s result sets.
+
+    The rows have the shapes of the PostgreSQL catalog queries, so the PostgreSQL marshalers
+    build table information from them.
+    """
+
+    def get_schemas(self, conn: DDLCatalog) -> list[str]:
+        """Get the schemas declared or used by the SQL files."""
+        result = conn.schema_names()
+        return result if isinstance(result, list) else []
+
+    def get_tables(self, conn: DDLCatalog, schema: str) -> list[tuple]:
+        """Get all tables in the specified schema."""
+        result = conn.schema_catalog(schema).tables
+        return result if isinstance(result, list) else []
+
+    def get_columns(self, conn: DDLCatalog, schema: str) -> list[tuple[Any, ...]]:
+        """Get all columns in the specified schema."""
+        result = conn.schema_catalog(schema).columns
+        return result if isinstance(result, list) else []
+
+    def get_foreign_keys(self, conn: DDLCatalog, schema: str) -> list[tuple[Any, ...]]:
+        """Get all foreign keys in the specified schema."""
+        result = conn.schema_catalog(schema).foreign_keys
+        return result if isinstance(result, list) else []
+
+    def get_constraints(self, conn: DDLCatalog, schema: str) -> list[tuple[Any, ...]]:
+        """Get all constraints in the specified schema."""
+        result = conn.schema_catalog(schema).constraints
+        return result if isinstance(result, list) else []
+
+    def get_user_defined_types(self, conn: DDLCatalog, schema: str) -> list[tuple[Any, ...]]:
+        """Get all user-defined types."""
+        result = conn.schema_catalog(schema).user_defined_types
+        return result if isinstance(result, list) else []
+
+    def get_type_mappings(self, conn: DDLCatalog, schema: str) -> list[tuple[Any, ...]]:
+        """Get type mapping information for the specified schema."""
+        result = conn.schema_catalog(schema).type_mappings
+        return result if isinstance(result, list) else []
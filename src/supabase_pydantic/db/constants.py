@@ -15,6 +15,8 @@ class DatabaseConnectionType(Enum):
 
     LOCAL = 'local'
     DB_URL = 'db_url'
+    SQL_FILE = 'sql_file'
+    CATALOG_FILE = 'catalog_file'
 
 
 class DatabaseUserDefinedType(str, Enum):
@@ -1,5 +1,7 @@
 """MySQL-specific queries for schema information retrieval."""
 
+import re
+
 TABLES_QUERY = """
 SELECT table_name
 FROM information_schema.tables
@@ -66,7 +68,8 @@ SELECT
     END as identity_generation,
     c.data_type as udt_name,
     NULL as array_element_type,
-    c.column_comment as description
+    c.column_comment as description,
+    c.column_type AS column_type
 FROM
     information_schema.columns AS c
 JOIN
@@ -102,53 +105,25 @@ ORDER BY
     tc.table_name, tc.constraint_type DESC;
 """  # noqa: E501
 
-ENUMS_QUERY = """
-SELECT
-    -- Enum type name (use column_name + '_enum' to create a unique type name)
-    CONCAT(c.column_name, '_enum') AS type_name,
-    -- Namespace is the schema name
-    c.table_schema AS namespace,
-    -- Owner - MySQL doesn't track owner the same way, use current user
-    'mysql_user' AS owner,
-    -- Category - use 'E' for enum like PostgreSQL
-    'E' AS category,
-    -- Is defined - always true for MySQL enums
-    TRUE AS is_defined,
-    -- Type - use 'e' for enum like PostgreSQL
-    'e' AS type,
-    -- Enum values as a string that can be parsed as an array
-    -- Extract values from enum('value1','value2') format
-    SUBSTRING(
-        COLUMN_TYPE,
-        LOCATE('enum(', COLUMN_TYPE) + 5,
-        LENGTH(COLUMN_TYPE) - LOCATE('enum(', COLUMN_TYPE) - 6
-    ) AS enum_values
-FROM
-    information_schema.columns c
-WHERE
-    c.table_schema = %s
-    AND c.column_type LIKE 'enum%';
-"""
+# Queries reading several schemas at once, derived from the single-schema queries: '{schemas}' is
+# replaced with one '%s' placeholder per schema. Every row starts with its schema; the tables and
+# constraints queries add it in front of the fields of their single-schema queries.
 
-USER_DEFINED_TYPES_QUERY = """
-SELECT
-    c.column_name AS column_name,
-    c.table_name AS table_name,
-    c.table_schema AS namespace,
-    c.data_type AS type_name,
-    CASE
-        WHEN c.data_type = 'enum' THEN 'e'
-        WHEN c.data_type = 'set' THEN 's'
-        ELSE 'o'
-    END AS type_category,
-    CASE
-        WHEN c.data_type = 'enum' THEN 'Enum'
-        WHEN c.data_type = 'set' THEN 'Set'
-        ELSE 'Other'
-    END AS type_description
-FROM
-    information_schema.columns c
-WHERE
-    c.table_schema = %s
-    AND (c.data_type = 'enum' OR c.data_type = 'set');
-"""
+
+def _batch(query: str, anchor: str, schema_field: str | None = None) -> str:
+    """Return `query` reading the schemas in '{schemas}' instead of the one compared in `anchor`.
+
+    If `schema_field` is given, it is selected, grouped and ordered by first.
+    """
+    if query.count(anchor) != 1:
+        raise ValueError(f'Expected exactly one {anchor!r} in query')
+    query = query.replace(anchor, anchor.replace('= %s', 'IN ({schemas})'))
+    if schema_field is not None:
+        query = re.sub(r'^(SELECT|GROUP BY|ORDER BY)(\s+)', rf'\1\2{schema_field}, ', query, flags=re.M)
+    return query
+
+
+BATCH_TABLES_QUERY = _batch(TABLES_QUERY, 'table_schema = %s', 'table_schema')
+BATCH_COLUMNS_QUERY = _batch(GET_ALL_PUBLIC_TABLES_AND_COLUMNS, 'c.table_schema = %s')
+BATCH_CONSTRAINTS_QUERY = _batch(CONSTRAINTS_QUERY, 'tc.constraint_schema = %s', 'tc.constraint_schema')
+BATCH_FOREIGN_KEYS_QUERY = _batch(FOREIGN_KEYS_QUERY, 'tc.constraint_schema = %s')
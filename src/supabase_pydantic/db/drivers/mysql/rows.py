@@ -0,0 +1,93 @@
+"""Positional row schemas for the MySQL queries.
+
+The MySQL schema reader fetches rows as plain tuples rather than building a dict per row. Each
+row schema names the fields of a query's rows in select order, and compiles accessors that read
+fields by position.
+"""
+
+from collections.abc import Callable, Sequence
+from operator import itemgetter
+from typing import Any
+
+
+class RowSchema:
+    """The field order of the rows of a query."""
+
+    def __init__(self, *fields: str):
+        """Initialize the row schema.
+
+        Args:
+            fields: The names of the fields, in select order.
+        """
+        self.fields = fields
+        self.positions = {name: i for i, name in enumerate(fields)}
+
+    def __len__(self) -> int:
+        """Return the number of fields in a row."""
+        return len(self.fields)
+
+    def getter(self, *names: str) -> Callable[[Sequence[Any]], Any]:
+        """Compile an accessor for the named fields of a row.
+
+        Args:
+            names: The fields to read.
+
+        Returns:
+            A function returning the field's value for a single name, or a tuple of the values
+            for several.
+        """
+        return itemgetter(*(self.positions[name] for name in names))
+
+
+SCHEMA_ROW = RowSchema('schema_name')
+
+TABLE_ROW = RowSchema('table_name')
+
+# Rows of GET_ALL_PUBLIC_TABLES_AND_COLUMNS: the column details shared with the other databases
+# (see get_table_details_from_columns), followed by the MySQL column type
+COLUMN_ROW = RowSchema(
+    'table_schema',
+    'table_name',
+    'column_name',
+    'column_default',
+    'is_nullable',
+    'data_type',
+    'character_maximum_length',
+    'table_type',
+    'identity_generation',
+    'udt_name',
+    'array_element_type',
+    'description',
+    'column_type',
+)
+
+# Rows of COLUMNS_QUERY, for a single table
+TABLE_COLUMN_ROW = RowSchema(
+    'column_name',
+    'data_type',
+    'column_default',
+    'is_nullable',
+    'character_maximum_length',
+    'column_type',
+    'identity_generation',
+)
+
+CONSTRAINT_ROW = RowSchema('constraint_name', 'table_name', 'columns', 'constraint_type', 'constraint_definition')
+
+FOREIGN_KEY_ROW = RowSchema(
+    'table_schema',
+    'table_name',
+    'column_name',
+    'foreign_table_schema',
+    'foreign_table_name',
+    'foreign_column_name',
+    'constraint_name',
+)
+
+# Rows of BATCH_TABLES_QUERY and BATCH_CONSTRAINTS_QUERY: the schema, then a single-schema row
+BATCH_TABLE_ROW = RowSchema('table_schema', *TABLE_ROW.fields)
+
+BATCH_CONSTRAINT_ROW = RowSchema('constraint_schema', *CONSTRAINT_ROW.fields)
+
+# The column details read by get_table_details_from_columns
+column_details = COLUMN_ROW.getter(*COLUMN_ROW.fields[:-1])
@@ -0,0 +1,1072 @@
+"""An in-memory PostgreSQL catalog built from DDL, for introspection without a database.
+
+`DDLCatalog` applies the statements of `pg_dump --schema-only` output or migration files in
+order, and returns each schema's result sets in the row shapes of the catalog queries in
+`queries.py`. The PostgreSQL marshalers therefore build the same table information from a DDL
+file as from a live database.
+
+Supported statements:
+
+- CREATE SCHEMA, CREATE TABLE (columns, column and table constraints, INHERITS)
+- CREATE TYPE ... AS ENUM / AS (composite) / AS RANGE, CREATE DOMAIN
+- CREATE [UNIQUE] INDEX (for ADD CONSTRAINT ... USING INDEX)
+- ALTER TABLE: ADD/DROP/ALTER/RENAME COLUMN, ADD/DROP/RENAME CONSTRAINT, RENAME TO
+- ALTER TYPE ... ADD VALUE / RENAME VALUE / RENAME TO
+- COMMENT ON COLUMN, DROP TABLE/TYPE/DOMAIN/INDEX, SET search_path
+
+Other statements (functions, policies, grants, ...) are skipped. Views are skipped too: their
+column types cannot be known without evaluating their queries.
+"""
+
+import logging
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field, replace
+from typing import NamedTuple
+
+from supabase_pydantic.db.models import SchemaCatalog
+
+# Get Logger
+logger = logging.getLogger(__name__)
+
+
+class DDLParseError(ValueError):
+    """Raised when a DDL statement cannot be parsed."""
+
+
+# Built-in types by every name they can be written as: (information_schema data_type, udt_name)
+BUILTIN_TYPES: dict[str, tuple[str, str]] = {}
+for _names, _data_type, _udt_name in [
+    (('smallint', 'int2'), 'smallint', 'int2'),
+    (('integer', 'int', 'int4'), 'integer', 'int4'),
+    (('bigint', 'int8'), 'bigint', 'int8'),
+    (('real', 'float4'), 'real', 'float4'),
+    (('double precision', 'float8', 'float'), 'double precision', 'float8'),
+    (('numeric', 'decimal'), 'numeric', 'numeric'),
+    (('character varying', 'varchar'), 'character varying', 'varchar'),
+    (('character', 'char', 'bpchar'), 'character', 'bpchar'),
+    (('boolean', 'bool'), 'boolean', 'bool'),
+    (('time', 'time without time zone'), 'time without time zone', 'time'),
+    (('timetz', 'time with time zone'), 'time with time zone', 'timetz'),
+    (('timestamp', 'timestamp without time zone'), 'timestamp without time zone', 'timestamp'),
+    (('timestamptz', 'timestamp with time zone'), 'timestamp with time zone', 'timestamptz'),
+    (('bit varying', 'varbit'), 'bit varying', 'varbit'),
+]:
+    for _name in _names:
+        BUILTIN_TYPES[_name] = (_data_type, _udt_name)
+for _name in (
+    'text money date interval bytea uuid json jsonb xml inet cidr macaddr macaddr8 tsvector tsquery '
+    'point line lseg box path polygon circle bit oid name'
+).split():
+    BUILTIN_TYPES[_name] = (_name, _name)
+
+# Serial pseudo-types: the integer type they stand for
+SERIAL_TYPES = {
+    'smallserial': 'smallint',
+    'serial2': 'smallint',
+    'serial': 'integer',
+    'serial4': 'integer',
+    'bigserial': 'bigint',
+    'serial8': 'bigint',
+}
+
+# Type categories (pg_type.typcategory) of built-in types, by data_type; others are 'U'
+TYPE_CATEGORIES = {
+    'smallint': 'N',
+    'integer': 'N',
+    'bigint': 'N',
+    'real': 'N',
+    'double precision': 'N',
+    'numeric': 'N',
+    'money': 'N',
+    'text': 'S',
+    'character varying': 'S',
+    'character': 'S',
+    'boolean': 'B',
+    'date': 'D',
+    'time without time zone': 'D',
+    'time with time zone': 'D',
+    'timestamp without time zone': 'D',
+    'timestamp with time zone': 'D',
+    'interval': 'T',
+}
+
+TYPE_DESCRIPTIONS = {'d': 'Domain', 'c': 'Composite', 'e': 'Enum', 'r': 'Range'}
+
+# Reserved words that must be quoted as identifiers
+RESERVED_WORDS = set(
+    'all analyse analyze and any array as asc asymmetric both case cast check collate column constraint create '
+    'current_catalog current_date current_role current_time current_timestamp current_user default deferrable desc '
+    'distinct do else end except false fetch for foreign from grant group having in initially intersect into '
+    'lateral leading limit localtime localtimestamp not null offset on only or order placing primary references '
+    'returning select session_user some symmetric table then to trailing true union unique user using variadic '
+    'when where window with'.split()
+)
+
+# Words that end a column's type or default expression in a column definition
+_COLUMN_CONSTRAINT_WORDS = {
+    'constraint',
+    'not',
+    'null',
+    'default',
+    'primary',
+    'unique',
+    'references',
+    'check',
+    'generated',
+    'collate',
+    'deferrable',
+    'initially',
+}
+
+# Words that start a table constraint in CREATE TABLE or ALTER TABLE ... ADD
+_TABLE_CONSTRAINT_WORDS = {'constraint', 'primary', 'unique', 'foreign', 'check', 'exclude'}
+
+# What INCLUDING ALL copies in a LIKE clause of CREATE TABLE
+_LIKE_OPTIONS = {
+    'comments',
+    'compression',
+    'constraints',
+    'defaults',
+    'generated',
+    'identity',
+    'indexes',
+    'statistics',
+    'storage',
+}
+
+
+def quote_ident(name: str) -> str:
+    """Quote an identifier the way PostgreSQL prints it, only when needed."""
+    if re.fullmatch(r'[a-z_][a-z0-9_$]*', name) and name not in RESERVED_WORDS:
+        return name
+    return '"' + name.replace('"', '""') + '"'
+
+
+def regclass(schema: str, name: str) -> str:
+    """Print a relation as `::regclass` does with the default search path."""
+    return quote_ident(name) if schema == 'public' else f'{quote_ident(schema)}.{quote_ident(name)}'
+
+
+# Tokenizing
+
+
+class Token(NamedTuple):
+    """A lexical token: its kind, value (identifiers unquoted, keywords lowercased) and span."""
+
+    kind: str  # 'word', 'ident' (quoted identifier), 'string', 'number' or 'op'
+    value: str
+    start: int
+    end: int
+
+
+_TOKEN_RE = re.compile(
+    r"""
+      (?P<space>\s+|--[^\n]*|/\*.*?\*/)
+    | (?P<dollar>\$(?:[A-Za-z_][A-Za-z_0-9]*)?\$)
+    | (?P<estring>[Ee]'(?:[^'\\]|''|\\.)*')
+    | (?P<string>[BbXxNn]?'(?:[^']|'')*')
+    | (?P<ident>"(?:[^"]|"")*")
+    | (?P<number>\d+(?:\.\d*)?(?:[eE][+-]?\d+)?|\.\d+)
+    | (?P<word>[^\W\d][\w$]*)
+    | (?P<op>::|\$\d+|[-+*/<>=~!@#%^&|`?:]+|.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+
+def tokenize(sql: str) -> Iterator[Token]:
+    """Split SQL into tokens, skipping whitespace and comments."""
+    pos = 0
+    while pos < len(sql):
+        match = _TOKEN_RE.match(sql, pos)
+        if match is None:  # pragma: no cover - the last alternative matches any character
+            raise DDLParseError(f'Unexpected character at offset {pos}')
+        kind, text = match.lastgroup, match.group()
+        start, pos = pos, match.end()
+        if kind == 'space':
+            continue
+        if kind == 'dollar':
+            # A dollar-quoted string runs to the next occurrence of the same tag
+            close = sql.find(text, pos)
+            if close < 0:
+                raise DDLParseError(f'Unterminated dollar-quoted string at offset {start}')
+            yield Token('string', sql[pos:close], start, close + len(text))
+            pos = close + len(text)
+        elif kind == 'estring':
+            yield Token('string', text[2:-1].replace("''", "'").replace("\\'", "'"), start, pos)
+        elif kind == 'string':
+            yield Token('string', text[text.index("'") + 1 : -1].replace("''", "'"), start, pos)
+        elif kind == 'ident':
+            yield Token('ident', text[1:-1].replace('""', '"'), start, pos)
+        elif kind == 'word':
+            yield Token('word', text.lower(), start, pos)
+        else:
+            yield Token(kind or 'op', text, start, pos)
+
+
+def split_statements(sql: str) -> Iterator[list[Token]]:
+    """Split SQL into the token lists of its statements."""
+    statement: list[Token] = []
+    for token in tokenize(sql):
+        if token.kind == 'op' and token.value == ';':
+            if statement:
+                yield statement
+            statement = []
+        else:
+            statement.append(token)
+    if statement:
+        yield statement
+
+
+def strip_parentheses(tokens: list[Token]) -> list[Token]:
+    """Remove parentheses around a whole expression, as pg_dump output adds them to CHECKs."""
+    while len(tokens) > 2 and tokens[0].value == '(' and tokens[-1].value == ')' and tokens[0].kind == 'op':
+        depth = 0
+        for i, token in enumerate(tokens):
+            if token.kind == 'op' and token.value in ('(', '['):
+                depth += 1
+            elif token.kind == 'op' and token.value in (')', ']'):
+                depth -= 1
+            if depth == 0:
+                break
+        if i != len(tokens) - 1:
+            break
+        tokens = tokens[1:-1]
+    return tokens
+
+
+class _Parser:
+    """A cursor over the tokens of one statement, or of one part of it."""
+
+    def __init__(self, tokens: list[Token], sql: str):
+        self.tokens = tokens
+        self.sql = sql
+        self.pos = 0
+
+    def at_end(self) -> bool:
+        return self.pos >= len(self.tokens)
+
+    def peek(self, offset: int = 0) -> Token | None:
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def is_word(self, *words: str, offset: int = 0) -> bool:
+        """Whether the next tokens are the given keywords."""
+        for i, word in enumerate(words):
+            token = self.peek(offset + i)
+            if token is None or token.kind != 'word' or token.value != word:
+                return False
+        return True
+
+    def is_op(self, op: str, offset: int = 0) -> bool:
+        token = self.peek(offset)
+        return token is not None and token.kind == 'op' and token.value == op
+
+    def accept(self, *words: str) -> bool:
+        """Consume the given keywords if they come next."""
+        if self.is_word(*words):
+            self.pos += len(words)
+            return True
+        return False
+
+    def accept_op(self, op: str) -> bool:
+        if self.is_op(op):
+            self.pos += 1
+            return True
+        return False
+
+    def expect(self, *words: str) -> None:
+        if not self.accept(*words):
+            raise DDLParseError(f'Expected {" ".join(words).upper()} but found {self.describe()}')
+
+    def describe(self) -> str:
+        token = self.peek()
+        return 'end of statement' if token is None else repr(self.sql[token.start : token.end])
+
+    def next(self) -> Token:
+        token = self.peek()
+        if token is None:
+            raise DDLParseError('Unexpected end of statement')
+        self.pos += 1
+        return token
+
+    def name(self) -> str:
+        """Consume an identifier."""
+        token = self.peek()
+        if token is None or token.kind not in ('word', 'ident'):
+            raise DDLParseError(f'Expected a name but found {self.describe()}')
+        self.pos += 1
+        return token.value
+
+    def qualified_name(self) -> tuple[str | None, str]:
+        """Consume a possibly schema-qualified name."""
+        parts = [self.name()]
+        while self.accept_op('.'):
+            parts.append(self.name())
+        return (parts[-2] if len(parts) > 1 else None), parts[-1]
+
+    def group(self) -> list[Token]:
+        """Consume a parenthesized group and return the tokens inside it."""
+        if not self.accept_op('('):
+            raise DDLParseError(f'Expected ( but found {self.describe()}')
+        start, depth = self.pos, 1
+        while depth:
+            token = self.next()
+            if token.kind == 'op' and token.value in ('(', '['):
+                depth += 1
+            elif token.kind == 'op' and token.value in (')', ']'):
+                depth -= 1
+        return self.tokens[start : self.pos - 1]
+
+    def expression(self, stop_words: set[str]) -> list[Token]:
+        """Consume tokens up to a stop word outside parentheses, taking at least one token."""
+        start, depth = self.pos, 0
+        while not self.at_end():
+            token = self.tokens[self.pos]
+            if self.pos > start and depth == 0 and token.kind == 'word' and token.value in stop_words:
+                break
+            if token.kind == 'op' and token.value in ('(', '['):
+                depth += 1
+            elif token.kind == 'op' and token.value in (')', ']'):
+                depth -= 1
+            self.pos += 1
+        return self.tokens[start : self.pos]
+
+    def rest(self) -> list[Token]:
+        tokens = self.tokens[self.pos :]
+        self.pos = len(self.tokens)
+        return tokens
+
+    def text(self, tokens: list[Token]) -> str:
+        """The source text spanned by tokens."""
+        return self.sql[tokens[0].start : tokens[-1].end] if tokens else ''
+
+    def sub(self, tokens: list[Token]) -> '_Parser':
+        return _Parser(tokens, self.sql)
+
+    def split(self, tokens: list[Token]) -> list['_Parser']:
+        """Split tokens at commas outside parentheses, into a parser for each part."""
+        parts: list[list[Token]] = [[]]
+        depth = 0
+        for token in tokens:
+            if token.kind == 'op' and token.value in ('(', '['):
+                depth += 1
+            elif token.kind == 'op' and token.value in (')', ']'):
+                depth -= 1
+            if depth == 0 and token.kind == 'op' and token.value == ',':
+                parts.append([])
+            else:
+                parts[-1].append(token)
+        return [self.sub(part) for part in parts if part]
+
+    def names(self, tokens: list[Token]) -> list[str]:
+        """The leading name of each comma-separated part, e.g. the columns of an index."""
+        return [part.name() for part in self.split(tokens)]
+
+
+# Catalog objects
+
+
+@dataclass
+class TypeRef:
+    """A column's type as written: a name, its modifiers and whether it is an array."""
+
+    schema: str | None
+    name: str
+    modifiers: list[str] = field(default_factory=list)
+    array: bool = False
+
+
+@dataclass
+class Column:
+    name: str
+    type: TypeRef
+    not_null: bool = False
+    default: str | None = None
+    identity: str | None = None  # 'ALWAYS' or 'BY DEFAULT'
+    description: str | None = None
+
+
+@dataclass
+class Constraint:
+    name: str
+    kind: str  # pg_constraint.contype: 'p', 'u', 'f' or 'c'
+    columns: list[str] = field(default_factory=list)
+    references: tuple[str, str] | None = None  # (schema, table)
+    ref_columns: list[str] = field(default_factory=list)
+    actions: str = ''  # e.g. ' ON DELETE CASCADE'
+    check: list[Token] = field(default_factory=list)
+    check_text: str = ''
+
+
+@dataclass
+class Table:
+    schema: str
+    name: str
+    columns: dict[str, Column] = field(default_factory=dict)
+    constraints: list[Constraint] = field(default_factory=list)
+
+
+@dataclass
+class UserType:
+    schema: str
+    name: str
+    kind: str  # pg_type.typtype: 'e', 'c', 'd' or 'r'
+    values: list[str] = field(default_factory=list)
+    base: TypeRef | None = None  # For domains
+
+
+class DDLCatalog:
+    """The relations and types declared by a sequence of DDL statements.
+
+    Example:
+        >>> catalog = DDLCatalog()
+        >>> catalog.execute('CREATE TABLE users (id serial PRIMARY KEY, email text NOT NULL);')
+        >>> catalog.schema_catalog('public').constraints
+        [('users_pkey', 'users', ['id'], 'p', 'PRIMARY KEY (id)')]
+    """
+
+    def __init__(self) -> None:
+        self.schemas: list[str] = ['public']
+        self.search_path: list[str] = ['public']
+        self.tables: dict[tuple[str, str], Table] = {}
+        self.types: dict[tuple[str, str], UserType] = {}
+        self.indexes: dict[tuple[str, str], tuple[tuple[str, str], list[str]]] = {}
+        self._catalogs: dict[str, SchemaCatalog] = {}
+
+    # Applying statements
+
+    def execute(self, sql: str, source: str = '<sql>') -> None:
+        """Apply the statements in `sql`, skipping (and logging) those that cannot be parsed."""
+        self._catalogs.clear()
+        for tokens in split_statements(sql):
+            parser = _Parser(tokens, sql)
+            try:
+                self._apply(parser)
+            except DDLParseError as e:
+                summary = ' '.join(parser.text(tokens[:8]).split())
+                logger.warning(f'{source}: skipping statement "{summary} ...": {e}')
+
+    def _apply(self, p: _Parser) -> None:
+        if p.accept('create'):
+            p.accept('or', 'replace')
+            if p.accept('schema'):
+                p.accept('if', 'not', 'exists')
+                self._add_schema(p.name())
+                return
+            for modifier in ('global', 'local', 'temporary', 'temp', 'unlogged'):
+                p.accept(modifier)
+            if p.accept('table'):
+                self._create_table(p)
+            elif p.accept('type'):
+                self._create_type(p)
+            elif p.accept('domain'):
+                self._create_domain(p)
+            elif p.accept('unique', 'index') or p.accept('index'):
+                self._create_index(p)
+            elif p.is_word('view') or p.is_word('materialized', 'view') or p.is_word('recursive', 'view'):
+                logger.info('Skipping view: view columns cannot be typed without a database')
+        elif p.accept('alter', 'table'):
+            self._alter_table(p)
+        elif p.accept('alter', 'type'):
+            self._alter_type(p)
+        elif p.accept('comment', 'on', 'column'):
+            self._comment_on_column(p)
+        elif p.accept('drop'):
+            self._drop(p)
+        elif p.accept('set', 'search_path') or p.accept('set', 'session', 'search_path'):
+            p.accept('to') or p.accept_op('=')
+            self.search_path = [part.name() for part in p.split(p.rest())] or ['public']
+
+    def _add_schema(self, schema: str) -> None:
+        if schema not in self.schemas:
+            self.schemas.append(schema)
+
+    def _qualify(self, schema: str | None) -> str:
+        """The schema of a new object: its qualifier, or the first schema on the search path."""
+        schema = schema or (self.search_path[0] if self.search_path else 'public')
+        self._add_schema(schema)
+        return schema
+
+    def _find_table(self, schema: str | None, name: str) -> Table | None:
+        for s in [schema] if schema else [*self.search_path, 'public']:
+            if (s, name) in self.tables:
+                return self.tables[(s, name)]
+        return None
+
+    def _find_type(self, schema: str | None, name: str) -> UserType | None:
+        for s in [schema] if schema else [*self.search_path, 'public']:
+            if (s, name) in self.types:
+                return self.types[(s, name)]
+        return None
+
+    def _create_table(self, p: _Parser) -> None:
+        if_not_exists = p.accept('if', 'not', 'exists')
+        schema, name = p.qualified_name()
+        schema = self._qualify(schema)
+        if if_not_exists and (schema, name) in self.tables:
+            return
+        if not p.is_op('('):
+            logger.info(f'Skipping table {schema}.{name}: only tables with column definitions are supported')
+            return
+
+        table = Table(schema, name)
+        elements = p.split(p.group())
+        if p.accept('inherits'):
+            for parent_parser in p.split(p.group()):
+                parent = self._find_table(*parent_parser.qualified_name())
+                if parent is not None:
+                    table.columns.update({c: Column(**vars(col)) for c, col in parent.columns.items()})
+        for element in elements:
+            if element.accept('like'):
+                self._like(table, element)
+                continue
+            if any(element.is_word(word) for word in _TABLE_CONSTRAINT_WORDS):
+                self._add_constraint(table, element)
+            else:
+                self._add_column(table, element)
+        self.tables[(schema, name)] = table
+
+    def _like(self, table: Table, p: _Parser) -> None:
+        """Parse the rest of LIKE source [{INCLUDING | EXCLUDING} option ...] and copy the source's columns.
+
+        Like PostgreSQL, column names, types and NOT NULL are always copied, and foreign keys never are.
+        """
+        source = self._find_table(*p.qualified_name())
+        if source is None:
+            raise DDLParseError('LIKE refers to an unknown table')
+        options: set[str] = set()
+        while not p.at_end():
+            including = p.accept('including')
+            if not including:
+                p.expect('excluding')
+            option = p.name()
+            if option not in _LIKE_OPTIONS and option != 'all':
+                raise DDLParseError(f'Unknown LIKE option {option.upper()}')
+            changed = _LIKE_OPTIONS if option == 'all' else {option}
+            options = options | changed if including else options - changed
+
+        for column in source.columns.values():
+            table.columns[column.name] = Column(
+                column.name,
+                column.type,
+                column.not_null,
+                default=column.default if 'defaults' in options else None,
+                identity=column.identity if 'identity' in options else None,
+                description=column.description if 'comments' in options else None,
+            )
+        for constraint in source.constraints:
+            if constraint.kind == 'c' and 'constraints' in options:
+                table.constraints.append(replace(constraint))
+            elif constraint.kind == 'p' and 'indexes' in options:
+                table.constraints.append(replace(constraint, name=f'{table.name}_pkey'))
+            elif constraint.kind == 'u' and 'indexes' in options:
+                name = f'{table.name}_{"_".join(constraint.columns)}_key'
+                table.constraints.append(replace(constraint, name=name))
+
+    def _add_column(self, table: Table, p: _Parser) -> None:
+        column = Column(p.name(), self._type_ref(p))
+        if column.type.schema is None and column.type.name in SERIAL_TYPES and not column.type.array:
+            sequence = regclass(table.schema, f'{table.name}_{column.name}_seq')
+            column.type = TypeRef(None, SERIAL_TYPES[column.type.name])
+            column.default = f"nextval('{sequence}'::regclass)"
+            column.not_null = True
+        table.columns[column.name] = column
+
+        while not p.at_end():
+            name = p.name() if p.accept('constraint') else None
+            if p.accept('not', 'null'):
+                column.not_null = True
+            elif p.accept('null'):
+                column.not_null = False
+            elif p.accept('default'):
+                column.default = p.text(p.expression(_COLUMN_CONSTRAINT_WORDS))
+            elif p.accept('primary', 'key'):
+                table.constraints.append(Constraint(name or f'{table.name}_pkey', 'p', [column.name]))
+                self._skip_index_parameters(p)
+            elif p.accept('unique'):
+                self._accept_nulls_distinct(p)
+                table.constraints.append(Constraint(name or f'{table.name}_{column.name}_key', 'u', [column.name]))
+                self._skip_index_parameters(p)
+            elif p.accept('references'):
+                constraint = Constraint(name or f'{table.name}_{column.name}_fkey', 'f', [column.name])
+                self._references(p, constraint)
+                table.constraints.append(constraint)
+            elif p.accept('check'):
+                check = strip_parentheses(p.group())
+                table.constraints.append(
+                    Constraint(name or f'{table.name}_{column.name}_check', 'c', check=check, check_text=p.text(check))
+                )
+                p.accept('no', 'inherit')
+            elif p.accept('generated'):
+                self._generated(p, column)
+            elif p.accept('collate'):
+                p.qualified_name()
+            elif p.accept('deferrable') or p.accept('not', 'deferrable'):
+                continue
+            elif p.accept('initially'):
+                p.name()
+            else:
+                raise DDLParseError(f'Unexpected {p.describe()} in definition of column {column.name}')
+
+    def _generated(self, p: _Parser, column: Column) -> None:
+        """Parse the rest of GENERATED {ALWAYS | BY DEFAULT} AS {IDENTITY | (expression) STORED}."""
+        identity = 'ALWAYS' if p.accept('always') else 'BY DEFAULT' if p.accept('by', 'default') else None
+        p.expect('as')
+        if p.accept('identity'):
+            column.identity = identity
+            column.not_null = True
+            if p.is_op('('):
+                p.group()  # Sequence options
+        else:
+            p.group()
+            p.accept('stored')
+
+    def _type_ref(self, p: _Parser) -> TypeRef:
+        """Parse a type name, with its modifiers and array bounds."""
+        schema, name = p.qualified_name()
+        if schema == 'pg_catalog':
+            schema = None
+        if schema is None:
+            if name == 'double' and p.accept('precision'):
+                name = 'double precision'
+            elif name in ('character', 'char', 'bit') and p.accept('varying'):
+                name = 'character varying' if name != 'bit' else 'bit varying'
+        modifiers = [part.text(part.rest()) for part in p.split(p.group())] if p.is_op('(') else []
+        if schema is None and name in ('time', 'timestamp'):
+            if p.accept('with', 'time', 'zone'):
+                name += ' with time zone'
+            elif p.accept('without', 'time', 'zone'):
+                name += ' without time zone'
+        elif schema is None and name == 'interval':
+            while any(p.is_word(w) for w in ('year', 'month', 'day', 'hour', 'minute', 'second', 'to')):
+                p.next()
+        array = False
+        while p.is_op('[') or p.is_word('array'):
+            p.accept('array')
+            if p.is_op('['):
+                p.next()
+                while not p.accept_op(']'):
+                    p.next()
+            array = True
+        return TypeRef(schema, name, modifiers, array)
+
+    def _skip_index_parameters(self, p: _Parser) -> None:
+        """Skip INCLUDE (...), WITH (...) and USING INDEX TABLESPACE name after a key."""
+        while True:
+            if p.accept('include') or p.accept('with'):
+                p.group()
+            elif p.accept('using', 'index', 'tablespace'):
+                p.name()
+            else:
+                return
+
+    def _accept_nulls_distinct(self, p: _Parser) -> None:
+        p.accept('nulls', 'not', 'distinct') or p.accept('nulls', 'distinct')
+
+    def _references(self, p: _Parser, constraint: Constraint) -> None:
+        """Parse the rest of REFERENCES table [(columns)] [MATCH ...] [ON DELETE/UPDATE action]."""
+        schema, table = p.qualified_name()
+        referenced = self._find_table(schema, table)
+        constraint.references = (referenced.schema, referenced.name) if referenced else (self._qualify(schema), table)
+        if p.is_op('('):
+            constraint.ref_columns = p.names(p.group())
+        actions: dict[str, str] = {}
+        while True:
+            if p.accept('match'):
+                p.name()
+            elif p.accept('on'):
+                event = p.name().upper()
+                if p.accept('set', 'null') or p.accept('set', 'default'):
+                    action = 'SET ' + p.tokens[p.pos - 1].value.upper()
+                    if p.is_op('('):
+                        action += f' ({", ".join(p.names(p.group()))})'
+                elif p.accept('no', 'action'):
+                    action = 'NO ACTION'
+                else:
+                    action = p.name().upper()
+                actions[event] = action
+            elif p.accept('deferrable') or p.accept('not', 'deferrable'):
+                continue
+            elif p.accept('initially'):
+                p.name()
+            else:
+                break
+        # Printed like pg_get_constraintdef: ON UPDATE before ON DELETE, and NO ACTION left out
+        constraint.actions = ''.join(
+            f' ON {event} {actions[event]}'
+            for event in ('UPDATE', 'DELETE')
+            if event in actions and actions[event] != 'NO ACTION'
+        )
+
+    def _add_constraint(self, table: Table, p: _Parser) -> None:
+        """Parse a table constraint and add it to the table."""
+        name = p.name() if p.accept('constraint') else None
+        if p.accept('primary', 'key'):
+            columns = self._key_columns(p, table)
+            constraint = Constraint(name or f'{table.name}_pkey', 'p', columns)
+            self._skip_index_parameters(p)
+        elif p.accept('unique'):
+            self._accept_nulls_distinct(p)
+            columns = self._key_columns(p, table)
+            constraint = Constraint(name or f'{table.name}_{"_".join(columns)}_key', 'u', columns)
+            self._skip_index_parameters(p)
+        elif p.accept('foreign', 'key'):
+            columns = p.names(p.group())
+            constraint = Constraint(name or f'{table.name}_{"_".join(columns)}_fkey', 'f', columns)
+            p.expect('references')
+            self._references(p, constraint)
+        elif p.accept('check'):
+            check = strip_parentheses(p.group())
+            referenced = [c for c in table.columns if c in {t.value for t in check if t.kind in ('word', 'ident')}]
+            # Like PostgreSQL, name the check after its column only when it uses a single column
+            default_name = f'{table.name}_{referenced[0]}_check' if len(referenced) == 1 else f'{table.name}_check'
+            constraint = Constraint(name or default_name, 'c', check=check, check_text=p.text(check))
+        elif p.accept('exclude'):
+            return  # Exclusion constraints do not affect the generated models
+        else:
+            raise DDLParseError(f'Unexpected {p.describe()} in table constraint')
+        table.constraints = [c for c in table.constraints if c.name != constraint.name] + [constraint]
+
+    def _key_columns(self, p: _Parser, table: Table) -> list[str]:
+        """Parse the columns of a key: a column list, or USING INDEX name."""
+        if p.accept('using', 'index'):
+            index = self.indexes.get((table.schema, p.name()))
+            if index is None:
+                raise DDLParseError('USING INDEX refers to an unknown index')
+            return index[1]
+        return p.names(p.group())
+
+    def _create_type(self, p: _Parser) -> None:
+        schema, name = p.qualified_name()
+        schema = self._qualify(schema)
+        if p.accept('as', 'enum'):
+            values = [t.value for t in p.group() if t.kind == 'string']
+            self.types[(schema, name)] = UserType(schema, name, 'e', values)
+        elif p.accept('as', 'range'):
+            self.types[(schema, name)] = UserType(schema, name, 'r')
+        elif p.accept('as') and p.is_op('('):
+            self.types[(schema, name)] = UserType(schema, name, 'c')
+
+    def _create_domain(self, p: _Parser) -> None:
+        schema, name = p.qualified_name()
+        schema = self._qualify(schema)
+        p.accept('as')
+        self.types[(schema, name)] = UserType(schema, name, 'd', base=self._type_ref(p))
+
+    def _create_index(self, p: _Parser) -> None:
+        p.accept('concurrently')
+        p.accept('if', 'not', 'exists')
+        name = None if p.is_word('on') else p.name()
+        p.expect('on')
+        p.accept('only')
+        table = self._find_table(*p.qualified_name())
+        if p.accept('using'):
+            p.name()
+        # Key columns by name; expressions (e.g. lower(email)) have none
+        columns = ['' if part.is_op('(') or part.is_op('(', offset=1) else part.name() for part in p.split(p.group())]
+        if table is not None and name is not None:
+            self.indexes[(table.schema, name)] = ((table.schema, table.name), columns)
+
+    def _alter_table(self, p: _Parser) -> None:
+        p.accept('if', 'exists')
+        p.accept('only')
+        table = self._find_table(*p.qualified_name())
+        p.accept_op('*')
+        if table is None:
+            return
+        for action in p.split(p.rest()):
+            self._alter_table_action(table, action)
+
+    def _alter_table_action(self, table: Table, p: _Parser) -> None:
+        if p.accept('add'):
+            if any(p.is_word(word) for word in _TABLE_CONSTRAINT_WORDS):
+                self._add_constraint(table, p)
+                return
+            p.accept('column')
+            if p.accept('if', 'not', 'exists'):
+                token = p.peek()
+                if token is not None and token.value in table.columns:
+                    return
+            self._add_column(table, p)
+        elif p.accept('drop'):
+            if p.accept('constraint'):
+                p.accept('if', 'exists')
+                name = p.name()
+                table.constraints = [c for c in table.constraints if c.name != name]
+                return
+            p.accept('column')
+            p.accept('if', 'exists')
+            self._drop_column(table, p.name())
+        elif p.accept('alter'):
+            p.accept('column')
+            column = table.columns.get(p.name())
+            if column is not None:
+                self._alter_column(table, column, p)
+        elif p.accept('rename'):
+            if p.accept('to'):
+                self._rename_table(table, p.name())
+            elif p.accept('constraint'):
+                old = p.name()
+                p.expect('to')
+                new = p.name()
+                for constraint in table.constraints:
+                    if constraint.name == old:
+                        constraint.name = new
+            else:
+                p.accept('column')
+                old = p.name()
+                p.expect('to')
+                self._rename_column(table, old, p.name())
+
+    def _alter_column(self, table: Table, column: Column, p: _Parser) -> None:
+        if p.accept('set', 'default'):
+            column.default = p.text(p.rest())
+        elif p.accept('drop', 'default'):
+            column.default = None
+        elif p.accept('set', 'not', 'null'):
+            column.not_null = True
+        elif p.accept('drop', 'not', 'null'):
+            column.not_null = False
+        elif p.accept('set', 'data', 'type') or p.accept('type'):
+            column.type = self._type_ref(p)
+        elif p.accept('add', 'generated'):
+            self._generated(p, column)
+        elif p.accept('drop', 'identity'):
+            column.identity = None
+
+    def _drop_column(self, table: Table, name: str) -> None:
+        """Drop a column and, like PostgreSQL, the constraints that use it."""
+        table.columns.pop(name, None)
+        table.constraints = [
+            c
+            for c in table.constraints
+            if name not in c.columns and name not in {t.value for t in c.check if t.kind in ('word', 'ident')}
+        ]
+
+    def _rename_column(self, table: Table, old: str, new: str) -> None:
+        if old not in table.columns:
+            return
+        table.columns = {new if c == old else c: col for c, col in table.columns.items()}
+        table.columns[new].name = new
+        key = (table.schema, table.name)
+        for other in self.tables.values():
+            for constraint in other.constraints:
+                if other is table:
+                    constraint.columns = [new if c == old else c for c in constraint.columns]
+                if constraint.references == key:
+                    constraint.ref_columns = [new if c == old else c for c in constraint.ref_columns]
+
+    def _rename_table(self, table: Table, new: str) -> None:
+        old_key, new_key = (table.schema, table.name), (table.schema, new)
+        del self.tables[old_key]
+        table.name = new
+        self.tables[new_key] = table
+        for other in self.tables.values():
+            for constraint in other.constraints:
+                if constraint.references == old_key:
+                    constraint.references = new_key
+
+    def _alter_type(self, p: _Parser) -> None:
+        user_type = self._find_type(*p.qualified_name())
+        if user_type is None:
+            return
+        if p.accept('add', 'value'):
+            p.accept('if', 'not', 'exists')
+            value = p.next().value
+            if value in user_type.values:
+                return
+            if p.accept('before') or p.accept('after'):
+                where, neighbor = p.tokens[p.pos - 1].value, p.next().value
+                index = user_type.values.index(neighbor) + (where == 'after')
+                user_type.values.insert(index, value)
+            else:
+                user_type.values.append(value)
+        elif p.accept('rename', 'value'):
+            old = p.next().value
+            p.expect('to')
+            new = p.next().value
+            user_type.values = [new if v == old else v for v in user_type.values]
+        elif p.accept('rename', 'to'):
+            del self.types[(user_type.schema, user_type.name)]
+            user_type.name = p.name()
+            self.types[(user_type.schema, user_type.name)] = user_type
+
+    def _comment_on_column(self, p: _Parser) -> None:
+        parts = [p.name()]
+        while p.accept_op('.'):
+            parts.append(p.name())
+        p.expect('is')
+        comment = p.next()
+        if len(parts) < 2:
+            return
+        table = self._find_table(parts[-3] if len(parts) > 2 else None, parts[-2])
+        column = table.columns.get(parts[-1]) if table else None
+        if column is not None:
+            column.description = comment.value if comment.kind == 'string' else None
+
+    def _drop(self, p: _Parser) -> None:
+        kind = 'table' if p.accept('table') else 'type' if p.accept('type') or p.accept('domain') else None
+        if kind is None:
+            if p.accept('index'):
+                p.accept('concurrently')
+                p.accept('if', 'exists')
+                for part in p.split(p.rest()):
+                    schema, name = part.qualified_name()
+                    for key in [k for k in self.indexes if k[1] == name and (schema is None or k[0] == schema)]:
+                        del self.indexes[key]
+            return
+        p.accept('if', 'exists')
+        for part in p.split(p.rest()):
+            schema, name = part.qualified_name()
+            if kind == 'table':
+                table = self._find_table(schema, name)
+                if table is not None:
+                    key = (table.schema, table.name)
+                    del self.tables[key]
+                    for other in self.tables.values():
+                        other.constraints = [c for c in other.constraints if c.references != key]
+            else:
+                user_type = self._find_type(schema, name)
+                if user_type is not None:
+                    del self.types[(user_type.schema, user_type.name)]
+
+    # Result sets
+
+    def schema_names(self) -> list[str]:
+        """The schemas declared or used by the statements, in the order they appeared."""
+        return list(self.schemas)
+
+    def _column_type(self, ref: TypeRef) -> tuple[str, str, str, str, str]:
+        """Resolve a column type.
+
+        Returns:
+            The column's data_type, udt_name and array_element_type as information_schema and
+            format_type print them, and the namespace and typtype of the column's type.
+        """
+        user_type = self._find_type(ref.schema, ref.name)
+        if user_type is not None and user_type.kind == 'd' and user_type.base is not None and not ref.array:
+            data_type, udt_name, _, _, _ = self._column_type(user_type.base)
+            return data_type, udt_name, '', user_type.schema, 'd'
+        if user_type is not None:
+            data_type, udt_name, namespace, typtype = 'USER-DEFINED', user_type.name, user_type.schema, user_type.kind
+            printed = regclass(user_type.schema, user_type.name)
+        elif ref.schema is None and ref.name in BUILTIN_TYPES:
+            data_type, udt_name = BUILTIN_TYPES[ref.name]
+            namespace, typtype, printed = 'pg_catalog', 'b', data_type
+        else:
+            # A type from an extension (e.g., citext, vector), unknown to the DDL
+            data_type, udt_name, namespace, typtype = 'USER-DEFINED', ref.name, ref.schema or 'public', 'b'
+            printed = ref.name
+        if ref.array:
+            return 'ARRAY', f'_{udt_name}', f'{printed}[]', namespace, 'b'
+        return data_type, udt_name, '', namespace, typtype
+
+    def _max_length(self, ref: TypeRef) -> int | None:
+        """The declared length of a character type, or of a domain over one."""
+        user_type = self._find_type(ref.schema, ref.name)
+        if user_type is not None and user_type.base is not None and not ref.array:
+            return self._max_length(user_type.base)
+        if ref.array or ref.schema is not None or ref.name not in BUILTIN_TYPES:
+            return None
+        data_type = BUILTIN_TYPES[ref.name][0]
+        if data_type not in ('character varying', 'character'):
+            return None
+        if ref.modifiers and ref.modifiers[0].isdigit():
+            return int(ref.modifiers[0])
+        return 1 if data_type == 'character' else None
+
+    def _constraint_row(self, table: Table, constraint: Constraint) -> tuple:
+        columns = constraint.columns
+        if constraint.kind == 'p':
+            definition = f'PRIMARY KEY ({", ".join(map(quote_ident, columns))})'
+        elif constraint.kind == 'u':
+            definition = f'UNIQUE ({", ".join(map(quote_ident, columns))})'
+        elif constraint.kind == 'f':
+            ref_schema, ref_table = constraint.references or (table.schema, '')
+            definition = (
+                f'FOREIGN KEY ({", ".join(map(quote_ident, columns))}) '
+                f'REFERENCES {regclass(ref_schema, ref_table)}({", ".join(map(quote_ident, constraint.ref_columns))})'
+                f'{constraint.actions}'
+            )
+        else:
+            names = {t.value for t in constraint.check if t.kind in ('word', 'ident')}
+            columns = [c for c in table.columns if c in names]
+            definition = f'CHECK (({constraint.check_text}))'
+        return (constraint.name, regclass(table.schema, table.name), columns, constraint.kind, definition)
+
+    def _primary_key(self, key: tuple[str, str]) -> list[str]:
+        table = self.tables.get(key)
+        return next((c.columns for c in table.constraints if c.kind == 'p'), []) if table else []
+
+    def schema_catalog(self, schema: str) -> SchemaCatalog:
+        """Return the schema's result sets, in the row shapes of the live catalog queries.
+
+        Like the live queries, user-defined types and column-to-type mappings are returned for
+        every schema, and foreign keys only when the referenced table is in the same schema.
+        """
+        if schema not in self._catalogs:
+            self._catalogs[schema] = self._build_catalog(schema)
+        return self._catalogs[schema]
+
+    def _build_catalog(self, schema: str) -> SchemaCatalog:
+        catalog = SchemaCatalog()
+        for user_type in sorted(self.types.values(), key=lambda t: (t.schema, t.name)):
+            if user_type.kind == 'd' and user_type.base is not None:
+                category = TYPE_CATEGORIES.get(self._column_type(user_type.base)[0], 'U')
+            else:
+                category = {'e': 'E', 'c': 'C', 'r': 'R'}.get(user_type.kind, 'U')
+            values: list[str | None] = list(user_type.values) if user_type.kind == 'e' else [None]
+            catalog.user_defined_types.append(
+                (user_type.name, user_type.schema, None, category, True, user_type.kind, values)
+            )
+
+        for table in self.tables.values():
+            primary_key = set(self._primary_key((table.schema, table.name)))
+            for column in table.columns.values():
+                data_type, udt_name, element_type, namespace, typtype = self._column_type(column.type)
+                type_name = udt_name if typtype != 'd' else column.type.name
+                catalog.type_mappings.append(
+                    (column.name, table.name, namespace, type_name, typtype, TYPE_DESCRIPTIONS.get(typtype, 'Other'))
+                )
+                if table.schema != schema:
+                    continue
+                catalog.columns.append(
+                    (
+                        table.schema,
+                        table.name,
+                        column.name,
+                        None if column.identity else column.default,
+                        'NO' if column.not_null or column.name in primary_key else 'YES',
+                        data_type,
+                        self._max_length(column.type),
+                        'BASE TABLE',
+                        column.identity,
+                        udt_name,
+                        element_type or None,
+                        column.description,
+                    )
+                )
+            if table.schema != schema:
+                continue
+
+            catalog.tables.append((table.name,))
+            for constraint in table.constraints:
+                if constraint.kind == 'f' and not constraint.ref_columns and constraint.references:
+                    constraint.ref_columns = self._primary_key(constraint.references)
+                catalog.constraints.append(self._constraint_row(table, constraint))
+                if constraint.kind == 'f' and constraint.references and constraint.references[0] == schema:
+                    for column_name, ref_column in zip(constraint.columns, constraint.ref_columns):
+                        catalog.foreign_keys.append(
+                            (
+                                schema,
+                                table.name,
+                                column_name,
+                                schema,
+                                constraint.references[1],
+                                ref_column,
+                                constraint.name,
+                            )
+                        )
+        return catalog
@@ -1,3 +1,5 @@
+import re
+
 TABLES_QUERY = """
 SELECT table_name
 FROM information_schema.tables
@@ -13,7 +15,7 @@ WHERE table_schema = %s AND table_name = %s
 SCHEMAS_QUERY = """
 SELECT schema_name
 FROM information_schema.schemata
-WHERE schema_name NOT IN ('information_schema', 'pg_catalog')
+WHERE schema_name NOT IN ('information_schema', 'pg_catalog', 'supabase_pydantic')
 """
 
 GET_TABLE_COLUMN_DETAILS = """
@@ -152,3 +154,246 @@ JOIN pg_type t ON a.atttypid = t.oid
 WHERE c.relkind IN ('r', 'v') -- Only look at ordinary tables and views
   AND NOT a.attisdropped; -- Skip dropped (deleted) columns
 """
+
+# One md5 per schema over the definitions of its relations, columns, constraints and enums;
+# a schema's fingerprint changes whenever DDL changes anything the generated models depend on.
+# Parameters: the schema names, and whether to include every user schema instead.
+CATALOG_FINGERPRINT_QUERY = """
+WITH objects AS (
+    SELECT
+        c.relnamespace AS nsp,
+        concat_ws(':', 'a', c.relname, c.relkind, a.attnum, a.attname, a.atttypid::regtype, a.atttypmod,
+                  a.attnotnull, a.attidentity, pg_get_expr(d.adbin, d.adrelid),
+                  col_description(c.oid, a.attnum)) AS def
+    FROM pg_class c
+    JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+    LEFT JOIN pg_attrdef d ON d.adrelid = c.oid AND d.adnum = a.attnum
+    WHERE c.relkind IN ('r', 'p', 'v', 'm', 'f')
+    UNION ALL
+    SELECT con.connamespace, concat_ws(':', 'c', con.conrelid::regclass, con.conname, pg_get_constraintdef(con.oid))
+    FROM pg_constraint con
+    UNION ALL
+    SELECT t.typnamespace, concat_ws(':', 'e', t.typname, e.enumsortorder, e.enumlabel)
+    FROM pg_type t
+    JOIN pg_enum e ON e.enumtypid = t.oid
+)
+SELECT n.nspname, md5(string_agg(o.def, ',' ORDER BY o.def))
+FROM objects o
+JOIN pg_namespace n ON n.oid = o.nsp
+WHERE n.nspname = ANY(%s)
+   OR (%s AND n.nspname NOT IN ('information_schema', 'pg_catalog') AND left(n.nspname, 3) <> 'pg_')
+GROUP BY n.nspname;
+"""
+
+# Restricting the per-table catalog queries to a list of relations, for re-reading only the tables
+# that DDL changed. Each adds a trailing parameter: the table names.
+
+
+def _restrict(query: str, anchor: str, condition: str) -> str:
+    """Return `query` with `condition` ANDed to the filter that ends with `anchor`."""
+    if query.count(anchor) != 1:
+        raise ValueError(f'Expected exactly one {anchor!r} in query')
+    return query.replace(anchor, f'{anchor}\n    AND {condition}')
+
+
+RELATION_TABLES_QUERY = _restrict(TABLES_QUERY, 'table_schema = %s', 'table_name = ANY(%s)')
+RELATION_COLUMNS_QUERY = _restrict(GET_ALL_PUBLIC_TABLES_AND_COLUMNS, 'c.table_schema = %s', 'c.table_name = ANY(%s)')
+RELATION_FOREIGN_KEYS_QUERY = _restrict(GET_TABLE_COLUMN_DETAILS, 'tc.table_schema = %s', 'tc.table_name = ANY(%s)')
+RELATION_CONSTRAINTS_QUERY = _restrict(
+    GET_CONSTRAINTS,
+    'nspname = %s)',
+    'conrelid IN (SELECT oid FROM pg_class WHERE relnamespace = connamespace AND relname = ANY(%s))',
+)
+RELATION_TYPE_MAPPING_QUERY = _restrict(
+    GET_COLUMN_TO_USER_DEFINED_TYPE_MAPPING,
+    "c.relkind IN ('r', 'v')",
+    'c.relnamespace = (SELECT oid FROM pg_namespace WHERE nspname = %s) AND c.relname = ANY(%s)',
+)
+
+# Reading the catalogs of several schemas in a single statement, for transaction-mode poolers
+# (PgBouncer, Supavisor), where each statement may run on a different server connection. Each
+# result set is aggregated into one JSON array, so the statement returns a single row.
+
+
+def _subquery(query: str) -> str:
+    """Return `query` without its terminating semicolon, which may be followed by a comment."""
+    return re.sub(r';([ \t]*--[^\n]*)?\s*$', r'\1', query.strip())
+
+
+def _json_rows(query: str) -> str:
+    """Return a subquery aggregating the rows of `query` into a JSON array of row objects."""
+    return f'(SELECT json_agg(row_to_json(catalog_row)) FROM (\n{_subquery(query)}\n) AS catalog_row)'
+
+
+def _json_rows_per_schema(query: str) -> str:
+    """Return a subquery running a per-schema `query` for each schema in an array parameter.
+
+    The rows are aggregated into a JSON array of `[schema, row object]` pairs, in schema order.
+    """
+    if query.count('%s') != 1:
+        raise ValueError('Expected exactly one schema parameter in query')
+    body = _subquery(query).replace('%s', 'catalog_schema.name')
+    return f"""(
+    SELECT json_agg(
+        json_build_array(catalog_schema.name, row_to_json(catalog_rows.catalog_row))
+        ORDER BY catalog_schema.position, catalog_rows.position
+    )
+    FROM unnest(%s::text[]) WITH ORDINALITY AS catalog_schema(name, position)
+    CROSS JOIN LATERAL (
+        SELECT catalog_row, row_number() OVER () AS position FROM (
+{body}
+        ) AS catalog_row
+    ) AS catalog_rows
+)"""
+
+
+# One row: the tables, columns, constraints and foreign keys of each schema, as [schema, row]
+# pairs, then the database's user-defined types and type mappings, which are not per schema.
+# Parameters: the schema names, once per per-schema result set (CATALOG_QUERY_SCHEMA_PARAMS).
+CATALOG_QUERY = f"""
+SELECT
+    {_json_rows_per_schema(TABLES_QUERY)} AS tables,
+    {_json_rows_per_schema(GET_ALL_PUBLIC_TABLES_AND_COLUMNS)} AS columns,
+    {_json_rows_per_schema(GET_CONSTRAINTS)} AS constraints,
+    {_json_rows_per_schema(GET_TABLE_COLUMN_DETAILS)} AS foreign_keys,
+    {_json_rows(GET_ENUM_TYPES)} AS user_defined_types,
+    {_json_rows(GET_COLUMN_TO_USER_DEFINED_TYPE_MAPPING)} AS type_mappings;
+"""
+
+CATALOG_QUERY_SCHEMA_PARAMS = 4
+
+# Scope a statement timeout to the current transaction, as poolers reject it as a startup
+# parameter. Parameters: the timeout in milliseconds.
+SET_LOCAL_STATEMENT_TIMEOUT = 'SET LOCAL statement_timeout = %s;'
+
+# Channel the DDL event trigger notifies, with the affected schema's name as the payload
+DDL_NOTIFY_CHANNEL = 'supabase_pydantic_ddl'
+
+# Schema holding the DDL log; excluded from SCHEMAS_QUERY so it is never generated
+DDL_LOG_SCHEMA = 'supabase_pydantic'
+
+# Event triggers that record every DDL command in DDL_LOG_SCHEMA.ddl_log, with the table it
+# affected (the owning table, for indexes, columns and constraints), and notify
+# DDL_NOTIFY_CHANNEL once per schema touched.
+INSTALL_DDL_EVENT_TRIGGERS = f"""
+CREATE SCHEMA IF NOT EXISTS {DDL_LOG_SCHEMA};
+
+CREATE TABLE IF NOT EXISTS {DDL_LOG_SCHEMA}.ddl_log (
+    id bigint GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    logged_at timestamptz NOT NULL DEFAULT now(),
+    command_tag text NOT NULL,
+    object_type text NOT NULL,
+    schema_name text NOT NULL,
+    relation_name text,
+    objid oid,
+    object_identity text
+);
+
+CREATE OR REPLACE FUNCTION {DDL_LOG_SCHEMA}.notify_ddl() RETURNS event_trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    affected text;
+BEGIN
+    IF TG_EVENT = 'sql_drop' THEN
+        INSERT INTO {DDL_LOG_SCHEMA}.ddl_log
+            (command_tag, object_type, schema_name, relation_name, objid, object_identity)
+        SELECT TG_TAG, d.object_type, d.schema_name,
+               CASE
+                   WHEN d.object_type IN ('table', 'view', 'materialized view', 'foreign table')
+                       THEN d.object_name
+                   WHEN d.object_type IN ('table column', 'table constraint')
+                       THEN d.address_names[2]
+               END,
+               d.objid, d.object_identity
+        FROM pg_event_trigger_dropped_objects() d
+        WHERE d.schema_name IS NOT NULL AND d.schema_name <> '{DDL_LOG_SCHEMA}' AND NOT d.is_temporary;
+
+        FOR affected IN SELECT DISTINCT schema_name FROM pg_event_trigger_dropped_objects()
+                        WHERE schema_name IS NOT NULL LOOP
+            PERFORM pg_notify('{DDL_NOTIFY_CHANNEL}', affected);
+        END LOOP;
+    ELSE
+        INSERT INTO {DDL_LOG_SCHEMA}.ddl_log
+            (command_tag, object_type, schema_name, relation_name, objid, object_identity)
+        SELECT c.command_tag, c.object_type, c.schema_name,
+               CASE c.classid
+                   WHEN 'pg_class'::regclass THEN (
+                       SELECT coalesce(owner.relname, rel.relname)
+                       FROM pg_class rel
+                       LEFT JOIN pg_index i ON i.indexrelid = rel.oid
+                       LEFT JOIN pg_class owner ON owner.oid = i.indrelid
+                       WHERE rel.oid = c.objid AND rel.relkind <> 'S')
+                   WHEN 'pg_constraint'::regclass THEN (
+                       SELECT rel.relname
+                       FROM pg_constraint con
+                       JOIN pg_class rel ON rel.oid = con.conrelid
+                       WHERE con.oid = c.objid)
+               END,
+               c.objid, c.object_identity
+        FROM pg_event_trigger_ddl_commands() c
+        WHERE c.schema_name IS NOT NULL AND c.schema_name <> '{DDL_LOG_SCHEMA}' AND NOT c.in_extension;
+
+        FOR affected IN SELECT DISTINCT schema_name FROM pg_event_trigger_ddl_commands()
+                        WHERE schema_name IS NOT NULL LOOP
+            PERFORM pg_notify('{DDL_NOTIFY_CHANNEL}', affected);
+        END LOOP;
+    END IF;
+END;
+$$;
+
+DROP EVENT TRIGGER IF EXISTS supabase_pydantic_notify_ddl;
+CREATE EVENT TRIGGER supabase_pydantic_notify_ddl ON ddl_command_end
+    EXECUTE FUNCTION {DDL_LOG_SCHEMA}.notify_ddl();
+
+DROP EVENT TRIGGER IF EXISTS supabase_pydantic_notify_drop;
+CREATE EVENT TRIGGER supabase_pydantic_notify_drop ON sql_drop
+    EXECUTE FUNCTION {DDL_LOG_SCHEMA}.notify_ddl();
+
+-- Created in the search path by earlier versions
+DROP FUNCTION IF EXISTS supabase_pydantic_notify_ddl();
+"""
+
+UNINSTALL_DDL_EVENT_TRIGGERS = f"""
+DROP EVENT TRIGGER IF EXISTS supabase_pydantic_notify_ddl;
+DROP EVENT TRIGGER IF EXISTS supabase_pydantic_notify_drop;
+DROP FUNCTION IF EXISTS {DDL_LOG_SCHEMA}.notify_ddl();
+DROP FUNCTION IF EXISTS supabase_pydantic_notify_ddl();
+DROP TABLE IF EXISTS {DDL_LOG_SCHEMA}.ddl_log;
+DROP SCHEMA IF EXISTS {DDL_LOG_SCHEMA};
+"""
+
+# The id of the latest DDL log entry, to read later entries from
+GET_DDL_LOG_POSITION = f'SELECT coalesce(max(id), 0) FROM {DDL_LOG_SCHEMA}.ddl_log;'
+
+# Delete the DDL log entries up to a position, already read. Parameters: the position.
+PRUNE_DDL_LOG = f'DELETE FROM {DDL_LOG_SCHEMA}.ddl_log WHERE id <= %s;'
+
+# DDL log entries after a position. Parameters: the position.
+GET_DDL_LOG_ENTRIES = f"""
+SELECT id, schema_name, object_type, relation_name, objid
+FROM {DDL_LOG_SCHEMA}.ddl_log
+WHERE id > %s
+ORDER BY id;
+"""
+
+# The schema and name of every table, view and foreign table, by oid; the DDL log only records
+# the names relations have after a command, so renames are told apart by comparing with these
+RELATION_NAMES_QUERY = f"""
+SELECT c.oid, n.nspname, c.relname
+FROM pg_class c
+JOIN pg_namespace n ON n.oid = c.relnamespace
+WHERE c.relkind IN ('r', 'p', 'v', 'm', 'f')
+  AND n.nspname NOT IN ('pg_catalog', 'information_schema', '{DDL_LOG_SCHEMA}')
+  AND n.nspname !~ '^pg_(toast|temp)';
+"""
+
+# A transaction whose queries all see the catalog as it was when it started
+BEGIN_CONSISTENT_READ = 'BEGIN ISOLATION LEVEL REPEATABLE READ READ ONLY;'
+
+# The id of the transaction's snapshot, for other connections to read the same catalog with
+EXPORT_SNAPSHOT_QUERY = 'SELECT pg_export_snapshot();'
+
+# Read from an exported snapshot; must be the first statement of the transaction. Parameters: the id.
+SET_TRANSACTION_SNAPSHOT = 'SET TRANSACTION SNAPSHOT %s;'
+
+END_CONSISTENT_READ = 'ROLLBACK;'
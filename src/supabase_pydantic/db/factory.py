@@ -1,6 +1,20 @@
-"""Factory for creating database-specific components."""
+"""Factory for creating database-specific components.
 
-from typing import Any, TypeVar
+Components are registered per backend, usually by import path, and each backend's components
+are registered the first time that backend is used. Besides the built-in backends, third-party
+packages can add backends through the `supabase_pydantic.databases` entry point group. Each
+entry point is named after its backend and points at a function that takes the factory class
+and registers the backend's components:
+
+    [project.entry-points."supabase_pydantic.databases"]
+    duckdb = "sb_pydantic_duckdb.registrations:register"
+"""
+
+import logging
+from collections.abc import Callable
+from importlib import import_module
+from importlib.metadata import EntryPoint, entry_points
+from typing import Any, TypeAlias, TypeVar
 
 from pydantic import BaseModel
 
@@ -12,95 +26,226 @@ from supabase_pydantic.db.marshalers.abstract.base_constraint_marshaler import B
 from supabase_pydantic.db.marshalers.abstract.base_relationship_marshaler import BaseRelationshipMarshaler
 from supabase_pydantic.db.marshalers.abstract.base_schema_marshaler import BaseSchemaMarshaler
 
+# Get Logger
+logger = logging.getLogger(__name__)
+
 T = TypeVar('T', bound=BaseModel)
+C = TypeVar('C')
+
+# A registered component: the class itself, or its import path ('package.module:ClassName')
+Component = type[C] | str
+
+# A backend: a built-in database type, or the name of a backend added by a plugin
+Backend: TypeAlias = DatabaseType | str
+
+# Entry point group for third-party backends
+ENTRY_POINT_GROUP = 'supabase_pydantic.databases'
+
+# Source backends, which register a connector and schema reader only: they read a schema
+# without a database, and the database type's marshalers build the table information
+SQL_FILE_BACKEND = 'sql'  # PostgreSQL DDL files (see `gen --from-sql`)
+CATALOG_FILE_BACKEND = 'catalog'  # Catalog snapshots (see `gen --from-catalog`)
+
+# Registration functions for the built-in backends
+BUILTIN_BACKENDS = {
+    DatabaseType.POSTGRES.value: 'supabase_pydantic.db.registrations:register_postgres_components',
+    DatabaseType.MYSQL.value: 'supabase_pydantic.db.registrations:register_mysql_components',
+    SQL_FILE_BACKEND: 'supabase_pydantic.db.registrations:register_sql_components',
+    CATALOG_FILE_BACKEND: 'supabase_pydantic.db.registrations:register_catalog_components',
+}
+
+
+def backend_name(db_type: Backend) -> str:
+    """Return the registry key for a backend: the database type's value, or the plugin's name."""
+    return str(db_type.value) if isinstance(db_type, DatabaseType) else db_type
+
+
+def import_path(path: str) -> Any:
+    """Import the object at an import path in 'package.module:attribute' form.
+
+    Raises:
+        ImportError: If the module or attribute cannot be found.
+    """
+    module_name, _, attr = path.partition(':')
+    module = import_module(module_name)
+    try:
+        return getattr(module, attr)
+    except AttributeError as e:
+        raise ImportError(f'Cannot import {attr!r} from {module_name!r} (registered as {path!r})') from e
+
+
+def load_component(entry: Component[C]) -> type[C]:
+    """Return the class for a registry entry, importing it if the entry is an import path.
+
+    Args:
+        entry: A class, or an import path in 'package.module:ClassName' form.
+
+    Returns:
+        The component class.
+
+    Raises:
+        ImportError: If the module or class cannot be found.
+    """
+    if not isinstance(entry, str):
+        return entry
+    component: type[C] = import_path(entry)
+    return component
 
 
 class DatabaseFactory:
-    """Factory for creating database-specific components."""
+    """Factory for creating database-specific components.
+
+    Registries are keyed by backend name, so `DatabaseType.POSTGRES` and 'postgres' are the same
+    backend. A backend's registration function runs once, the first time one of its components
+    is created.
+    """
 
-    _connector_registry: dict[DatabaseType, type[BaseDBConnector[Any]]] = {}
-    _schema_reader_registry: dict[DatabaseType, type[BaseSchemaReader]] = {}
-    _column_marshaler_registry: dict[DatabaseType, type[BaseColumnMarshaler]] = {}
-    _constraint_marshaler_registry: dict[DatabaseType, type[BaseConstraintMarshaler]] = {}
-    _relationship_marshaler_registry: dict[DatabaseType, type[BaseRelationshipMarshaler]] = {}
-    _schema_marshaler_registry: dict[DatabaseType, type[BaseSchemaMarshaler]] = {}
+    _connector_registry: dict[str, Component[BaseDBConnector[Any]]] = {}
+    _schema_reader_registry: dict[str, Component[BaseSchemaReader]] = {}
+    _column_marshaler_registry: dict[str, Component[BaseColumnMarshaler]] = {}
+    _constraint_marshaler_registry: dict[str, Component[BaseConstraintMarshaler]] = {}
+    _relationship_marshaler_registry: dict[str, Component[BaseRelationshipMarshaler]] = {}
+    _schema_marshaler_registry: dict[str, Component[BaseSchemaMarshaler]] = {}
+
+    # Backends whose registration function has run, and plugin backends found via entry points
+    _loaded_backends: set[str] = set()
+    _plugin_backends: dict[str, EntryPoint] | None = None
 
     @classmethod
-    def register_connector(cls, db_type: DatabaseType, connector_class: type[BaseDBConnector[Any]]) -> None:
+    def register_connector(cls, db_type: Backend, connector_class: Component[BaseDBConnector[Any]]) -> None:
         """Register a connector class for a specific database type.
 
         Args:
-            db_type: Database type enum value.
-            connector_class: Connector implementation class.
+            db_type: Database type enum value, or a plugin backend's name.
+            connector_class: Connector implementation class, or its import path.
         """
-        cls._connector_registry[db_type] = connector_class
+        cls._connector_registry[backend_name(db_type)] = connector_class
 
     @classmethod
-    def register_schema_reader(cls, db_type: DatabaseType, schema_reader_class: type[BaseSchemaReader]) -> None:
+    def register_schema_reader(cls, db_type: Backend, schema_reader_class: Component[BaseSchemaReader]) -> None:
         """Register a schema reader class for a specific database type.
 
         Args:
-            db_type: Database type enum value.
-            schema_reader_class: Schema reader implementation class.
+            db_type: Database type enum value, or a plugin backend's name.
+            schema_reader_class: Schema reader implementation class, or its import path.
         """
-        cls._schema_reader_registry[db_type] = schema_reader_class
+        cls._schema_reader_registry[backend_name(db_type)] = schema_reader_class
 
     @classmethod
     def register_column_marshaler(
-        cls, db_type: DatabaseType, column_marshaler_class: type[BaseColumnMarshaler]
+        cls, db_type: Backend, column_marshaler_class: Component[BaseColumnMarshaler]
     ) -> None:
         """Register a column marshaler class for a specific database type.
 
         Args:
-            db_type: Database type enum value.
-            column_marshaler_class: Column marshaler implementation class.
+            db_type: Database type enum value, or a plugin backend's name.
+            column_marshaler_class: Column marshaler implementation class, or its import path.
         """
-        cls._column_marshaler_registry[db_type] = column_marshaler_class
+        cls._column_marshaler_registry[backend_name(db_type)] = column_marshaler_class
 
     @classmethod
     def register_constraint_marshaler(
-        cls, db_type: DatabaseType, constraint_marshaler_class: type[BaseConstraintMarshaler]
+        cls, db_type: Backend, constraint_marshaler_class: Component[BaseConstraintMarshaler]
     ) -> None:
         """Register a constraint marshaler class for a specific database type.
 
         Args:
-            db_type: Database type enum value.
-            constraint_marshaler_class: Constraint marshaler implementation class.
+            db_type: Database type enum value, or a plugin backend's name.
+            constraint_marshaler_class: Constraint marshaler implementation class, or its import path.
         """
-        cls._constraint_marshaler_registry[db_type] = constraint_marshaler_class
+        cls._constraint_marshaler_registry[backend_name(db_type)] = constraint_marshaler_class
 
     @classmethod
     def register_relationship_marshaler(
-        cls, db_type: DatabaseType, relationship_marshaler_class: type[BaseRelationshipMarshaler]
+        cls, db_type: Backend, relationship_marshaler_class: Component[BaseRelationshipMarshaler]
     ) -> None:
         """Register a relationship marshaler class for a specific database type.
 
         Args:
-            db_type: Database type enum value.
-            relationship_marshaler_class: Relationship marshaler implementation class.
+            db_type: Database type enum value, or a plugin backend's name.
+            relationship_marshaler_class: Relationship marshaler implementation class, or its import path.
         """
-        cls._relationship_marshaler_registry[db_type] = relationship_marshaler_class
+        cls._relationship_marshaler_registry[backend_name(db_type)] = relationship_marshaler_class
 
     @classmethod
     def register_schema_marshaler(
-        cls, db_type: DatabaseType, schema_marshaler_class: type[BaseSchemaMarshaler]
+        cls, db_type: Backend, schema_marshaler_class: Component[BaseSchemaMarshaler]
     ) -> None:
         """Register a schema marshaler class for a specific database type.
 
         Args:
-            db_type: Database type enum value.
-            schema_marshaler_class: Schema marshaler implementation class.
+            db_type: Database type enum value, or a plugin backend's name.
+            schema_marshaler_class: Schema marshaler implementation class, or its import path.
+        """
+        cls._schema_marshaler_registry[backend_name(db_type)] = schema_marshaler_class
+
+    @classmethod
+    def plugin_backends(cls) -> dict[str, EntryPoint]:
+        """Find the backends installed by third-party packages, without importing them.
+
+        Returns:
+            A mapping of backend names to the entry points of their registration functions.
+        """
+        if cls._plugin_backends is None:
+            cls._plugin_backends = {ep.name: ep for ep in entry_points(group=ENTRY_POINT_GROUP)}
+        return cls._plugin_backends
+
+    @classmethod
+    def available_backends(cls) -> list[str]:
+        """List the names of the built-in, plugin and directly registered backends."""
+        return sorted({*BUILTIN_BACKENDS, *cls.plugin_backends(), *cls._connector_registry})
+
+    @classmethod
+    def load_backend(cls, db_type: Backend) -> None:
+        """Run the registration function for a backend, if it has not run yet.
+
+        Only the selected backend's registration function is imported. Built-in backends take
+        precedence over plugins with the same name. Backends without a registration function
+        (e.g., ones whose components were registered directly) are left as they are.
+
+        Args:
+            db_type: Database type enum value, or a plugin backend's name.
+        """
+        name = backend_name(db_type)
+        if name in cls._loaded_backends:
+            return
+
+        register: Callable[[type[DatabaseFactory]], None] | None = None
+        if name in BUILTIN_BACKENDS:
+            register = import_path(BUILTIN_BACKENDS[name])
+        elif name in cls.plugin_backends():
+            logger.debug(f'Loading database backend plugin: {name}')
+            register = cls.plugin_backends()[name].load()
+        if register is not None:
+            register(cls)
+        cls._loaded_backends.add(name)
+
+    @classmethod
+    def _load(cls, registry: dict[str, Component[C]], db_type: Backend, kind: str) -> type[C]:
+        """Look up the component registered for a backend, importing it on first use.
+
+        Raises:
+            ValueError: If no component of this kind is registered for the backend.
         """
-        cls._schema_marshaler_registry[db_type] = schema_marshaler_class
+        cls.load_backend(db_type)
+        name = backend_name(db_type)
+        entry = registry.get(name)
+        if not entry:
+            raise ValueError(f'No {kind} registered for database type: {db_type}')
+        if isinstance(entry, str):
+            component: type[C] = load_component(entry)
+            registry[name] = component
+            return component
+        return entry
 
     @classmethod
     def create_connector(
-        cls, db_type: DatabaseType, connection_params: BaseModel | dict[str, Any] | None = None, **kwargs: Any
+        cls, db_type: Backend, connection_params: BaseModel | dict[str, Any] | None = None, **kwargs: Any
     ) -> BaseDBConnector[Any]:
         """Create a connector instance for the specified database type.
 
         Args:
-            db_type: Database type enum value.
+            db_type: Database type enum value, or a plugin backend's name.
             connection_params: Connection parameters as a Pydantic model or dictionary.
             **kwargs: Additional arguments to pass to the connector constructor.
 
@@ -110,21 +255,19 @@ class DatabaseFactory:
         Raises:
             ValueError: If no connector is registered for the database type.
         """
-        connector_class = cls._connector_registry.get(db_type)
-        if not connector_class:
-            raise ValueError(f'No connector registered for database type: {db_type}')
+        connector_class = cls._load(cls._connector_registry, db_type, 'connector')
 
         # Pass connection parameters separately to leverage the new Pydantic model support
         return connector_class(connection_params=connection_params, **kwargs)
 
     @classmethod
     def create_schema_reader(
-        cls, db_type: DatabaseType, connector: BaseDBConnector[Any] | None = None, **kwargs: Any
+        cls, db_type: Backend, connector: BaseDBConnector[Any] | None = None, **kwargs: Any
     ) -> BaseSchemaReader:
         """Create a schema reader instance for the specified database type.
 
         Args:
-            db_type: Database type enum value.
+            db_type: Database type enum value, or a plugin backend's name.
             connector: Optional connector instance to use. If not provided,
                        a new connector will be created.
             **kwargs: Additional arguments to pass to the schema reader constructor.
@@ -135,9 +278,7 @@ class DatabaseFactory:
         Raises:
             ValueError: If no schema reader is registered for the database type.
         """
-        schema_reader_class = cls._schema_reader_registry.get(db_type)
-        if not schema_reader_class:
-            raise ValueError(f'No schema reader registered for database type: {db_type}')
+        schema_reader_class = cls._load(cls._schema_reader_registry, db_type, 'schema reader')
 
         if not connector:
             connector = cls.create_connector(db_type)
@@ -145,11 +286,11 @@ class DatabaseFactory:
         return schema_reader_class(connector, **kwargs)
 
     @classmethod
-    def create_marshalers(cls, db_type: DatabaseType, **kwargs: Any) -> BaseSchemaMarshaler:
+    def create_marshalers(cls, db_type: Backend, **kwargs: Any) -> BaseSchemaMarshaler:
         """Create marshaler instances for the specified database type.
 
         Args:
-            db_type: Database type enum value.
+            db_type: Database type enum value, or a plugin backend's name.
             **kwargs: Additional arguments to pass to the marshalers' constructors.
 
         Returns:
@@ -158,21 +299,15 @@ class DatabaseFactory:
         Raises:
             ValueError: If any required marshaler is not registered for the database type.
         """
-        column_marshaler_class = cls._column_marshaler_registry.get(db_type)
-        if not column_marshaler_class:
-            raise ValueError(f'No column marshaler registered for database type: {db_type}')
+        column_marshaler_class = cls._load(cls._column_marshaler_registry, db_type, 'column marshaler')
 
-        constraint_marshaler_class = cls._constraint_marshaler_registry.get(db_type)
-        if not constraint_marshaler_class:
-            raise ValueError(f'No constraint marshaler registered for database type: {db_type}')
+        constraint_marshaler_class = cls._load(cls._constraint_marshaler_registry, db_type, 'constraint marshaler')
 
-        relationship_marshaler_class = cls._relationship_marshaler_registry.get(db_type)
-        if not relationship_marshaler_class:
-            raise ValueError(f'No relationship marshaler registered for database type: {db_type}')
+        relationship_marshaler_class = cls._load(
+            cls._relationship_marshaler_registry, db_type, 'relationship marshaler'
+        )
 
-        schema_marshaler_class = cls._schema_marshaler_registry.get(db_type)
-        if not schema_marshaler_class:
-            raise ValueError(f'No schema marshaler registered for database type: {db_type}')
+        schema_marshaler_class = cls._load(cls._schema_marshaler_registry, db_type, 'schema marshaler')
 
         column_marshaler = column_marshaler_class(**kwargs)
         constraint_marshaler = constraint_marshaler_class(**kwargs)
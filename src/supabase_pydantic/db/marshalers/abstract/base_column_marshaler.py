@@ -1,6 +1,7 @@
 """Abstract base class for column marshaling."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Set
 
 
 class BaseColumnMarshaler(ABC):
@@ -32,13 +33,20 @@ class BaseColumnMarshaler(ABC):
         pass
 
     @abstractmethod
-    def process_column_type(self, db_type: str, type_info: str, enum_types: list[str] | None = None) -> str:
+    def process_column_type(
+        self,
+        db_type: str,
+        type_info: str,
+        enum_types: list[str] | None = None,
+        lowered_enum_types: Set[str] | None = None,
+    ) -> str:
         """Process database-specific column type into standard Python type.
 
         Args:
             db_type: Database-specific type name.
             type_info: Additional type information.
             enum_types: Optional list of known enum type names.
+            lowered_enum_types: `enum_types` lower-cased, when built once for many columns.
 
         Returns:
             Python/Pydantic type name.
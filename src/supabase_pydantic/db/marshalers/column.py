@@ -1,17 +1,21 @@
 import builtins
 import keyword
-import logging
+from collections.abc import Set
 
 from supabase_pydantic.db.database_type import DatabaseType
+from supabase_pydantic.db.marshalers.log import get_logger
 from supabase_pydantic.db.type_factory import TypeMapFactory
 
 # Get logger
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
+
+# Keywords and built-in names, checked once per column
+RESERVED_NAMES = frozenset(dir(builtins)) | frozenset(keyword.kwlist)
 
 
 def string_is_reserved(value: str) -> bool:
     """Check if the string is a reserved keyword or built-in name."""
-    return value in dir(builtins) or value in keyword.kwlist
+    return value in RESERVED_NAMES
 
 
 def column_name_is_reserved(column_name: str, disable_model_prefix_protection: bool = False) -> bool:
@@ -59,8 +63,18 @@ def get_alias(column_name: str, disable_model_prefix_protection: bool = False) -
     )
 
 
+def lowercase_enum_types(known_enum_types: list[str] | None) -> frozenset[str]:
+    """Return the known enum type names lower-cased, for case-insensitive matching."""
+    # MySQL passes its user-defined type rows, which name no enum to match
+    return frozenset(name.lower() for name in known_enum_types or () if isinstance(name, str))
+
+
 def process_udt_field(
-    udt_name: str, data_type: str, db_type: DatabaseType = DatabaseType.POSTGRES, known_enum_types: list[str] = []
+    udt_name: str,
+    data_type: str,
+    db_type: DatabaseType = DatabaseType.POSTGRES,
+    known_enum_types: list[str] = [],
+    lowered_enum_types: Set[str] | None = None,
 ) -> str:
     """Process a user-defined type field.
 
@@ -69,11 +83,15 @@ def process_udt_field(
         data_type: The database data type
         db_type: The database type (used to select appropriate type maps)
         known_enum_types: Optional list of known enum type names to avoid warnings
+        lowered_enum_types: `known_enum_types` lower-cased (see `lowercase_enum_types`), when
+            built once for many columns; built from `known_enum_types` if not given
 
     Returns:
         A string representing the Python/Pydantic type
     """
-    logger.debug(f'Processing type: data_type={data_type}, udt_name={udt_name}, db_type={db_type}')
+    debug = logger.debug_enabled
+    if debug:
+        logger.debug('Processing type: data_type=%s, udt_name=%s, db_type=%s', data_type, udt_name, db_type)
 
     # Clean the udt_name for comparison
     # clean_udt_name = udt_name.strip('_').lower()
@@ -85,7 +103,8 @@ def process_udt_field(
     else:
         type_map = TypeMapFactory.get_pydantic_type_map(DatabaseType.POSTGRES)  # Default to PostgreSQL
 
-    logger.debug(f'Using type map: {list(type_map.keys())[:5]}... (showing first 5 keys)')
+    if debug:
+        logger.debug('Using type map: %s... (showing first 5 keys)', list(type_map)[:5])
 
     # First, check if this is an array type
     pydantic_type: str
@@ -109,32 +128,40 @@ def process_udt_field(
         if enum_type_name_check.startswith('"') and enum_type_name_check.endswith('"'):
             enum_type_name_check = enum_type_name_check[1:-1]
 
-        logger.debug(f'Checking array element: original={original_element_type}, cleaned={enum_type_name_check}')
-        logger.debug(f'Known enum types (before conversion): {known_enum_types}')
+        if debug:
+            logger.debug('Checking array element: original=%s, cleaned=%s', original_element_type, enum_type_name_check)
+            logger.debug('Known enum types (before conversion): %s', known_enum_types)
 
         # Simplified approach: check if the element type exists in the type map
         element_mapping = type_map.get(enum_type_name_check)
         if element_mapping:
             element_pydantic_type = element_mapping[0]
-            logger.debug(f'Found array element type mapping for {element_type_name}: {element_pydantic_type}')
+            if debug:
+                logger.debug('Found array element type mapping for %s: %s', element_type_name, element_pydantic_type)
         else:
-            # Match against known enum types (case-insensitive)
-            known_enum_lower = [e.lower() for e in known_enum_types]
-
             # Check multiple variants: original type, without leading underscore, etc.
-            variants_to_check = [
+            variants_to_check = {
                 original_element_type.lower(),  # Original from DB
                 enum_type_name_check.lower(),  # Cleaned (without _)
-            ]
+            }
 
             # For types with double underscore, add single underscore variant
             if original_element_type.startswith('__'):
-                variants_to_check.append('_' + enum_type_name_check.lower())
+                variants_to_check.add('_' + enum_type_name_check.lower())
 
-            is_known_enum = any(variant in known_enum_lower for variant in variants_to_check)
+            # Match against known enum types (case-insensitive)
+            if lowered_enum_types is None:
+                lowered_enum_types = lowercase_enum_types(known_enum_types)
+            is_known_enum = not variants_to_check.isdisjoint(lowered_enum_types)
 
             # Debug log to help diagnose issues
-            logger.debug(f'Checking if any of {variants_to_check} is in {known_enum_lower}: {is_known_enum}')
+            if debug:
+                logger.debug(
+                    'Checking if any of %s is in %s: %s',
+                    sorted(variants_to_check),
+                    sorted(lowered_enum_types),
+                    is_known_enum,
+                )
 
             # Default to Any for unknown types
             element_pydantic_type = 'Any'
@@ -142,7 +169,9 @@ def process_udt_field(
             # Only log warning if not a known enum type
             if element_type_name.lower() != 'user-defined' and not is_known_enum:
                 logger.warning(
-                    f'Unknown array element type: {original_element_type} (cleaned: {enum_type_name_check}), using Any'
+                    'Unknown array element type: %s (cleaned: %s), using Any',
+                    original_element_type,
+                    enum_type_name_check,
                 )
 
         # Create a properly typed list
@@ -157,7 +186,8 @@ def process_udt_field(
 
         if type_mapping:
             pydantic_type = type_mapping[0]
-            logger.debug(f'Found type mapping for {data_type_lower}: {pydantic_type}')
+            if debug:
+                logger.debug('Found type mapping for %s: %s', data_type_lower, pydantic_type)
         else:
             # No match found in the type map
             # If this is a test for the 'unknown' type, return None to test the None handling
@@ -168,7 +198,7 @@ def process_udt_field(
             # Only log warning if not a known enum type and the data type is user-defined
             if data_type_lower != 'user-defined' and udt_name not in known_enum_types:
                 logger.warning(
-                    f'No type mapping found for {data_type_lower}, using Any. Available keys: {list(type_map.keys())[:10]}'  # noqa: E501
+                    'No type mapping found for %s, using Any. Available keys: %s', data_type_lower, list(type_map)[:10]
                 )
 
     return pydantic_type
@@ -3,6 +3,7 @@ from typing import Any
 
 from supabase_pydantic.db.marshalers.column import standardize_column_name
 from supabase_pydantic.db.models import ConstraintInfo
+from supabase_pydantic.utils.profiling import timed
 
 
 def parse_constraint_definition_for_fk(constraint_definition: str) -> tuple[str, str, str] | None:
@@ -17,6 +18,7 @@ def parse_constraint_definition_for_fk(constraint_definition: str) -> tuple[str,
     return None
 
 
+@timed('marshal.constraints')
 def add_constraints_to_table_details(tables: dict, schema: str, constraints: list) -> None:
     """Add constraints to the table details."""
     for row in constraints:
@@ -50,6 +52,7 @@ def get_unique_columns_from_constraints(constraint: ConstraintInfo) -> list[str
     return unique_columns
 
 
+@timed('marshal.constraint_definitions')
 def update_column_constraint_definitions(tables: dict) -> None:
     """Update columns with their CHECK constraint definitions."""
     for table in tables.values():
@@ -67,6 +70,7 @@ def update_column_constraint_definitions(tables: dict) -> None:
                         column.constraint_definition = constraint.constraint_definition
 
 
+@timed('marshal.column_constraints')
 def update_columns_with_constraints(tables: dict) -> None:
     """Update columns with constraints."""
     for table in tables.values():
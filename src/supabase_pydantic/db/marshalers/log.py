@@ -0,0 +1,70 @@
+"""Level-guarded logging for the per-table and per-column marshaling code paths."""
+
+import logging
+from typing import Any
+
+# Loguru's TRACE level, registered with stdlib logging so records bridge by name
+TRACE = 5
+logging.addLevelName(TRACE, 'TRACE')
+
+
+class MarshalerLogger:
+    """A thin wrapper around a stdlib logger for code that runs once per table or column.
+
+    Hot functions read `debug_enabled` (or `trace_enabled`) once per call and guard their
+    logging with it, so nothing is formatted, and no debug-only arguments are built, when the
+    level is off. Messages take lazy `%`-style args. The flags come from the stdlib logger's
+    own level cache, so they follow any later `setup_logging` reconfiguration.
+
+    Attributes:
+        logger (logging.Logger): The wrapped logger.
+    """
+
+    __slots__ = ('logger',)
+
+    def __init__(self, name: str):
+        self.logger = logging.getLogger(name)
+
+    @property
+    def debug_enabled(self) -> bool:
+        """Whether DEBUG records would be handled."""
+        return self.logger.isEnabledFor(logging.DEBUG)
+
+    @property
+    def trace_enabled(self) -> bool:
+        """Whether TRACE records, and therefore structured events, would be handled."""
+        return self.logger.isEnabledFor(TRACE)
+
+    def debug(self, msg: str, *args: Any) -> None:
+        """Log a DEBUG message, formatted with `args` only if it is emitted."""
+        self.logger.debug(msg, *args, stacklevel=2)
+
+    def info(self, msg: str, *args: Any) -> None:
+        """Log an INFO message, formatted with `args` only if it is emitted."""
+        self.logger.info(msg, *args, stacklevel=2)
+
+    def warning(self, msg: str, *args: Any) -> None:
+        """Log a WARNING message, formatted with `args` only if it is emitted."""
+        self.logger.warning(msg, *args, stacklevel=2)
+
+    def error(self, msg: str, *args: Any) -> None:
+        """Log an ERROR message, formatted with `args` only if it is emitted."""
+        self.logger.error(msg, *args, stacklevel=2)
+
+    def event(self, name: str, **fields: Any) -> None:
+        """Log a structured event at TRACE level.
+
+        The event name and fields are attached to the record as `event` and `fields`, so
+        handlers can consume them as data rather than parsing the message.
+
+        Args:
+            name: The event name, e.g. 'relationship_type'.
+            **fields: The event's data.
+        """
+        if self.logger.isEnabledFor(TRACE):
+            self.logger.log(TRACE, '%s %s', name, fields, extra={'event': name, 'fields': fields}, stacklevel=2)
+
+
+def get_logger(name: str) -> MarshalerLogger:
+    """Get the level-guarded logger for a marshaler module."""
+    return MarshalerLogger(name)
@@ -1,6 +1,7 @@
 """MySQL column marshaler implementation."""
 
 import logging
+from collections.abc import Set
 
 from supabase_pydantic.db.database_type import DatabaseType
 from supabase_pydantic.db.marshalers.abstract.base_column_marshaler import BaseColumnMarshaler
@@ -31,11 +32,23 @@ class MySQLColumnMarshaler(BaseColumnMarshaler):
         result = get_col_alias(column_name)
         return str(result) if result is not None else ''
 
-    def process_column_type(self, db_type: str, type_info: str, enum_types: list[str] | None = None) -> str:
+    def process_column_type(
+        self,
+        db_type: str,
+        type_info: str,
+        enum_types: list[str] | None = None,
+        lowered_enum_types: Set[str] | None = None,
+    ) -> str:
         """Process database-specific column type into standard Python type."""
         # Call process_udt_field with the correct parameter order:
         # (udt_name, data_type, db_type, known_enum_types)
-        result = process_udt_field(type_info, db_type, db_type=DatabaseType.MYSQL, known_enum_types=enum_types)
+        result = process_udt_field(
+            type_info,
+            db_type,
+            db_type=DatabaseType.MYSQL,
+            known_enum_types=enum_types,
+            lowered_enum_types=lowered_enum_types,
+        )
 
         # Handle None return value by returning empty string
         if result is None:
@@ -1,10 +1,10 @@
 """MySQL schema marshaler implementation."""
 
 import logging
-from typing import Any
 
 from supabase_pydantic.core.models import EnumInfo
 from supabase_pydantic.db.database_type import DatabaseType
+from supabase_pydantic.db.drivers.mysql.rows import COLUMN_ROW, column_details
 from supabase_pydantic.db.marshalers.abstract.base_column_marshaler import BaseColumnMarshaler
 from supabase_pydantic.db.marshalers.abstract.base_constraint_marshaler import BaseConstraintMarshaler
 from supabase_pydantic.db.marshalers.abstract.base_relationship_marshaler import BaseRelationshipMarshaler
@@ -20,6 +20,7 @@ from supabase_pydantic.db.marshalers.schema import (
     update_columns_with_constraints,
 )
 from supabase_pydantic.db.models import TableInfo, UserEnumType, UserTypeMapping
+from supabase_pydantic.utils.profiling import timed
 
 # Get Logger
 logger = logging.getLogger(__name__)
@@ -39,7 +40,7 @@ def get_enum_types(enum_types: list, schema: str) -> list[UserEnumType]:
     """
     enums = []
     for row in enum_types:
-        # Our modified MySQL ENUMS_QUERY now returns data in this structure
+        # Rows from MySQLSchemaReader.get_user_defined_types are tuples; dicts are still accepted
         if isinstance(row, dict):
             type_name = row.get('type_name')
             namespace = row.get('namespace')
@@ -53,7 +54,7 @@ def get_enum_types(enum_types: list, schema: str) -> list[UserEnumType]:
             if not isinstance(enum_values, list) and enum_values:
                 logger.warning(f'Enum values for {type_name} not properly converted to list: {enum_values}')
         else:
-            # Tuple unpacking for the standard format
+            # Tuple unpacking for the rows returned by the schema reader
             try:
                 (
                     type_name,
@@ -83,6 +84,7 @@ def get_enum_types(enum_types: list, schema: str) -> list[UserEnumType]:
     return enums
 
 
+@timed('marshal.user_defined_types')
 def add_mysql_user_defined_types_to_tables(
     tables: dict[tuple[str, str], TableInfo], schema: str, enums: list[UserEnumType], enum_type_mapping: list
 ) -> None:
@@ -199,49 +201,26 @@ class MySQLSchemaMarshaler(BaseSchemaMarshaler):
         super().__init__(column_marshaler, constraint_marshaler, relationship_marshaler)
         self.db_type = DatabaseType.MYSQL
 
-    def process_columns(self, column_data: list[dict[str, Any]]) -> list[tuple]:
+    def process_columns(self, column_data: list[tuple]) -> list[tuple]:
         """Process column data from database-specific format.
 
-        In MySQL, we need to adjust the column data to match the expected format.
+        MySQL column rows carry the column type after the shared column details; the details
+        are read by position (see `supabase_pydantic.db.drivers.mysql.rows`).
         """
-        # Convert MySQL-specific column data format to the common format
-        # If the formats are compatible, this can just return the data
         processed_data = []
         for column in column_data:
-            # Check if this is a result from GET_ALL_PUBLIC_TABLES_AND_COLUMNS query
-            if 'TABLE_SCHEMA' in column and 'TABLE_NAME' in column:
-                # Already in the correct format with all fields
-                processed_data.append(
-                    (
-                        column.get('TABLE_SCHEMA'),
-                        column.get('TABLE_NAME'),
-                        column.get('COLUMN_NAME'),
-                        column.get('COLUMN_DEFAULT'),
-                        column.get('IS_NULLABLE'),
-                        column.get('DATA_TYPE'),
-                        column.get('CHARACTER_MAXIMUM_LENGTH'),
-                        column.get('TABLE_TYPE', 'BASE TABLE'),
-                        column.get('IDENTITY_GENERATION'),
-                        column.get('UDT_NAME', column.get('DATA_TYPE')),
-                        column.get('ARRAY_ELEMENT_TYPE'),
-                        column.get('COLUMN_COMMENT', ''),  # Add column description/comment as 12th value
-                    )
-                )
+            if len(column) == len(COLUMN_ROW):
+                processed_data.append(column_details(column))
             else:
-                # Standard column format, we need to adjust it
-                # Note: Missing table_schema and table_name here
-                # This branch won't be used with our new approach
-                logger.warning(
-                    f"Column data missing table_schema and table_name: {column}. This branch won't be used with our new approach."  # noqa: E501
-                )
-                pass
+                # Rows of the single-table column query have no table_schema or table_name
+                logger.warning(f'Column data missing table_schema and table_name: {column}')
         return processed_data
 
     def process_constraints(self, constraint_data: list[tuple]) -> list[tuple]:
         """Process constraint data from database-specific format."""
         return constraint_data
 
-    def get_table_details_from_columns(self, column_data: list[dict[str, Any]]) -> dict[tuple[str, str], TableInfo]:
+    def get_table_details_from_columns(self, column_data: list[tuple]) -> dict[tuple[str, str], TableInfo]:
         """Get table details from column data.
 
         Args:
@@ -258,7 +237,9 @@ class MySQLSchemaMarshaler(BaseSchemaMarshaler):
 
         # Call the common implementation
         result: dict[tuple[str, str], TableInfo] = get_table_details_from_columns(
-            processed_column_data, disable_model_prefix_protection, column_marshaler=self.column_marshaler
+            processed_column_data,
+            disable_model_prefix_protection=disable_model_prefix_protection,
+            column_marshaler=self.column_marshaler,
         )
         return result
 
@@ -274,8 +255,8 @@ class MySQLSchemaMarshaler(BaseSchemaMarshaler):
 
     def construct_table_info(
         self,
-        table_data: list[dict[str, Any]],
-        column_data: list[dict[str, Any]],
+        table_data: list[tuple],
+        column_data: list[tuple],
         fk_data: list[tuple],
         constraint_data: list[tuple],
         type_data: list[tuple],
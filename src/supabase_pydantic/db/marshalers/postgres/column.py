@@ -1,3 +1,5 @@
+from collections.abc import Set
+
 from supabase_pydantic.db.marshalers.abstract.base_column_marshaler import BaseColumnMarshaler
 from supabase_pydantic.db.marshalers.column import (
     get_alias as get_col_alias,
@@ -23,9 +25,17 @@ class PostgresColumnMarshaler(BaseColumnMarshaler):
         result = get_col_alias(column_name)
         return str(result) if result is not None else ''
 
-    def process_column_type(self, db_type: str, type_info: str, enum_types: list[str] | None = None) -> str:
+    def process_column_type(
+        self,
+        db_type: str,
+        type_info: str,
+        enum_types: list[str] | None = None,
+        lowered_enum_types: Set[str] | None = None,
+    ) -> str:
         """Process database-specific column type into standard Python type."""
-        result = process_udt_field(type_info, db_type, known_enum_types=enum_types)
+        result = process_udt_field(
+            type_info, db_type, known_enum_types=enum_types, lowered_enum_types=lowered_enum_types
+        )
         if result is None:
             return ''
         # Make sure we check for None again and return empty string
@@ -57,7 +57,9 @@ class PostgresSchemaMarshaler(BaseSchemaMarshaler):
         # Call the common implementation
         # Get table details using common function
         result: dict[tuple[str, str], TableInfo] = get_table_details_from_columns(
-            processed_column_data, disable_model_prefix_protection, column_marshaler=self.column_marshaler
+            processed_column_data,
+            disable_model_prefix_protection=disable_model_prefix_protection,
+            column_marshaler=self.column_marshaler,
         )
         return result
 
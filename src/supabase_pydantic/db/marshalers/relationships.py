@@ -1,13 +1,14 @@
-import logging
-
 from supabase_pydantic.db.constants import RelationType
 from supabase_pydantic.db.marshalers.column import standardize_column_name
+from supabase_pydantic.db.marshalers.log import get_logger
 from supabase_pydantic.db.models import ForeignKeyInfo, RelationshipInfo, TableInfo
+from supabase_pydantic.utils.profiling import timed
 
 # Get Logger
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
+@timed('marshal.relationships')
 def add_relationships_to_table_details(tables: dict, fk_details: list) -> None:
     """Add relationships to the table details."""
     # Process relationships
@@ -129,31 +130,48 @@ def determine_relationship_type(
         col.is_unique and col.name == fk.foreign_column_name for col in target_table.columns
     )
 
-    # Log the analysis
-    logger.debug(
-        f'Analyzing relationship: {source_table.name}.{fk.column_name} -> {target_table.name}.{fk.foreign_column_name}'
-    )
-    logger.debug(f'Source uniqueness: {is_source_unique}, Target uniqueness: {is_target_unique}')
-
     # Determine relationship type
     if is_source_unique and is_target_unique:
         # If both sides are unique, it's a one-to-one relationship
-        logger.debug('ONE_TO_ONE: Both sides are unique')
-        return RelationType.ONE_TO_ONE, RelationType.ONE_TO_ONE
+        forward_type, reverse_type = RelationType.ONE_TO_ONE, RelationType.ONE_TO_ONE
+        reason = 'Both sides are unique'
     elif is_target_unique:
         # If only target is unique, it's many-to-one from source to target
-        logger.debug('MANY_TO_ONE: Target is unique, source is not')
-        return RelationType.MANY_TO_ONE, RelationType.ONE_TO_MANY
+        forward_type, reverse_type = RelationType.MANY_TO_ONE, RelationType.ONE_TO_MANY
+        reason = 'Target is unique, source is not'
     elif is_source_unique:
         # If only source is unique, it's one-to-many from source to target
-        logger.debug('ONE_TO_MANY: Source is unique, target is not')
-        return RelationType.ONE_TO_MANY, RelationType.MANY_TO_ONE
+        forward_type, reverse_type = RelationType.ONE_TO_MANY, RelationType.MANY_TO_ONE
+        reason = 'Source is unique, target is not'
     else:
         # If neither side is unique, it's many-to-many
-        logger.debug('MANY_TO_MANY: Neither side is unique')
-        return RelationType.MANY_TO_MANY, RelationType.MANY_TO_MANY
-
+        forward_type, reverse_type = RelationType.MANY_TO_MANY, RelationType.MANY_TO_MANY
+        reason = 'Neither side is unique'
 
+    # Log the analysis
+    if logger.debug_enabled:
+        logger.debug(
+            'Analyzing relationship: %s.%s -> %s.%s',
+            source_table.name,
+            fk.column_name,
+            target_table.name,
+            fk.foreign_column_name,
+        )
+        logger.debug('Source uniqueness: %s, Target uniqueness: %s', is_source_unique, is_target_unique)
+        logger.debug('%s: %s', forward_type.name, reason)
+    if logger.trace_enabled:
+        logger.event(
+            'relationship_type',
+            source=f'{source_table.name}.{fk.column_name}',
+            target=f'{target_table.name}.{fk.foreign_column_name}',
+            forward=forward_type.name,
+            reverse=reverse_type.name,
+        )
+
+    return forward_type, reverse_type
+
+
+@timed('marshal.table_relationships')
 def analyze_table_relationships(tables: dict) -> None:
     """Analyze table relationships."""
     # Keep track of processed relationships to avoid duplicate analysis
@@ -202,53 +220,65 @@ def analyze_table_relationships(tables: dict) -> None:
 
 def is_bridge_table(table: TableInfo) -> bool:
     """Check if the table is a bridge table."""
-    logger.debug(f'Analyzing if {table.name} is a bridge table')
-    logger.debug(f'Foreign keys: {[fk.column_name for fk in table.foreign_keys]}')
+    debug = logger.debug_enabled
+    if debug:
+        logger.debug('Analyzing if %s is a bridge table', table.name)
+        logger.debug('Foreign keys: %s', [fk.column_name for fk in table.foreign_keys])
 
     # Check for at least two foreign keys
     if len(table.foreign_keys) < 2:
-        logger.debug('Not a bridge table: Less than 2 foreign keys')
+        if debug:
+            logger.debug('Not a bridge table: Less than 2 foreign keys')
         return False
 
     # Identify columns that are both primary keys and part of foreign keys
-    primary_foreign_keys = [
-        col.name
-        for col in table.columns
-        if col.primary and any(fk.column_name == col.name for fk in table.foreign_keys)
-    ]
-    logger.debug(f'Primary foreign keys: {primary_foreign_keys}')
+    fk_columns = {fk.column_name for fk in table.foreign_keys}
+    primary_foreign_keys = [col.name for col in table.columns if col.primary and col.name in fk_columns]
+    if debug:
+        logger.debug('Primary foreign keys: %s', primary_foreign_keys)
 
     # Check if there are at least two such columns
     if len(primary_foreign_keys) < 2:
-        logger.debug('Not a bridge table: Less than 2 primary foreign keys')
+        if debug:
+            logger.debug('Not a bridge table: Less than 2 primary foreign keys')
         return False
 
     # Get all primary key columns
     primary_keys = [col.name for col in table.columns if col.primary]
-    logger.debug(f'All primary keys: {primary_keys}')
+    if debug:
+        logger.debug('All primary keys: %s', primary_keys)
 
     # Consider the table a bridge table if the primary key is composite and includes at least two foreign key columns
-    if len(primary_foreign_keys) == len(primary_keys):
-        logger.debug('Is bridge table: All primary keys are foreign keys')
-        return True
-
-    logger.debug('Not a bridge table: Some primary keys are not foreign keys')
-    return False
+    is_bridge = len(primary_foreign_keys) == len(primary_keys)
+    if debug:
+        if is_bridge:
+            logger.debug('Is bridge table: All primary keys are foreign keys')
+        else:
+            logger.debug('Not a bridge table: Some primary keys are not foreign keys')
+    return is_bridge
 
 
+@timed('marshal.bridge_tables')
 def analyze_bridge_tables(tables: dict) -> None:
     """Analyze if each table is a bridge table."""
+    debug = logger.debug_enabled
     for table in tables.values():
         table.is_bridge = is_bridge_table(table)
         if table.is_bridge:
             # Update all foreign key relationships to MANY_TO_MANY
             for fk in table.foreign_keys:
-                logger.debug(
-                    f'Setting {table.name}.{fk.column_name} -> {fk.foreign_table_name}.{fk.foreign_column_name} to MANY_TO_MANY'  # noqa: E501
-                )
+                if debug:
+                    logger.debug(
+                        'Setting %s.%s -> %s.%s to MANY_TO_MANY',
+                        table.name,
+                        fk.column_name,
+                        fk.foreign_table_name,
+                        fk.foreign_column_name,
+                    )
                 fk.relation_type = RelationType.MANY_TO_MANY
 
 
+@timed('marshal.foreign_keys')
 def add_foreign_key_info_to_table_details(tables: dict, fk_details: list) -> None:
     """Add foreign key information to the table details.
 
@@ -1,14 +1,18 @@
-import logging
-
 from supabase_pydantic.core.models import EnumInfo
 from supabase_pydantic.db.database_type import DatabaseType
 from supabase_pydantic.db.marshalers.abstract.base_column_marshaler import BaseColumnMarshaler
-from supabase_pydantic.db.marshalers.column import get_alias, process_udt_field, standardize_column_name
+from supabase_pydantic.db.marshalers.column import (
+    get_alias,
+    lowercase_enum_types,
+    process_udt_field,
+    standardize_column_name,
+)
 from supabase_pydantic.db.marshalers.constraints import (
     add_constraints_to_table_details,
     update_column_constraint_definitions,
     update_columns_with_constraints,
 )
+from supabase_pydantic.db.marshalers.log import get_logger
 from supabase_pydantic.db.marshalers.relationships import (
     add_foreign_key_info_to_table_details,
     add_relationships_to_table_details,
@@ -17,11 +21,13 @@ from supabase_pydantic.db.marshalers.relationships import (
 )
 from supabase_pydantic.db.models import ColumnInfo, TableInfo, UserEnumType, UserTypeMapping
 from supabase_pydantic.db.type_factory import TypeMapFactory
+from supabase_pydantic.utils.profiling import timed
 
 # Make sure logger is defined
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
+@timed('marshal.columns')
 def get_table_details_from_columns(
     column_details: list,
     enum_types: list[str] = [],
@@ -40,6 +46,7 @@ def get_table_details_from_columns(
         Dictionary mapping schema and table names to TableInfo objects
     """
     tables = {}
+    lowered_enum_types = lowercase_enum_types(enum_types)  # Matched against each array column
     for row in column_details:
         (
             schema,
@@ -60,9 +67,13 @@ def get_table_details_from_columns(
             tables[table_key] = TableInfo(name=table_name, schema=schema, table_type=table_type)
         # Use the marshaler's method if provided, otherwise fallback to direct function call
         python_type = (
-            column_marshaler.process_column_type(data_type, udt_name, enum_types=enum_types)
+            column_marshaler.process_column_type(
+                data_type, udt_name, enum_types=enum_types, lowered_enum_types=lowered_enum_types
+            )
             if column_marshaler
-            else process_udt_field(udt_name, data_type, known_enum_types=enum_types)
+            else process_udt_field(
+                udt_name, data_type, known_enum_types=enum_types, lowered_enum_types=lowered_enum_types
+            )
         )
 
         column_info = ColumnInfo(
@@ -141,6 +152,7 @@ def get_user_type_mappings(enum_type_mapping: list, schema: str | None = None) -
     return mappings
 
 
+@timed('marshal.user_defined_types')
 def add_user_defined_types_to_tables(
     tables: dict[tuple[str, str], TableInfo],
     schema: str,
@@ -153,7 +165,9 @@ def add_user_defined_types_to_tables(
     mappings = get_user_type_mappings(enum_type_mapping)
 
     # Log available enums for debugging
-    logger.debug(f'Available enum types: {[e.type_name for e in enums]}')
+    debug = logger.debug_enabled
+    if debug:
+        logger.debug('Available enum types: %s', [e.type_name for e in enums])
 
     # First, process direct enum mappings
     for mapping in mappings:
@@ -185,8 +199,11 @@ def add_user_defined_types_to_tables(
                 if clean_element_type and clean_element_type.endswith('[]'):
                     clean_element_type = clean_element_type[:-2]  # Remove the trailing []
 
-                logger.debug(f'Column {table.name}.{col.name} has array_element_type: {col.array_element_type}')
-                logger.debug(f'Cleaned element type: {clean_element_type}')
+                if debug:
+                    logger.debug(
+                        'Column %s.%s has array_element_type: %s', table.name, col.name, col.array_element_type
+                    )
+                    logger.debug('Cleaned element type: %s', clean_element_type)
 
                 # Try to find a matching enum using our new helper method
                 matched_enum = None
@@ -195,10 +212,11 @@ def add_user_defined_types_to_tables(
                 for enum in enums:
                     if enum.matches_type_name(clean_element_type):
                         matched_enum = enum
-                        logger.debug(f'✅ Matched enum {enum.type_name} for element type {clean_element_type}')
+                        if debug:
+                            logger.debug('✅ Matched enum %s for element type %s', enum.type_name, clean_element_type)
                         break
-                    else:
-                        logger.debug(f'❌ Failed to match {clean_element_type} with enum {enum.type_name}')
+                    elif debug:
+                        logger.debug('❌ Failed to match %s with enum %s', clean_element_type, enum.type_name)
 
                 # If no match, try a special case for _first_type/_second_type
                 if not matched_enum and clean_element_type and clean_element_type.startswith('_'):
@@ -206,11 +224,13 @@ def add_user_defined_types_to_tables(
                     for enum in enums:
                         if enum.type_name.lower() == clean_name.lower():
                             matched_enum = enum
-                            logger.debug(f'✅ Special case match: {clean_element_type} -> {enum.type_name}')
+                            if debug:
+                                logger.debug('✅ Special case match: %s -> %s', clean_element_type, enum.type_name)
                             break
                         elif enum.type_name.lower() == clean_element_type.lower():
                             matched_enum = enum
-                            logger.debug(f'✅ Direct match for {clean_element_type} with {enum.type_name}')
+                            if debug:
+                                logger.debug('✅ Direct match for %s with %s', clean_element_type, enum.type_name)
                             break
 
                 if matched_enum:
@@ -228,7 +248,7 @@ def add_user_defined_types_to_tables(
                         pass
                     else:
                         # Just log the element type that wasn't matched
-                        logger.warning(f'Unknown array element type: {clean_element_type}, using Any')
+                        logger.warning('Unknown array element type: %s, using Any', clean_element_type)
 
 
 def get_enum_types_by_schema(enum_types: list, schema: str) -> list[str]:
@@ -250,9 +270,9 @@ def get_enum_types_by_schema(enum_types: list, schema: str) -> list[str]:
         if name.startswith('_'):
             clean_name = name.lstrip('_')
             normalized_names.append(clean_name)
-            logger.debug(f'Added normalized enum name: {name} -> {clean_name}')
+            logger.debug('Added normalized enum name: %s -> %s', name, clean_name)
 
-    logger.debug(f'Normalized enum type list: {normalized_names}')
+    logger.debug('Normalized enum type list: %s', normalized_names)
     return normalized_names
 
 
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
@@ -299,9 +300,71 @@ class TableInfo(AsDictParent):
         return any(c.constraint_type() == 'UNIQUE' for c in self.constraints)
 
 
+def _relation_name(value: Any) -> str:
+    """Return the unqualified, unquoted table name of a catalog value such as `"Public"."Users"`."""
+    return str(value).rsplit('.', 1)[-1].strip('"')
+
+
+@dataclass
+class SchemaCatalog:
+    """The raw result sets a schema reader returns for one schema, before marshaling."""
+
+    tables: list[tuple] = field(default_factory=list)
+    columns: list[tuple] = field(default_factory=list)
+    constraints: list[tuple] = field(default_factory=list)
+    foreign_keys: list[tuple] = field(default_factory=list)
+    user_defined_types: list[tuple] = field(default_factory=list)
+    type_mappings: list[tuple] = field(default_factory=list)
+
+    def replace_tables(
+        self, tables: Iterable[str], delta: 'SchemaCatalog', positions: dict[str, int]
+    ) -> 'SchemaCatalog':
+        """Return a catalog with the rows of `tables` replaced by the rows read again for them.
+
+        Args:
+            tables: The tables that were read again; tables without rows in `delta` were dropped.
+            delta: The result sets read for `tables` only. Its user-defined types, which are read
+                for the whole schema, replace this catalog's.
+            positions: The position of the table name in the rows of each per-table result set,
+                by attribute name.
+
+        Returns:
+            The merged catalog.
+        """
+        tables = set(tables)
+        merged = SchemaCatalog(user_defined_types=delta.user_defined_types)
+        for name, position in positions.items():
+            kept = [row for row in getattr(self, name) if _relation_name(row[position]) not in tables]
+            setattr(merged, name, kept + getattr(delta, name))
+        return merged
+
+
 # Connection Models
 
 
+@dataclass(frozen=True)
+class ConnectionOptions:
+    """How connectors open connections, and keep them healthy.
+
+    Attributes:
+        connect_timeout: Give up on a connection attempt after this many seconds.
+        statement_timeout: Cancel queries running longer than this many seconds, if set.
+        retries: Retry a failed connection attempt this many times.
+        backoff: Seconds to wait before the first retry; doubled for each further retry.
+        keepalives_idle: Send TCP keepalives after the connection is idle for this many seconds,
+            so long-lived connections (e.g., `watch`) survive idle timeouts; None disables them.
+        pooler: Whether connections go through a transaction-mode pooler (PgBouncer, Supavisor);
+            None detects it from the port (Supabase's pooler listens on 6543).
+    """
+
+    connect_timeout: float | None = 10.0
+    statement_timeout: float | None = None
+    retries: int = 2
+    backoff: float = 0.5
+    keepalives_idle: int | None = 30
+    pooler: bool | None = None
+
+
 class DatabaseConnectionParams(BaseModel):
     """Base model for database connection parameters."""
 
@@ -424,3 +487,37 @@ class MySQLConnectionParams(BaseModel):
         return all([self.dbname, self.user, self.password, self.host, self.port])
 
     model_config = ConfigDict(extra='forbid')
+
+
+class SqlFileConnectionParams(BaseModel):
+    """Parameters for reading a schema from SQL files instead of a database."""
+
+    paths: list[str] = Field(
+        default_factory=list, description='SQL files, or folders of .sql files, applied in the order given'
+    )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return self.model_dump()
+
+    def is_valid(self) -> bool:
+        """Check if parameters are valid for reading."""
+        return bool(self.paths)
+
+    model_config = ConfigDict(extra='forbid')
+
+
+class CatalogFileConnectionParams(BaseModel):
+    """Parameters for replaying a catalog snapshot instead of querying a database."""
+
+    path: str | None = Field(None, description='Catalog snapshot file written by gen --dump-catalog')
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary, excluding None values."""
+        return {k: v for k, v in self.model_dump().items() if v is not None}
+
+    def is_valid(self) -> bool:
+        """Check if parameters are valid for reading."""
+        return bool(self.path)
+
+    model_config = ConfigDict(extra='forbid')
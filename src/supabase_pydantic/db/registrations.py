@@ -2,45 +2,79 @@
 
 import logging
 
-from supabase_pydantic.db.connectors.mysql.connector import MySQLConnector
-from supabase_pydantic.db.connectors.mysql.schema_reader import MySQLSchemaReader
-from supabase_pydantic.db.connectors.postgres.connector import PostgresConnector
-from supabase_pydantic.db.connectors.postgres.schema_reader import PostgresSchemaReader
 from supabase_pydantic.db.database_type import DatabaseType
-from supabase_pydantic.db.factory import DatabaseFactory
-from supabase_pydantic.db.marshalers.mysql.column import MySQLColumnMarshaler
-from supabase_pydantic.db.marshalers.mysql.constraints import MySQLConstraintMarshaler
-from supabase_pydantic.db.marshalers.mysql.relationship import MySQLRelationshipMarshaler
-from supabase_pydantic.db.marshalers.mysql.schema import MySQLSchemaMarshaler
-from supabase_pydantic.db.marshalers.postgres.column import PostgresColumnMarshaler
-from supabase_pydantic.db.marshalers.postgres.constraints import PostgresConstraintMarshaler
-from supabase_pydantic.db.marshalers.postgres.relationship import PostgresRelationshipMarshaler
-from supabase_pydantic.db.marshalers.postgres.schema import PostgresSchemaMarshaler
+from supabase_pydantic.db.factory import CATALOG_FILE_BACKEND, SQL_FILE_BACKEND, DatabaseFactory
 
 # Get Logger
 logger = logging.getLogger(__name__)
 
+# Components are registered by import path, so a database driver (psycopg2, mysql-connector) is
+# only imported when that database type is actually used.
+_CONNECTORS = 'supabase_pydantic.db.connectors'
+_MARSHALERS = 'supabase_pydantic.db.marshalers'
 
-def register_database_components() -> None:
-    """Register all database components with the factory."""
-    # Register PostgreSQL components
+
+def register_postgres_components(factory: type[DatabaseFactory] = DatabaseFactory) -> None:
+    """Register the PostgreSQL components with the factory."""
     logger.debug('Registering PostgreSQL components with factory')
-    DatabaseFactory.register_connector(DatabaseType.POSTGRES, PostgresConnector)
-    DatabaseFactory.register_schema_reader(DatabaseType.POSTGRES, PostgresSchemaReader)
-    DatabaseFactory.register_column_marshaler(DatabaseType.POSTGRES, PostgresColumnMarshaler)
-    DatabaseFactory.register_constraint_marshaler(DatabaseType.POSTGRES, PostgresConstraintMarshaler)
-    DatabaseFactory.register_relationship_marshaler(DatabaseType.POSTGRES, PostgresRelationshipMarshaler)
-    DatabaseFactory.register_schema_marshaler(DatabaseType.POSTGRES, PostgresSchemaMarshaler)
-
-    # Register MySQL components
+    factory.register_connector(DatabaseType.POSTGRES, f'{_CONNECTORS}.postgres.connector:PostgresConnector')
+    factory.register_schema_reader(DatabaseType.POSTGRES, f'{_CONNECTORS}.postgres.schema_reader:PostgresSchemaReader')
+    factory.register_column_marshaler(DatabaseType.POSTGRES, f'{_MARSHALERS}.postgres.column:PostgresColumnMarshaler')
+    factory.register_constraint_marshaler(
+        DatabaseType.POSTGRES, f'{_MARSHALERS}.postgres.constraints:PostgresConstraintMarshaler'
+    )
+    factory.register_relationship_marshaler(
+        DatabaseType.POSTGRES, f'{_MARSHALERS}.postgres.relationship:PostgresRelationshipMarshaler'
+    )
+    factory.register_schema_marshaler(DatabaseType.POSTGRES, f'{_MARSHALERS}.postgres.schema:PostgresSchemaMarshaler')
+
+
+def register_mysql_components(factory: type[DatabaseFactory] = DatabaseFactory) -> None:
+    """Register the MySQL components with the factory."""
     logger.debug('Registering MySQL components with factory')
-    DatabaseFactory.register_connector(DatabaseType.MYSQL, MySQLConnector)
-    DatabaseFactory.register_schema_reader(DatabaseType.MYSQL, MySQLSchemaReader)
-    DatabaseFactory.register_column_marshaler(DatabaseType.MYSQL, MySQLColumnMarshaler)
-    DatabaseFactory.register_constraint_marshaler(DatabaseType.MYSQL, MySQLConstraintMarshaler)
-    DatabaseFactory.register_relationship_marshaler(DatabaseType.MYSQL, MySQLRelationshipMarshaler)
-    DatabaseFactory.register_schema_marshaler(DatabaseType.MYSQL, MySQLSchemaMarshaler)
+    factory.register_connector(DatabaseType.MYSQL, f'{_CONNECTORS}.mysql.connector:MySQLConnector')
+    factory.register_schema_reader(DatabaseType.MYSQL, f'{_CONNECTORS}.mysql.schema_reader:MySQLSchemaReader')
+    factory.register_column_marshaler(DatabaseType.MYSQL, f'{_MARSHALERS}.mysql.column:MySQLColumnMarshaler')
+    factory.register_constraint_marshaler(
+        DatabaseType.MYSQL, f'{_MARSHALERS}.mysql.constraints:MySQLConstraintMarshaler'
+    )
+    factory.register_relationship_marshaler(
+        DatabaseType.MYSQL, f'{_MARSHALERS}.mysql.relationship:MySQLRelationshipMarshaler'
+    )
+    factory.register_schema_marshaler(DatabaseType.MYSQL, f'{_MARSHALERS}.mysql.schema:MySQLSchemaMarshaler')
+
+
+def register_sql_components(factory: type[DatabaseFactory] = DatabaseFactory) -> None:
+    """Register the components that read a PostgreSQL schema from SQL files.
 
-    # TODO: Add other database types as needed
+    This is a source backend: it reads the schema, and the PostgreSQL marshalers build the
+    table information (see `DatabaseBuilder`).
+    """
+    logger.debug('Registering SQL file components with factory')
+    factory.register_connector(SQL_FILE_BACKEND, f'{_CONNECTORS}.sql.connector:SqlFileConnector')
+    factory.register_schema_reader(SQL_FILE_BACKEND, f'{_CONNECTORS}.sql.schema_reader:SqlFileSchemaReader')
+
+
+def register_catalog_components(factory: type[DatabaseFactory] = DatabaseFactory) -> None:
+    """Register the components that replay a catalog snapshot.
+
+    This is a source backend: the snapshotted database's marshalers build the table information.
+    """
+    logger.debug('Registering catalog snapshot components with factory')
+    factory.register_connector(CATALOG_FILE_BACKEND, f'{_CONNECTORS}.snapshot.connector:CatalogFileConnector')
+    factory.register_schema_reader(
+        CATALOG_FILE_BACKEND, f'{_CONNECTORS}.snapshot.schema_reader:CatalogFileSchemaReader'
+    )
+
+
+def register_database_components() -> None:
+    """Register all built-in database components with the factory.
 
+    The factory registers each backend on first use (see `DatabaseFactory.load_backend`), so
+    this is only needed to populate the registries up front.
+    """
+    register_postgres_components()
+    register_mysql_components()
+    register_sql_components()
+    register_catalog_components()
     logger.debug('Database components registered with factory')
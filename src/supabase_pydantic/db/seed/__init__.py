@@ -1,5 +1,6 @@
 # Re-export the required functions for gen.py
 from supabase_pydantic.core.writers.utils import write_seed_file
+from supabase_pydantic.db.seed.context import SeedContext
 from supabase_pydantic.db.seed.generator import generate_seed_data
 
-__all__ = ['generate_seed_data', 'write_seed_file']
+__all__ = ['SeedContext', 'generate_seed_data', 'write_seed_file']
@@ -0,0 +1,100 @@
+"""Column-at-a-time fake data generation for seed data, backed by NumPy when it is installed."""
+
+import logging
+import uuid
+from datetime import date
+from typing import Any
+
+from supabase_pydantic.db.models import ColumnInfo
+from supabase_pydantic.db.seed.context import np
+from supabase_pydantic.db.seed.fake import NULL_PROBABILITY, match_column_name, reference_datetime
+
+# Get Logger
+logger = logging.getLogger(__name__)
+
+# Datatypes whose values depend only on the datatype, so whole columns can be drawn at once
+COLUMNAR_DATATYPES = frozenset(
+    [
+        'integer',
+        'bigint',
+        'boolean',
+        'date',
+        'timestamp',
+        'timestamp with time zone',
+        'timestamp without time zone',
+        'uuid',
+    ]
+)
+
+# Largest number of digits whose random numbers still fit in an int64 array
+MAX_COLUMNAR_DIGITS = 18
+
+
+def is_columnar(column: ColumnInfo) -> bool:
+    """Check if a column's fake data can be generated a whole column at a time.
+
+    Unique and foreign key columns depend on other rows or tables, and columns whose
+    name matches a Faker pattern use that pattern per cell, so neither is columnar.
+    """
+    if np is None or column.is_unique or column.is_foreign_key:
+        return False
+    if column.user_defined_values:
+        return True
+
+    datatype = column.post_gres_datatype.lower()
+    if datatype not in COLUMNAR_DATATYPES or match_column_name(column.name) is not None:
+        return False
+    if datatype in ['integer', 'bigint']:
+        return (column.max_length if column.max_length else 5) <= MAX_COLUMNAR_DIGITS
+    return True
+
+
+def generate_column(column: ColumnInfo, num_rows: int, rng: Any) -> list[Any]:
+    """Generate fake data for a whole column at once.
+
+    Values match what the per-cell generators in `fake` produce for the same column,
+    including the 'NULL' share for nullable columns.
+
+    Args:
+        column: A column for which `is_columnar` is True.
+        num_rows: The number of values to generate.
+        rng: The `numpy.random.Generator` to draw values from.
+
+    Returns:
+        list: The generated values, formatted for PostgreSQL.
+    """
+    # User-defined values are used regardless of data type and are never nulled
+    if column.user_defined_values:
+        return [column.user_defined_values[0]] * num_rows
+
+    datatype = column.post_gres_datatype.lower()
+    values: list[Any]
+    if datatype in ['integer', 'bigint']:
+        digits = column.max_length if column.max_length else 5
+        values = rng.integers(0, 10**digits, size=num_rows).tolist()
+    elif datatype == 'boolean':
+        values = (rng.random(num_rows) < 0.5).tolist()
+    elif datatype == 'date':
+        days = rng.integers(0, (date.today() - date(1970, 1, 1)).days, size=num_rows, endpoint=True)
+        values = [f"'{d}'" for d in days.astype('datetime64[D]').tolist()]
+    elif datatype == 'uuid':
+        raw = rng.integers(0, 256, size=(num_rows, 16), dtype=np.uint8)
+        raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+        raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+        values = [f"'{uuid.UUID(bytes=row.tobytes())}'" for row in raw]
+    else:  # timestamps
+        seconds = rng.integers(0, int(reference_datetime().timestamp()), size=num_rows, endpoint=True)
+        values = [f"'{ts}'" for ts in seconds.astype('datetime64[s]').tolist()]
+
+    if column.nullable():
+        mask = (rng.random(num_rows) < NULL_PROBABILITY).tolist()
+        values = ['NULL' if is_null else v for v, is_null in zip(values, mask)]
+
+    return values
+
+
+def generate_columns(columns: list[ColumnInfo], num_rows: int, rng: Any) -> dict[str, list[Any]]:
+    """Generate fake data for every columnar column, keyed by column name."""
+    if rng is None:
+        return {}
+    return {c.name: generate_column(c, num_rows, rng) for c in columns if is_columnar(c)}
@@ -0,0 +1,48 @@
+"""Random state shared by the seed data generators."""
+
+import random
+from typing import Any
+
+from faker import Faker
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None  # type: ignore[assignment]
+
+
+class SeedContext:
+    """Random state for one seed data generation run.
+
+    Holds a `random.Random`, a Faker instance and, when NumPy is installed, a
+    `numpy.random.Generator`, all seeded from the same value. Passing the same seed
+    produces the same seed data; leaving it unset draws a fresh seed.
+
+    Attributes:
+        seed (int): The seed every random source was initialized from.
+        random (random.Random): The random number generator for per-value choices.
+        faker (Faker): The Faker instance used to generate fake values.
+        rng (numpy.random.Generator | None): The NumPy generator for columnar data, if available.
+    """
+
+    def __init__(self, seed: int | None = None):
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(64)
+        self.random = random.Random(self.seed)
+        self.faker = Faker()
+        self.faker.seed_instance(self.seed)
+        self.rng: Any = np.random.default_rng(self.seed) if np is not None else None
+
+    def spawn(self, key: str | int) -> 'SeedContext':
+        """Derive an independent, deterministic child context.
+
+        The child's seed depends only on this context's seed and the key, so parallel
+        workers (e.g., one per schema) get reproducible streams regardless of the order
+        in which they run.
+
+        Args:
+            key: A key identifying the child, such as a schema name or worker index.
+
+        Returns:
+            SeedContext: A new context with its own random state.
+        """
+        return SeedContext(random.Random(f'{self.seed}:{key}').getrandbits(64))
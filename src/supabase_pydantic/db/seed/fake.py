@@ -1,12 +1,15 @@
 import json
 import logging
 import re
-from datetime import datetime, timedelta
+from collections.abc import Callable
+from datetime import date, datetime, time, timedelta
+from functools import cache
 from random import randint, random
 from typing import Any, Literal
 
 from faker import Faker
 
+from supabase_pydantic.db.seed.context import SeedContext
 from supabase_pydantic.utils.serialization import CustomJsonEncoder
 
 # Get Logger
@@ -15,6 +18,12 @@ logger = logging.getLogger(__name__)
 # Setup Faker seed
 faker = Faker()
 
+# Share of values in nullable columns that are generated as NULL
+NULL_PROBABILITY = 0.15
+
+# PostgreSQL date datatypes that take part in datetime ordering
+POSTGRES_DATE_DATATYPES = ['date', 'timestamp', 'timestamp with time zone', 'timestamp without time zone']
+
 
 def format_for_postgres(value: Any, data_type: str) -> str:
     """Formats a Python value for SQL based on PostgreSQL data type.
@@ -66,27 +75,36 @@ def format_for_postgres(value: Any, data_type: str) -> str:
         # raise ValueError(f'Unsupported data type: {data_type}')
 
 
-def random_datetime_within_N_years(n: int = 2) -> Any:
+def reference_datetime() -> datetime:
+    """Get the upper bound for generated datetimes.
+
+    This is the start of the current day rather than the current instant, so seeded
+    runs generate the same datetimes throughout the day.
+    """
+    return datetime.combine(date.today(), time())
+
+
+def random_datetime_within_N_years(n: int = 2, fake: Faker = faker) -> Any:
     """Generate a random datetime within the last N years."""
-    now = datetime.now()
-    max_date = now - timedelta(days=n * 365)
+    now = reference_datetime()
+    # The window starts a day late so it stays within N years of the current instant
+    max_date = now + timedelta(days=1) - timedelta(days=n * 365)
     end_date = now - timedelta(days=60)
-    return faker.date_time_between(start_date=max_date, end_date=end_date)
+    return fake.date_time_between(start_date=max_date, end_date=end_date)
 
 
-def guess_datetime_order(row: dict[str, tuple[int, str, Any]]) -> list[Any]:
+def guess_datetime_order(row: dict[str, tuple[int, str, Any]], context: SeedContext | None = None) -> list[Any]:
     """Guess the ordering of datetimes in a row and return a list of values.
 
     The definition of the dictionary is column_name: (order in final list, data_type, value).
 
     Args:
         row (dict): A dictionary of column names and their values.
+        context (SeedContext | None): The random state to draw from; defaults to the module-level state.
 
     Returns:
         list: A list of values ordered by their group and within each group.
     """
-    postgres_date_datatypes = ['date', 'timestamp', 'timestamp with time zone', 'timestamp without time zone']
-
     # Define grouped datetime columns in order of precedence
     datetime_groups = [
         (r'birthdate|dob', 'dob'),
@@ -107,14 +125,15 @@ def guess_datetime_order(row: dict[str, tuple[int, str, Any]]) -> list[Any]:
     ]
 
     # Start with a base datetime for the sequence of fake timestamps
-    base_time = random_datetime_within_N_years(5)
-    dob_date = base_time - timedelta(days=365 * randint(18, 40))  # Subtract 18-40 years from the base time
+    rand_int = context.random.randint if context is not None else randint
+    base_time = random_datetime_within_N_years(5, context.faker if context is not None else faker)
+    dob_date = base_time - timedelta(days=365 * rand_int(18, 40))  # Subtract 18-40 years from the base time
 
     def _time_step() -> timedelta:
         return timedelta(  # Increment
-            days=randint(1, 4),
-            minutes=randint(1, 60) * randint(1, 10),
-            seconds=randint(1, 60),
+            days=rand_int(1, 4),
+            minutes=rand_int(1, 60) * rand_int(1, 10),
+            seconds=rand_int(1, 60),
         )
 
     # Create a dictionary to hold the ordered datetime values with modified timestamps
@@ -122,7 +141,7 @@ def guess_datetime_order(row: dict[str, tuple[int, str, Any]]) -> list[Any]:
     for pattern, description in datetime_groups:
         regex = re.compile(pattern)
         for key, (order, dtype, value) in row.items():
-            if dtype in postgres_date_datatypes and regex.search(key):
+            if dtype in POSTGRES_DATE_DATATYPES and regex.search(key):
                 if description == 'dob':
                     modified_datetimes[key] = (order, dtype, format_for_postgres(dob_date, dtype))
                 else:
@@ -143,140 +162,214 @@ def guess_datetime_order(row: dict[str, tuple[int, str, Any]]) -> list[Any]:
     return final_order
 
 
+# Column-name patterns mapped to Faker-backed generators, in order of precedence.
+# The first pattern that matches a column name (case-insensitively) wins.
+NAME_PATTERNS: tuple[tuple[str, str, Callable[[Faker], Any]], ...] = (
+    ('username', r'username', lambda f: f.user_name()),
+    ('email', r'email', lambda f: f.email()),
+    ('password', r'password', lambda f: f.password()),
+    ('phone_number', r'phone.*number', lambda f: f.phone_number()),
+    ('phone_extension', r'phone.*extension', lambda f: f.numerify(text='###')),
+    ('first_name', r'first.*name', lambda f: f.first_name()),
+    ('last_name', r'last.*name', lambda f: f.last_name()),
+    ('full_name', r'(full.*name|name)', lambda f: f.name()),
+    # ('name', r'^name$', lambda f: f.name()),
+    ('address', r'address', lambda f: f.address()),
+    ('address_1', r'address.*1', lambda f: f.address()),
+    ('street_name', r'street.*name', lambda f: f.street_name()),
+    ('street_address', r'street.*address', lambda f: f.street_address()),
+    ('secondary_address', r'secondary.*address', lambda f: f.secondary_address()),
+    ('address_2', r'address.*2', lambda f: f.secondary_address()),
+    ('city', r'city', lambda f: f.city()),
+    ('state', r'state', lambda f: f.state()),
+    ('country', r'country', lambda f: f.country()),
+    ('zip_code', r'zip.*code', lambda f: f.zipcode()),
+    ('zip', r'^zip$', lambda f: f.zipcode()),
+    ('postcode', r'post.*code', lambda f: f.postcode()),
+    ('latitude', r'latitude', lambda f: str(f.latitude())),
+    ('longitude', r'longitude', lambda f: str(f.longitude())),
+    ('ip_address', r'ip.*address', lambda f: f.ipv4()),
+    ('user_agent', r'user.*agent', lambda f: f.user_agent()),
+    ('user_id', r'user.*id', lambda f: f.uuid4()),
+    ('created_at', r'created.*at', lambda f: random_datetime_within_N_years(fake=f)),
+    ('updated_at', r'updated.*at', lambda f: random_datetime_within_N_years(fake=f)),
+    ('deleted_at', r'deleted.*at', lambda f: random_datetime_within_N_years(fake=f)),
+    ('is_', r'^is_.*', lambda f: f.boolean(chance_of_getting_true=50)),
+    ('company_name', r'company.*name', lambda f: f.company()),
+    ('company_suffix', r'company.*suffix', lambda f: f.company_suffix()),
+    ('job_title', r'job.*title', lambda f: f.job()),
+    ('ssn', r'ssn', lambda f: f.ssn()),
+    ('birthdate', r'birth.*date', lambda f: f.date_of_birth()),
+    ('age', r'^age$', lambda f: f.random_int(min=18, max=100)),
+    ('gender', r'gender', lambda f: f.random_element(elements=('Male', 'Female'))),
+    ('domain_name', r'domain.*name', lambda f: f.domain_name()),
+    ('url', r'url', lambda f: f.url()),
+    ('image_url', r'image.*url', lambda f: f.image_url()),
+    ('mac_address', r'mac.*address', lambda f: f.mac_address()),
+    ('uuid', r'uuid', lambda f: f.uuid4()),
+    ('slug', r'slug', lambda f: f.slug()),
+    ('credit_card_number', r'credit.*card.*number', lambda f: f.credit_card_number()),
+    ('credit_card_expire', r'credit.*card.*expire', lambda f: f.credit_card_expire()),
+    ('credit_card_provider', r'credit.*card.*provider', lambda f: f.credit_card_provider()),
+    ('iban', r'iban', lambda f: f.iban()),
+    ('currency_code', r'currency.*code', lambda f: f.currency_code()),
+    ('color', r'color', lambda f: f.color_name()),
+    ('license_plate', r'license.*plate', lambda f: f.license_plate()),
+    ('file_name', r'file.*name', lambda f: f.file_name()),
+    ('mime_type', r'mime.*type', lambda f: f.mime_type()),
+    ('time', r'time', lambda f: f.time()),
+    ('month', r'month', lambda f: f.month_name()),
+    ('year', r'year', lambda f: f.year()),
+)
+
+_COMPILED_NAME_PATTERNS = tuple((re.compile(pattern, re.IGNORECASE), func) for _, pattern, func in NAME_PATTERNS)
+
+
+@cache
+def match_column_name(column_name: str) -> Callable[[Faker], Any] | None:
+    """Resolve the Faker generator for a column name.
+
+    Patterns are precompiled and the result is cached per column name, so the
+    pattern scan happens once per distinct column rather than once per cell.
+
+    Args:
+        column_name: The name of the column.
+
+    Returns:
+        A callable taking a Faker instance, or None if no pattern matches.
+    """
+    for regex, func in _COMPILED_NAME_PATTERNS:
+        if regex.search(column_name):
+            return func
+    return None
+
+
 def guess_and_generate_fake_data(
     column_name: str, faker: Faker = faker, data_type: Literal['int', 'float', 'bool', 'str'] | None = None
 ) -> Any:
     """Guess the data type based on the column name and generate fake data."""
+    func = match_column_name(column_name)
+    if func is None:
+        return None  # Return None if no matching pattern found
+
+    data = func(faker)
+    if data_type:
+        try:
+            # Convert data to the specified type
+            if data_type == 'int':
+                return int(data)
+            elif data_type == 'float':
+                return float(data)
+            elif data_type == 'bool':
+                return bool(data)
+            elif data_type == 'str':
+                return str(data)
+        except ValueError as e:
+            logger.error(f'Error converting data_type "{data_type}" with data "{data}"')
+            logger.error(f'Error: {e}')
+            return data  # Return original data if conversion fails
+    return data
+
+
+def _datatype_generator(
+    post_gres_datatype: str,
+    max_length: int | None,
+    user_defined_values: list[str] | None,
+    fake: Faker,
+) -> Callable[[], Any]:
+    """Resolve the datatype-based fallback generator for a column."""
+    datatype = post_gres_datatype.lower()
 
-    # Dictionary mapping data items to their regex patterns and Faker methods
-    patterns = {
-        'username': (r'username', faker.user_name),
-        'email': (r'email', faker.email),
-        'password': (r'password', faker.password),
-        'phone_number': (r'phone.*number', faker.phone_number),
-        'phone_extension': (r'phone.*extension', lambda: faker.numerify(text='###')),
-        'first_name': (r'first.*name', faker.first_name),
-        'last_name': (r'last.*name', faker.last_name),
-        'full_name': (r'(full.*name|name)', faker.name),
-        # 'name': (r'^name$', faker.name),
-        'address': (r'address', faker.address),
-        'address_1': (r'address.*1', faker.address),
-        'street_name': (r'street.*name', faker.street_name),
-        'street_address': (r'street.*address', faker.street_address),
-        'secondary_address': (r'secondary.*address', faker.secondary_address),
-        'address_2': (r'address.*2', faker.secondary_address),
-        'city': (r'city', faker.city),
-        'state': (r'state', faker.state),
-        'country': (r'country', faker.country),
-        'zip_code': (r'zip.*code', faker.zipcode),
-        'zip': (r'^zip$', faker.zipcode),
-        'postcode': (r'post.*code', faker.postcode),
-        'latitude': (r'latitude', lambda: str(faker.latitude())),
-        'longitude': (r'longitude', lambda: str(faker.longitude())),
-        'ip_address': (r'ip.*address', faker.ipv4),
-        'user_agent': (r'user.*agent', faker.user_agent),
-        'user_id': (r'user.*id', faker.uuid4),
-        'created_at': (r'created.*at', random_datetime_within_N_years),
-        'updated_at': (r'updated.*at', random_datetime_within_N_years),
-        'deleted_at': (r'deleted.*at', random_datetime_within_N_years),
-        'is_': (r'^is_.*', lambda: faker.boolean(chance_of_getting_true=50)),
-        'company_name': (r'company.*name', faker.company),
-        'company_suffix': (r'company.*suffix', faker.company_suffix),
-        'job_title': (r'job.*title', faker.job),
-        'ssn': (r'ssn', faker.ssn),
-        'birthdate': (r'birth.*date', faker.date_of_birth),
-        'age': (r'^age$', lambda: faker.random_int(min=18, max=100)),
-        'gender': (r'gender', lambda: faker.random_element(elements=('Male', 'Female'))),
-        'domain_name': (r'domain.*name', faker.domain_name),
-        'url': (r'url', faker.url),
-        'image_url': (r'image.*url', faker.image_url),
-        'mac_address': (r'mac.*address', faker.mac_address),
-        'uuid': (r'uuid', faker.uuid4),
-        'slug': (r'slug', faker.slug),
-        'credit_card_number': (r'credit.*card.*number', faker.credit_card_number),
-        'credit_card_expire': (r'credit.*card.*expire', faker.credit_card_expire),
-        'credit_card_provider': (r'credit.*card.*provider', faker.credit_card_provider),
-        'iban': (r'iban', faker.iban),
-        'currency_code': (r'currency.*code', faker.currency_code),
-        'color': (r'color', faker.color_name),
-        'license_plate': (r'license.*plate', faker.license_plate),
-        'file_name': (r'file.*name', faker.file_name),
-        'mime_type': (r'mime.*type', faker.mime_type),
-        'time': (r'time', faker.time),
-        'month': (r'month', faker.month_name),
-        'year': (r'year', faker.year),
-    }
-
-    # Search for a matching pattern and generate data
-    for _, (pattern, func) in patterns.items():
-        if re.search(pattern, column_name, re.IGNORECASE):
-            data = func()
-            if data_type:
-                try:
-                    # Convert data to the specified type
-                    if data_type == 'int':
-                        return int(data)
-                    elif data_type == 'float':
-                        return float(data)
-                    elif data_type == 'bool':
-                        return bool(data)
-                    elif data_type == 'str':
-                        return str(data)
-                except ValueError as e:
-                    logger.error(f'Error converting data_type "{data_type}" with data "{data}"')
-                    logger.error(f'Error: {e}')
-                    return data  # Return original data if conversion fails
-            return data
-
-    return None  # Return None if no matching pattern found
+    if datatype in ['integer', 'bigint']:
+        return lambda: fake.random_number(digits=(max_length if max_length else 5))
+    elif datatype == 'text' or 'varchar' in datatype or datatype == 'character varying':
 
+        def _text() -> str:
+            out = fake.text(max_nb_chars=max_length if max_length else 100).replace("'", r'\'')  # noqa: Q004
+            return format_for_postgres(out, post_gres_datatype)
 
-def generate_fake_data(
+        return _text
+    elif datatype == 'boolean':
+        return lambda: fake.boolean()
+    elif datatype == 'date':
+        return lambda: format_for_postgres(fake.date(end_datetime=reference_datetime()), post_gres_datatype)
+    elif datatype in ['timestamp', 'timestamp with time zone', 'timestamp without time zone']:
+        return lambda: format_for_postgres(fake.date_time(end_datetime=reference_datetime()), post_gres_datatype)
+    elif datatype == 'uuid':
+        return lambda: format_for_postgres(fake.uuid4(), post_gres_datatype)
+    elif datatype in ['json', 'jsonb']:
+
+        def _json() -> str:
+            out = json.dumps(fake.profile(), cls=CustomJsonEncoder).replace("'", '')
+            return format_for_postgres(out, post_gres_datatype)  # noqa: Q004
+
+        return _json
+    elif datatype == 'user-defined' and user_defined_values:
+        return lambda: format_for_postgres(fake.random_element(user_defined_values), post_gres_datatype)
+    else:
+        return lambda: 'NULL'
+
+
+def fake_data_generator(
     post_gres_datatype: str,
     is_nullable: bool,
     max_length: int | None,
     name: str,
     user_defined_values: list[str] | None = None,
     fake: Faker = faker,
-) -> Any:
-    """Generate fake data based on the column datatype."""
-    datatype = post_gres_datatype.lower()
+    context: SeedContext | None = None,
+) -> Callable[[], Any]:
+    """Build a fake data generator for a column.
+
+    The column-name match and datatype dispatch are resolved once, so the
+    returned callable can be invoked for every row without repeating them.
+
+    Args:
+        post_gres_datatype: The PostgreSQL data type of the column.
+        is_nullable: Whether the column is nullable.
+        max_length: The maximum length of the column, if any.
+        name: The name of the column.
+        user_defined_values: The user-defined values (e.g., enum values), if any.
+        fake: The Faker instance to generate data with.
+        context: The random state to draw from; when given, its Faker instance is used instead of `fake`.
 
+    Returns:
+        A zero-argument callable returning a fake value for the column.
+    """
     # If user-defined values are provided, use them regardless of data type
     if user_defined_values:
-        return user_defined_values[0]
+        value = user_defined_values[0]
+        return lambda: value
 
-    if is_nullable and random() < 0.15:
-        return 'NULL'
+    rand = context.random.random if context is not None else None
+    if context is not None:
+        fake = context.faker
 
-    data_base_on_name = guess_and_generate_fake_data(name, fake)
-    if data_base_on_name:
-        return format_for_postgres(data_base_on_name, post_gres_datatype)
+    name_fn = match_column_name(name)
+    datatype_fn = _datatype_generator(post_gres_datatype, max_length, user_defined_values, fake)
 
-    if datatype in ['integer', 'bigint']:
-        return fake.random_number(digits=(max_length if max_length else 5))
-    elif datatype == 'text' or 'varchar' in datatype or datatype == 'character varying':
-        out = fake.text(max_nb_chars=max_length if max_length else 100).replace("'", r'\'')  # noqa: Q004
-        return format_for_postgres(out, post_gres_datatype)
-    elif datatype == 'boolean':
-        return fake.boolean()
-    elif datatype == 'date':
-        return format_for_postgres(fake.date(), post_gres_datatype)
-    elif datatype == 'timestamp':
-        return format_for_postgres(fake.date_time(), post_gres_datatype)
-    elif datatype == 'timestamp with time zone':
-        return format_for_postgres(fake.date_time(), post_gres_datatype)
-    elif datatype == 'timestamp without time zone':
-        return format_for_postgres(fake.date_time(), post_gres_datatype)
-    elif datatype == 'uuid':
-        return format_for_postgres(fake.uuid4(), post_gres_datatype)
-    elif datatype in ['json', 'jsonb']:
-        out = json.dumps(fake.profile(), cls=CustomJsonEncoder).replace("'", '')
-        return format_for_postgres(out, post_gres_datatype)  # noqa: Q004
-    elif datatype == 'user-defined':
-        if user_defined_values:
-            return format_for_postgres(fake.random_element(user_defined_values), post_gres_datatype)
-        else:
+    def _generate() -> Any:
+        if is_nullable and (rand or random)() < NULL_PROBABILITY:
             return 'NULL'
-    else:
-        return 'NULL'
+
+        if name_fn is not None:
+            data_base_on_name = name_fn(fake)
+            if data_base_on_name:
+                return format_for_postgres(data_base_on_name, post_gres_datatype)
+
+        return datatype_fn()
+
+    return _generate
+
+
+def generate_fake_data(
+    post_gres_datatype: str,
+    is_nullable: bool,
+    max_length: int | None,
+    name: str,
+    user_defined_values: list[str] | None = None,
+    fake: Faker = faker,
+    context: SeedContext | None = None,
+) -> Any:
+    """Generate fake data based on the column datatype."""
+    return fake_data_generator(post_gres_datatype, is_nullable, max_length, name, user_defined_values, fake, context)()
@@ -1,13 +1,21 @@
 import logging
-from collections.abc import Callable, Generator
-from itertools import islice, product
+import sys
+from collections.abc import Callable, Generator, Sequence
 from math import inf, prod
-from random import choice, randint
+from random import Random, choice, randint, random
 from typing import Any
 
 from supabase_pydantic.db.graph import sort_tables_for_insert
-from supabase_pydantic.db.models import ColumnInfo, TableInfo
-from supabase_pydantic.db.seed.fake import format_for_postgres, generate_fake_data, guess_datetime_order
+from supabase_pydantic.db.models import ColumnInfo, ForeignKeyInfo, TableInfo
+from supabase_pydantic.db.seed.columnar import generate_columns
+from supabase_pydantic.db.seed.context import SeedContext
+from supabase_pydantic.db.seed.fake import (
+    POSTGRES_DATE_DATATYPES,
+    fake_data_generator,
+    format_for_postgres,
+    guess_datetime_order,
+)
+from supabase_pydantic.db.seed.pools import ValuePool
 
 # Get Logger
 logger = logging.getLogger(__name__)
@@ -33,29 +41,112 @@ def total_possible_combinations(table: TableInfo) -> float:
     return float(prod(values))  # Ensure that the product is in float to handle large numbers properly.
 
 
-def random_num_rows() -> int:
+def random_num_rows(context: SeedContext | None = None) -> int:
     """Generate a random number of rows."""
-    return randint(10, MAX_ROWS)
-
-
-def pick_random_foreign_key(column_name: str, table: TableInfo, remember_fn: Callable) -> Any:
-    """Pick a random foreign key value for a column."""
-    fk = next((fk for fk in table.foreign_keys if fk.column_name == column_name), None)
+    rand_int = context.random.randint if context is not None else randint
+    return rand_int(10, MAX_ROWS)
+
+
+def column_generators(columns: list[ColumnInfo], context: SeedContext | None = None) -> dict[str, Callable[[], Any]]:
+    """Build the fake data generator plan for a list of columns, keyed by column name."""
+    return {
+        c.name: fake_data_generator(
+            c.post_gres_datatype, c.nullable(), c.max_length, c.name, c.user_defined_values, context=context
+        )
+        for c in columns
+    }
+
+
+def foreign_key_map(table: TableInfo) -> dict[str, ForeignKeyInfo]:
+    """Map each foreign key column of a table to its (first) foreign key."""
+    fk_map: dict[str, ForeignKeyInfo] = {}
+    for fk in table.foreign_keys:
+        fk_map.setdefault(fk.column_name, fk)
+    return fk_map
+
+
+def pick_random_foreign_key(
+    column_name: str,
+    table: TableInfo,
+    remember_fn: Callable,
+    context: SeedContext | None = None,
+    fk_map: dict[str, ForeignKeyInfo] | None = None,
+    skew: float = 0.0,
+) -> Any:
+    """Pick a random foreign key value for a column.
+
+    Args:
+        column_name: The name of the foreign key column.
+        table: The table the column belongs to.
+        remember_fn: A function returning the remembered values of a (table, column),
+            ideally as a ValuePool so sampling is O(1).
+        context: The random state to draw from; defaults to the module-level state.
+        fk_map: The table's precomputed column to foreign key map, see `foreign_key_map`.
+        skew: The Zipf exponent for picking values; 0 picks uniformly.
+
+    Returns:
+        Any: A remembered value of the referenced column, or 'NULL' if there is none.
+    """
+    fk = (fk_map if fk_map is not None else foreign_key_map(table)).get(column_name)
     if fk is None:
-        # TODO: change this to debug logging
-        # print(f'Could not find foreign table for column {column_name}')
+        logger.debug(f'Could not find foreign key for column {column_name}')
         return 'NULL'
-    else:
-        try:
-            values = remember_fn(fk.foreign_table_name, fk.foreign_column_name)
-            return choice(list(values))
-        except KeyError:
-            # TODO: change this to debug logging
-            # print(f'Could not find foreign table for column {column_name}')
-            return 'NULL'
 
+    try:
+        values = remember_fn(fk.foreign_table_name, fk.foreign_column_name)
+    except KeyError:
+        logger.debug(f'Could not find foreign table for column {column_name}')
+        return 'NULL'
 
-def unique_data_rows(table: TableInfo, remember_fn: Callable) -> list[dict[str, Any]]:
+    pool = values if isinstance(values, ValuePool) else ValuePool(values or ())
+    if not pool:
+        return 'NULL'
+    return pool.sample(context.random.random if context is not None else random, skew)
+
+
+def decode_combination(index: int, values: Sequence[Sequence[Any]]) -> tuple[Any, ...]:
+    """Decode an index into the matching combination of `itertools.product(*values)`.
+
+    The index is read as a mixed-radix number whose digits, from last to first, are
+    positions in the last to first value lists.
+    """
+    combination = []
+    for value_list in reversed(values):
+        index, position = divmod(index, len(value_list))
+        combination.append(value_list[position])
+    return tuple(reversed(combination))
+
+
+def sample_combinations(values: Sequence[Sequence[Any]], k: int, rand: Random) -> list[tuple[Any, ...]]:
+    """Randomly sample k distinct combinations of `itertools.product(*values)`.
+
+    Indices are drawn without replacement from [0, prod(len(v) for v in values)) and
+    decoded, so memory is O(k) however large the product is. The sampled combinations
+    are returned in product order.
+
+    Args:
+        values: The value lists to combine.
+        k: The number of combinations to sample; capped at the number of combinations.
+        rand: The random number generator to draw indices from.
+
+    Returns:
+        list: The sampled combinations.
+    """
+    total = prod(len(v) for v in values)
+    k = min(k, total)
+    if total <= sys.maxsize:
+        indices = rand.sample(range(total), k)
+    else:  # range() can't be that long; collisions are negligible when k is this small relative to total
+        seen: set[int] = set()
+        while len(seen) < k:
+            seen.add(rand.randrange(total))
+        indices = list(seen)
+    return [decode_combination(i, values) for i in sorted(indices)]
+
+
+def unique_data_rows(
+    table: TableInfo, remember_fn: Callable, context: SeedContext | None = None, foreign_key_skew: float = 0.0
+) -> list[dict[str, Any]]:
     """Generate unique data rows for a table based on the unique columns."""
     if not table.has_unique_constraint():
         return []
@@ -71,19 +162,15 @@ def unique_data_rows(table: TableInfo, remember_fn: Callable) -> list[dict[str,
 
     # Get the total number of rows
     possible_n = total_possible_combinations(table)
-    num_rows = int(possible_n) if possible_n <= MAX_ROWS else random_num_rows()
+    num_rows = int(possible_n) if possible_n <= MAX_ROWS else random_num_rows(context)
+    rand_choice = context.random.choice if context is not None else choice
     rows = []
 
     # If possible_n is not infinite, generate from finite combinations
     # This point will only be hit if all unique columns have user-defined values
     if possible_n != inf:
-        # Lazy iterator
-        all_combinations_iterator = product(*values)  # type: ignore
-
-        # TODO: since this is a lazy iterator, we value performance over memory
-        # However, in the future there may need to be a way to randomly sample
-        # from the iterator without exhausting it or exceeding memory limits
-        combinations = list(islice(all_combinations_iterator, num_rows))
+        # Sample combinations uniformly by index, without materializing the product
+        combinations = sample_combinations(values, num_rows, context.random if context is not None else Random())
         rows = [
             {n: format_for_postgres(v, col.post_gres_datatype) for n, v, col in zip(names, combo, columns)}
             for combo in combinations
@@ -94,6 +181,10 @@ def unique_data_rows(table: TableInfo, remember_fn: Callable) -> list[dict[str,
     # values that can be anything
     else:
         seen_combinations = set()  # Set to track unique combinations
+        fk_map = foreign_key_map(table)
+        generators = column_generators(
+            [c for c in columns if not c.user_defined_values and not c.is_foreign_key], context
+        )
         i = 0
         while len(rows) < num_rows:
             if i >= MAX_ROWS:  # Break if the loop runs too long
@@ -102,13 +193,11 @@ def unique_data_rows(table: TableInfo, remember_fn: Callable) -> list[dict[str,
             row = {}
             for name, val_list, col in zip(names, values, columns):
                 if bool(val_list):  # Pick a random value from the user-defined list (i.e., enums)
-                    row[name] = format_for_postgres(choice(val_list), col.post_gres_datatype)  # type: ignore
+                    row[name] = format_for_postgres(rand_choice(val_list), col.post_gres_datatype)  # type: ignore
                 elif col.is_foreign_key:  # Pick a random foreign key value
-                    row[name] = pick_random_foreign_key(name, table, remember_fn)
+                    row[name] = pick_random_foreign_key(name, table, remember_fn, context, fk_map, foreign_key_skew)
                 else:  # Generate random data (e.g., a new username)
-                    row[name] = generate_fake_data(
-                        col.post_gres_datatype, col.nullable(), col.max_length, col.name, col.user_defined_values
-                    )
+                    row[name] = generators[name]()
             # Create a tuple of the row items sorted by key to ensure uniqueness is properly checked
             row_tuple = tuple(row[name] for name in sorted(row))
             if row_tuple not in seen_combinations:
@@ -121,26 +210,45 @@ def unique_data_rows(table: TableInfo, remember_fn: Callable) -> list[dict[str,
     return rows
 
 
-def generate_seed_data(tables: list[TableInfo]) -> dict[str, list[list[Any]]]:
-    """Generate seed data for the tables."""
+def generate_seed_data(
+    tables: list[TableInfo], context: SeedContext | None = None, foreign_key_skew: float = 0.0
+) -> dict[str, list[list[Any]]]:
+    """Generate seed data for the tables.
+
+    Args:
+        tables: The tables to generate seed data for.
+        context: The random state to draw from. Pass a seeded context for reproducible data;
+            defaults to a freshly seeded one.
+        foreign_key_skew: The Zipf exponent for picking foreign key values. 0 picks uniformly;
+            larger values make a few parent rows "hot", as in production load.
+
+    Returns:
+        dict: The seed data per table name, with the column headers as the first row.
+    """
+    context = context if context is not None else SeedContext()
     seed_data = {}
-    memory: dict[str, dict[str, set[Any]]] = {}
+    # Remembered values keep insertion order so seeded runs pick the same foreign keys
+    memory: dict[str, dict[str, ValuePool]] = {}
+    missing: set[tuple[str, str]] = set()
     sorted_tables, _ = sort_tables_for_insert(tables)
 
-    def _memorize(table_name: str, column_name: str, data: Any) -> None:
-        """Add data to memory."""
+    def _memorize(table_name: str, column_name: str, data: list[Any]) -> None:
+        """Add a column of data to memory."""
         if table_name not in memory:
             memory[table_name] = dict()
         if column_name not in memory[table_name]:
-            memory[table_name][column_name] = set()
-        memory[table_name][column_name].add(data)
+            memory[table_name][column_name] = ValuePool()
+        memory[table_name][column_name].extend(data)
 
-    def _remember(table_name: str, column_name: str) -> set[Any]:  # type: ignore
+    def _remember(table_name: str, column_name: str) -> ValuePool:
         """Get data from memory."""
         try:
             return memory[table_name][column_name]
         except KeyError:
-            logger.error(f'Could not remember data for {table_name}.{column_name}')
+            if (table_name, column_name) not in missing:  # Log once per column, not once per row
+                missing.add((table_name, column_name))
+                logger.error(f'Could not remember data for {table_name}.{column_name}')
+            raise
 
     def _rows_for_datetime_parsing(
         data: list[list[Any]], header: list[Any], columns: list[ColumnInfo]
@@ -173,45 +281,55 @@ def generate_seed_data(tables: list[TableInfo]) -> dict[str, list[list[Any]]]:
             logger.error(f'Could not find table {table_name}')
             continue
 
-        unique_rows = unique_data_rows(table, _remember)
-        fake_data = [[c.name for c in table.columns]]  # Add headers first
-        num_rows = len(unique_rows) if unique_rows else random_num_rows()
-        # print(unique_rows, num_rows)
-
-        for i in range(int(num_rows)):
-            row = []
-            for column in table.columns:
-                # Use unique values already generated to coordinate data additions
-                # correctly.
-                if column.is_unique:
-                    data = unique_rows[i][column.name]
-
-                # Choose a random foreign key value
-                elif column.is_foreign_key:
-                    data = pick_random_foreign_key(column.name, table, _remember)
-
-                # Else, generate new value
-                else:
-                    data = generate_fake_data(
-                        column.post_gres_datatype,
-                        column.nullable(),
-                        column.max_length,
-                        column.name,
-                        column.user_defined_values,
-                    )
-
-                # Add to memory
-                if column.primary or column.is_unique or column.is_foreign_key:
-                    _memorize(table_name, column.name, data)
-
-                row.append(data)
-            fake_data.append(row)
+        unique_rows = unique_data_rows(table, _remember, context, foreign_key_skew)
+        fk_map = foreign_key_map(table)
+        headers = [c.name for c in table.columns]
+        num_rows = int(len(unique_rows) if unique_rows else random_num_rows(context))
+
+        # Draw vectorizable columns in one go; the rest use per-column generators
+        columnar_data = generate_columns(table.columns, num_rows, context.rng)
+        generators = column_generators(
+            [c for c in table.columns if not c.is_unique and not c.is_foreign_key and c.name not in columnar_data],
+            context,
+        )
+
+        columns_data = []
+        for column in table.columns:
+            if column.name in columnar_data:
+                values = columnar_data[column.name]
+
+            # Use unique values already generated to coordinate data additions
+            # correctly.
+            elif column.is_unique:
+                values = [unique_rows[i][column.name] for i in range(num_rows)]
+
+            # Choose a random foreign key value
+            elif column.is_foreign_key:
+                values = [
+                    pick_random_foreign_key(column.name, table, _remember, context, fk_map, foreign_key_skew)
+                    for _ in range(num_rows)
+                ]
+
+            # Else, generate new values
+            else:
+                generate = generators[column.name]
+                values = [generate() for _ in range(num_rows)]
+
+            # Add to memory
+            if column.primary or column.is_unique or column.is_foreign_key:
+                _memorize(table_name, column.name, values)
+
+            columns_data.append(values)
+
+        # Transpose the columns into rows
+        fake_data = [list(row) for row in zip(*columns_data)] if columns_data else [[] for _ in range(num_rows)]
 
         # Modify fake data for datetime sequences
-        headers = fake_data[0]
-        fake_data = [
-            guess_datetime_order(row) for row in _rows_for_datetime_parsing(fake_data[1:], headers, table.columns)
-        ]
+        if any(c.post_gres_datatype in POSTGRES_DATE_DATATYPES for c in table.columns):
+            fake_data = [
+                guess_datetime_order(row, context)
+                for row in _rows_for_datetime_parsing(fake_data, headers, table.columns)
+            ]
         fake_data.insert(0, headers)
 
         # Add foreign keys
@@ -0,0 +1,79 @@
+"""Value pools for sampling remembered seed data, such as foreign key targets."""
+
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+
+class ValuePool:
+    """An append-only pool of distinct values with constant-time random sampling.
+
+    Values are kept in insertion order in a list for indexed sampling, and in a set
+    so duplicates are skipped without scanning the list.
+    """
+
+    def __init__(self, values: Iterable[Any] = ()):
+        self.values: list[Any] = []
+        self._seen: set[Any] = set()
+        self.extend(values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.values)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._seen
+
+    def add(self, value: Any) -> None:
+        """Add a value to the pool, unless it is already present."""
+        if value not in self._seen:
+            self._seen.add(value)
+            self.values.append(value)
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Add several values to the pool, skipping those already present."""
+        for value in values:
+            self.add(value)
+
+    def sample(self, rand: Callable[[], float], skew: float = 0.0) -> Any:
+        """Pick a random value from the pool.
+
+        Args:
+            rand: A function returning a random float in [0, 1), e.g. `random.Random.random`.
+            skew: The Zipf exponent. 0 picks uniformly; larger values concentrate picks on
+                the earliest-added values, producing hot keys.
+
+        Returns:
+            Any: The picked value.
+
+        Raises:
+            IndexError: If the pool is empty.
+        """
+        n = len(self.values)
+        if n == 0:
+            raise IndexError('Cannot sample from an empty pool')
+        return self.values[zipf_index(n, rand(), skew)]
+
+
+def zipf_index(n: int, u: float, skew: float = 0.0) -> int:
+    """Map a uniform random number to an index in [0, n), following a Zipf-like distribution.
+
+    Uses the inverse CDF of a continuous power law over [1, n + 1), so sampling is O(1)
+    regardless of n. A skew of 0 gives a uniform distribution.
+
+    Args:
+        n: The number of indices to pick from.
+        u: A uniform random number in [0, 1).
+        skew: The Zipf exponent.
+
+    Returns:
+        int: The picked index.
+    """
+    if skew <= 0:
+        x = 1 + u * n
+    elif skew == 1:
+        x = (n + 1) ** u
+    else:
+        x = ((((n + 1) ** (1 - skew)) - 1) * u + 1) ** (1 / (1 - skew))
+    return max(0, min(int(x) - 1, n - 1))
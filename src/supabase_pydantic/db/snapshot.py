@@ -0,0 +1,128 @@
+"""Catalog snapshots: the raw result sets of an introspection, saved to a file and replayed later.
+
+A snapshot is a JSON Lines file, gzip-compressed when its name ends in '.gz'. The first line
+is a header naming the database type the result sets came from; each further line holds one
+schema's result sets (see `SchemaCatalog`):
+
+    {"format": "supabase-pydantic-catalog", "version": 1, "db_type": "postgres"}
+    {"schema": "public", "tables": [...], "columns": [...], ...}
+
+The header can be read without parsing the rest of the file.
+"""
+
+import gzip
+import json
+import logging
+from dataclasses import dataclass, field, fields
+from datetime import date, datetime, time
+from decimal import Decimal
+from pathlib import Path
+from typing import IO, Any, cast
+
+from supabase_pydantic.db.factory import Backend, backend_name
+from supabase_pydantic.db.models import SchemaCatalog
+
+# Get Logger
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = 'supabase-pydantic-catalog'
+SNAPSHOT_VERSION = 1
+
+# The result sets in a snapshot, in SchemaCatalog order
+RESULT_SETS = [f.name for f in fields(SchemaCatalog)]
+
+_GZIP_MAGIC = b'\x1f\x8b'
+
+
+@dataclass
+class CatalogSnapshot:
+    """The result sets of every schema in a snapshot, and the database type they came from."""
+
+    db_type: str
+    catalogs: dict[str, SchemaCatalog] = field(default_factory=dict)
+
+
+def _json_default(value: Any) -> Any:
+    """Convert the values drivers return that JSON cannot represent."""
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode('utf-8', errors='replace')
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else str(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f'Cannot store a {type(value).__name__} in a catalog snapshot')
+
+
+def _open(path: str | Path, mode: str) -> IO[str]:
+    """Open a snapshot for text reading or writing, through gzip if it is compressed."""
+    path = Path(path)
+    if mode == 'r':
+        with open(path, 'rb') as f:
+            compressed = f.read(2) == _GZIP_MAGIC
+    else:
+        compressed = path.suffix == '.gz'
+    if compressed:
+        return cast(IO[str], gzip.open(path, mode + 't', encoding='utf-8'))
+    return open(path, mode, encoding='utf-8')
+
+
+def write_catalog_snapshot(path: str | Path, catalogs: dict[str, SchemaCatalog], db_type: Backend) -> None:
+    """Save the result sets of each schema to a snapshot file.
+
+    Args:
+        path: The file to write; gzip-compressed if its name ends in '.gz'.
+        catalogs: The result sets, by schema (see `DatabaseBuilder.catalogs`).
+        db_type: The database type the result sets came from.
+    """
+    header = {'format': SNAPSHOT_FORMAT, 'version': SNAPSHOT_VERSION, 'db_type': backend_name(db_type)}
+    with _open(path, 'w') as f:
+        f.write(json.dumps(header) + '\n')
+        for schema, catalog in catalogs.items():
+            line = {'schema': schema, **{name: getattr(catalog, name) for name in RESULT_SETS}}
+            f.write(json.dumps(line, default=_json_default, separators=(',', ':')) + '\n')
+    logger.info(f'Catalog snapshot of {len(catalogs)} schema(s) written to {path}')
+
+
+def _check_header(path: str | Path, line: str) -> dict[str, Any]:
+    try:
+        header = json.loads(line)
+    except json.JSONDecodeError:
+        header = None
+    if not isinstance(header, dict) or header.get('format') != SNAPSHOT_FORMAT:
+        raise ValueError(f'Not a catalog snapshot: {path}')
+    if header.get('version') != SNAPSHOT_VERSION:
+        raise ValueError(f'Unsupported catalog snapshot version {header.get("version")} in {path}')
+    return header
+
+
+def read_snapshot_header(path: str | Path) -> dict[str, Any]:
+    """Read a snapshot's header, without reading its result sets.
+
+    Raises:
+        ValueError: If the file is not a catalog snapshot of a supported version.
+    """
+    with _open(path, 'r') as f:
+        return _check_header(path, f.readline())
+
+
+def read_catalog_snapshot(path: str | Path) -> CatalogSnapshot:
+    """Load the result sets saved in a snapshot file.
+
+    Rows are restored as tuples, as drivers return them.
+
+    Raises:
+        ValueError: If the file is not a catalog snapshot of a supported version.
+    """
+    with _open(path, 'r') as f:
+        header = _check_header(path, f.readline())
+        snapshot = CatalogSnapshot(db_type=header['db_type'])
+        for line in f:
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            snapshot.catalogs[data['schema']] = SchemaCatalog(
+                **{name: [tuple(row) for row in data.get(name, [])] for name in RESULT_SETS}
+            )
+    return snapshot
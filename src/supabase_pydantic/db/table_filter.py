@@ -0,0 +1,125 @@
+"""Selecting the tables of a schema to generate code for, by name.
+
+Patterns are globs (`fnmatch` syntax) unless prefixed with `re:`, in which case the rest is a
+regular expression that must match the whole name. Each pattern is tried against both the table
+name and its schema-qualified name, so `user*` and `public.user*` both select `public.users`.
+
+Tables referenced by a foreign key of a selected table are selected too, so the generated
+relationships and foreign key types always resolve.
+"""
+
+import logging
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from fnmatch import translate
+from functools import cache
+
+from supabase_pydantic.db.models import TableInfo
+
+# Get Logger
+logger = logging.getLogger(__name__)
+
+REGEX_PREFIX = 're:'
+
+
+@cache
+def compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a table pattern: a glob, or a regular expression prefixed with 're:'.
+
+    Raises:
+        ValueError: If the regular expression is invalid.
+    """
+    if pattern.startswith(REGEX_PREFIX):
+        try:
+            return re.compile(pattern[len(REGEX_PREFIX) :])
+        except re.error as e:
+            raise ValueError(f'Invalid table pattern {pattern!r}: {e}') from e
+    return re.compile(translate(pattern))
+
+
+@dataclass(frozen=True)
+class TableFilter:
+    """The tables to include and exclude, as patterns.
+
+    With no include patterns every table is included; exclude patterns win over include ones.
+    """
+
+    include: tuple[str, ...] = ()
+    exclude: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        # Fail on invalid patterns before connecting to anything
+        for pattern in (*self.include, *self.exclude):
+            compile_pattern(pattern)
+
+    def __bool__(self) -> bool:
+        """Return whether the filter selects anything less than every table."""
+        return bool(self.include or self.exclude)
+
+    @staticmethod
+    def _any_match(patterns: tuple[str, ...], schema: str, table: str) -> bool:
+        qualified = f'{schema}.{table}'
+        return any(compile_pattern(p).fullmatch(table) or compile_pattern(p).fullmatch(qualified) for p in patterns)
+
+    def matches(self, schema: str, table: str) -> bool:
+        """Return whether the filter selects a table."""
+        if self.include and not self._any_match(self.include, schema, table):
+            return False
+        return not self._any_match(self.exclude, schema, table)
+
+    def select(
+        self,
+        schema: str,
+        tables: Iterable[str],
+        referenced_tables: Callable[[list[str]], Iterable[str]],
+    ) -> list[str]:
+        """Select the matching tables of a schema, and the tables their foreign keys reference.
+
+        Args:
+            schema: The schema of the tables.
+            tables: The names of every table in the schema.
+            referenced_tables: Returns the tables of the schema referenced by foreign keys of the
+                given tables.
+
+        Returns:
+            The selected table names, sorted.
+        """
+        selected = {table for table in tables if self.matches(schema, table)}
+        matched = len(selected)
+        frontier = sorted(selected)
+        while frontier:
+            frontier = sorted(set(referenced_tables(frontier)) - selected)
+            selected.update(frontier)
+        if len(selected) > matched:
+            logger.info(f'Including {len(selected) - matched} table(s) referenced by foreign keys in schema: {schema}')
+        return sorted(selected)
+
+    def apply(self, schema: str, tables: list[TableInfo]) -> list[TableInfo]:
+        """Keep the selected tables among tables already read in full.
+
+        For schema readers that cannot read a subset of tables; relationships to tables that are
+        not kept are dropped.
+
+        Args:
+            schema: The schema of the tables.
+            tables: The schema's tables.
+
+        Returns:
+            The selected tables, in their original order.
+        """
+        by_name = {table.name: table for table in tables}
+
+        def referenced_tables(names: list[str]) -> set[str]:
+            return {
+                fk.foreign_table_name
+                for name in names
+                for fk in by_name[name].foreign_keys
+                if fk.foreign_table_schema == schema and fk.foreign_table_name in by_name
+            }
+
+        selected = set(self.select(schema, by_name, referenced_tables))
+        kept = [table for table in tables if table.name in selected]
+        for table in kept:
+            table.relationships = [r for r in table.relationships if r.related_table_name in selected]
+        return kept
@@ -0,0 +1,375 @@
+"""Change detection and incremental re-introspection for the `watch` command.
+
+A `Watcher` holds one open connection and a set of triggers. Each trigger reports which schemas,
+and where it knows, which of their tables may have changed since it was last polled:
+
+- `DDLLogTrigger` reads the tables recorded by the DDL event triggers (see
+  `install_ddl_event_triggers`), waking on their notifications, so a migration that touches two
+  tables re-reads the catalog rows of those two tables only.
+- `NotifyTrigger` listens for the event triggers' notifications, which name schemas only.
+- `FingerprintTrigger` polls a per-schema hash of the catalog, for databases where an event
+  trigger cannot be installed.
+- `MigrationsTrigger` polls a migrations folder for added, removed or modified files.
+
+When a trigger fires, the watcher re-introspects only the affected schemas (or tables) over its
+open connection and passes the schemas whose tables actually changed to its callback.
+"""
+
+import logging
+import os
+import select
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from supabase_pydantic.db.builder import DatabaseBuilder
+from supabase_pydantic.db.drivers.postgres.queries import (
+    CATALOG_FINGERPRINT_QUERY,
+    DDL_LOG_SCHEMA,
+    DDL_NOTIFY_CHANNEL,
+    GET_DDL_LOG_ENTRIES,
+    GET_DDL_LOG_POSITION,
+    INSTALL_DDL_EVENT_TRIGGERS,
+    PRUNE_DDL_LOG,
+    RELATION_NAMES_QUERY,
+    UNINSTALL_DDL_EVENT_TRIGGERS,
+)
+from supabase_pydantic.db.models import TableInfo
+
+# Get Logger
+logger = logging.getLogger(__name__)
+
+# Reported by a trigger when every watched schema may have changed
+ALL_SCHEMAS = '*'
+
+# The changed tables reported by triggers, by schema; None if any table in the schema may have changed
+Changes = dict[str, set[str] | None]
+
+# DDL log object types that can change a schema's models without naming a table (e.g., enums)
+SCHEMA_OBJECT_TYPES = {'type', 'domain', 'schema'}
+
+# DDL log object types whose object id is that of the relation named in the entry
+RELATION_OBJECT_TYPES = {'table', 'view', 'materialized view', 'foreign table', 'table column'}
+
+
+def merge_changes(changes: Changes, more: Changes) -> Changes:
+    """Merge `more` into `changes` in place, widening to the whole schema where either does."""
+    for schema, tables in more.items():
+        current = changes.get(schema, set())
+        changes[schema] = None if current is None or tables is None else current | tables
+    return changes
+
+
+def _execute(conn: Any, query: str, params: tuple = ()) -> list[tuple]:
+    """Run a query on a DB-API connection and return its rows, if any."""
+    cur = conn.cursor()
+    try:
+        cur.execute(query, params)
+        return cur.fetchall() if cur.description is not None else []
+    finally:
+        cur.close()
+
+
+def install_ddl_event_triggers(conn: Any) -> None:
+    """Install the event triggers that log DDL and notify `DDL_NOTIFY_CHANNEL` (requires superuser).
+
+    Each DDL command adds a row per affected object to `supabase_pydantic.ddl_log`; a
+    `DDLLogTrigger` deletes the rows logged before it starts, and the table can be truncated at
+    any time.
+    """
+    _execute(conn, INSTALL_DDL_EVENT_TRIGGERS)
+    conn.commit()
+    logger.info(f'Installed DDL event triggers logging to {DDL_LOG_SCHEMA}.ddl_log')
+
+
+def uninstall_ddl_event_triggers(conn: Any) -> None:
+    """Remove the event triggers and DDL log installed by `install_ddl_event_triggers`."""
+    _execute(conn, UNINSTALL_DDL_EVENT_TRIGGERS)
+    conn.commit()
+    logger.info('Removed DDL event triggers')
+
+
+class ChangeTrigger(ABC):
+    """A source of change notifications for the watcher."""
+
+    # Whether `wait` blocks on the connection until a change may be available
+    waits_on_connection = False
+
+    def start(self, conn: Any) -> None:  # noqa: B027
+        """Prepare the trigger on a newly opened connection."""
+
+    @abstractmethod
+    def poll(self, conn: Any) -> Changes:
+        """Return the schemas, and tables where known, that may have changed since the last poll.
+
+        Returns:
+            The changed tables by schema, with `ALL_SCHEMAS` as a key if every watched schema
+            may have changed.
+        """
+
+    def wait(self, conn: Any, timeout: float) -> None:
+        """Block until a change may be available or `timeout` seconds pass."""
+        time.sleep(timeout)
+
+
+class NotifyTrigger(ChangeTrigger):
+    """Reports the schemas named in notifications from the DDL event trigger."""
+
+    waits_on_connection = True
+
+    def __init__(self, channel: str = DDL_NOTIFY_CHANNEL):
+        self.channel = channel
+
+    def start(self, conn: Any) -> None:
+        """Listen on the channel; the connection must be in autocommit mode to receive notifications."""
+        _execute(conn, f'LISTEN {self.channel}')
+        logger.info(f'Listening for DDL notifications on channel {self.channel!r}')
+
+    def poll(self, conn: Any) -> Changes:
+        """Return the schemas named in the notifications received since the last poll."""
+        conn.poll()
+        schemas = {n.payload or ALL_SCHEMAS for n in conn.notifies if n.channel == self.channel}
+        conn.notifies.clear()
+        return dict.fromkeys(schemas)
+
+    def wait(self, conn: Any, timeout: float) -> None:
+        """Block until the connection has data (e.g., a notification) or `timeout` seconds pass."""
+        select.select([conn], [], [], timeout)
+
+
+class DDLLogTrigger(NotifyTrigger):
+    """Reports the tables recorded in the DDL log since the last poll.
+
+    Wakes on the event triggers' notifications like `NotifyTrigger`, but reads what changed
+    from the log, so each change names the tables it touched. DDL on objects that belong to no
+    table but can change models, such as enum types, reports the whole schema.
+
+    The log only records the name a relation has after each command, so the trigger keeps the
+    last known schema and name of each relation: a renamed or moved table reports its old name
+    as well as its new one, and its old model is dropped.
+
+    Starting the trigger deletes the entries logged before then, so the log does not grow
+    without limit. Run one watcher with this trigger per database: one started earlier misses
+    the entries it had not read yet.
+    """
+
+    def __init__(self, channel: str = DDL_NOTIFY_CHANNEL):
+        super().__init__(channel)
+        self.position = 0
+        self.relations: dict[int, tuple[str, str]] = {}  # oid -> (schema, name)
+
+    def start(self, conn: Any) -> None:
+        """Listen on the channel, delete the entries logged before now, and record the relations' names."""
+        super().start(conn)
+        self.position = _execute(conn, GET_DDL_LOG_POSITION)[0][0]
+        _execute(conn, PRUNE_DDL_LOG, (self.position,))
+        self.relations = {oid: (schema, name) for oid, schema, name in _execute(conn, RELATION_NAMES_QUERY)}
+
+    def poll(self, conn: Any) -> Changes:
+        """Return the tables, by schema, logged since the last poll."""
+        super().poll(conn)  # Consume the notifications; the log says what changed
+        changes: Changes = {}
+        for entry_id, schema, object_type, relation, objid in _execute(conn, GET_DDL_LOG_ENTRIES, (self.position,)):
+            self.position = entry_id
+            if relation is not None and object_type in RELATION_OBJECT_TYPES and objid is not None:
+                previous = self.relations.get(objid)
+                if previous is not None and previous != (schema, relation):
+                    merge_changes(changes, {previous[0]: {previous[1]}})  # Renamed, or moved to another schema
+                self.relations[objid] = (schema, relation)
+            if relation is not None:
+                merge_changes(changes, {schema: {relation}})
+            elif object_type in SCHEMA_OBJECT_TYPES:
+                merge_changes(changes, {schema: None})
+        return changes
+
+
+class FingerprintTrigger(ChangeTrigger):
+    """Reports the schemas whose catalog fingerprint changed since the last poll.
+
+    The fingerprint query returns one hash per schema, so each poll is a single round trip
+    with a few rows, however large the schemas are.
+    """
+
+    def __init__(self, schemas: Iterable[str]):
+        """Initialize the trigger for the given schemas; `('*',)` watches every user schema."""
+        schemas = list(schemas)
+        self.schemas = [s for s in schemas if s != ALL_SCHEMAS]
+        self.all_schemas = ALL_SCHEMAS in schemas
+        self.fingerprints: dict[str, str] = {}
+
+    def read(self, conn: Any) -> dict[str, str]:
+        """Read the current fingerprint of each watched schema."""
+        return dict(_execute(conn, CATALOG_FINGERPRINT_QUERY, (self.schemas, self.all_schemas)))
+
+    def start(self, conn: Any) -> None:
+        """Record the fingerprints to compare later polls against."""
+        self.fingerprints = self.read(conn)
+
+    def poll(self, conn: Any) -> Changes:
+        """Return the schemas whose fingerprint was added, removed or changed."""
+        current = self.read(conn)
+        changed = {s for s in current.keys() | self.fingerprints.keys() if current.get(s) != self.fingerprints.get(s)}
+        self.fingerprints = current
+        return dict.fromkeys(changed)
+
+
+class MigrationsTrigger(ChangeTrigger):
+    """Reports every watched schema when a file in the migrations folder is added, removed or modified."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.signature = self.read()
+
+    def read(self) -> dict[str, tuple[int, int]]:
+        """Return each file's modification time and size, by path."""
+        signature = {}
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:  # Removed while walking
+                    continue
+                signature[path] = (stat.st_mtime_ns, stat.st_size)
+        return signature
+
+    def poll(self, conn: Any) -> Changes:
+        """Return `{ALL_SCHEMAS: None}` if the folder's contents changed since the last poll."""
+        current = self.read()
+        changed, self.signature = current != self.signature, current
+        if changed:
+            logger.info(f'Change detected in migrations folder: {self.directory}')
+        return {ALL_SCHEMAS: None} if changed else {}
+
+
+class Watcher:
+    """Keeps table information up to date by re-introspecting schemas as triggers report changes.
+
+    Attributes:
+        builder (DatabaseBuilder): Builds table information over the watcher's connection.
+        schemas (tuple[str, ...]): The watched schemas, or `('*',)` for all schemas.
+        on_change (Callable): Called with the tables of each schema whose tables changed.
+        triggers (list[ChangeTrigger]): The change sources to poll.
+        interval (float): Seconds between polls while nothing changes.
+        debounce (float): Seconds without further changes to wait before re-introspecting, so a
+            migration's many statements cause one regeneration.
+        tables (dict[str, list[TableInfo]]): The latest table information, by schema.
+    """
+
+    def __init__(
+        self,
+        builder: DatabaseBuilder,
+        schemas: tuple[str, ...],
+        on_change: Callable[[dict[str, list[TableInfo]]], None],
+        triggers: list[ChangeTrigger],
+        interval: float = 2.0,
+        debounce: float = 0.5,
+        disable_model_prefix_protection: bool = False,
+    ):
+        self.builder = builder
+        self.schemas = schemas
+        self.on_change = on_change
+        self.triggers = triggers
+        self.interval = interval
+        self.debounce = debounce
+        self.disable_model_prefix_protection = disable_model_prefix_protection
+        self.tables: dict[str, list[TableInfo]] = {}
+        self._stopped = False
+
+    def stop(self) -> None:
+        """Stop the watch loop after the current cycle."""
+        self._stopped = True
+
+    def poll(self, conn: Any) -> Changes:
+        """Poll every trigger and return the union of the changes they report."""
+        changed: Changes = {}
+        for trigger in self.triggers:
+            merge_changes(changed, trigger.poll(conn))
+        return changed
+
+    def wait(self, conn: Any, timeout: float) -> None:
+        """Wait on the connection if a trigger listens on it, otherwise sleep."""
+        waiter = next((t for t in self.triggers if t.waits_on_connection), None)
+        if waiter is not None:
+            waiter.wait(conn, timeout)
+        else:
+            time.sleep(timeout)
+
+    def refresh(self, conn: Any, changed: Changes) -> dict[str, list[TableInfo]]:
+        """Re-introspect the changed schemas and report those whose tables differ from the last run.
+
+        Args:
+            conn: The open connection.
+            changed: The changed tables by schema (None for the whole schema), or
+                `{ALL_SCHEMAS: None}` for every watched schema.
+
+        Returns:
+            The tables of each schema that changed.
+        """
+        if ALL_SCHEMAS in changed:
+            schemas = self.schemas
+            changed_tables = {}
+        else:
+            if self.schemas == ('*',):
+                schemas = tuple(sorted(changed))
+            else:
+                schemas = tuple(s for s in self.schemas if s in changed)
+            changed_tables = {s: t for s, t in changed.items() if s in schemas and t is not None}
+        if not schemas:
+            return {}
+
+        logger.info(f'Re-introspecting schemas: {", ".join(schemas)}')
+        tables = self.builder.build_tables(
+            schemas=schemas,
+            disable_model_prefix_protection=self.disable_model_prefix_protection,
+            connection=conn,
+            changed_tables=changed_tables,
+        )
+        updated = {s: t for s, t in tables.items() if s not in self.tables or t != self.tables[s]}
+        self.tables.update(updated)
+        if updated:
+            self.on_change(updated)
+        else:
+            logger.info('No model changes')
+        return updated
+
+    def run(self, max_cycles: int | None = None) -> None:
+        """Introspect the watched schemas, then regenerate on every change until stopped.
+
+        Args:
+            max_cycles: Stop after this many poll cycles; None to run until `stop` is called.
+        """
+        self._stopped = False
+        with self.builder.connector as conn:
+            # Notifications are only delivered outside transactions
+            if hasattr(conn, 'autocommit'):
+                conn.autocommit = True
+            for trigger in self.triggers:
+                trigger.start(conn)
+
+            self.refresh(conn, {ALL_SCHEMAS: None})
+            logger.info('Watching for schema changes (press Ctrl+C to stop)')
+
+            cycles = 0
+            while not self._stopped and (max_cycles is None or cycles < max_cycles):
+                cycles += 1
+                changed = self.poll(conn)
+                if not changed:
+                    self.wait(conn, self.interval)
+                    continue
+
+                # Wait for a quiet period, so one migration causes one regeneration
+                while True:
+                    self.wait(conn, self.debounce)
+                    more = self.poll(conn)
+                    if not more:
+                        break
+                    merge_changes(changed, more)
+
+                try:
+                    self.refresh(conn, changed)
+                except Exception as e:
+                    if not self.builder.connector.check_connection(conn):
+                        raise ConnectionError(f'Lost the database connection while watching: {e}') from e
+                    logger.error(f'Failed to regenerate after schema change: {e}')
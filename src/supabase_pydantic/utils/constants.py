@@ -8,6 +8,8 @@ class AppConfig(TypedDict, total=False):
     overwrite_existing_files: bool
     nullify_base_schema: bool
     disable_model_prefix_protection: bool
+    include_tables: list[str]
+    exclude_tables: list[str]
 
 
 class ToolConfig(TypedDict):
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+from functools import cache
 from types import FrameType
 
 try:
@@ -30,31 +34,67 @@ def _want_caller_details(effective_level: int) -> bool:
     return effective_level <= logging.DEBUG
 
 
+@cache
+def _loguru_level(levelname: str, levelno: int) -> str | int:
+    """Map a stdlib level to a Loguru level, by name if Loguru knows it, else by number."""
+    try:
+        return logger.level(levelname).name  # type: ignore[union-attr]
+    except Exception:
+        return levelno
+
+
 # stdlib → loguru bridge
 
 
 class InterceptHandler(logging.Handler):
-    """Redirect standard logging records to Loguru if available."""
+    """Redirect standard logging records to Loguru if available.
 
-    def emit(self, record: logging.LogRecord) -> None:  # pragma: no cover - trivial  # noqa: D102
+    Args:
+        level: The handler's minimum level.
+        caller_details: Whether the Loguru format shows the caller's file, line and function.
+            Finding the caller means walking the stack for every record, so it is skipped
+            when the details are not shown.
+    """
+
+    def __init__(self, level: int = logging.NOTSET, *, caller_details: bool = True):
+        super().__init__(level)
+        self.caller_details = caller_details
+
+    def emit(self, record: logging.LogRecord) -> None:  # noqa: D102
         if not _HAS_LOGURU or logger is None:
             return
 
-        try:
-            lvl = logger.level(record.levelname).name
-        except Exception:
-            lvl = record.levelno  # type: ignore
+        lvl = _loguru_level(record.levelname, record.levelno)
 
-        # Compute correct depth by skipping frames from stdlib logging module
-        frame: FrameType | None = logging.currentframe()
-        depth = 2
-        while frame and frame.f_code.co_filename == getattr(logging, '__file__', None):
-            frame = frame.f_back
-            depth += 1
+        # Point Loguru at the frame that made the logging call (honoring `stacklevel`),
+        # skipping this handler and the stdlib logging frames above it
+        depth = 0
+        if self.caller_details:
+            frame: FrameType | None = sys._getframe(0)
+            while frame and frame.f_code.co_filename != record.pathname:
+                frame = frame.f_back
+                depth += 1
+            if frame is None:
+                depth = 0
 
         logger.bind(logger_name=record.name).opt(depth=depth, exception=record.exc_info).log(lvl, record.getMessage())
 
 
+# Listener draining the stdlib fallback's log queue, if queued logging is enabled
+_queue_listener: logging.handlers.QueueListener | None = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the stdlib fallback's queue listener, if one is running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 # main setup
 
 
@@ -66,6 +106,7 @@ def setup_logging(
     stdlib_datefmt: str = '%Y-%m-%d %H:%M:%S',
     include_ms: bool = False,
     force: bool = False,  # Python 3.8+: override pre-existing handlers
+    enqueue: bool = False,
 ) -> None:
     """Configure Loguru if available; otherwise stdlib logging.
 
@@ -75,6 +116,8 @@ def setup_logging(
         stdlib_datefmt: Time format for stdlib (strftime, e.g., "%Y-%m-%d %H:%M:%S").
         include_ms: Append milliseconds in both Loguru and stdlib outputs.
         force: If True and Python>=3.8, force override existing handlers.
+        enqueue: If True, hand records to a background thread that writes them, so logging
+            never blocks on terminal I/O. Queued records are flushed at exit.
     """
 
     # If TRACE (5) is requested but Loguru isn't available, bump to DEBUG
@@ -83,6 +126,7 @@ def setup_logging(
         effective_level = logging.DEBUG
 
     debug_details = _want_caller_details(effective_level)
+    _stop_queue_listener()
 
     # ----- LOGURU BRANCH -----
     if _HAS_LOGURU and logger is not None:
@@ -110,10 +154,11 @@ def setup_logging(
             diagnose=(effective_level <= logging.DEBUG),
             level=effective_level,
             format=loguru_fmt,
+            enqueue=enqueue,
         )
 
         # Route stdlib logging to Loguru
-        kwargs = {'handlers': [InterceptHandler()], 'level': effective_level}
+        kwargs = {'handlers': [InterceptHandler(caller_details=debug_details)], 'level': effective_level}
         if force and hasattr(logging, 'basicConfig'):
             kwargs['force'] = True  # type: ignore[arg-type]
         logging.basicConfig(**kwargs)  # type: ignore
@@ -136,4 +181,15 @@ def setup_logging(
     )
     if force and hasattr(logging, 'basicConfig'):
         kwargs['force'] = True  # type: ignore[assignment]
+
+    if enqueue:
+        # Format and write records on a listener thread; callers only put them on a queue
+        global _queue_listener
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter(stdlib_fmt, stdlib_datefmt))
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _queue_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+        _queue_listener.start()
+        kwargs = dict(level=effective_level, handlers=[logging.handlers.QueueHandler(log_queue)], force=force)
+
     logging.basicConfig(**kwargs)  # type: ignore
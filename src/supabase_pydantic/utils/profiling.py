@@ -0,0 +1,234 @@
+"""Lightweight per-stage timing for profiling `gen` runs.
+
+Code marks its stages with `span` (a context manager) or `timed` (a decorator). Spans are
+only recorded while a `Profiler` is active, so when profiling is off each one costs a single
+global lookup.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import functools
+import io
+import json
+import logging
+import os
+import pstats
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+# Get Logger
+logger = logging.getLogger(__name__)
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+# Supported deep profilers for `deep_profile`
+DEEP_PROFILERS = ('cprofile', 'pyinstrument')
+
+
+@dataclass
+class Span:
+    """A timed stage of a run.
+
+    Attributes:
+        name (str): The stage name, e.g. 'catalog.columns'.
+        start (float): Seconds from the start of profiling to the start of the span.
+        duration (float): The span's duration in seconds.
+        depth (int): The nesting depth of the span within its thread.
+        thread_id (int): The identifier of the thread that ran the span.
+        attrs (dict): Extra details, such as the schema or file being processed.
+    """
+
+    name: str
+    start: float
+    duration: float
+    depth: int
+    thread_id: int
+    attrs: dict[str, Any] = field(default_factory=dict)
+
+
+class Profiler:
+    """Collects spans and reports them as a summary table, JSON or a Chrome trace."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._origin = time.perf_counter()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **attrs: Any) -> Iterator[None]:
+        """Time the enclosed block as a span named `name`."""
+        depth = getattr(self._local, 'depth', 0)
+        self._local.depth = depth + 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self._local.depth = depth
+            with self._lock:
+                self.spans.append(Span(name, start - self._origin, end - start, depth, threading.get_ident(), attrs))
+
+    def summary(self) -> list[dict[str, Any]]:
+        """Aggregate spans by name, in order of first appearance.
+
+        Returns:
+            list[dict]: One entry per span name with its count and total, mean and max seconds.
+        """
+        stats: dict[str, dict[str, Any]] = {}
+        for s in sorted(self.spans, key=lambda s: s.start):
+            entry = stats.setdefault(s.name, {'name': s.name, 'depth': s.depth, 'count': 0, 'total': 0.0, 'max': 0.0})
+            entry['count'] += 1
+            entry['total'] += s.duration
+            entry['max'] = max(entry['max'], s.duration)
+        for entry in stats.values():
+            entry['mean'] = entry['total'] / entry['count']
+        return list(stats.values())
+
+    def format_summary(self) -> str:
+        """Format the summary as a table, with nested stages indented under their parents."""
+        rows = [(('  ' * e['depth']) + e['name'], e['count'], e['total'], e['mean'], e['max']) for e in self.summary()]
+        width = max([len(r[0]) for r in rows] + [len('Stage')])
+        lines = [f'{"Stage":<{width}}  {"Count":>6}  {"Total (ms)":>11}  {"Mean (ms)":>10}  {"Max (ms)":>10}']
+        lines.append('-' * len(lines[0]))
+        for name, count, total, mean, max_ in rows:
+            lines.append(
+                f'{name:<{width}}  {count:>6}  {total * 1000:>11.2f}  {mean * 1000:>10.2f}  {max_ * 1000:>10.2f}'
+            )
+        return '\n'.join(lines)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Build a Chrome trace (loadable in chrome://tracing or Perfetto) with the summary attached."""
+        pid = os.getpid()
+        events = [
+            {
+                'name': s.name,
+                'ph': 'X',
+                'ts': round(s.start * 1e6, 3),
+                'dur': round(s.duration * 1e6, 3),
+                'pid': pid,
+                'tid': s.thread_id,
+                'args': {k: str(v) for k, v in s.attrs.items()},
+            }
+            for s in self.spans
+        ]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms', 'summary': self.summary()}
+
+    def write(self, file_path: str) -> None:
+        """Write the spans to a JSON file in Chrome trace format."""
+        with open(file_path, 'w') as f:
+            json.dump(self.to_chrome_trace(), f, indent=2)
+
+
+# The profiler recording spans, if profiling is enabled
+_active: Profiler | None = None
+_NULL_SPAN = nullcontext()
+
+
+def span(name: str, **attrs: Any) -> Any:
+    """Time a block as a stage of the active profiler; does nothing if profiling is off.
+
+    Example:
+        with span('catalog.columns', schema='public'):
+            rows = reader.get_columns(conn, 'public')
+    """
+    profiler = _active
+    if profiler is None:
+        return _NULL_SPAN
+    return profiler.span(name, **attrs)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Decorate a function so each call is timed as a span named `name`."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            profiler = _active
+            if profiler is None:
+                return func(*args, **kwargs)
+            with profiler.span(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+@contextmanager
+def profiling(enabled: bool = True) -> Iterator[Profiler | None]:
+    """Activate a new profiler for the enclosed block.
+
+    Args:
+        enabled: If False, do nothing and yield None, so callers need no separate branch.
+
+    Yields:
+        Profiler | None: The active profiler, or None if disabled.
+    """
+    global _active
+    if not enabled:
+        yield None
+        return
+
+    previous, _active = _active, Profiler()
+    try:
+        yield _active
+    finally:
+        _active = previous
+
+
+@contextmanager
+def deep_profile(kind: str | None, output_path: str | None = None) -> Iterator[None]:
+    """Run the enclosed block under cProfile or pyinstrument.
+
+    cProfile stats are dumped to `output_path` (if given) and the top functions by cumulative
+    time are logged. pyinstrument, if installed, renders its call tree to `output_path` as
+    HTML (if given) and logs a text summary.
+
+    Args:
+        kind: 'cprofile', 'pyinstrument', or None to do nothing.
+        output_path: Where to write the profiler's output.
+    """
+    if kind is None:
+        yield
+        return
+
+    if kind == 'pyinstrument':
+        try:
+            from pyinstrument import Profiler as Pyinstrument
+        except ImportError:
+            logger.warning('pyinstrument is not installed; run `pip install pyinstrument`. Skipping deep profiling.')
+            yield
+            return
+
+        profiler = Pyinstrument()
+        profiler.start()
+        try:
+            yield
+        finally:
+            profiler.stop()
+            if output_path:
+                with open(output_path, 'w') as f:
+                    f.write(profiler.output_html())
+            logger.info(f'pyinstrument profile:\n{profiler.output_text()}')
+        return
+
+    if kind != 'cprofile':
+        raise ValueError(f'Unknown deep profiler: {kind}. Expected one of: {", ".join(DEEP_PROFILERS)}')
+
+    cprofiler = cProfile.Profile()
+    cprofiler.enable()
+    try:
+        yield
+    finally:
+        cprofiler.disable()
+        if output_path:
+            cprofiler.dump_stats(output_path)
+        stream = io.StringIO()
+        pstats.Stats(cprofiler, stream=stream).sort_stats('cumulative').print_stats(20)
+        logger.info(f'cProfile top functions by cumulative time:\n{stream.getvalue()}')
@@ -202,8 +202,8 @@ def test_gen_command_with_seed_data(runner):
         patch('supabase_pydantic.cli.commands.gen.get_working_directories') as mock_dirs,
         patch('supabase_pydantic.cli.commands.gen.get_standard_jobs') as mock_jobs,
         patch('supabase_pydantic.cli.commands.gen.FileWriterFactory') as mock_factory,
-        patch('supabase_pydantic.cli.commands.gen.generate_seed_data') as mock_seed,
-        patch('supabase_pydantic.cli.commands.gen.write_seed_file') as mock_write_seed,
+        patch('supabase_pydantic.db.seed.generate_seed_data') as mock_seed,
+        patch('supabase_pydantic.db.seed.write_seed_file') as mock_write_seed,
     ):
         table_info = MagicMock()
         table_info.name = 'table1'
@@ -237,7 +237,7 @@ def test_gen_command_with_seed_data_no_tables(runner):
         patch('supabase_pydantic.cli.commands.gen.get_working_directories') as mock_dirs,
         patch('supabase_pydantic.cli.commands.gen.get_standard_jobs') as mock_jobs,
         patch('supabase_pydantic.cli.commands.gen.FileWriterFactory') as mock_factory,
-        patch('supabase_pydantic.cli.commands.gen.generate_seed_data') as mock_seed,
+        patch('supabase_pydantic.db.seed.generate_seed_data') as mock_seed,
         patch('supabase_pydantic.utils.formatting.format_with_ruff'),
         patch('supabase_pydantic.utils.io.clean_directories'),
         patch(
@@ -0,0 +1,65 @@
+"""Startup cost regression tests for the CLI, using `python -X importtime`."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+import supabase_pydantic
+from supabase_pydantic.cli import LAZY_SUBCOMMANDS, cli
+
+# Modules that are slow to import and only needed by some code paths
+HEAVY_MODULES = {'faker', 'numpy', 'psycopg2', 'mysql.connector'}
+
+
+def imported_modules(statement: str) -> dict[str, int]:
+    """Run `statement` in a fresh interpreter and return each imported module's cumulative import time (us)."""
+    src = os.path.dirname(os.path.dirname(supabase_pydantic.__file__))
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join([src, os.environ.get('PYTHONPATH', '')])}
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement], capture_output=True, text=True, check=True, env=env
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+@pytest.mark.unit
+@pytest.mark.cli
+def test_cli_import_skips_commands_and_heavy_dependencies():
+    """Test that importing the CLI group loads no subcommand, driver or seed data dependency."""
+    modules = imported_modules('import supabase_pydantic.cli')
+    commands = {m for m in modules if m.startswith('supabase_pydantic.cli.commands')}
+    loaded = HEAVY_MODULES.intersection(modules) | commands
+    assert not loaded, f'CLI startup ({modules["supabase_pydantic.cli"] / 1000:.1f} ms) imported {sorted(loaded)}'
+
+
+@pytest.mark.unit
+@pytest.mark.cli
+def test_gen_import_skips_drivers_and_faker():
+    """Test that the gen command defers database drivers, Faker and NumPy until they are used."""
+    modules = imported_modules('import supabase_pydantic.cli.commands.gen')
+    loaded = HEAVY_MODULES.intersection(modules)
+    total = modules['supabase_pydantic.cli.commands.gen'] / 1000
+    assert not loaded, f'gen import ({total:.1f} ms) imported {sorted(loaded)}'
+
+
+@pytest.mark.unit
+@pytest.mark.cli
+def test_lazy_subcommand_help_matches_commands():
+    """Test that the stored short help for each lazy subcommand matches the command itself."""
+    ctx = cli.make_context('sb-pydantic', [], resilient_parsing=True)
+    for name, (_, short_help) in LAZY_SUBCOMMANDS.items():
+        command = cli.get_command(ctx, name)
+        assert command is not None
+        assert command.get_short_help_str(limit=len(short_help)) == short_help
+
+    result = CliRunner().invoke(cli, ['--help'])
+    assert result.exit_code == 0
+    assert 'gen' in result.output and 'clean' in result.output
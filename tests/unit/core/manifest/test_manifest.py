@@ -0,0 +1,70 @@
+"""Tests for reading generation manifests in supabase_pydantic.core.manifest."""
+
+import pytest
+
+from supabase_pydantic.core.manifest import ManifestTarget, load_manifest
+
+
+@pytest.mark.unit
+@pytest.mark.config
+def test_load_manifest_merges_defaults(tmp_path, monkeypatch):
+    """Test that defaults apply to each target, paths resolve against the manifest and env vars expand."""
+    monkeypatch.setenv('BILLING_URL', 'postgresql://u:p@db:5432/billing')
+    manifest = tmp_path / 'targets.toml'
+    manifest.write_text(
+        """
+[defaults]
+type = ["pydantic", "sqlalchemy"]
+schemas = ["public", "api"]
+
+[[targets]]
+name = "billing"
+db_url = "${BILLING_URL}"
+dir = "billing/entities"
+
+[[targets]]
+from_sql = "migrations"
+type = "pydantic"
+exclude_tables = ["re:.*_audit"]
+"""
+    )
+
+    billing, second = load_manifest(manifest)
+
+    assert billing == ManifestTarget(
+        name='billing',
+        db_url='postgresql://u:p@db:5432/billing',
+        schemas=('public', 'api'),
+        dir=str(tmp_path / 'billing' / 'entities'),
+        type=('pydantic', 'sqlalchemy'),
+    )
+    assert second.name == 'target_2'
+    assert second.from_sql == str(tmp_path / 'migrations')
+    assert second.type == ('pydantic',)
+    assert second.exclude_tables == ('re:.*_audit',)
+
+
+@pytest.mark.unit
+@pytest.mark.config
+@pytest.mark.parametrize(
+    'content, message',
+    [
+        ('title = "no targets"', 'No \\[\\[targets\\]\\]'),
+        ('[[targets]]\nname = "a"', 'exactly one of'),
+        ('[[targets]]\nlocal = true\ndb_url = "x"', 'exactly one of'),
+        ('[[targets]]\nlocal = true\nschema = ["x"]', "Unknown key\\(s\\) for target 'target_1': schema"),
+        ('[[targets]]\nname = "a"\nlocal = true\n[[targets]]\nname = "a"\nlocal = true', 'Duplicate target'),
+        (
+            '[[targets]]\nname = "a"\nlocal = true\ndir = "out"\n[[targets]]\nname = "b"\nlocal = true\ndir = "./out"',
+            'share an output dir: a, b',
+        ),
+        ('[[targets]\n', 'Invalid manifest'),
+    ],
+)
+def test_load_manifest_rejects_invalid_targets(tmp_path, content, message):
+    """Test that invalid manifests are reported with the offending target."""
+    manifest = tmp_path / 'targets.toml'
+    manifest.write_text(content)
+
+    with pytest.raises(ValueError, match=message):
+        load_manifest(manifest)
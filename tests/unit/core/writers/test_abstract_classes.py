@@ -192,6 +192,7 @@ def test_concrete_file_writer_methods():
 @pytest.mark.unit
 @pytest.mark.writers
 def test_save_method():
+    """Test that save streams the latest file, and copies it to the versioned file."""
     tables = [TableInfo(name='test_table', columns=[])]
     writer = ConcreteFileWriter(tables, 'directory/test_file.py', MagicMock(spec=AbstractClassWriter))
 
@@ -202,19 +203,37 @@ def test_save_method():
             'supabase_pydantic.core.writers.abstract.generate_unique_filename',
             return_value='test_file_unique.py',
         ) as mock_unique_filename,
+        patch('supabase_pydantic.core.writers.abstract.shutil.copyfile') as mock_copyfile,
     ):
         result = writer.save(overwrite=False)
 
         # Assert the generate_unique_filename was called correctly
         mock_unique_filename.assert_called_once_with('test_file', '.py', 'directory')
 
-        # Assert the file was opened with the correct filename and mode
-        mock_open.assert_called_with('test_file_unique.py', 'w')
+        # Assert the latest file was written, and the versioned file copied from it
+        mock_open.assert_called_once_with('directory/test_file_latest.py', 'w')
+        mock_copyfile.assert_called_once_with('directory/test_file_latest.py', 'test_file_unique.py')
 
         # Assert the correct path is returned
         assert result == ('directory/test_file_latest.py', 'test_file_unique.py')
 
 
+@pytest.mark.unit
+@pytest.mark.writers
+def test_save_streams_chunks(tmp_path):
+    """Test that the saved file is the written chunks, and that a versioned copy matches it."""
+    tables = [TableInfo(name='test_table', columns=[])]
+    writer = ConcreteFileWriter(tables, str(tmp_path / 'models.py'), ConcreteClassWriter)
+
+    latest, versioned = writer.save(overwrite=False)
+
+    assert list(writer.write_chunks()) == [
+        'Imports', '\n\n\n', 'CustomClasses', '\n\n\n', 'BaseClasses', '\n\n\n', 'OperationalClasses', '\n'
+    ]  # fmt: skip
+    assert open(latest).read() == writer.write()
+    assert open(versioned).read() == writer.write()
+
+
 @pytest.mark.unit
 @pytest.mark.writers
 def test_abstract_file_writer_type_error_on_implementation():
@@ -0,0 +1,140 @@
+"""Tests for the package layout of the generated code."""
+
+import importlib
+import sys
+
+import pytest
+
+from supabase_pydantic.core.models import EnumInfo
+from supabase_pydantic.core.writers.package import PackageWriter, group_tables, module_name
+from supabase_pydantic.core.writers.pydantic import PydanticFastAPIWriter
+from supabase_pydantic.core.writers.sqlalchemy import SqlAlchemyFastAPIWriter
+from supabase_pydantic.db.models import ColumnInfo, ForeignKeyInfo, RelationshipInfo, TableInfo
+
+
+@pytest.fixture
+def tables():
+    """Return two tables connected by a foreign key, and an unrelated table with an enum column."""
+    return [
+        TableInfo(
+            name='authors',
+            schema='public',
+            columns=[
+                ColumnInfo(name='id', post_gres_datatype='integer', datatype='int', is_nullable=False, primary=True),
+                ColumnInfo(name='name', post_gres_datatype='text', datatype='str'),
+            ],
+        ),
+        TableInfo(
+            name='books',
+            schema='public',
+            columns=[
+                ColumnInfo(name='id', post_gres_datatype='integer', datatype='int', is_nullable=False, primary=True),
+                ColumnInfo(name='author_id', post_gres_datatype='integer', datatype='int', is_foreign_key=True),
+            ],
+            foreign_keys=[ForeignKeyInfo('books_author_id_fkey', 'author_id', 'authors', 'id')],
+        ),
+        TableInfo(
+            name='tags',
+            schema='public',
+            columns=[
+                ColumnInfo(name='id', post_gres_datatype='integer', datatype='int', is_nullable=False, primary=True),
+                ColumnInfo(
+                    name='color',
+                    post_gres_datatype='USER-DEFINED',
+                    datatype='color',
+                    enum_info=EnumInfo(name='color', values=['red', 'blue']),
+                ),
+            ],
+        ),
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.writers
+def test_group_tables(tables):
+    """Test that tables connected by foreign keys or relationships share a group, in table order."""
+    assert [[t.name for t in g] for g in group_tables(tables)] == [['authors', 'books'], ['tags']]
+
+    # Through another table, by relationship, and ignoring tables of other schemas or not generated
+    tables[2].relationships = [RelationshipInfo(table_name='tags', related_table_name='books')]
+    tables[0].foreign_keys = [ForeignKeyInfo('fk', 'id', 'tags', 'id', foreign_table_schema='other')]
+    tables.append(TableInfo(name='notes', schema='public', foreign_keys=[ForeignKeyInfo('fk', 'x', 'missing', 'id')]))
+    assert [[t.name for t in g] for g in group_tables(tables)] == [['authors', 'books', 'tags'], ['notes']]
+
+
+@pytest.mark.unit
+@pytest.mark.writers
+@pytest.mark.parametrize(
+    'table_name, expected',
+    [
+        ('users', 'users'),
+        ('UserProfiles', 'userprofiles'),
+        ('order-items', 'order_items'),
+        ('2fa_codes', 'table_2fa_codes'),
+        ('class', 'table_class'),
+        ('_base', 'table__base'),
+        ('Profiles', 'profiles_2'),
+    ],
+)
+def test_module_name(table_name, expected):
+    """Test that module names are importable, and unique without regard to case."""
+    assert module_name(table_name, {'_base', '_enums', 'profiles'}) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.writers
+@pytest.mark.pydantic
+def test_package_writer_pydantic_loads_modules_lazily(tables, tmp_path, monkeypatch):
+    """Test that the Pydantic package imports a table group's module only when one of its models is used."""
+    package = PackageWriter(PydanticFastAPIWriter(tables, str(tmp_path / 'lazy_pydantic_models.py')))
+    (tmp_path / 'lazy_pydantic_models').mkdir()
+    (tmp_path / 'lazy_pydantic_models' / 'dropped_table.py').write_text('')
+    paths = package.save()
+
+    directory = tmp_path / 'lazy_pydantic_models'
+    assert sorted(p.name for p in directory.iterdir()) == [
+        '__init__.py',
+        '_base.py',
+        '_enums.py',
+        'authors.py',
+        'tags.py',
+    ]
+    assert sorted(paths) == sorted(str(p) for p in directory.iterdir())
+    assert 'from ._enums import PublicColorEnum' in (directory / 'tags.py').read_text()
+    assert '_enums' not in (directory / 'authors.py').read_text()
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        models = importlib.import_module('lazy_pydantic_models')
+        assert 'lazy_pydantic_models.authors' not in sys.modules
+        assert models.BooksInsert(id=1, author_id=1).author_id == 1
+        assert 'lazy_pydantic_models.authors' in sys.modules
+        assert 'lazy_pydantic_models.tags' not in sys.modules
+        assert models.Tags(id=1, color='red').color is models.PublicColorEnum.RED
+        assert {'Authors', 'Books', 'CustomModel', 'PublicColorEnum'} <= set(dir(models))
+        with pytest.raises(AttributeError, match='Missing'):
+            models.Missing
+    finally:
+        for name in [m for m in sys.modules if m.split('.')[0] == 'lazy_pydantic_models']:
+            del sys.modules[name]
+
+
+@pytest.mark.unit
+@pytest.mark.writers
+@pytest.mark.sqlalchemy
+def test_package_writer_sqlalchemy(tables, tmp_path):
+    """Test that the SQLAlchemy package shares the declarative base and enums between its modules."""
+    paths = PackageWriter(SqlAlchemyFastAPIWriter(tables, str(tmp_path / 'database_public.py'))).save()
+
+    directory = tmp_path / 'database_public'
+    assert [p.rsplit('/', 1)[-1] for p in paths] == ['_enums.py', '_base.py', 'authors.py', 'tags.py', '__init__.py']
+    assert 'class Base(DeclarativeBase)' in (directory / '_base.py').read_text()
+    authors = (directory / 'authors.py').read_text()
+    assert 'from ._base import Base\n' in authors
+    assert 'class Authors(Base)' in authors and 'class Books(Base)' in authors
+    assert 'class Base(' not in authors
+    assert 'from ._enums import PublicColorEnum' in (directory / 'tags.py').read_text()
+    init = (directory / '__init__.py').read_text()
+    assert "'Base': '_base'" in init and "'PublicColorEnum': '_enums'" in init and "'TagsInsert': 'tags'" in init
+    for path in paths:
+        compile((tmp_path / path).read_text(), path, 'exec')
@@ -578,6 +578,20 @@ def test_PydanticFastAPIWriter_write(fastapi_file_writer):
     assert fastapi_file_writer.write() == expected_output
 
 
+@pytest.mark.unit
+@pytest.mark.writers
+@pytest.mark.pydantic
+def test_PydanticFastAPIWriter_write_chunks_streams_classes(fastapi_file_writer):
+    """Validate that classes are rendered one at a time, as the chunks are consumed."""
+    chunks = fastapi_file_writer.iter_base_classes()
+    assert next(chunks).startswith('# BASE CLASSES')
+    assert next(chunks) == fastapi_file_writer.jstr
+    assert next(chunks).startswith('class ')
+
+    assert ''.join(fastapi_file_writer.write_chunks()) == fastapi_file_writer.write()
+    assert len(list(fastapi_file_writer.write_chunks())) > len(fastapi_file_writer.tables) * 4
+
+
 @pytest.mark.unit
 @pytest.mark.writers
 @pytest.mark.pydantic
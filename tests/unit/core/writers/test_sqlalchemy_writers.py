@@ -420,3 +420,15 @@ def test_SqlAlchemyFastAPIWriter_write(fastapi_writer):
     assert 'class UserUpdate(Base):' in output
     assert '"""User Update model."""' in output
     assert 'id: Mapped[int | None] = mapped_column(Integer, nullable=True)' in output
+
+
+@pytest.mark.unit
+@pytest.mark.writers
+@pytest.mark.sqlalchemy
+def test_SqlAlchemyFastAPIWriter_streams_operational_classes(fastapi_writer):
+    """Verify the Insert and Update models stream a class at a time and match the joined output."""
+    chunks = list(fastapi_writer.iter_operational_classes())
+    assert chunks[0].startswith('# Insert Models')
+    assert '\n\n' in chunks
+    assert ''.join(chunks) == fastapi_writer.write_operational_classes()
+    assert ''.join(fastapi_writer.write_chunks()) == fastapi_writer.write()
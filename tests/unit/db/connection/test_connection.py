@@ -82,8 +82,9 @@ def test_create_postgres_connector(mock_psycopg2):
 @pytest.mark.unit
 @pytest.mark.db
 @pytest.mark.connection
-def test_postgres_connector_operational_error():
+def test_postgres_connector_operational_error(monkeypatch):
     """Test that PostgreSQL OperationalError is caught and re-raised as ConnectionError."""
+    monkeypatch.setattr('supabase_pydantic.db.abstract.base_connector.time.sleep', lambda seconds: None)
     error_message = 'unable to connect to the database'
     # Mock the psycopg2.connect function
     with patch(
@@ -239,8 +240,9 @@ def test_create_mysql_connector(mock_mysql_connector):
 @pytest.mark.unit
 @pytest.mark.db
 @pytest.mark.connection
-def test_mysql_connector_operational_error():
+def test_mysql_connector_operational_error(monkeypatch):
     """Test that MySQL OperationalError is handled properly in normal and debug modes."""
+    monkeypatch.setattr('supabase_pydantic.db.abstract.base_connector.time.sleep', lambda seconds: None)
     error_message = 'unable to connect to the database'
     # Mock the mysql.connector.connect function
     with patch(
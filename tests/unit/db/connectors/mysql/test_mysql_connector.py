@@ -4,7 +4,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from supabase_pydantic.db.models import MySQLConnectionParams
+from supabase_pydantic.db.models import ConnectionOptions, MySQLConnectionParams
 from supabase_pydantic.db.connectors.mysql.connector import MySQLConnector
 
 
@@ -281,6 +281,37 @@ class TestMySQLConnector:
         # Verify connection was closed after checking
         mock_conn.close.assert_called_once()
 
+    def test_check_connection_probes_given_connection(self, mock_mysql_connect):
+        """Test that checking an open connection runs a probe on it instead of connecting again."""
+        mock_connect_fn, mock_conn, mock_cursor = mock_mysql_connect
+        connector = MySQLConnector(
+            connection_params=MySQLConnectionParams(
+                dbname='testdb', user='root', password='mysql', host='localhost', port='3306'
+            )
+        )
+
+        assert connector.check_connection(mock_conn) is True
+
+        mock_connect_fn.assert_not_called()
+        mock_cursor.execute.assert_called_once_with('SELECT 1')
+        mock_conn.close.assert_not_called()
+
+    def test_connection_options(self, mock_mysql_connect):
+        """Test that connection options set the connect timeout and the session's statement timeout."""
+        mock_connect_fn, _, mock_cursor = mock_mysql_connect
+        connector = MySQLConnector(
+            connection_params=MySQLConnectionParams(
+                dbname='testdb', user='root', password='mysql', host='localhost', port='3306'
+            ),
+            connection_options=ConnectionOptions(connect_timeout=5, statement_timeout=30),
+        )
+
+        connector.connect()
+
+        assert mock_connect_fn.call_args.kwargs['connection_timeout'] == 5
+        assert 'connection_options' not in connector.connection_params
+        mock_cursor.execute.assert_called_once_with('SET SESSION max_execution_time = 30000')
+
     def test_check_connection_failure(self):
         """Test failed connection check when connect raises an exception."""
         connector = MySQLConnector(
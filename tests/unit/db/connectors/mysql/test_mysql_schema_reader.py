@@ -6,25 +6,41 @@ import pytest
 
 from supabase_pydantic.db.connectors.mysql.connector import MySQLConnector
 from supabase_pydantic.db.connectors.mysql.schema_reader import MySQLSchemaReader
+from supabase_pydantic.db.drivers.mysql.queries import (
+    BATCH_COLUMNS_QUERY,
+    BATCH_CONSTRAINTS_QUERY,
+    BATCH_FOREIGN_KEYS_QUERY,
+    BATCH_TABLES_QUERY,
+)
 
 
 @pytest.fixture
 def mock_mysql_connection():
-    """Mock MySQL connection with dictionary cursor support."""
+    """Mock MySQL connection with a tuple cursor."""
     mock_conn = MagicMock()
     mock_cursor = MagicMock()
     mock_conn.cursor.return_value = mock_cursor
 
-    # Configure cursor to return dictionary results by default
-    def dict_cursor(**kwargs):
-        # Ensure the dictionary=True parameter works
-        if kwargs.get('dictionary', False):
-            mock_cursor.description = [('column1',), ('column2',)]
-        return mock_cursor
+    return mock_conn, mock_cursor
 
-    mock_conn.cursor = MagicMock(side_effect=dict_cursor)
 
-    return mock_conn, mock_cursor
+def column_row(table_name, column_name, data_type, column_type=None):
+    """Create a row of the all-columns query, in the field order of COLUMN_ROW."""
+    return (
+        'testschema',
+        table_name,
+        column_name,
+        None,
+        'YES',
+        data_type,
+        None,
+        'BASE TABLE',
+        None,
+        data_type,
+        None,
+        '',
+        column_type or data_type,
+    )
 
 
 @pytest.fixture
@@ -44,7 +60,7 @@ class TestMySQLSchemaReader:
         mock_conn, mock_cursor = mock_mysql_connection
 
         # Set up mock cursor to return specific results
-        expected_results = [{'id': 1, 'name': 'Row 1'}, {'id': 2, 'name': 'Row 2'}]
+        expected_results = [(1, 'Row 1'), (2, 'Row 2')]
         mock_cursor.fetchall.return_value = expected_results
 
         # Execute query without parameters
@@ -58,8 +74,8 @@ class TestMySQLSchemaReader:
         # Verify results are returned correctly
         assert results == expected_results
 
-        # Verify cursor was properly created and closed
-        mock_conn.cursor.assert_called_once()
+        # Verify a tuple cursor was created and closed
+        mock_conn.cursor.assert_called_once_with()
         mock_cursor.close.assert_called_once()
 
     def test_execute_query_with_params(self, schema_reader, mock_mysql_connection):
@@ -67,7 +83,7 @@ class TestMySQLSchemaReader:
         mock_conn, mock_cursor = mock_mysql_connection
 
         # Set up mock cursor to return results
-        expected_results = [{'id': 1, 'name': 'Test'}]
+        expected_results = [(1, 'Test')]
         mock_cursor.fetchall.return_value = expected_results
 
         # Execute query with parameters
@@ -122,7 +138,7 @@ class TestMySQLSchemaReader:
         mock_conn, mock_cursor = mock_mysql_connection
 
         # Mock the execute_query method to return specific results
-        schema_data = [{'SCHEMA_NAME': 'schema1'}, {'SCHEMA_NAME': 'schema2'}]
+        schema_data = [('schema1',), ('schema2',)]
 
         with patch.object(schema_reader, 'execute_query', return_value=schema_data):
             schemas = schema_reader.get_schemas(mock_conn)
@@ -155,17 +171,14 @@ class TestMySQLSchemaReader:
         mock_conn, _ = mock_mysql_connection
 
         # Mock the execute_query method to return specific results
-        table_data = [
-            {'table_name': 'table1', 'table_type': 'BASE TABLE'},
-            {'table_name': 'table2', 'table_type': 'BASE TABLE'},
-        ]
+        table_data = [('table1',), ('table2',)]
 
         with patch.object(schema_reader, 'execute_query', return_value=table_data):
             tables = schema_reader.get_tables(mock_conn, 'testschema')
 
             assert len(tables) == 2
-            assert tables[0]['table_name'] == 'table1'
-            assert tables[1]['table_name'] == 'table2'
+            assert tables[0][0] == 'table1'
+            assert tables[1][0] == 'table2'
 
     def test_get_tables_empty_result(self, schema_reader, mock_mysql_connection):
         """Test retrieving tables when there are no results."""
@@ -194,17 +207,17 @@ class TestMySQLSchemaReader:
 
         # Mock the execute_query method to return specific results
         column_data = [
-            {'table_name': 'table1', 'column_name': 'id', 'data_type': 'int'},
-            {'table_name': 'table1', 'column_name': 'name', 'data_type': 'varchar'},
-            {'table_name': 'table2', 'column_name': 'id', 'data_type': 'int'},
+            column_row('table1', 'id', 'int'),
+            column_row('table1', 'name', 'varchar'),
+            column_row('table2', 'id', 'int'),
         ]
 
         with patch.object(schema_reader, 'execute_query', return_value=column_data):
             columns = schema_reader.get_columns(mock_conn, 'testschema')
 
             assert len(columns) == 3
-            assert columns[0]['table_name'] == 'table1'
-            assert columns[0]['column_name'] == 'id'
+            assert columns[0][1] == 'table1'
+            assert columns[0][2] == 'id'
 
     def test_get_columns_for_specific_table(self, schema_reader, mock_mysql_connection):
         """Test retrieving columns for a specific table."""
@@ -212,16 +225,16 @@ class TestMySQLSchemaReader:
 
         # Mock the execute_query method to return specific results
         column_data = [
-            {'table_name': 'table1', 'column_name': 'id', 'data_type': 'int'},
-            {'table_name': 'table1', 'column_name': 'name', 'data_type': 'varchar'},
+            ('id', 'int', None, 'NO', None, 'int', 'IDENTITY'),
+            ('name', 'varchar', None, 'YES', 255, 'varchar(255)', None),
         ]
 
         with patch.object(schema_reader, 'execute_query', return_value=column_data):
             columns = schema_reader.get_columns(mock_conn, 'testschema', 'table1')
 
             assert len(columns) == 2
-            assert columns[0]['table_name'] == 'table1'
-            assert columns[1]['column_name'] == 'name'
+            assert columns[0][0] == 'id'
+            assert columns[1][0] == 'name'
 
     def test_get_columns_exception_handling(self, schema_reader, mock_mysql_connection):
         """Test that get_columns handles exceptions gracefully."""
@@ -240,16 +253,18 @@ class TestMySQLSchemaReader:
 
         # Mock the execute_query method to return specific results
         constraint_data = [
-            {'table_name': 'table1', 'constraint_name': 'pk_table1', 'constraint_type': 'PRIMARY KEY'},
-            {'table_name': 'table1', 'constraint_name': 'unique_name', 'constraint_type': 'UNIQUE'},
+            ('pk_table1', 'table1', 'id', 'PRIMARY KEY', 'PRIMARY KEY (id)'),
+            ('unique_name', 'table1', 'first,last', 'UNIQUE', 'UNIQUE (first,last)'),
         ]
 
         with patch.object(schema_reader, 'execute_query', return_value=constraint_data):
             constraints = schema_reader.get_constraints(mock_conn, 'testschema')
 
-            assert len(constraints) == 2
-            assert constraints[0]['constraint_name'] == 'pk_table1'
-            assert constraints[1]['constraint_type'] == 'UNIQUE'
+            # The constrained columns are split into a list
+            assert constraints == [
+                ('pk_table1', 'table1', ['id'], 'PRIMARY KEY', 'PRIMARY KEY (id)'),
+                ('unique_name', 'table1', ['first', 'last'], 'UNIQUE', 'UNIQUE (first,last)'),
+            ]
 
     def test_get_constraints_exception_handling(self, schema_reader, mock_mysql_connection):
         """Test that get_constraints handles exceptions gracefully."""
@@ -268,28 +283,14 @@ class TestMySQLSchemaReader:
 
         # Mock the execute_query method to return specific results
         fk_data = [
-            {
-                'constraint_name': 'fk_posts_user',
-                'source_table': 'posts',
-                'source_column': 'user_id',
-                'target_table': 'users',
-                'target_column': 'id',
-            },
-            {
-                'constraint_name': 'fk_comments_post',
-                'source_table': 'comments',
-                'source_column': 'post_id',
-                'target_table': 'posts',
-                'target_column': 'id',
-            },
+            ('testschema', 'posts', 'user_id', 'testschema', 'users', 'id', 'fk_posts_user'),
+            ('testschema', 'comments', 'post_id', 'testschema', 'posts', 'id', 'fk_comments_post'),
         ]
 
         with patch.object(schema_reader, 'execute_query', return_value=fk_data):
             foreign_keys = schema_reader.get_foreign_keys(mock_conn, 'testschema')
 
-            assert len(foreign_keys) == 2
-            assert foreign_keys[0]['constraint_name'] == 'fk_posts_user'
-            assert foreign_keys[1]['source_table'] == 'comments'
+            assert foreign_keys == fk_data
 
     def test_get_foreign_keys_exception_handling(self, schema_reader, mock_mysql_connection):
         """Test that get_foreign_keys handles exceptions gracefully."""
@@ -303,37 +304,22 @@ class TestMySQLSchemaReader:
             assert foreign_keys == []
 
     def test_get_user_defined_types(self, schema_reader, mock_mysql_connection):
-        """Test retrieving user-defined types (enums) from a schema."""
+        """Test that enum types are derived from the column types of the schema."""
         mock_conn, _ = mock_mysql_connection
 
-        # Raw enum data from database
-        enum_data = [
-            {
-                'table_name': 'users',
-                'column_name': 'status',
-                'data_type': 'enum',
-                'enum_values': "'active','inactive','pending'",
-            },
-            {
-                'table_name': 'posts',
-                'column_name': 'visibility',
-                'data_type': 'enum',
-                'enum_values': "'public','private','draft'",
-            },
+        column_data = [
+            column_row('users', 'id', 'int'),
+            column_row('users', 'status', 'enum', "enum('active','inactive','pending')"),
+            column_row('posts', 'visibility', 'enum', "enum('public','it''s private')"),
         ]
 
-        # Mock the parse_mysql_enum_values method to properly process enum values
-        with patch.object(schema_reader, 'execute_query', return_value=enum_data):
-            with patch.object(
-                schema_reader,
-                'parse_mysql_enum_values',
-                side_effect=[['active', 'inactive', 'pending'], ['public', 'private', 'draft']],
-            ):
-                enums = schema_reader.get_user_defined_types(mock_conn, 'testschema')
+        with patch.object(schema_reader, 'execute_query', return_value=column_data):
+            enums = schema_reader.get_user_defined_types(mock_conn, 'testschema')
 
-                assert len(enums) == 2
-                assert enums[0]['enum_values'] == ['active', 'inactive', 'pending']
-                assert enums[1]['enum_values'] == ['public', 'private', 'draft']
+        assert enums == [
+            ('status_enum', 'testschema', 'mysql_user', 'E', True, 'e', ['active', 'inactive', 'pending']),
+            ('visibility_enum', 'testschema', 'mysql_user', 'E', True, 'e', ['public', "it's private"]),
+        ]
 
     def test_get_user_defined_types_exception_handling(self, schema_reader, mock_mysql_connection):
         """Test that get_user_defined_types handles exceptions gracefully."""
@@ -347,21 +333,41 @@ class TestMySQLSchemaReader:
             assert udts == []
 
     def test_get_type_mappings(self, schema_reader, mock_mysql_connection):
-        """Test retrieving type mappings from a schema."""
+        """Test that ENUM and SET columns are mapped to their types."""
         mock_conn, _ = mock_mysql_connection
 
-        # Mock the execute_query method to return specific results
-        type_data = [
-            {'type_name': 'int', 'data_type': 'integer'},
-            {'type_name': 'varchar', 'data_type': 'character varying'},
+        column_data = [
+            column_row('users', 'id', 'int'),
+            column_row('users', 'status', 'enum', "enum('a','b')"),
+            column_row('posts', 'tags', 'set', "set('x','y')"),
+        ]
+
+        with patch.object(schema_reader, 'execute_query', return_value=column_data):
+            type_mappings = schema_reader.get_type_mappings(mock_conn, 'testschema')
+
+        assert type_mappings == [
+            ('status', 'users', 'testschema', 'enum', 'e', 'Enum'),
+            ('tags', 'posts', 'testschema', 'set', 's', 'Set'),
         ]
 
-        with patch.object(schema_reader, 'execute_query', return_value=type_data):
+    def test_columns_are_scanned_once_per_schema(self, schema_reader, mock_mysql_connection):
+        """Test that enum types and type mappings reuse the rows read by get_columns."""
+        mock_conn, _ = mock_mysql_connection
+
+        column_data = [column_row('users', 'status', 'enum', "enum('a','b')")]
+
+        with patch.object(schema_reader, 'execute_query', return_value=column_data) as mock_execute:
+            schema_reader.get_columns(mock_conn, 'testschema')
+            enums = schema_reader.get_user_defined_types(mock_conn, 'testschema')
             type_mappings = schema_reader.get_type_mappings(mock_conn, 'testschema')
+            assert mock_execute.call_count == 1
+
+            # The cached rows are released once the type mappings are read
+            schema_reader.get_user_defined_types(mock_conn, 'testschema')
+            assert mock_execute.call_count == 2
 
-            assert len(type_mappings) == 2
-            assert type_mappings[0]['type_name'] == 'int'
-            assert type_mappings[1]['data_type'] == 'character varying'
+        assert enums[0][-1] == ['a', 'b']
+        assert type_mappings[0][0] == 'status'
 
     def test_get_type_mappings_exception_handling(self, schema_reader, mock_mysql_connection):
         """Test that get_type_mappings handles exceptions gracefully."""
@@ -373,3 +379,87 @@ class TestMySQLSchemaReader:
 
             # Should return empty list on exception
             assert type_mappings == []
+
+    def test_read_catalogs_partitions_batched_rows(self, schema_reader, mock_mysql_connection):
+        """Test that several schemas are read with one query per result set and split by schema."""
+        mock_conn, _ = mock_mysql_connection
+        tenant_a = (
+            'tenant_a',
+            'users',
+            'status',
+            None,
+            'YES',
+            'enum',
+            1,
+            'BASE TABLE',
+            None,
+            'enum',
+            None,
+            '',
+            "enum('a')",
+        )
+        tenant_b = (
+            'tenant_b',
+            'users',
+            'id',
+            None,
+            'NO',
+            'int',
+            None,
+            'BASE TABLE',
+            'IDENTITY',
+            'int',
+            None,
+            '',
+            'int',
+        )
+        fk = ('tenant_b', 'posts', 'user_id', 'tenant_b', 'users', 'id', 'fk_posts_user')
+        results = {
+            BATCH_TABLES_QUERY: [('tenant_a', 'users'), ('tenant_b', 'users'), ('tenant_b', 'posts')],
+            BATCH_COLUMNS_QUERY: [tenant_a, tenant_b],
+            BATCH_CONSTRAINTS_QUERY: [('tenant_b', 'PRIMARY', 'users', 'id', 'PRIMARY KEY', 'PRIMARY KEY (id)')],
+            BATCH_FOREIGN_KEYS_QUERY: [fk],
+        }
+        placeholders = '%s, %s'
+
+        def execute_query(connection, query, params):
+            assert params == {'schema_0': 'tenant_a', 'schema_1': 'tenant_b'}
+            template = next(t for t in results if t.format(schemas=placeholders) == query)
+            return results[template]
+
+        with patch.object(schema_reader, 'execute_query', side_effect=execute_query) as mock_execute:
+            catalogs = schema_reader.read_catalogs(mock_conn, ['tenant_a', 'tenant_b'])
+
+        assert mock_execute.call_count == 4
+        assert catalogs['tenant_a'].tables == [('users',)]
+        assert catalogs['tenant_a'].columns == [tenant_a]
+        assert catalogs['tenant_a'].user_defined_types == [
+            ('status_enum', 'tenant_a', 'mysql_user', 'E', True, 'e', ['a'])
+        ]
+        assert catalogs['tenant_a'].type_mappings == [('status', 'users', 'tenant_a', 'enum', 'e', 'Enum')]
+        assert catalogs['tenant_a'].foreign_keys == []
+        assert catalogs['tenant_b'].tables == [('users',), ('posts',)]
+        assert catalogs['tenant_b'].constraints == [('PRIMARY', 'users', ['id'], 'PRIMARY KEY', 'PRIMARY KEY (id)')]
+        assert catalogs['tenant_b'].foreign_keys == [fk]
+        assert catalogs['tenant_b'].user_defined_types == []
+
+    def test_read_catalogs_splits_large_schema_lists(self, schema_reader, mock_mysql_connection):
+        """Test that schema lists longer than the batch size are read in several batches."""
+        mock_conn, _ = mock_mysql_connection
+
+        with (
+            patch('supabase_pydantic.db.connectors.mysql.schema_reader.SCHEMA_BATCH_SIZE', 2),
+            patch.object(schema_reader, 'execute_query', return_value=[]) as mock_execute,
+        ):
+            catalogs = schema_reader.read_catalogs(mock_conn, ['a', 'b', 'c'])
+
+        assert list(catalogs) == ['a', 'b', 'c']
+        assert mock_execute.call_count == 8
+        assert mock_execute.call_args.args[2] == {'schema_0': 'c'}
+
+    def test_read_catalogs_returns_none_on_failure(self, schema_reader, mock_mysql_connection):
+        """Test that a failed batched query leaves the schemas to be read one by one."""
+        mock_conn, _ = mock_mysql_connection
+
+        with patch.object(schema_reader, 'execute_query', side_effect=Exception('Query failed')):
+            assert schema_reader.read_catalogs(mock_conn, ['a', 'b']) is None
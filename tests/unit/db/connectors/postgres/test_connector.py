@@ -5,7 +5,7 @@ from unittest.mock import patch, Mock
 import psycopg2
 
 from supabase_pydantic.db.connectors.postgres.connector import PostgresConnector
-from supabase_pydantic.db.models import PostgresConnectionParams
+from supabase_pydantic.db.models import ConnectionOptions, PostgresConnectionParams
 
 
 @pytest.fixture
@@ -246,7 +246,16 @@ def test_create_connection(connector):
 
         # Verify psycopg2.connect was called with correct parameters
         mock_connect.assert_called_once_with(
-            dbname='testdb', user='testuser', password='testpass', host='localhost', port='5432'
+            dbname='testdb',
+            user='testuser',
+            password='testpass',
+            host='localhost',
+            port='5432',
+            connect_timeout=10,
+            keepalives=1,
+            keepalives_idle=30,
+            keepalives_interval=10,
+            keepalives_count=3,
         )
         assert conn == mock_conn
 
@@ -386,3 +395,144 @@ def test_close_connection():
 
     # Verify close was called
     mock_conn.close.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_consistent_read_exports_snapshot():
+    """Test that a consistent read runs in a read-only transaction and restores autocommit."""
+    connector = PostgresConnector()
+    mock_conn = Mock(autocommit=False, closed=0)
+    mock_cursor = mock_conn.cursor.return_value
+    mock_cursor.fetchone.return_value = ('00000003-0000001B-1',)
+
+    with connector.consistent_read(mock_conn, export=True) as snapshot:
+        assert snapshot == '00000003-0000001B-1'
+        assert mock_conn.autocommit is True
+
+    mock_conn.rollback.assert_called_once()
+    statements = [c.args[0] for c in mock_cursor.execute.call_args_list]
+    assert statements == [
+        'BEGIN ISOLATION LEVEL REPEATABLE READ READ ONLY;',
+        'SELECT pg_export_snapshot();',
+        'ROLLBACK;',
+    ]
+    assert mock_conn.autocommit is False
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_consistent_read_imports_snapshot():
+    """Test that a consistent read reads from a snapshot exported by another connection."""
+    connector = PostgresConnector()
+    mock_conn = Mock(autocommit=True, closed=0)
+    mock_cursor = mock_conn.cursor.return_value
+
+    with connector.consistent_read(mock_conn, snapshot='00000003-0000001B-1') as snapshot:
+        assert snapshot is None
+
+    mock_conn.rollback.assert_not_called()
+    assert mock_cursor.execute.call_args_list[1].args == ('SET TRANSACTION SNAPSHOT %s;', ('00000003-0000001B-1',))
+    assert mock_conn.autocommit is True
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_consistent_read_without_export_support():
+    """Test that the read stays in one transaction when the snapshot cannot be exported."""
+    connector = PostgresConnector()
+    mock_conn = Mock(autocommit=True, closed=0)
+    mock_cursor = mock_conn.cursor.return_value
+    mock_cursor.execute.side_effect = [None, psycopg2.Error('cannot export a snapshot'), None, None, None]
+
+    with connector.consistent_read(mock_conn, export=True) as snapshot:
+        assert snapshot is None
+
+    statements = [c.args[0] for c in mock_cursor.execute.call_args_list]
+    assert statements == [
+        'BEGIN ISOLATION LEVEL REPEATABLE READ READ ONLY;',
+        'SELECT pg_export_snapshot();',
+        'ROLLBACK;',
+        'BEGIN ISOLATION LEVEL REPEATABLE READ READ ONLY;',
+        'ROLLBACK;',
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_create_connection_with_connection_options():
+    """Test that connection options become libpq timeouts, and disabled keepalives are left out."""
+    connector = PostgresConnector(
+        connection_options=ConnectionOptions(connect_timeout=2.5, statement_timeout=1.5, keepalives_idle=None)
+    )
+    with patch('psycopg2.connect') as mock_connect:
+        connector._create_connection('testdb', 'testuser', 'testpass', 'localhost', '5432')
+
+    kwargs = mock_connect.call_args.kwargs
+    assert kwargs['connect_timeout'] == 3
+    assert kwargs['options'] == '-c statement_timeout=1500'
+    assert 'keepalives' not in kwargs
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_open_connection_retries_with_backoff(valid_connection_params):
+    """Test that failed connection attempts are retried with exponential backoff, then re-raised."""
+    connector = PostgresConnector(valid_connection_params, connection_options=ConnectionOptions(retries=2, backoff=0.5))
+    mock_conn = Mock()
+    with (
+        patch.object(
+            connector, 'connect', side_effect=[ConnectionError('timeout'), ConnectionError('timeout'), mock_conn]
+        ),
+        patch('supabase_pydantic.db.abstract.base_connector.time.sleep') as mock_sleep,
+    ):
+        assert connector.open_connection() is mock_conn
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
+
+    with (
+        patch.object(connector, 'connect', side_effect=ConnectionError('refused')),
+        patch('supabase_pydantic.db.abstract.base_connector.time.sleep'),
+    ):
+        with pytest.raises(ConnectionError, match='refused'):
+            connector.open_connection()
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.parametrize(
+    'port, pooler, pooled',
+    [('6543', None, True), ('5432', None, False), ('5432', True, True), ('6543', False, False)],
+)
+def test_create_connection_detects_pooler(port, pooler, pooled):
+    """Test that the pooler is detected from its port unless set, and gets no startup options."""
+    connector = PostgresConnector(connection_options=ConnectionOptions(statement_timeout=1.5, pooler=pooler))
+    with patch('psycopg2.connect') as mock_connect:
+        connector._create_connection('testdb', 'testuser', 'testpass', 'localhost', port)
+
+    assert connector.pooled is pooled
+    assert ('options' not in mock_connect.call_args.kwargs) is pooled
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_consistent_read_behind_pooler():
+    """Test that behind a pooler no snapshot is shared, and a transaction only scopes the timeout."""
+    connector = PostgresConnector(connection_options=ConnectionOptions(statement_timeout=1.5, pooler=True))
+    mock_conn = Mock(autocommit=True, closed=0)
+    mock_cursor = mock_conn.cursor.return_value
+
+    with connector.consistent_read(mock_conn, export=True) as snapshot:
+        assert snapshot is None
+
+    assert [c.args for c in mock_cursor.execute.call_args_list] == [
+        ('BEGIN ISOLATION LEVEL REPEATABLE READ READ ONLY;',),
+        ('SET LOCAL statement_timeout = %s;', (1500,)),
+        ('ROLLBACK;',),
+    ]
+
+    connector = PostgresConnector(connection_options=ConnectionOptions(pooler=True))
+    mock_conn = Mock(autocommit=False, closed=0)
+    with connector.consistent_read(mock_conn) as snapshot:
+        assert mock_conn.autocommit is True
+    mock_conn.cursor.return_value.execute.assert_not_called()
+    assert mock_conn.autocommit is False
@@ -4,16 +4,25 @@ import pytest
 from unittest.mock import MagicMock, patch
 
 from supabase_pydantic.db.abstract.base_connector import BaseDBConnector
+from supabase_pydantic.db.connectors.postgres.connector import PostgresConnector
 from supabase_pydantic.db.connectors.postgres.schema_reader import PostgresSchemaReader
 from supabase_pydantic.db.drivers.postgres.queries import (
+    CATALOG_QUERY,
+    CATALOG_QUERY_SCHEMA_PARAMS,
     GET_ALL_PUBLIC_TABLES_AND_COLUMNS,
     GET_COLUMN_TO_USER_DEFINED_TYPE_MAPPING,
     GET_CONSTRAINTS,
     GET_ENUM_TYPES,
     GET_TABLE_COLUMN_DETAILS,
+    RELATION_COLUMNS_QUERY,
+    RELATION_CONSTRAINTS_QUERY,
+    RELATION_FOREIGN_KEYS_QUERY,
+    RELATION_TABLES_QUERY,
+    RELATION_TYPE_MAPPING_QUERY,
     SCHEMAS_QUERY,
     TABLES_QUERY,
 )
+from supabase_pydantic.db.models import ConnectionOptions
 
 
 @pytest.fixture
@@ -280,3 +289,80 @@ def test_get_type_mappings_non_list_result(schema_reader, mock_connector):
 
     # Verify result
     assert result == []
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.parametrize(
+    'method, query',
+    [
+        ('get_tables', RELATION_TABLES_QUERY),
+        ('get_columns', RELATION_COLUMNS_QUERY),
+        ('get_constraints', RELATION_CONSTRAINTS_QUERY),
+        ('get_foreign_keys', RELATION_FOREIGN_KEYS_QUERY),
+        ('get_type_mappings', RELATION_TYPE_MAPPING_QUERY),
+    ],
+)
+def test_per_table_methods_read_only_given_tables(schema_reader, mock_connector, method, query):
+    """Test that passing tables runs the restricted query with the table names as a parameter."""
+    mock_conn = MagicMock()
+    mock_connector.execute_query.return_value = []
+
+    getattr(schema_reader, method)(mock_conn, 'public', tables=('users', 'posts'))
+
+    mock_connector.execute_query.assert_called_once_with(mock_conn, query, ('public', ['users', 'posts']))
+    assert query.count('%s') == 2
+    assert method.removeprefix('get_') in PostgresSchemaReader.relation_positions
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_get_referenced_tables(schema_reader, mock_connector):
+    """Test that only tables of the same schema referenced by the given tables are returned."""
+    mock_conn = MagicMock()
+    mock_connector.execute_query.return_value = [
+        ('public', 'posts', 'author_id', 'public', 'users', 'id', 'posts_author_id_fkey'),
+        ('public', 'posts', 'tenant_id', 'auth', 'tenants', 'id', 'posts_tenant_id_fkey'),
+    ]
+
+    assert schema_reader.get_referenced_tables(mock_conn, 'public', ['posts']) == {'users'}
+    mock_connector.execute_query.assert_called_once_with(mock_conn, RELATION_FOREIGN_KEYS_QUERY, ('public', ['posts']))
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_read_catalogs_behind_pooler():
+    """Test that behind a pooler every schema is read with one statement, and its rows partitioned."""
+    connector = PostgresConnector(connection_options=ConnectionOptions(pooler=True))
+    reader = PostgresSchemaReader(connector)
+    mock_conn = MagicMock()
+    row = (
+        [['public', {'table_name': 'users'}], ['auth', {'table_name': 'sessions'}]],
+        [['public', {'table_schema': 'public', 'table_name': 'users', 'column_name': 'id'}]],
+        None,
+        None,
+        [{'type_name': 'mood', 'namespace': 'public', 'enum_values': ['happy', 'sad']}],
+        [{'column_name': 'mood', 'table_name': 'users'}],
+    )
+
+    with patch.object(connector, 'execute_query', return_value=[row]) as mock_execute:
+        assert reader.batches_single_schema()
+        catalogs = reader.read_catalogs(mock_conn, ['public', 'auth'])
+
+    mock_execute.assert_called_once_with(mock_conn, CATALOG_QUERY, (['public', 'auth'],) * 4)
+    assert CATALOG_QUERY.count('%s') == CATALOG_QUERY_SCHEMA_PARAMS
+    assert catalogs['public'].tables == [('users',)]
+    assert catalogs['auth'].tables == [('sessions',)]
+    assert catalogs['public'].columns == [('public', 'users', 'id')]
+    assert catalogs['auth'].columns == [] and catalogs['auth'].constraints == []
+    assert catalogs['auth'].user_defined_types == [('mood', 'public', ['happy', 'sad'])]
+    assert catalogs['public'].type_mappings == [('mood', 'users')]
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_read_catalogs_without_pooler(schema_reader, mock_connector):
+    """Test that without a pooler the schemas are left to be read one by one."""
+    assert not schema_reader.batches_single_schema()
+    assert schema_reader.read_catalogs(MagicMock(), ['public', 'auth']) is None
+    mock_connector.execute_query.assert_not_called()
@@ -0,0 +1,121 @@
+"""Tests for catalog snapshots and the 'catalog' source backend."""
+
+import gzip
+import json
+from decimal import Decimal
+
+import pytest
+
+from supabase_pydantic.db.builder import DatabaseBuilder, construct_tables
+from supabase_pydantic.db.connectors.snapshot.connector import CatalogFileConnector
+from supabase_pydantic.db.connectors.snapshot.schema_reader import CatalogFileSchemaReader
+from supabase_pydantic.db.constants import DatabaseConnectionType
+from supabase_pydantic.db.database_type import DatabaseType
+from supabase_pydantic.db.factory import CATALOG_FILE_BACKEND, SQL_FILE_BACKEND
+from supabase_pydantic.db.models import CatalogFileConnectionParams, SchemaCatalog
+from supabase_pydantic.db.snapshot import (
+    SNAPSHOT_FORMAT,
+    read_catalog_snapshot,
+    read_snapshot_header,
+    write_catalog_snapshot,
+)
+
+
+@pytest.fixture
+def catalogs():
+    """Raw result sets for two schemas, as a PostgreSQL schema reader returns them."""
+    return {
+        'public': SchemaCatalog(
+            tables=[('users',)],
+            columns=[('public', 'users', 'id', None, 'NO', 'integer', None, 'BASE TABLE', None, 'int4', None, None)],
+            constraints=[('users_pkey', 'users', ['id'], 'p', 'PRIMARY KEY (id)')],
+            user_defined_types=[('role', 'public', 'postgres', 'E', True, 'e', ['admin', 'member'])],
+        ),
+        'auth': SchemaCatalog(tables=[('tokens',)]),
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.parametrize('name', ['catalog.jsonl', 'catalog.jsonl.gz'])
+def test_snapshot_round_trip(tmp_path, catalogs, name):
+    """Test that a snapshot restores every result set, with rows as tuples, compressed or not."""
+    path = tmp_path / name
+    write_catalog_snapshot(path, catalogs, DatabaseType.POSTGRES)
+
+    assert path.read_bytes().startswith(b'\x1f\x8b') == name.endswith('.gz')
+    assert read_snapshot_header(path)['db_type'] == 'postgres'
+    snapshot = read_catalog_snapshot(path)
+    assert snapshot.db_type == 'postgres'
+    assert snapshot.catalogs == catalogs
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_snapshot_converts_driver_values(tmp_path):
+    """Test that values JSON cannot hold, like bytes and Decimals, are stored as plain values."""
+    path = tmp_path / 'catalog.jsonl'
+    catalog = SchemaCatalog(columns=[(b'users', Decimal('255'), Decimal('1.5'))])
+    write_catalog_snapshot(path, {'db': catalog}, 'mysql')
+    assert read_catalog_snapshot(path).catalogs['db'].columns == [('users', 255, '1.5')]
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_snapshot_rejects_other_files(tmp_path):
+    """Test that files that are not snapshots, or of another version, are refused."""
+    other = tmp_path / 'schema.sql'
+    other.write_text('create table users (id int);')
+    with pytest.raises(ValueError, match='Not a catalog snapshot'):
+        read_snapshot_header(other)
+
+    newer = tmp_path / 'newer.jsonl.gz'
+    with gzip.open(newer, 'wt') as f:
+        f.write(json.dumps({'format': SNAPSHOT_FORMAT, 'version': 99, 'db_type': 'postgres'}) + '\n')
+    with pytest.raises(ValueError, match='Unsupported catalog snapshot version 99'):
+        read_catalog_snapshot(newer)
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_connector_loads_snapshot_and_reader_returns_rows(tmp_path, catalogs):
+    """Test that connecting loads the snapshot, and the reader returns its rows by schema."""
+    path = tmp_path / 'catalog.jsonl'
+    write_catalog_snapshot(path, catalogs, DatabaseType.POSTGRES)
+
+    connector = CatalogFileConnector(CatalogFileConnectionParams(path=str(path)))
+    with connector as conn:
+        assert connector.check_connection(conn)
+        reader = CatalogFileSchemaReader(connector)
+        assert reader.get_schemas(conn) == ['public', 'auth']
+        assert reader.get_tables(conn, 'auth') == [('tokens',)]
+        assert reader.get_constraints(conn, 'public') == catalogs['public'].constraints
+        assert reader.get_columns(conn, 'missing') == []
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_replaying_a_dump_builds_the_same_tables(tmp_path):
+    """Test that tables built from a catalog dumped during a run equal those of the run itself."""
+    ddl = tmp_path / 'schema.sql'
+    ddl.write_text(
+        "create type role as enum ('admin', 'member');\n"
+        'create table users (id serial primary key, role role not null);\n'
+        'create table posts (id serial primary key, user_id int references users (id));\n'
+    )
+    snapshot = tmp_path / 'catalog.jsonl.gz'
+    tables = construct_tables(
+        conn_type=DatabaseConnectionType.SQL_FILE,
+        db_type=DatabaseType.POSTGRES,
+        connection_params={'paths': [str(ddl)]},
+        source=SQL_FILE_BACKEND,
+        dump_catalog=str(snapshot),
+    )
+
+    builder = DatabaseBuilder(
+        DatabaseType.POSTGRES,
+        DatabaseConnectionType.CATALOG_FILE,
+        connection_params={'path': str(snapshot)},
+        source=CATALOG_FILE_BACKEND,
+    )
+    assert builder.build_tables(schemas=('public',)) == tables
@@ -0,0 +1,84 @@
+"""Tests for reading a schema from SQL files with the 'sql' backend."""
+
+import pytest
+
+from supabase_pydantic.db.builder import DatabaseBuilder
+from supabase_pydantic.db.connectors.sql.connector import SqlFileConnector, sql_files
+from supabase_pydantic.db.connectors.sql.schema_reader import SqlFileSchemaReader
+from supabase_pydantic.db.constants import DatabaseConnectionType
+from supabase_pydantic.db.database_type import DatabaseType
+from supabase_pydantic.db.drivers.postgres.ddl import DDLCatalog
+from supabase_pydantic.db.factory import SQL_FILE_BACKEND
+from supabase_pydantic.db.models import SqlFileConnectionParams
+
+
+@pytest.fixture
+def migrations(tmp_path):
+    """Create a folder of migration files, named in the order they apply."""
+    folder = tmp_path / 'migrations'
+    (folder / 'nested').mkdir(parents=True)
+    (folder / '0002_posts.sql').write_text(
+        'create table posts (id bigint generated by default as identity primary key, '
+        'author_id uuid not null references users (id), body text);'
+    )
+    (folder / '0001_users.sql').write_text(
+        "create type role as enum ('admin', 'member');\n"
+        'create table users (id uuid primary key, email varchar(100) unique not null, role role);'
+    )
+    (folder / 'nested' / '0003_rename.sql').write_text('alter table posts rename column body to content;')
+    (folder / 'README.md').write_text('not sql')
+    return folder
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_sql_files_expands_folders_in_name_order(migrations, tmp_path):
+    """Test that folders contribute their .sql files in name order, and missing paths raise."""
+    assert [p.name for p in sql_files([str(migrations)])] == ['0001_users.sql', '0002_posts.sql', '0003_rename.sql']
+    with pytest.raises(FileNotFoundError):
+        sql_files([str(tmp_path / 'missing.sql')])
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_connector_applies_files_and_reader_returns_rows(migrations):
+    """Test that connecting applies every file, and the reader returns the catalog's rows."""
+    connector = SqlFileConnector(SqlFileConnectionParams(paths=[str(migrations)]))
+    with connector as conn:
+        assert isinstance(conn, DDLCatalog)
+        assert connector.check_connection(conn)
+        reader = SqlFileSchemaReader(connector)
+        assert reader.get_schemas(conn) == ['public']
+        assert reader.get_tables(conn, 'public') == [('users',), ('posts',)]
+        assert [c[2] for c in reader.get_columns(conn, 'public') if c[1] == 'posts'] == ['id', 'author_id', 'content']
+        assert reader.get_foreign_keys(conn, 'public') == [
+            ('public', 'posts', 'author_id', 'public', 'users', 'id', 'posts_author_id_fkey')
+        ]
+        with pytest.raises(NotImplementedError):
+            connector.execute_query(conn, 'select 1')
+
+    with pytest.raises(ValueError):
+        SqlFileConnector({}).connect()
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_builder_builds_tables_from_sql_files(migrations):
+    """Test that the 'sql' source backend reads tables for the PostgreSQL marshalers."""
+    builder = DatabaseBuilder(
+        DatabaseType.POSTGRES,
+        DatabaseConnectionType.SQL_FILE,
+        connection_params=SqlFileConnectionParams(paths=[str(migrations)]).to_dict(),
+        source=SQL_FILE_BACKEND,
+    )
+    tables = {t.name: t for t in builder.build_tables(schemas=('public',))['public']}
+
+    assert set(tables) == {'users', 'posts'}
+    users = {c.name: c for c in tables['users'].columns}
+    assert users['email'].max_length == 100
+    assert users['email'].is_unique
+    assert users['role'].user_defined_values == ['admin', 'member']
+    posts = {c.name: c for c in tables['posts'].columns}
+    assert posts['id'].is_identity
+    assert posts['author_id'].is_foreign_key
+    assert [fk.foreign_table_name for fk in tables['posts'].foreign_keys] == ['users']
@@ -0,0 +1,80 @@
+"""Tests for the positional row schemas of the MySQL queries."""
+
+import re
+
+import pytest
+
+from supabase_pydantic.db.drivers.mysql.queries import (
+    BATCH_COLUMNS_QUERY,
+    BATCH_CONSTRAINTS_QUERY,
+    BATCH_FOREIGN_KEYS_QUERY,
+    BATCH_TABLES_QUERY,
+    COLUMNS_QUERY,
+    CONSTRAINTS_QUERY,
+    FOREIGN_KEYS_QUERY,
+    GET_ALL_PUBLIC_TABLES_AND_COLUMNS,
+    SCHEMAS_QUERY,
+    TABLES_QUERY,
+)
+from supabase_pydantic.db.drivers.mysql.rows import (
+    BATCH_CONSTRAINT_ROW,
+    BATCH_TABLE_ROW,
+    COLUMN_ROW,
+    CONSTRAINT_ROW,
+    FOREIGN_KEY_ROW,
+    SCHEMA_ROW,
+    TABLE_COLUMN_ROW,
+    TABLE_ROW,
+    RowSchema,
+    column_details,
+)
+
+
+def select_names(query):
+    """Get the names of the fields a query selects: the alias, or else the column name."""
+    select_list = re.search(r'SELECT(.*?)\bFROM\b', query, re.S | re.I).group(1)
+    items, depth, current = [], 0, ''
+    for char in select_list:
+        if char == ',' and depth == 0:
+            items.append(current)
+            current = ''
+            continue
+        depth += (char == '(') - (char == ')')
+        current += char
+    items.append(current)
+    return tuple(item.split()[-1].split('.')[-1].lower() for item in items)
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.parametrize(
+    'query, row',
+    [
+        (SCHEMAS_QUERY, SCHEMA_ROW),
+        (TABLES_QUERY, TABLE_ROW),
+        (GET_ALL_PUBLIC_TABLES_AND_COLUMNS, COLUMN_ROW),
+        (COLUMNS_QUERY, TABLE_COLUMN_ROW),
+        (CONSTRAINTS_QUERY, CONSTRAINT_ROW),
+        (FOREIGN_KEYS_QUERY, FOREIGN_KEY_ROW),
+        (BATCH_TABLES_QUERY, BATCH_TABLE_ROW),
+        (BATCH_COLUMNS_QUERY, COLUMN_ROW),
+        (BATCH_CONSTRAINTS_QUERY, BATCH_CONSTRAINT_ROW),
+        (BATCH_FOREIGN_KEYS_QUERY, FOREIGN_KEY_ROW),
+    ],
+)
+def test_row_schemas_match_query_select_lists(query, row):
+    """Test that each row schema names the fields of its query in select order."""
+    assert select_names(query) == row.fields
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_row_schema_getters():
+    """Test that compiled getters read single fields as values and several as tuples."""
+    row_schema = RowSchema('a', 'b', 'c')
+    assert len(row_schema) == 3
+    assert row_schema.getter('b')(('x', 'y', 'z')) == 'y'
+    assert row_schema.getter('c', 'a')(('x', 'y', 'z')) == ('z', 'x')
+
+    row = tuple(range(len(COLUMN_ROW)))
+    assert column_details(row) == row[:-1]
@@ -0,0 +1,286 @@
+"""Tests for the DDL catalog in supabase_pydantic.db.drivers.postgres.ddl."""
+
+import pytest
+
+from supabase_pydantic.db.drivers.postgres.ddl import DDLCatalog, quote_ident, split_statements
+
+PG_DUMP = """
+--
+-- PostgreSQL database dump
+--
+SET statement_timeout = 0;
+SELECT pg_catalog.set_config('search_path', '', false);
+
+CREATE SCHEMA app;
+
+CREATE TYPE public.user_role AS ENUM (
+    'admin',
+    'member'
+);
+
+CREATE FUNCTION public.touch() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+begin new.updated_at = now(); return new; end;
+$$;
+
+CREATE TABLE public.users (
+    id bigint NOT NULL,
+    email character varying(255) NOT NULL,
+    role public.user_role DEFAULT 'member'::public.user_role NOT NULL,
+    tags text[],
+    created_at timestamp with time zone DEFAULT now()
+);
+
+COMMENT ON COLUMN public.users.email IS 'Login e-mail';
+
+CREATE TABLE public.posts (
+    id integer NOT NULL,
+    user_id bigint,
+    title text,
+    CONSTRAINT posts_title_check CHECK ((length(title) <= 100))
+);
+
+ALTER TABLE public.posts ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY (
+    SEQUENCE NAME public.posts_id_seq START WITH 1 INCREMENT BY 1
+);
+ALTER TABLE ONLY public.users ALTER COLUMN id SET DEFAULT nextval('public.users_id_seq'::regclass);
+ALTER TABLE ONLY public.users
+    ADD CONSTRAINT users_pkey PRIMARY KEY (id);
+ALTER TABLE ONLY public.users
+    ADD CONSTRAINT users_email_key UNIQUE (email);
+ALTER TABLE ONLY public.posts
+    ADD CONSTRAINT posts_pkey PRIMARY KEY (id);
+ALTER TABLE ONLY public.posts
+    ADD CONSTRAINT posts_user_id_fkey FOREIGN KEY (user_id) REFERENCES public.users(id) ON DELETE CASCADE;
+
+CREATE VIEW public.recent_posts AS SELECT * FROM public.posts;
+CREATE POLICY own_posts ON public.posts USING (true);
+"""
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_split_statements_ignores_semicolons_in_strings_and_bodies():
+    """Test that statements split at semicolons outside strings, comments and dollar quotes."""
+    sql = 'select \'a;b\'; -- c;d\ncreate function f() as $x$ begin; end; $x$; /* ; */ select "e;f"'
+    statements = list(split_statements(sql))
+    assert len(statements) == 3
+    assert statements[0][1].value == 'a;b'
+    assert statements[2][1].value == 'e;f'
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_pg_dump_rows_match_catalog_query_shapes():
+    """Test that pg_dump output yields the rows the live PostgreSQL catalog queries return."""
+    catalog = DDLCatalog()
+    catalog.execute(PG_DUMP)
+    result = catalog.schema_catalog('public')
+
+    assert catalog.schema_names() == ['public', 'app']
+    assert result.tables == [('users',), ('posts',)]
+    assert result.columns == [
+        (
+            'public',
+            'users',
+            'id',
+            "nextval('public.users_id_seq'::regclass)",
+            'NO',
+            'bigint',
+            None,
+            'BASE TABLE',
+            None,
+            'int8',
+            None,
+            None,
+        ),
+        (
+            'public',
+            'users',
+            'email',
+            None,
+            'NO',
+            'character varying',
+            255,
+            'BASE TABLE',
+            None,
+            'varchar',
+            None,
+            'Login e-mail',
+        ),
+        (
+            'public',
+            'users',
+            'role',
+            "'member'::public.user_role",
+            'NO',
+            'USER-DEFINED',
+            None,
+            'BASE TABLE',
+            None,
+            'user_role',
+            None,
+            None,
+        ),
+        ('public', 'users', 'tags', None, 'YES', 'ARRAY', None, 'BASE TABLE', None, '_text', 'text[]', None),
+        (
+            'public',
+            'users',
+            'created_at',
+            'now()',
+            'YES',
+            'timestamp with time zone',
+            None,
+            'BASE TABLE',
+            None,
+            'timestamptz',
+            None,
+            None,
+        ),
+        ('public', 'posts', 'id', None, 'NO', 'integer', None, 'BASE TABLE', 'ALWAYS', 'int4', None, None),
+        ('public', 'posts', 'user_id', None, 'YES', 'bigint', None, 'BASE TABLE', None, 'int8', None, None),
+        ('public', 'posts', 'title', None, 'YES', 'text', None, 'BASE TABLE', None, 'text', None, None),
+    ]
+    assert result.constraints == [
+        ('users_pkey', 'users', ['id'], 'p', 'PRIMARY KEY (id)'),
+        ('users_email_key', 'users', ['email'], 'u', 'UNIQUE (email)'),
+        ('posts_title_check', 'posts', ['title'], 'c', 'CHECK ((length(title) <= 100))'),
+        ('posts_pkey', 'posts', ['id'], 'p', 'PRIMARY KEY (id)'),
+        (
+            'posts_user_id_fkey',
+            'posts',
+            ['user_id'],
+            'f',
+            'FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE',
+        ),
+    ]
+    assert result.foreign_keys == [('public', 'posts', 'user_id', 'public', 'users', 'id', 'posts_user_id_fkey')]
+    assert result.user_defined_types == [('user_role', 'public', None, 'E', True, 'e', ['admin', 'member'])]
+    assert ('role', 'users', 'public', 'user_role', 'e', 'Enum') in result.type_mappings
+    assert ('email', 'users', 'pg_catalog', 'varchar', 'b', 'Other') in result.type_mappings
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_migrations_are_applied_in_order():
+    """Test that later migrations alter, rename and drop what earlier ones created."""
+    catalog = DDLCatalog()
+    catalog.execute(
+        """
+        create type status as enum ('draft', 'live');
+        create domain short_text as varchar(20);
+        create table authors (id serial primary key, name text);
+        create table books (
+            id uuid primary key default gen_random_uuid(),
+            author_id int references authors on update cascade on delete set null,
+            state status not null default 'draft',
+            label short_text,
+            old_column int
+        );
+        """
+    )
+    catalog.execute(
+        """
+        alter type status add value 'archived' before 'live';
+        alter table books drop column old_column, add column if not exists pages int check (pages > 0);
+        alter table authors rename column name to full_name;
+        alter table authors rename to writers;
+        alter table books alter column label set not null;
+        """
+    )
+    result = catalog.schema_catalog('public')
+
+    columns = {(c[1], c[2]): c for c in result.columns}
+    assert set(columns) == {
+        ('writers', 'id'),
+        ('writers', 'full_name'),
+        ('books', 'id'),
+        ('books', 'author_id'),
+        ('books', 'state'),
+        ('books', 'label'),
+        ('books', 'pages'),
+    }
+    assert columns[('writers', 'id')][3] == "nextval('authors_id_seq'::regclass)"
+    assert columns[('writers', 'id')][5] == 'integer'
+    # Domains report their base type
+    assert columns[('books', 'label')][4:7] == ('NO', 'character varying', 20)
+    assert ('label', 'books', 'public', 'short_text', 'd', 'Domain') in result.type_mappings
+
+    assert (
+        'books_author_id_fkey',
+        'books',
+        ['author_id'],
+        'f',
+        'FOREIGN KEY (author_id) REFERENCES writers(id) ON UPDATE CASCADE ON DELETE SET NULL',
+    ) in result.constraints
+    assert ('books_pages_check', 'books', ['pages'], 'c', 'CHECK ((pages > 0))') in result.constraints
+    assert result.foreign_keys == [('public', 'books', 'author_id', 'public', 'writers', 'id', 'books_author_id_fkey')]
+    assert ('status', 'public', None, 'E', True, 'e', ['draft', 'archived', 'live']) in result.user_defined_types
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_other_schemas_and_cross_schema_foreign_keys():
+    """Test that schemas are kept apart, and cross-schema foreign keys are constraints only."""
+    catalog = DDLCatalog()
+    catalog.execute(
+        """
+        create schema if not exists auth;
+        create table auth.users (id uuid primary key);
+        set search_path to app, public;
+        create table profiles (id uuid primary key references auth.users (id), "Display Name" text);
+        """
+    )
+    app = catalog.schema_catalog('app')
+    assert app.tables == [('profiles',)]
+    assert app.foreign_keys == []
+    assert (
+        'profiles_id_fkey',
+        'app.profiles',
+        ['id'],
+        'f',
+        'FOREIGN KEY (id) REFERENCES auth.users(id)',
+    ) in app.constraints
+    assert [c[2] for c in app.columns] == ['id', 'Display Name']
+    assert catalog.schema_catalog('auth').tables == [('users',)]
+    assert quote_ident('Display Name') == '"Display Name"'
+    assert quote_ident('user') == '"user"'
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_create_table_like_copies_columns(caplog):
+    """Test that LIKE copies the source's columns, and its defaults and keys only when included."""
+    catalog = DDLCatalog()
+    catalog.execute(
+        """
+        create table src (id int generated always as identity primary key, email text not null default 'x',
+            n int check (n > 0), parent_id int references src (id));
+        create table plain (like src);
+        create table full_copy (like src including all excluding constraints, extra text);
+        create table orphan (like missing);
+        """
+    )
+    public = catalog.schema_catalog('public')
+    assert public.tables == [('src',), ('plain',), ('full_copy',)]
+    assert 'LIKE refers to an unknown table' in caplog.text
+    columns = {(c[1], c[2]): (c[3], c[4], c[8]) for c in public.columns}
+    assert columns[('plain', 'id')] == (None, 'NO', None)
+    assert columns[('plain', 'email')] == (None, 'NO', None)
+    assert columns[('full_copy', 'id')] == (None, 'NO', 'ALWAYS')
+    assert columns[('full_copy', 'email')] == ("'x'", 'NO', None)
+    assert ('full_copy', 'extra') in columns
+    assert [c[:4] for c in public.constraints if c[1] != 'src'] == [
+        ('full_copy_pkey', 'full_copy', ['id'], 'p'),
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_unparsable_statements_are_skipped(caplog):
+    """Test that a statement that cannot be parsed is logged and the rest still apply."""
+    catalog = DDLCatalog()
+    catalog.execute('create table broken (id int frobnicate); create table ok (id int);', source='schema.sql')
+    assert catalog.schema_catalog('public').tables == [('ok',)]
+    assert 'schema.sql: skipping statement' in caplog.text
@@ -38,60 +38,26 @@ def schema_marshaler(mock_marshalers):
 
 @pytest.fixture
 def sample_column_data():
-    """Create sample column data for testing."""
+    """Create sample column rows for testing, in the field order of COLUMN_ROW."""
     return [
-        {
-            'TABLE_SCHEMA': 'test_schema',
-            'TABLE_NAME': 'users',
-            'COLUMN_NAME': 'id',
-            'COLUMN_DEFAULT': None,
-            'IS_NULLABLE': 'NO',
-            'DATA_TYPE': 'int',
-            'CHARACTER_MAXIMUM_LENGTH': None,
-            'TABLE_TYPE': 'BASE TABLE',
-            'IDENTITY_GENERATION': None,
-            'UDT_NAME': 'int',
-            'ARRAY_ELEMENT_TYPE': None,
-        },
-        {
-            'TABLE_SCHEMA': 'test_schema',
-            'TABLE_NAME': 'users',
-            'COLUMN_NAME': 'username',
-            'COLUMN_DEFAULT': None,
-            'IS_NULLABLE': 'YES',
-            'DATA_TYPE': 'varchar',
-            'CHARACTER_MAXIMUM_LENGTH': 255,
-            'TABLE_TYPE': 'BASE TABLE',
-            'IDENTITY_GENERATION': None,
-            'UDT_NAME': 'varchar',
-            'ARRAY_ELEMENT_TYPE': None,
-        },
-        {
-            'TABLE_SCHEMA': 'test_schema',
-            'TABLE_NAME': 'posts',
-            'COLUMN_NAME': 'id',
-            'COLUMN_DEFAULT': None,
-            'IS_NULLABLE': 'NO',
-            'DATA_TYPE': 'int',
-            'CHARACTER_MAXIMUM_LENGTH': None,
-            'TABLE_TYPE': 'BASE TABLE',
-            'IDENTITY_GENERATION': None,
-            'UDT_NAME': 'int',
-            'ARRAY_ELEMENT_TYPE': None,
-        },
-        {
-            'TABLE_SCHEMA': 'test_schema',
-            'TABLE_NAME': 'posts',
-            'COLUMN_NAME': 'user_id',
-            'COLUMN_DEFAULT': None,
-            'IS_NULLABLE': 'YES',
-            'DATA_TYPE': 'int',
-            'CHARACTER_MAXIMUM_LENGTH': None,
-            'TABLE_TYPE': 'BASE TABLE',
-            'IDENTITY_GENERATION': None,
-            'UDT_NAME': 'int',
-            'ARRAY_ELEMENT_TYPE': None,
-        },
+        ('test_schema', 'users', 'id', None, 'NO', 'int', None, 'BASE TABLE', 'IDENTITY', 'int', None, '', 'int'),
+        (
+            'test_schema',
+            'users',
+            'username',
+            None,
+            'YES',
+            'varchar',
+            255,
+            'BASE TABLE',
+            None,
+            'varchar',
+            None,
+            'Login name',
+            'varchar(255)',
+        ),
+        ('test_schema', 'posts', 'id', None, 'NO', 'int', None, 'BASE TABLE', 'IDENTITY', 'int', None, '', 'int'),
+        ('test_schema', 'posts', 'user_id', None, 'YES', 'int', None, 'BASE TABLE', None, 'int', None, '', 'int'),
     ]
 
 
@@ -291,12 +257,24 @@ def test_process_columns(schema_marshaler, sample_column_data):
     # Verify that we have the correct number of processed columns
     assert len(result) == 4
 
-    # Check the first column's processed data
+    # The shared column details are read by position, without the column type
     first_column = result[0]
-    assert first_column[0] == 'test_schema'  # schema
-    assert first_column[1] == 'users'  # table_name
-    assert first_column[2] == 'id'  # column_name
-    assert first_column[5] == 'int'  # data_type
+    assert first_column == (
+        'test_schema',
+        'users',
+        'id',
+        None,
+        'NO',
+        'int',
+        None,
+        'BASE TABLE',
+        'IDENTITY',
+        'int',
+        None,
+        '',
+    )
+    assert result[1][6] == 255  # max_length
+    assert result[1][11] == 'Login name'  # description
 
     # Check that all columns are processed
     table_columns = [(col[1], col[2]) for col in result]  # (table_name, column_name)
@@ -312,7 +290,7 @@ def test_process_columns(schema_marshaler, sample_column_data):
 def test_process_columns_warning_on_missing_data(schema_marshaler):
     """Test that a warning is logged when column data is missing schema/table info."""
     incomplete_data = [
-        {'COLUMN_NAME': 'id'},  # Missing TABLE_SCHEMA and TABLE_NAME
+        ('id', 'int', None, 'NO', None, 'int', None),  # A single-table row, without schema and table
     ]
 
     with patch('supabase_pydantic.db.marshalers.mysql.schema.logger') as mock_logger:
@@ -382,7 +360,7 @@ def test_process_foreign_keys(schema_marshaler, sample_tables):
 def test_construct_table_info(schema_marshaler, sample_column_data, sample_tables):
     """Test constructing table info from database details."""
     # Mock data for test
-    table_data = [{'TABLE_NAME': 'users'}, {'TABLE_NAME': 'posts'}]
+    table_data = [('users',), ('posts',)]
     column_data = sample_column_data
     fk_data = [('test_schema', 'posts', 'user_id', 'test_schema', 'users', 'id', 'CASCADE', 'CASCADE')]
     constraint_data = [
@@ -704,3 +682,39 @@ def test_add_mysql_user_defined_types_to_tables_qualified_array_type(sample_tabl
     assert tags_column.enum_info is not None
     assert tags_column.enum_info.name == 'tag_type'
     assert tags_column.enum_info.values == ['news', 'tech', 'sports']
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.marshalers
+def test_construct_table_info_from_tuple_rows():
+    """Test that tuple rows as returned by the MySQL schema reader build complete tables."""
+    from supabase_pydantic.db.marshalers.mysql.column import MySQLColumnMarshaler
+    from supabase_pydantic.db.marshalers.mysql.constraints import MySQLConstraintMarshaler
+    from supabase_pydantic.db.marshalers.mysql.relationship import MySQLRelationshipMarshaler
+
+    marshaler = MySQLSchemaMarshaler(MySQLColumnMarshaler(), MySQLConstraintMarshaler(), MySQLRelationshipMarshaler())
+    column_data = [
+        ('shop', 'users', 'id', None, 'NO', 'int', None, 'BASE TABLE', 'IDENTITY', 'int', None, '', 'int'),
+        ('shop', 'users', 'status', None, 'NO', 'enum', 8, 'BASE TABLE', None, 'enum', None, '', "enum('a','b')"),
+        ('shop', 'orders', 'id', None, 'NO', 'int', None, 'BASE TABLE', 'IDENTITY', 'int', None, '', 'int'),
+        ('shop', 'orders', 'user_id', None, 'YES', 'int', None, 'BASE TABLE', None, 'int', None, 'Buyer', 'int'),
+    ]
+    constraint_data = [
+        ('PRIMARY', 'users', ['id'], 'PRIMARY KEY', 'PRIMARY KEY (id)'),
+        ('PRIMARY', 'orders', ['id'], 'PRIMARY KEY', 'PRIMARY KEY (id)'),
+    ]
+    fk_data = [('shop', 'orders', 'user_id', 'shop', 'users', 'id', 'fk_orders_user')]
+    type_data = [('status_enum', 'shop', 'mysql_user', 'E', True, 'e', ['a', 'b'])]
+    type_mapping_data = [('status', 'users', 'shop', 'status_enum', 'e', 'Enum')]
+
+    tables = marshaler.construct_table_info(
+        [('users',), ('orders',)], column_data, fk_data, constraint_data, type_data, type_mapping_data, 'shop'
+    )
+
+    users, orders = tables
+    assert [c.name for c in users.columns] == ['id', 'status']
+    assert users.constraints[0].columns == ['id']
+    assert users.columns[1].enum_info.values == ['a', 'b']
+    assert orders.columns[1].description == 'Buyer'
+    assert orders.foreign_keys[0].foreign_table_name == 'users'
@@ -170,7 +170,9 @@ def test_get_table_details_from_columns(marshaler, sample_column_data):
         assert result == mock_get_details.return_value
 
         # Verify get_table_details_from_columns was called with the processed column data
-        mock_get_details.assert_called_once_with(sample_column_data, False, column_marshaler=marshaler.column_marshaler)
+        mock_get_details.assert_called_once_with(
+            sample_column_data, disable_model_prefix_protection=False, column_marshaler=marshaler.column_marshaler
+        )
 
 
 @pytest.mark.unit
@@ -253,4 +255,6 @@ def test_disable_model_prefix_protection(marshaler, sample_column_data):
         marshaler.get_table_details_from_columns(sample_column_data)
 
         # Verify get_table_details_from_columns was called with the right flag value
-        mock_get_details.assert_called_once_with(sample_column_data, True, column_marshaler=marshaler.column_marshaler)
+        mock_get_details.assert_called_once_with(
+            sample_column_data, disable_model_prefix_protection=True, column_marshaler=marshaler.column_marshaler
+        )
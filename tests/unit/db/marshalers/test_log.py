@@ -0,0 +1,126 @@
+"""Tests for the level-guarded marshaler logger in supabase_pydantic.db.marshalers.log."""
+
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from supabase_pydantic.db.constants import RelationType
+from supabase_pydantic.db.marshalers.column import lowercase_enum_types, process_udt_field
+from supabase_pydantic.db.marshalers.log import TRACE, get_logger
+from supabase_pydantic.db.marshalers.relationships import determine_relationship_type, is_bridge_table
+from supabase_pydantic.db.models import ColumnInfo, ConstraintInfo, ForeignKeyInfo, TableInfo
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.marshalers
+def test_flags_follow_logger_level():
+    """Test that the enabled flags track the wrapped logger's level, including later changes."""
+    log = get_logger('supabase_pydantic.tests.flags')
+    log.logger.setLevel(logging.INFO)
+    assert log.debug_enabled is False
+    assert log.trace_enabled is False
+
+    log.logger.setLevel(TRACE)
+    assert log.debug_enabled is True
+    assert log.trace_enabled is True
+    log.logger.setLevel(logging.NOTSET)
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.marshalers
+def test_lazy_args_and_caller(caplog):
+    """Test that %-style args are formatted on emit and the record points at the caller."""
+    log = get_logger('supabase_pydantic.tests.lazy')
+    with caplog.at_level(logging.DEBUG, logger='supabase_pydantic.tests.lazy'):
+        log.debug('Processing %s.%s', 'table', 'column')
+
+    record = caplog.records[-1]
+    assert record.getMessage() == 'Processing table.column'
+    assert record.args == ('table', 'column')
+    assert record.funcName == 'test_lazy_args_and_caller'
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.marshalers
+def test_event_is_structured_and_trace_only(caplog):
+    """Test that events carry their fields on the record and are dropped above TRACE."""
+    log = get_logger('supabase_pydantic.tests.event')
+    with caplog.at_level(logging.DEBUG, logger='supabase_pydantic.tests.event'):
+        log.event('relationship_type', forward='ONE_TO_ONE')
+    assert caplog.records == []
+
+    with caplog.at_level(TRACE, logger='supabase_pydantic.tests.event'):
+        log.event('relationship_type', forward='ONE_TO_ONE')
+    record = caplog.records[-1]
+    assert record.levelname == 'TRACE'
+    assert record.event == 'relationship_type'  # type: ignore[attr-defined]
+    assert record.fields == {'forward': 'ONE_TO_ONE'}  # type: ignore[attr-defined]
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.marshalers
+def test_hot_paths_skip_debug_when_disabled(caplog):
+    """Test that per-column and per-table functions do not call the logger when DEBUG is off."""
+    table = TableInfo(
+        name='bridge',
+        columns=[ColumnInfo(name='a_id', post_gres_datatype='integer', datatype='int', primary=True)],
+        foreign_keys=[
+            ForeignKeyInfo(constraint_name='fk', column_name='a_id', foreign_table_name='a', foreign_column_name='id')
+        ],
+        constraints=[
+            ConstraintInfo(
+                constraint_name='pk',
+                raw_constraint_type='p',
+                constraint_definition='PRIMARY KEY (a_id)',
+                columns=['a_id'],
+            )
+        ],
+    )
+    fk = table.foreign_keys[0]
+
+    caplog.set_level(logging.INFO)
+    with (
+        patch('logging.Logger.debug') as mock_debug,
+        patch('logging.Logger.log') as mock_log,
+        patch('supabase_pydantic.db.marshalers.log.MarshalerLogger.event') as mock_event,
+    ):
+        assert process_udt_field('_mood', 'ARRAY', known_enum_types=['Mood']) == 'list[Any]'
+        assert process_udt_field('int4', 'integer') == 'int'
+        assert is_bridge_table(table) is False
+        assert determine_relationship_type(table, table, fk) == (RelationType.ONE_TO_MANY, RelationType.MANY_TO_ONE)
+    mock_debug.assert_not_called()
+    mock_log.assert_not_called()
+    mock_event.assert_not_called()
+
+    caplog.set_level(logging.DEBUG)
+    with patch('logging.Logger.debug') as mock_debug:
+        process_udt_field('int4', 'integer')
+        is_bridge_table(table)
+    messages = [call.args[0] % call.args[1:] for call in mock_debug.call_args_list]
+    assert 'Found type mapping for integer: int' in messages
+    assert 'Not a bridge table: Less than 2 foreign keys' in messages
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.marshalers
+def test_known_enum_match_is_case_insensitive(caplog):
+    """Test that array element types matching a known enum do not warn."""
+    caplog.set_level(logging.WARNING)
+    assert process_udt_field('__Mood', 'ARRAY', known_enum_types=['_MOOD']) == 'list[Any]'
+    assert 'Unknown array element type' not in caplog.text
+
+    assert process_udt_field('_colour', 'ARRAY', known_enum_types=['Mood']) == 'list[Any]'
+    assert 'Unknown array element type: _colour (cleaned: colour), using Any' in caplog.text
+
+    # Lower-cased once for many columns, and passed in
+    caplog.clear()
+    lowered = lowercase_enum_types(['Mood', 'Colour'])
+    assert lowered == {'mood', 'colour'}
+    assert process_udt_field('_colour', 'ARRAY', known_enum_types=['Mood'], lowered_enum_types=lowered) == 'list[Any]'
+    assert 'Unknown array element type' not in caplog.text
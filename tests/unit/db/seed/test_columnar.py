@@ -0,0 +1,138 @@
+"""Tests for columnar fake data generation in supabase_pydantic.db.seed.columnar."""
+
+import uuid
+from datetime import datetime
+
+import pytest
+
+from supabase_pydantic.db.models import ColumnInfo, ForeignKeyInfo, TableInfo
+from supabase_pydantic.db.seed import columnar
+from supabase_pydantic.db.seed.columnar import generate_column, generate_columns, is_columnar
+from supabase_pydantic.db.seed.generator import generate_seed_data
+
+np = pytest.importorskip('numpy')
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.seed
+@pytest.mark.parametrize(
+    'column, expected',
+    [
+        (ColumnInfo(name='foo', post_gres_datatype='integer', datatype='int'), True),
+        (ColumnInfo(name='foo', post_gres_datatype='uuid', datatype='UUID4'), True),
+        (ColumnInfo(name='foo', post_gres_datatype='text', datatype='str'), False),
+        (ColumnInfo(name='age', post_gres_datatype='integer', datatype='int'), False),  # name pattern wins
+        (ColumnInfo(name='foo', post_gres_datatype='integer', datatype='int', is_unique=True), False),
+        (ColumnInfo(name='foo', post_gres_datatype='integer', datatype='int', is_foreign_key=True), False),
+        (ColumnInfo(name='foo', post_gres_datatype='integer', datatype='int', max_length=19), False),
+        (ColumnInfo(name='foo', post_gres_datatype='USER-DEFINED', datatype='str', user_defined_values=['a']), True),
+    ],
+)
+def test_is_columnar(column, expected):
+    """Test which columns are eligible for columnar generation."""
+    assert is_columnar(column) is expected
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.seed
+def test_generate_column_datatypes():
+    """Test that whole columns are generated with the expected value shapes."""
+    rng = np.random.default_rng(0)
+
+    ints = generate_column(
+        ColumnInfo(name='n', post_gres_datatype='integer', datatype='int', is_nullable=False), 50, rng
+    )
+    assert len(ints) == 50 and all(isinstance(v, int) and 0 <= v < 10**5 for v in ints)
+
+    bools = generate_column(
+        ColumnInfo(name='b', post_gres_datatype='boolean', datatype='bool', is_nullable=False), 50, rng
+    )
+    assert all(isinstance(v, bool) for v in bools)
+
+    uuids = generate_column(
+        ColumnInfo(name='u', post_gres_datatype='uuid', datatype='UUID4', is_nullable=False), 50, rng
+    )
+    assert all(uuid.UUID(v.strip("'")).version == 4 for v in uuids)
+
+    stamps = generate_column(
+        ColumnInfo(name='t', post_gres_datatype='timestamp', datatype='datetime', is_nullable=False), 50, rng
+    )
+    assert all(datetime.fromisoformat(v.strip("'")) <= datetime.now() for v in stamps)
+
+    dates = generate_column(
+        ColumnInfo(name='d', post_gres_datatype='date', datatype='date', is_nullable=False), 50, rng
+    )
+    assert all(len(v.strip("'")) == 10 for v in dates)
+
+    enums = generate_column(
+        ColumnInfo(name='e', post_gres_datatype='USER-DEFINED', datatype='str', user_defined_values=['x', 'y']), 5, rng
+    )
+    assert enums == ['x'] * 5
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.seed
+def test_generate_column_null_mask():
+    """Test that nullable columns get a share of NULL values and non-nullable ones get none."""
+    rng = np.random.default_rng(0)
+    nullable = generate_column(ColumnInfo(name='n', post_gres_datatype='integer', datatype='int'), 1000, rng)
+    assert 50 < nullable.count('NULL') < 300
+
+    required = generate_column(
+        ColumnInfo(name='n', post_gres_datatype='integer', datatype='int', is_nullable=False), 1000, rng
+    )
+    assert 'NULL' not in required
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.seed
+def test_generate_columns_without_numpy(monkeypatch):
+    """Test that columnar generation is skipped when NumPy is unavailable."""
+    monkeypatch.setattr(columnar, 'np', None)
+    column = ColumnInfo(name='n', post_gres_datatype='integer', datatype='int')
+    assert is_columnar(column) is False
+    assert generate_columns([column], 10, None) == {}
+
+    table = TableInfo(
+        name='A', columns=[ColumnInfo(name='id', post_gres_datatype='integer', datatype='int', primary=True)]
+    )
+    seed_data = generate_seed_data([table])
+    assert seed_data['A'][0] == ['id']
+    assert len(seed_data['A']) > 1
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.seed
+def test_generate_seed_data_mixes_columnar_and_per_cell_columns():
+    """Test that rows are assembled from columnar, per-cell and foreign key columns."""
+    parent = TableInfo(
+        name='parent',
+        columns=[
+            ColumnInfo(name='id', post_gres_datatype='integer', datatype='int', primary=True, is_nullable=False),
+            ColumnInfo(name='email', post_gres_datatype='text', datatype='str', is_nullable=False),
+        ],
+    )
+    child = TableInfo(
+        name='child',
+        columns=[
+            ColumnInfo(name='id', post_gres_datatype='uuid', datatype='UUID4', primary=True, is_nullable=False),
+            ColumnInfo(name='parent_id', post_gres_datatype='integer', datatype='int', is_foreign_key=True),
+        ],
+        foreign_keys=[
+            ForeignKeyInfo(
+                constraint_name='fk', column_name='parent_id', foreign_table_name='parent', foreign_column_name='id'
+            )
+        ],
+    )
+
+    seed_data = generate_seed_data([child, parent])
+
+    parent_ids = {row[0] for row in seed_data['parent'][1:]}
+    assert all('@' in row[1] for row in seed_data['parent'][1:])
+    assert all(row[1] in parent_ids for row in seed_data['child'][1:])
+    assert all(len(row) == 2 for row in seed_data['child'][1:])
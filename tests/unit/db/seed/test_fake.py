@@ -8,9 +8,11 @@ from dateutil.parser import parse
 from faker import Faker
 
 from supabase_pydantic.db.seed.fake import (
+    fake_data_generator,
     generate_fake_data,
     guess_and_generate_fake_data,
     guess_datetime_order,
+    match_column_name,
     random_datetime_within_N_years,
 )
 
@@ -264,3 +266,51 @@ def test_type_conversion_edge_cases(fake_faker):
     # Test whitespace string conversion
     result = generate_fake_data('integer', False, None, 'id', ['   '], fake_faker)
     assert result == '   ', 'Should return whitespace string on conversion error'
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.seed
+def test_match_column_name_precedence_and_cache():
+    """Test that the first matching pattern wins and results are cached per name."""
+    fake = Faker()
+    match_column_name.cache_clear()
+
+    # 'first.*name' precedes the generic 'name' pattern and matching is case-insensitive
+    assert match_column_name('First_Name') is match_column_name('first_name')
+    assert match_column_name('first_name') is not match_column_name('name')
+    first_name_fn = match_column_name('first_name')
+    assert first_name_fn is not None
+    assert isinstance(first_name_fn(fake), str)
+
+    assert match_column_name('foo') is None
+    assert match_column_name('foo') is None
+    info = match_column_name.cache_info()
+    assert info.hits >= 1
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.seed
+def test_fake_data_generator_resolves_once(fake_faker, mock_random):
+    """Test that a column generator produces the same values as generate_fake_data."""
+    email_gen = fake_data_generator('text', False, None, 'email', None, fake_faker)
+    assert email_gen() == email_gen() == "'example@example.com'"
+
+    int_gen = fake_data_generator('integer', False, None, 'foo', None, fake_faker)
+    assert int_gen() == generate_fake_data('integer', False, None, 'foo', None, fake_faker) == 12345
+
+    enum_gen = fake_data_generator('user-defined', False, None, 'foo', ['bar', 'baz'], fake_faker)
+    assert enum_gen() == 'bar'
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.seed
+def test_fake_data_generator_nullable(fake_faker, monkeypatch):
+    """Test that column generators still honor the nullable threshold per call."""
+    gen = fake_data_generator('text', True, None, 'foo', None, fake_faker)
+    monkeypatch.setattr('supabase_pydantic.db.seed.fake.random', lambda: 0.01)
+    assert gen() == 'NULL'
+    monkeypatch.setattr('supabase_pydantic.db.seed.fake.random', lambda: 0.9)
+    assert gen() == "'This is a fake text.'"
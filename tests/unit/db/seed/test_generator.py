@@ -1,13 +1,21 @@
 """Tests for seed data generation utilities in supabase_pydantic.db.seed.generator."""
 
 import pytest
+import random
+import sys
+from itertools import product
 from math import inf
 from unittest.mock import Mock, patch
 
 from supabase_pydantic.db.models import ColumnInfo, ConstraintInfo, ForeignKeyInfo, TableInfo
+from supabase_pydantic.db.seed.context import SeedContext
+from supabase_pydantic.db.seed.pools import ValuePool
 from supabase_pydantic.db.seed.generator import (
+    decode_combination,
+    foreign_key_map,
     generate_seed_data,
     pick_random_foreign_key,
+    sample_combinations,
     total_possible_combinations,
     unique_data_rows,
 )
@@ -150,6 +158,30 @@ def test_pick_random_foreign_key():
     assert result == 'NULL', "Expected 'NULL' when remember_fn raises KeyError"
 
 
+@pytest.mark.unit
+@pytest.mark.seed
+@pytest.mark.db
+def test_pick_random_foreign_key_from_pool():
+    """Test sampling from a ValuePool with a precomputed foreign key map and skew."""
+    fk_info = ForeignKeyInfo(
+        constraint_name='fk', column_name='fk_column', foreign_table_name='parent', foreign_column_name='id'
+    )
+    table_info = TableInfo(name='table', foreign_keys=[fk_info])
+    fk_map = foreign_key_map(table_info)
+    assert fk_map == {'fk_column': fk_info}
+
+    pool = ValuePool(range(100))
+    context = SeedContext(0)
+    picks = [
+        pick_random_foreign_key('fk_column', table_info, lambda t, c: pool, context, fk_map, 2.0) for _ in range(200)
+    ]
+    assert all(p in pool for p in picks)
+    assert picks.count(0) > 50
+
+    # An empty pool yields NULL instead of failing
+    assert pick_random_foreign_key('fk_column', table_info, lambda t, c: ValuePool(), context, fk_map) == 'NULL'
+
+
 # Test for total_possible_combinations
 @pytest.mark.unit
 @pytest.mark.seed
@@ -285,3 +317,43 @@ def test_unique_data_rows_with_foreign_keys():
     with patch('supabase_pydantic.db.seed.generator.pick_random_foreign_key', return_value=1):
         result = unique_data_rows(table, remember_fn=Mock())
     assert len(result) == 2  # Should generate 2 rows, one for each name
+
+
+@pytest.mark.unit
+@pytest.mark.seed
+@pytest.mark.db
+def test_decode_combination_matches_product():
+    values = [['a', 'b'], [1, 2, 3], ['x', 'y']]
+    assert [decode_combination(i, values) for i in range(12)] == list(product(*values))
+
+
+@pytest.mark.unit
+@pytest.mark.seed
+@pytest.mark.db
+def test_sample_combinations():
+    values = [[str(i) for i in range(50)], [str(i) for i in range(40)], ['A', 'B', 'C']]
+    rand = random.Random(0)
+
+    sample = sample_combinations(values, 100, rand)
+    assert len(sample) == len(set(sample)) == 100
+    all_combinations = set(product(*values))
+    assert all(combo in all_combinations for combo in sample)
+    # Uniform sampling reaches beyond the lexicographically first combinations
+    assert any(combo[0] != '0' for combo in sample)
+
+    # Asking for more than exist returns every combination, in product order
+    small = [['a', 'b'], ['x']]
+    assert sample_combinations(small, 10, rand) == list(product(*small))
+
+
+@pytest.mark.unit
+@pytest.mark.seed
+@pytest.mark.db
+def test_sample_combinations_huge_space():
+    """Test sampling when the product is too large to index with range()."""
+    values = [list(range(1000))] * 8  # 10**24 combinations
+    assert 1000**8 > sys.maxsize
+
+    sample = sample_combinations(values, 20, random.Random(1))
+    assert len(set(sample)) == 20
+    assert all(len(combo) == 8 for combo in sample)
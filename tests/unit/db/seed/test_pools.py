@@ -0,0 +1,60 @@
+"""Tests for seed data value pools in supabase_pydantic.db.seed.pools."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from supabase_pydantic.db.seed.pools import ValuePool, zipf_index
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.seed
+def test_value_pool_dedups_and_keeps_order():
+    """Test that the pool skips duplicates and keeps insertion order."""
+    pool = ValuePool([3, 1, 3])
+    pool.add(2)
+    pool.extend([1, 4])
+
+    assert list(pool) == [3, 1, 2, 4]
+    assert len(pool) == 4
+    assert 2 in pool and 5 not in pool
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.seed
+def test_value_pool_sample():
+    """Test uniform sampling and the empty-pool error."""
+    rand = random.Random(0).random
+    pool = ValuePool(range(10))
+    assert {pool.sample(rand) for _ in range(500)} == set(range(10))
+
+    with pytest.raises(IndexError):
+        ValuePool().sample(rand)
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.seed
+@pytest.mark.parametrize('skew', [0.0, 0.5, 1.0, 2.0])
+def test_zipf_index_bounds(skew):
+    """Test that indices stay within the pool for the whole range of uniform inputs."""
+    for n in (1, 2, 100):
+        for u in (0.0, 0.25, 0.5, 0.999999):
+            assert 0 <= zipf_index(n, u, skew) < n
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.seed
+def test_zipf_index_skew_creates_hot_keys():
+    """Test that a positive skew concentrates picks on the earliest values."""
+    rand = random.Random(1)
+    uniform = Counter(zipf_index(100, rand.random(), 0.0) for _ in range(5000))
+    skewed = Counter(zipf_index(100, rand.random(), 1.5) for _ in range(5000))
+
+    assert uniform[0] < 150
+    assert skewed[0] > 1000
+    assert skewed[0] > skewed[10] > skewed[90]
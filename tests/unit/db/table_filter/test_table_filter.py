@@ -0,0 +1,76 @@
+"""Tests for selecting tables by name with include and exclude patterns."""
+
+import pytest
+
+from supabase_pydantic.db.models import ForeignKeyInfo, RelationshipInfo, TableInfo
+from supabase_pydantic.db.table_filter import TableFilter
+
+
+@pytest.mark.unit
+@pytest.mark.db
+@pytest.mark.parametrize(
+    'include, exclude, table, expected',
+    [
+        ((), (), 'users', True),
+        (('user*',), (), 'users', True),
+        (('user*',), (), 'posts', False),
+        (('public.user*',), (), 'users', True),
+        (('auth.*',), (), 'users', False),
+        (('re:(users|posts)',), (), 'posts', True),
+        (('re:user',), (), 'users', False),  # Regular expressions match the whole name
+        (('*',), ('*_audit',), 'users_audit', False),
+        ((), ('re:.*_audit',), 'users', True),
+    ],
+)
+def test_table_filter_matches(include, exclude, table, expected):
+    """Test that globs and regular expressions match bare and schema-qualified table names."""
+    assert TableFilter(include=include, exclude=exclude).matches('public', table) is expected
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_table_filter_rejects_invalid_regex():
+    """Test that invalid regular expressions are reported when the filter is created."""
+    with pytest.raises(ValueError, match='Invalid table pattern'):
+        TableFilter(include=('re:(users',))
+    assert not TableFilter()
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_table_filter_select_closes_over_foreign_keys():
+    """Test that tables referenced by selected tables are selected too, transitively."""
+    references = {'comments': {'posts'}, 'posts': {'users'}, 'users': set()}
+    calls = []
+
+    def referenced_tables(tables):
+        calls.append(tables)
+        return set().union(*(references.get(t, set()) for t in tables))
+
+    selected = TableFilter(include=('comments',)).select(
+        'public', ['comments', 'posts', 'users', 'audit'], referenced_tables
+    )
+
+    assert selected == ['comments', 'posts', 'users']
+    assert calls == [['comments'], ['posts'], ['users']]
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_table_filter_apply_keeps_referenced_tables():
+    """Test filtering tables already read, keeping referenced tables and dropping dangling relationships."""
+    users = TableInfo(
+        name='users', relationships=[RelationshipInfo('users', 'posts'), RelationshipInfo('users', 'logs')]
+    )
+    posts = TableInfo(
+        name='posts',
+        foreign_keys=[ForeignKeyInfo('posts_author_id_fkey', 'author_id', 'users', 'id')],
+        relationships=[RelationshipInfo('posts', 'users')],
+    )
+    logs = TableInfo(name='logs', foreign_keys=[ForeignKeyInfo('logs_user_id_fkey', 'user_id', 'users', 'id')])
+
+    kept = TableFilter(include=('posts',)).apply('public', [users, posts, logs])
+
+    assert kept == [users, posts]
+    assert users.relationships == [RelationshipInfo('users', 'posts')]
+    assert posts.relationships == [RelationshipInfo('posts', 'users')]
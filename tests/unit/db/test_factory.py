@@ -0,0 +1,132 @@
+"""Tests for lazily registered components and backend plugins in the database factory."""
+
+import os
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import supabase_pydantic
+from supabase_pydantic.db.database_type import DatabaseType
+from supabase_pydantic.db.factory import ENTRY_POINT_GROUP, DatabaseFactory, backend_name, load_component
+from supabase_pydantic.db.registrations import register_database_components
+
+
+@pytest.fixture
+def isolated_factory():
+    """Give DatabaseFactory empty registries for the duration of a test."""
+    registries = [name for name in vars(DatabaseFactory) if name.endswith('_registry')]
+    with (
+        patch.multiple(DatabaseFactory, **{name: {} for name in registries}),
+        patch.object(DatabaseFactory, '_loaded_backends', set()),
+        patch.object(DatabaseFactory, '_plugin_backends', {}),
+    ):
+        yield DatabaseFactory
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_load_component_by_import_path():
+    """Test that import paths resolve to classes and classes pass through unchanged."""
+    from supabase_pydantic.db.marshalers.postgres.column import PostgresColumnMarshaler
+
+    path = 'supabase_pydantic.db.marshalers.postgres.column:PostgresColumnMarshaler'
+    assert load_component(path) is PostgresColumnMarshaler
+    assert load_component(PostgresColumnMarshaler) is PostgresColumnMarshaler
+
+    with pytest.raises(ImportError, match='NoSuchMarshaler'):
+        load_component('supabase_pydantic.db.marshalers.postgres.column:NoSuchMarshaler')
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_backend_name():
+    """Test that database types and plugin names share one registry key space."""
+    assert backend_name(DatabaseType.POSTGRES) == 'postgres'
+    assert backend_name('duckdb') == 'duckdb'
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_registered_paths_are_imported_on_first_use(isolated_factory):
+    """Test that registering components imports nothing and creating one caches its class."""
+    register_database_components()
+    registry = isolated_factory._column_marshaler_registry
+    assert registry['mysql'] == 'supabase_pydantic.db.marshalers.mysql.column:MySQLColumnMarshaler'
+
+    marshaler_class = isolated_factory._load(registry, DatabaseType.MYSQL, 'column marshaler')
+    assert marshaler_class.__name__ == 'MySQLColumnMarshaler'
+    assert registry['mysql'] is marshaler_class
+
+    del registry['mysql']
+    with pytest.raises(ValueError, match='No column marshaler registered'):
+        isolated_factory._load(registry, DatabaseType.MYSQL, 'column marshaler')
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_load_backend_registers_only_the_selected_backend(isolated_factory):
+    """Test that a built-in backend registers on first use, once, without touching the others."""
+    isolated_factory.create_marshalers(DatabaseType.POSTGRES)
+    assert set(isolated_factory._connector_registry) == {'postgres'}
+    assert isolated_factory._loaded_backends == {'postgres'}
+
+    with patch('supabase_pydantic.db.registrations.register_postgres_components') as register:
+        isolated_factory.load_backend('postgres')
+    register.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_plugin_backend_from_entry_point(isolated_factory):
+    """Test that a backend plugin's registration function is loaded and run on first use."""
+
+    class DuckDBColumnMarshaler(MagicMock):
+        pass
+
+    def register(factory):
+        factory.register_column_marshaler('duckdb', DuckDBColumnMarshaler)
+
+    entry_point = MagicMock(spec=EntryPoint)
+    entry_point.load.return_value = register
+    isolated_factory._plugin_backends = {'duckdb': entry_point}
+
+    assert 'duckdb' in isolated_factory.available_backends()
+    entry_point.load.assert_not_called()
+
+    marshaler_class = isolated_factory._load(isolated_factory._column_marshaler_registry, 'duckdb', 'column marshaler')
+    assert marshaler_class is DuckDBColumnMarshaler
+    entry_point.load.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_plugin_backends_are_discovered_by_entry_point_group(isolated_factory):
+    """Test that plugin discovery reads the factory's entry point group once."""
+    isolated_factory._plugin_backends = None
+    entry_point = EntryPoint(name='duckdb', value='sb_pydantic_duckdb:register', group=ENTRY_POINT_GROUP)
+    with patch('supabase_pydantic.db.factory.entry_points', return_value=[entry_point]) as mock_entry_points:
+        assert isolated_factory.plugin_backends() == {'duckdb': entry_point}
+        isolated_factory.plugin_backends()
+    mock_entry_points.assert_called_once_with(group=ENTRY_POINT_GROUP)
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_postgres_backend_does_not_import_mysql():
+    """Test that creating PostgreSQL components in a fresh interpreter never imports mysql-connector."""
+    src = os.path.dirname(os.path.dirname(supabase_pydantic.__file__))
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join([src, os.environ.get('PYTHONPATH', '')])}
+    code = (
+        'import sys\n'
+        'from supabase_pydantic.db.database_type import DatabaseType\n'
+        'from supabase_pydantic.db.factory import DatabaseFactory\n'
+        'DatabaseFactory.create_schema_reader(DatabaseType.POSTGRES)\n'
+        'DatabaseFactory.create_marshalers(DatabaseType.POSTGRES)\n'
+        "prefixes = ('mysql', 'supabase_pydantic.db.connectors.mysql', 'supabase_pydantic.db.marshalers.mysql')\n"
+        'print(sorted(m for m in sys.modules if m.startswith(prefixes)))\n'
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, env=env)
+    assert result.stdout.strip() == '[]'
@@ -0,0 +1,275 @@
+"""Tests for change triggers and the incremental watcher in supabase_pydantic.db.watch."""
+
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from supabase_pydantic.db.drivers.postgres.queries import (
+    CATALOG_FINGERPRINT_QUERY,
+    DDL_NOTIFY_CHANNEL,
+    GET_DDL_LOG_ENTRIES,
+    PRUNE_DDL_LOG,
+    RELATION_NAMES_QUERY,
+)
+from supabase_pydantic.db.models import TableInfo
+from supabase_pydantic.db.watch import (
+    ALL_SCHEMAS,
+    ChangeTrigger,
+    DDLLogTrigger,
+    FingerprintTrigger,
+    MigrationsTrigger,
+    NotifyTrigger,
+    Watcher,
+    merge_changes,
+)
+
+
+def make_connection(*results):
+    """Create a connection whose cursor returns each of `results` from successive queries."""
+    conn = MagicMock()
+    cursor = conn.cursor.return_value
+    cursor.fetchall.side_effect = list(results)
+    return conn
+
+
+class ScriptedTrigger(ChangeTrigger):
+    """Reports a scripted sequence of changes, one per poll."""
+
+    def __init__(self, *changes):
+        self.changes = list(changes)
+
+    def poll(self, conn):
+        return self.changes.pop(0) if self.changes else {}
+
+    def wait(self, conn, timeout):
+        pass
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_fingerprint_trigger_reports_changed_schemas():
+    """Test that only schemas whose fingerprint changed, appeared or vanished are reported."""
+    conn = make_connection(
+        [('public', 'a'), ('auth', 'b')],
+        [('public', 'a'), ('auth', 'c'), ('extra', 'd')],
+        [('public', 'a'), ('auth', 'c'), ('extra', 'd')],
+        [('auth', 'c'), ('extra', 'd')],
+    )
+    trigger = FingerprintTrigger(['public', 'auth', 'extra'])
+    trigger.start(conn)
+    assert trigger.poll(conn) == {'auth': None, 'extra': None}
+    assert trigger.poll(conn) == {}
+    assert trigger.poll(conn) == {'public': None}
+
+    conn.cursor.return_value.execute.assert_called_with(CATALOG_FINGERPRINT_QUERY, (['public', 'auth', 'extra'], False))
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_fingerprint_trigger_all_schemas():
+    """Test that watching all schemas asks the query for every user schema."""
+    trigger = FingerprintTrigger(('*',))
+    conn = make_connection([])
+    trigger.start(conn)
+    conn.cursor.return_value.execute.assert_called_once_with(CATALOG_FINGERPRINT_QUERY, ([], True))
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_notify_trigger_collects_payloads():
+    """Test that notifications on the DDL channel are reported by schema and then cleared."""
+    conn = MagicMock()
+    conn.notifies = [
+        SimpleNamespace(channel=DDL_NOTIFY_CHANNEL, payload='public'),
+        SimpleNamespace(channel=DDL_NOTIFY_CHANNEL, payload='public'),
+        SimpleNamespace(channel='other', payload='auth'),
+        SimpleNamespace(channel=DDL_NOTIFY_CHANNEL, payload=''),
+    ]
+    trigger = NotifyTrigger()
+    trigger.start(conn)
+    conn.cursor.return_value.execute.assert_called_once_with(f'LISTEN {DDL_NOTIFY_CHANNEL}', ())
+
+    assert trigger.poll(conn) == {'public': None, ALL_SCHEMAS: None}
+    assert conn.notifies == []
+    assert trigger.poll(conn) == {}
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_ddl_log_trigger_reports_logged_tables():
+    """Test that the DDL log trigger reports logged tables by schema, and whole schemas for types."""
+    conn = make_connection(
+        [],  # LISTEN
+        [(7,)],  # Log position at start
+        [],  # Prune
+        [(100, 'public', 'users')],  # Relation names at start
+        [
+            (8, 'public', 'table', 'users', 100),
+            (9, 'public', 'index', 'posts', 201),
+            (10, 'public', 'function', None, 300),
+            (11, 'auth', 'type', None, 400),
+            (12, 'auth', 'table', 'tokens', 500),
+        ],
+        [],
+    )
+    conn.notifies = [SimpleNamespace(channel=DDL_NOTIFY_CHANNEL, payload='public')]
+    trigger = DDLLogTrigger()
+    trigger.start(conn)
+    assert trigger.position == 7
+    conn.cursor.return_value.execute.assert_any_call(PRUNE_DDL_LOG, (7,))
+
+    assert trigger.poll(conn) == {'public': {'users', 'posts'}, 'auth': None}
+    assert conn.notifies == []
+    assert trigger.position == 12
+    assert trigger.poll(conn) == {}
+    conn.cursor.return_value.execute.assert_called_with(GET_DDL_LOG_ENTRIES, (12,))
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_ddl_log_trigger_reports_old_names_of_renamed_tables():
+    """Test that renaming or moving a table reports its old name too, so its old model is dropped."""
+    conn = make_connection(
+        [],  # LISTEN
+        [(7,)],  # Log position at start
+        [],  # Prune
+        [(100, 'public', 'users'), (101, 'public', 'posts')],  # Relation names at start
+        [(8, 'public', 'table', 'accounts', 100)],  # ALTER TABLE users RENAME TO accounts
+        [(9, 'archive', 'table', 'accounts', 100), (10, 'public', 'table column', 'posts', 101)],
+        [(11, 'public', 'table', 'drafts', 102), (12, 'public', 'table', 'notes', 102)],  # Created after start
+    )
+    trigger = DDLLogTrigger()
+    trigger.start(conn)
+    conn.cursor.return_value.execute.assert_called_with(RELATION_NAMES_QUERY, ())
+
+    assert trigger.poll(conn) == {'public': {'users', 'accounts'}}
+    assert trigger.poll(conn) == {'public': {'accounts', 'posts'}, 'archive': {'accounts'}}
+    assert trigger.poll(conn) == {'public': {'drafts', 'notes'}}
+    assert trigger.relations[100] == ('archive', 'accounts')
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_merge_changes_widens_to_whole_schema():
+    """Test that merging table sets unions them, and a whole-schema change wins."""
+    changes = {'public': {'users'}}
+    merge_changes(changes, {'public': {'posts'}, 'auth': {'tokens'}})
+    assert changes == {'public': {'users', 'posts'}, 'auth': {'tokens'}}
+    merge_changes(changes, {'auth': None})
+    merge_changes(changes, {'auth': {'sessions'}})
+    assert changes == {'public': {'users', 'posts'}, 'auth': None}
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_migrations_trigger_detects_file_changes(tmp_path):
+    """Test that adding or modifying a migration file reports every schema."""
+    migration = tmp_path / '0001_init.sql'
+    migration.write_text('create table a (id int);')
+    trigger = MigrationsTrigger(str(tmp_path))
+    assert trigger.poll(None) == {}
+
+    (tmp_path / '0002_b.sql').write_text('create table b (id int);')
+    assert trigger.poll(None) == {ALL_SCHEMAS: None}
+    assert trigger.poll(None) == {}
+
+    migration.write_text('create table a (id bigint);')
+    os.utime(migration, ns=(0, 0))
+    assert trigger.poll(None) == {ALL_SCHEMAS: None}
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_watcher_regenerates_only_changed_schemas():
+    """Test that the watcher introspects once, then re-introspects and reports only what changed."""
+    users = [TableInfo(name='users', schema='public')]
+    users_v2 = [TableInfo(name='users', schema='public', table_type='VIEW')]
+    tokens = [TableInfo(name='tokens', schema='auth')]
+
+    builder = MagicMock()
+    conn = builder.connector.__enter__.return_value
+    builder.build_tables.side_effect = [
+        {'public': users, 'auth': tokens},  # Initial introspection
+        {'public': users_v2},  # Change in public
+        {'auth': tokens},  # Notification for auth without a model change
+    ]
+    on_change = MagicMock()
+    trigger = ScriptedTrigger({'public': None}, {}, {}, {'auth': None, 'ignored': None}, {})
+
+    watcher = Watcher(builder, ('public', 'auth'), on_change, [trigger], interval=0, debounce=0)
+    watcher.run(max_cycles=4)
+
+    assert conn.autocommit is True
+    assert [c.kwargs['schemas'] for c in builder.build_tables.call_args_list] == [
+        ('public', 'auth'),
+        ('public',),
+        ('auth',),
+    ]
+    assert all(c.kwargs['connection'] is conn for c in builder.build_tables.call_args_list)
+    assert on_change.call_args_list[0].args == ({'public': users, 'auth': tokens},)
+    assert on_change.call_args_list[1].args == ({'public': users_v2},)
+    assert on_change.call_count == 2
+    assert watcher.tables == {'public': users_v2, 'auth': tokens}
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_watcher_reports_schema_whose_last_table_was_dropped():
+    """Test that a schema left without tables is reported, and a table recreated in it is reported again."""
+    users = [TableInfo(name='users', schema='public')]
+    builder = MagicMock()
+    builder.build_tables.side_effect = [{'public': users}, {'public': []}, {'public': users}]
+    on_change = MagicMock()
+    trigger = ScriptedTrigger({'public': None}, {}, {'public': None}, {})
+
+    watcher = Watcher(builder, ('public',), on_change, [trigger], interval=0, debounce=0)
+    watcher.run(max_cycles=4)
+
+    assert [c.args for c in on_change.call_args_list] == [({'public': users},), ({'public': []},), ({'public': users},)]
+    assert watcher.tables == {'public': users}
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_watcher_debounces_bursts():
+    """Test that changes reported while waiting for a quiet period cause a single re-introspection."""
+    builder = MagicMock()
+    builder.build_tables.return_value = {}
+    trigger = ScriptedTrigger({'public': None}, {'auth': None}, {'public': None}, {})
+
+    watcher = Watcher(builder, ('*',), MagicMock(), [trigger], interval=0, debounce=0)
+    watcher.run(max_cycles=1)
+
+    assert [c.kwargs['schemas'] for c in builder.build_tables.call_args_list] == [('*',), ('auth', 'public')]
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_watcher_raises_when_connection_is_lost():
+    """Test that a failed refresh on a closed connection stops the watcher instead of looping."""
+    builder = MagicMock()
+    builder.build_tables.side_effect = [{}, RuntimeError('server closed the connection')]
+    builder.connector.check_connection.return_value = False
+
+    watcher = Watcher(builder, ('public',), MagicMock(), [ScriptedTrigger({'public': None})], interval=0, debounce=0)
+    with pytest.raises(ConnectionError, match='Lost the database connection'):
+        watcher.run(max_cycles=1)
+
+
+@pytest.mark.unit
+@pytest.mark.db
+def test_watcher_passes_changed_tables_to_builder():
+    """Test that table-level changes reach the builder, and whole-schema changes read the schema."""
+    builder = MagicMock()
+    builder.build_tables.return_value = {}
+    trigger = ScriptedTrigger({'public': {'users'}, 'auth': None, 'ignored': {'x'}}, {})
+
+    watcher = Watcher(builder, ('public', 'auth'), MagicMock(), [trigger], interval=0, debounce=0)
+    watcher.run(max_cycles=1)
+
+    initial, delta = builder.build_tables.call_args_list
+    assert initial.kwargs['changed_tables'] == {}
+    assert delta.kwargs['schemas'] == ('public', 'auth')
+    assert delta.kwargs['changed_tables'] == {'public': {'users'}}
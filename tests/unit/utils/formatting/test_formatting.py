@@ -4,7 +4,7 @@ import logging
 import subprocess
 import pytest
 
-from supabase_pydantic.utils.formatting import format_with_ruff, RuffNotFoundError
+from supabase_pydantic.utils.formatting import format_many_with_ruff, format_with_ruff, RuffNotFoundError
 
 
 @pytest.mark.unit
@@ -54,3 +54,18 @@ def test_ruff_not_found_error_constructor():
     assert error2.file_path == 'another_file.py'
     assert 'Custom error message' in str(error2)
     assert 'For file: another_file.py' in str(error2)
+
+
+@pytest.mark.unit
+@pytest.mark.formatting
+def test_format_many_with_ruff_runs_each_step_once(mocker):
+    """Test that formatting several files runs each ruff step once, for all of them."""
+    run = mocker.patch('subprocess.run', return_value=subprocess.CompletedProcess([], 0, '', ''))
+
+    format_many_with_ruff(['a.py', 'b.py'])
+
+    assert [c.args[0] for c in run.call_args_list] == [
+        ['ruff', 'check', '--select', 'I', '--fix', 'a.py', 'b.py'],
+        ['ruff', 'format', 'a.py', 'b.py'],
+        ['ruff', 'check', '--fix', 'a.py', 'b.py'],
+    ]
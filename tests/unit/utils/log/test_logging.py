@@ -0,0 +1,88 @@
+"""Tests for logging setup in supabase_pydantic.utils.logging."""
+
+import logging
+
+import pytest
+from loguru import logger as loguru_logger
+
+from supabase_pydantic.utils import logging as logging_utils
+from supabase_pydantic.utils.logging import InterceptHandler, _loguru_level, setup_logging
+
+
+@pytest.fixture
+def loguru_records():
+    """Capture the records Loguru receives, and restore the default logging setup afterwards."""
+    records: list = []
+    sink_id = loguru_logger.add(lambda message: records.append(message.record), level=0)
+    yield records
+    loguru_logger.remove(sink_id)
+    setup_logging('INFO', force=True)
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+def test_loguru_level_mapping_is_cached():
+    """Test that stdlib levels map to Loguru level names, falling back to the number."""
+    _loguru_level.cache_clear()
+    assert _loguru_level('INFO', logging.INFO) == 'INFO'
+    assert _loguru_level('TRACE', 5) == 'TRACE'
+    assert _loguru_level('Level 15', 15) == 15
+    assert _loguru_level('INFO', logging.INFO) == 'INFO'
+    assert _loguru_level.cache_info().hits == 1
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+@pytest.mark.parametrize('caller_details, expected_function', [(True, 'log_from_here'), (False, 'emit')])
+def test_intercept_handler_caller_details(loguru_records, caller_details, expected_function):
+    """Test that the caller's frame is only looked up when caller details are shown."""
+    stdlib_logger = logging.getLogger('supabase_pydantic.tests.intercept')
+    stdlib_logger.addHandler(InterceptHandler(caller_details=caller_details))
+    stdlib_logger.propagate = False
+    stdlib_logger.setLevel(logging.INFO)
+
+    def log_from_here() -> None:
+        stdlib_logger.info('hello %s', 'world')
+
+    try:
+        log_from_here()
+    finally:
+        stdlib_logger.handlers.clear()
+        stdlib_logger.propagate = True
+
+    record = loguru_records[-1]
+    assert record['message'] == 'hello world'
+    assert record['level'].name == 'INFO'
+    assert record['function'] == expected_function
+    assert record['extra']['logger_name'] == 'supabase_pydantic.tests.intercept'
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+def test_setup_logging_enqueue_with_loguru(capsys):
+    """Test that queued Loguru output reaches stderr once the queue is drained."""
+    setup_logging('INFO', force=True, enqueue=True)
+    try:
+        logging.getLogger('supabase_pydantic.tests.queue').info('queued message')
+        loguru_logger.complete()
+    finally:
+        setup_logging('INFO', force=True)
+    assert 'queued message' in capsys.readouterr().err
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+def test_setup_logging_enqueue_stdlib_fallback(monkeypatch, capsys):
+    """Test that the stdlib fallback writes through a queue listener that is flushed on stop."""
+    monkeypatch.setattr(logging_utils, '_HAS_LOGURU', False)
+    setup_logging('INFO', force=True, enqueue=True)
+    try:
+        assert logging_utils._queue_listener is not None
+        assert isinstance(logging.root.handlers[0], logging.handlers.QueueHandler)
+        logging.getLogger('supabase_pydantic.tests.queue').info('queued message')
+    finally:
+        logging_utils._stop_queue_listener()
+        monkeypatch.undo()
+        setup_logging('INFO', force=True)
+    assert logging_utils._queue_listener is None
+    assert 'queued message' in capsys.readouterr().err
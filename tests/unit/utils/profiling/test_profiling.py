@@ -0,0 +1,115 @@
+"""Tests for stage timing in supabase_pydantic.utils.profiling."""
+
+import builtins
+import json
+import logging
+import pstats
+
+import pytest
+
+from supabase_pydantic.utils import profiling as profiling_module
+from supabase_pydantic.utils.profiling import deep_profile, profiling, span, timed
+
+
+@timed('double')
+def double(x):
+    return x * 2
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+def test_span_and_timed_are_noops_when_inactive():
+    """Test that spans record nothing, and decorated functions still run, without a profiler."""
+    assert profiling_module._active is None
+    with span('ignored'):
+        pass
+    assert double(2) == 4
+    assert double.__name__ == 'double'
+
+    with profiling(enabled=False) as profiler:
+        assert profiler is None
+        assert profiling_module._active is None
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+def test_spans_are_nested_and_summarized():
+    """Test that spans record their depth and attributes and aggregate by name."""
+    with profiling() as profiler:
+        with span('outer', schema='public'):
+            double(1)
+            double(2)
+    assert profiling_module._active is None
+
+    assert [(s.name, s.depth) for s in profiler.spans] == [('double', 1), ('double', 1), ('outer', 0)]
+    assert profiler.spans[-1].attrs == {'schema': 'public'}
+
+    summary = profiler.summary()
+    assert [(e['name'], e['count'], e['depth']) for e in summary] == [('outer', 1, 0), ('double', 2, 1)]
+    assert summary[0]['total'] >= summary[1]['total']
+
+    table = profiler.format_summary().splitlines()
+    assert table[0].split()[0] == 'Stage'
+    assert table[2].startswith('outer')
+    assert table[3].startswith('  double')
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+def test_chrome_trace(tmp_path):
+    """Test that the written trace has complete events in microseconds plus the summary."""
+    with profiling() as profiler:
+        with span('render', job='pydantic'):
+            pass
+
+    path = tmp_path / 'trace.json'
+    profiler.write(str(path))
+    trace = json.loads(path.read_text())
+
+    (event,) = trace['traceEvents']
+    assert event['name'] == 'render'
+    assert event['ph'] == 'X'
+    assert event['args'] == {'job': 'pydantic'}
+    assert event['dur'] >= 0
+    assert trace['summary'][0]['name'] == 'render'
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+def test_deep_profile_cprofile(tmp_path, caplog):
+    """Test that cProfile stats are written and the top functions are logged."""
+    caplog.set_level(logging.INFO)
+    path = tmp_path / 'run.prof'
+    with deep_profile('cprofile', str(path)):
+        double(3)
+
+    assert 'double' in str(pstats.Stats(str(path)).stats)
+    assert 'cProfile top functions' in caplog.text
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+def test_deep_profile_pyinstrument_missing(monkeypatch, caplog):
+    """Test that a missing pyinstrument is reported and the block still runs."""
+    real_import = builtins.__import__
+
+    def fake_import(name, *args, **kwargs):
+        if name == 'pyinstrument':
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, '__import__', fake_import)
+    ran = []
+    with deep_profile('pyinstrument'):
+        ran.append(True)
+    assert ran == [True]
+    assert 'pyinstrument is not installed' in caplog.text
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+def test_deep_profile_unknown_kind():
+    """Test that an unknown profiler is rejected."""
+    with pytest.raises(ValueError, match='Unknown deep profiler'):
+        with deep_profile('perf'):
+            pass